@@ -0,0 +1,120 @@
+"""Add source summaries
+
+Revision ID: 27fce92a49f8
+Revises: 66539bd5572e
+Create Date: 2026-10-18 21:12:47.391064
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "27fce92a49f8"
+down_revision = "66539bd5572e"
+branch_labels = None
+depends_on = None
+
+# Duplicated from securedrop_client.db so that this migration does not depend on the models
+MAX_PREVIEW_LENGTH = 200
+DOWNLOAD_ERRORS = {
+    "CHECKSUM_ERROR": "cannot download {object_type}",
+    "DECRYPTION_ERROR": "cannot decrypt {object_type}",
+}
+
+
+def upgrade():
+    op.create_table(
+        "source_summaries",
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("last_activity_uuid", sa.String(length=36), nullable=True),
+        sa.Column("preview", sa.Text(), nullable=True),
+        sa.Column("unseen_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["source_id"], ["sources.id"], name=op.f("fk_source_summaries_source_id_sources")
+        ),
+        sa.PrimaryKeyConstraint("source_id", name=op.f("pk_source_summaries")),
+    )
+
+    conn = op.get_bind()
+
+    # Count the files and messages of each source that have not been seen by any journalist
+    conn.execute(
+        """
+        INSERT INTO source_summaries
+        (source_id, unseen_count)
+        SELECT sources.id, (
+            SELECT COUNT(*) FROM messages
+            WHERE messages.source_id = sources.id AND messages.is_read = 0
+            AND NOT EXISTS (
+                SELECT 1 FROM seen_messages WHERE seen_messages.message_id = messages.id
+            )
+        ) + (
+            SELECT COUNT(*) FROM files
+            WHERE files.source_id = sources.id AND files.is_read = 0
+            AND NOT EXISTS (SELECT 1 FROM seen_files WHERE seen_files.file_id = files.id)
+        )
+        FROM sources;
+    """
+    )
+
+    # Find the latest item of each source, preferring replies over files over messages with the
+    # same file counter, as Source.server_collection does
+    latest_items = {}
+    item_types = [("messages", "message"), ("files", "file"), ("replies", "reply")]
+    for table_name, object_type in item_types:
+        content_column = "NULL" if table_name == "files" else f"{table_name}.content"
+        rows = conn.execute(
+            f"""
+            SELECT {table_name}.source_id, {table_name}.file_counter, {table_name}.uuid,
+            {table_name}.filename, {table_name}.is_downloaded, {content_column},
+            downloaderrors.name
+            FROM {table_name}
+            LEFT OUTER JOIN downloaderrors
+            ON {table_name}.download_error_id = downloaderrors.id;
+        """
+        )
+        for source_id, file_counter, uuid, filename, is_downloaded, content, error in rows:
+            latest = latest_items.get(source_id)
+            if latest is None or file_counter >= latest[0]:
+                preview = _preview(object_type, filename, is_downloaded, content, error)
+                latest_items[source_id] = (file_counter, uuid, preview)
+
+    for source_id, (_, uuid, preview) in latest_items.items():
+        conn.execute(
+            sa.text(
+                """
+                UPDATE source_summaries
+                SET last_activity_uuid = :uuid, preview = :preview
+                WHERE source_id = :source_id;
+            """
+            ),
+            uuid=uuid,
+            preview=preview,
+            source_id=source_id,
+        )
+
+
+def downgrade():
+    op.drop_table("source_summaries")
+
+
+def _preview(object_type, filename, is_downloaded, content, error):
+    """
+    Duplicate the first line of the string representation of a File, Message or Reply.
+    """
+    if object_type == "file":
+        if not is_downloaded:
+            text = "<Encrypted file on server>"
+        elif error is not None:
+            text = DOWNLOAD_ERRORS[error].format(object_type=object_type)
+        else:
+            text = "File: {}".format(filename)
+    elif content is not None:
+        text = content
+    elif error is not None:
+        text = DOWNLOAD_ERRORS[error].format(object_type=object_type)
+    else:
+        text = "<{} not yet available>".format(object_type.capitalize())
+
+    return text.strip().split("\n", 1)[0][:MAX_PREVIEW_LENGTH]
@@ -0,0 +1,38 @@
+"""Add indexes for new item and source queries
+
+Revision ID: 66539bd5572e
+Revises: 414627c04463
+Create Date: 2026-10-18 19:40:12.209561
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "66539bd5572e"
+down_revision = "414627c04463"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_sources_last_updated", "sources", ["last_updated"], unique=False)
+    for table_name in ["messages", "files", "replies"]:
+        op.create_index(
+            f"ix_{table_name}_is_downloaded",
+            table_name,
+            ["is_downloaded", "source_id"],
+            unique=False,
+        )
+        op.create_index(
+            f"ix_{table_name}_is_decrypted",
+            table_name,
+            ["is_decrypted", "source_id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    for table_name in ["replies", "files", "messages"]:
+        op.drop_index(f"ix_{table_name}_is_decrypted", table_name=table_name)
+        op.drop_index(f"ix_{table_name}_is_downloaded", table_name=table_name)
+    op.drop_index("ix_sources_last_updated", table_name="sources")
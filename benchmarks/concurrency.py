@@ -0,0 +1,142 @@
+"""
+Measure how conversation rendering reads are held up by a metadata sync running at the same time,
+with the default SQLite pragmas and with none (SQLite's rollback journal and full syncs).
+
+Like in the client, sync and rendering run in threads of the same process.
+
+Usage:
+
+    python -m benchmarks.concurrency --sources 2000 --duration 20
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+from typing import Dict, List, Union
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import scoped_session
+
+from securedrop_client import db
+from securedrop_client.storage import update_local_storage
+
+from .synthetic import add_users, make_database, make_remote_data, make_users
+
+PROFILES: Dict[str, Dict[str, Union[int, str]]] = {
+    "none": {},
+    "default": db.DEFAULT_PRAGMAS,
+}
+
+
+def sync(
+    session_maker: scoped_session,
+    sdc_home: str,
+    source_count: int,
+    stop: threading.Event,
+    durations: List[float],
+) -> None:
+    """
+    Run full syncs back to back, each of them against remote data that differs from the previous
+    one, so that every sync writes to the database.
+    """
+    session = session_maker()
+    users = make_users(5)
+    seed = 0
+    while not stop.is_set():
+        seed += 1
+        sources, submissions, replies = make_remote_data(source_count, users=users, seed=seed)
+        start = time.perf_counter()
+        update_local_storage(session, sources, submissions, replies, sdc_home)
+        durations.append(time.perf_counter() - start)
+    session.close()
+
+
+def render(
+    session_maker: scoped_session,
+    source_count: int,
+    stop: threading.Event,
+    latencies: List[float],
+    errors: List[Exception],
+) -> None:
+    """
+    Load random conversations the way the conversation view does, through Source.collection.
+    """
+    session = session_maker()
+    rng = random.Random(0)
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            source = (
+                session.query(db.Source)
+                .filter_by(uuid="source-uuid-{}".format(rng.randrange(source_count)))
+                .one_or_none()
+            )
+            if source:
+                for item in source.collection:
+                    item.seen
+            session.commit()
+        except OperationalError as e:
+            session.rollback()
+            errors.append(e)
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.01)
+    session.close()
+
+
+def run(profile: str, source_count: int, duration: float, readers: int) -> None:
+    sdc_home, session_maker = make_database()
+    session_maker = db.make_session_maker(sdc_home, PROFILES[profile])
+    session = session_maker()
+    users = make_users(5)
+    add_users(session, users)
+    update_local_storage(session, *make_remote_data(source_count, users=users), sdc_home)
+    session.close()
+
+    stop = threading.Event()
+    durations = []  # type: List[float]
+    latencies = []  # type: List[float]
+    errors = []  # type: List[Exception]
+    threads = [
+        threading.Thread(target=sync, args=(session_maker, sdc_home, source_count, stop, durations))
+    ]
+    for i in range(readers):
+        threads.append(
+            threading.Thread(
+                target=render, args=(session_maker, source_count, stop, latencies, errors)
+            )
+        )
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    print("== {} ==".format(profile))
+    print("syncs: {}, mean {:.2f}s".format(len(durations), statistics.mean(durations)))
+    print(
+        "renders: {}, median {:.1f}ms, p99 {:.1f}ms, max {:.1f}ms, errors {}".format(
+            len(latencies),
+            statistics.median(latencies) * 1000,
+            latencies[int(len(latencies) * 0.99)] * 1000,
+            latencies[-1] * 1000,
+            len(errors),
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sources", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=20, help="seconds per profile")
+    parser.add_argument("--readers", type=int, default=3, help="threads rendering conversations")
+    args = parser.parse_args()
+
+    for profile in PROFILES:
+        run(profile, args.sources, args.duration, args.readers)
+
+
+if __name__ == "__main__":
+    main()
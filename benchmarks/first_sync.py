@@ -0,0 +1,39 @@
+"""
+Time the first metadata sync (an empty local database) against a synthetic instance.
+
+Usage:
+
+    python -m benchmarks.first_sync --sources 10000
+"""
+import argparse
+import time
+
+from securedrop_client import db
+from securedrop_client.storage import update_local_storage
+
+from .synthetic import add_users, make_database, make_remote_data, make_users
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sources", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=5)
+    args = parser.parse_args()
+
+    sdc_home, session_maker = make_database()
+    session = session_maker()
+    users = make_users(args.users)
+    add_users(session, users)
+    sources, submissions, replies = make_remote_data(args.sources, users=users)
+
+    start = time.perf_counter()
+    update_local_storage(session, sources, submissions, replies, sdc_home)
+    elapsed = time.perf_counter() - start
+
+    for model in (db.Source, db.Message, db.File, db.Reply, db.SeenMessage, db.SeenFile):
+        print("{:<14} {:>8}".format(model.__tablename__, session.query(model).count()))
+    print("first sync: {:.2f}s".format(elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Time decrypting small messages with one gpg process per message against a single gpg process for
+all of them.
+
+Usage:
+
+    python -m benchmarks.gpg_batch --messages 1000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import List
+
+from securedrop_client.config import Config
+from securedrop_client.crypto import GpgHelper
+
+JOURNALIST_KEY_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "files", "securedrop.gpg.asc"
+)
+JOURNALIST_KEY_FINGERPRINT = "65A1B5FF195B56353CC63DFFCC40EF1228271441"
+
+
+def make_gpg_helper() -> GpgHelper:
+    sdc_home = tempfile.mkdtemp()
+    os.chmod(sdc_home, 0o700)
+    with open(os.path.join(sdc_home, Config.CONFIG_NAME), "w") as f:
+        json.dump({"journalist_key_fingerprint": JOURNALIST_KEY_FINGERPRINT}, f)
+    gpg = GpgHelper(sdc_home, None, is_qubes=False)  # type: ignore [arg-type]
+    with open(JOURNALIST_KEY_PATH) as f:
+        gpg._import(f.read())
+    return gpg
+
+
+def make_messages(gpg: GpgHelper, count: int) -> List[str]:
+    """
+    Write count small messages encrypted to the journalist key, encrypting them all in one go.
+    """
+    messages_dir = tempfile.mkdtemp(dir=gpg.sdc_home)
+    plaintext_filepaths = []
+    for i in range(count):
+        plaintext_filepath = os.path.join(messages_dir, "{}-message".format(i))
+        with open(plaintext_filepath, "w") as f:
+            f.write("message {}".format(i))
+        plaintext_filepaths.append(plaintext_filepath)
+
+    cmd = gpg._gpg_cmd_base()
+    cmd.extend(["--batch", "--recipient", JOURNALIST_KEY_FINGERPRINT, "--encrypt-files"])
+    subprocess.run(cmd + plaintext_filepaths, check=True)
+    for plaintext_filepath in plaintext_filepaths:
+        os.unlink(plaintext_filepath)
+
+    return [plaintext_filepath + ".gpg" for plaintext_filepath in plaintext_filepaths]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1000)
+    args = parser.parse_args()
+
+    gpg = make_gpg_helper()
+    try:
+        filepaths = make_messages(gpg, args.messages)
+        start = time.perf_counter()
+        for filepath in filepaths:
+            gpg.decrypt_message_or_reply(filepath)
+        per_item = time.perf_counter() - start
+
+        filepaths = make_messages(gpg, args.messages)
+        start = time.perf_counter()
+        results = gpg.decrypt_messages_or_replies(filepaths)
+        batch = time.perf_counter() - start
+        failures = [result for result in results.values() if not isinstance(result, str)]
+    finally:
+        shutil.rmtree(gpg.sdc_home)
+
+    print("messages:         {:>8}".format(args.messages))
+    print("one gpg per item: {:>7.2f}s".format(per_item))
+    print("one gpg for all:  {:>7.2f}s".format(batch))
+    print("batch failures:   {:>8}".format(len(failures)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Record the query plans and timings of the hot storage queries on a large synthetic database, with
+and without the indexes declared in securedrop_client.db.
+
+Usage:
+
+    python -m benchmarks.queries --sources 10000
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from securedrop_client import db
+from securedrop_client.storage import (
+    find_new_files,
+    find_new_messages,
+    find_new_replies,
+    get_local_sources,
+    update_local_storage,
+)
+
+from .synthetic import add_users, make_database, make_remote_data, make_users
+
+QUERIES: Dict[str, Callable[[Session], Any]] = {
+    "get_local_sources": get_local_sources,
+    "find_new_files": find_new_files,
+    "find_new_messages": find_new_messages,
+    "find_new_replies": find_new_replies,
+}
+
+
+def populate(session: Session, sdc_home: str, source_count: int, downloaded: float) -> None:
+    """
+    Sync a synthetic instance, then mark the given fraction of its items as downloaded and
+    decrypted, as they would be in a client that has been running for a while.
+    """
+    users = make_users(5)
+    add_users(session, users)
+    update_local_storage(session, *make_remote_data(source_count, users=users), sdc_home)
+    modulo = 1000
+    threshold = int(downloaded * modulo)
+    for table_name in ("messages", "files", "replies"):
+        content = ", content = ''" if table_name == "replies" else ""
+        session.execute(
+            text(
+                f"UPDATE {table_name} SET is_downloaded = 1, is_decrypted = 1{content} "
+                f"WHERE id % {modulo} < {threshold}"
+            )
+        )
+    session.commit()
+
+
+def capture_statements(session: Session, query: Callable[[Session], Any]) -> List[Tuple]:
+    statements = []  # type: List[Tuple]
+
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Tuple, *args: Any
+    ) -> None:
+        statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        query(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def measure(session: Session, repeat: int) -> None:
+    """
+    Print the plan of each statement emitted by the queries, and the time it takes SQLite to
+    run them, which leaves out the time the ORM spends building objects from the results.
+    """
+    connection = session.connection().connection
+    for name, query in QUERIES.items():
+        print("{}:".format(name))
+        statements = capture_statements(session, query)
+        for statement, parameters in statements:
+            for row in connection.execute("EXPLAIN QUERY PLAN " + statement, parameters):
+                print("    {}".format(row[3]))
+
+        timings = []
+        for i in range(repeat):
+            start = time.perf_counter()
+            for statement, parameters in statements:
+                connection.execute(statement, parameters).fetchall()
+            timings.append(time.perf_counter() - start)
+        print("    best of {}: {:.2f}ms".format(repeat, min(timings) * 1000))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sources", type=int, default=10000)
+    parser.add_argument(
+        "--downloaded", type=float, default=0.999, help="fraction of items already downloaded"
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    sdc_home, session_maker = make_database()
+    session = session_maker()
+    populate(session, sdc_home, args.sources, args.downloaded)
+
+    print("== with indexes ==")
+    measure(session, args.repeat)
+
+    for table in db.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            session.execute(text("DROP INDEX {}".format(index.name)))
+    session.commit()
+
+    print("== without indexes ==")
+    measure(session, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
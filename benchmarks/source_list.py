@@ -0,0 +1,155 @@
+"""
+Measure the memory and frame time of the source list populated from a synthetic instance.
+
+For each size, the script syncs a fresh database, shows a SourceList at the size of the client's
+source list pane and reports:
+
+* the resident memory added by populating the list (the sources are loaded beforehand, so ORM
+  objects are not counted),
+* the time taken by initial_update to add every source, and by update_sources to reload them
+  on a later sync, and on a sync where one source in a hundred has new activity and moves to the
+  top of the list,
+* the mean and worst time to paint the viewport after scrolling by one page.
+
+Usage:
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.source_list --sources 1000 10000 50000
+"""
+import argparse
+import gc
+import os
+import time
+from datetime import datetime
+from typing import Any, List
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from securedrop_client.gui.widgets import SourceList
+from securedrop_client.resources import load_css, load_font
+from securedrop_client.storage import get_local_sources, update_local_storage
+
+from .synthetic import add_users, make_database, make_remote_data, make_users
+
+WIDTH = 500
+HEIGHT = 1000
+FRAMES = 50
+
+
+class BenchmarkController(QObject):
+    """
+    The parts of securedrop_client.logic.Controller used by the source list.
+    """
+
+    authentication_state = pyqtSignal(bool)
+    sync_started = pyqtSignal(datetime)
+    reply_succeeded = pyqtSignal(str, str, str)
+    message_ready = pyqtSignal(str, str, str)
+    reply_ready = pyqtSignal(str, str, str)
+    file_ready = pyqtSignal(str, str, str)
+    file_missing = pyqtSignal(str, str, str)
+    message_download_failed = pyqtSignal(str, str, str)
+    reply_download_failed = pyqtSignal(str, str, str)
+    conversation_deleted = pyqtSignal(str)
+    conversation_deletion_successful = pyqtSignal(str, datetime)
+    conversation_deletion_failed = pyqtSignal(str)
+    source_deleted = pyqtSignal(str)
+    source_deletion_failed = pyqtSignal(str)
+    star_update_failed = pyqtSignal(str, bool)
+    star_update_successful = pyqtSignal(str)
+
+    def __init__(self, session: Any) -> None:
+        super().__init__()
+        self.session = session
+        self.is_authenticated = True
+
+
+def resident_memory() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measure(app: QApplication, source_count: int) -> None:
+    sdc_home, session_maker = make_database()
+    session = session_maker()
+    users = make_users(5)
+    add_users(session, users)
+    update_local_storage(session, *make_remote_data(source_count, users=users), sdc_home)
+    sources = get_local_sources(session)
+    for source in sources:
+        source.server_collection  # Load each conversation, as a running client would have done
+
+    gc.collect()
+    app.processEvents()
+    rss_before = resident_memory()
+
+    source_list = SourceList()
+    source_list.setStyleSheet(load_css("sdclient.css"))
+    source_list.setup(BenchmarkController(session))  # type: ignore[arg-type]
+    source_list.resize(WIDTH, HEIGHT)
+    source_list.show()
+
+    start = time.perf_counter()
+    source_list.initial_update(sources)
+    while source_list.count() < len(sources):
+        app.processEvents()
+    app.processEvents()
+    populate_time = time.perf_counter() - start
+
+    gc.collect()
+    rss_after = resident_memory()
+
+    start = time.perf_counter()
+    source_list.update_sources(sources)
+    app.processEvents()
+    reload_time = time.perf_counter() - start
+
+    for source in sources[::100]:
+        source.last_updated = datetime.utcnow()
+    session.commit()
+    start = time.perf_counter()
+    source_list.update_sources(sources)
+    app.processEvents()
+    reorder_time = time.perf_counter() - start
+
+    scrollbar = source_list.verticalScrollBar()
+    frame_times = []  # type: List[float]
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        scrollbar.setValue((frame * scrollbar.pageStep()) % (scrollbar.maximum() + 1))
+        source_list.viewport().repaint()
+        frame_times.append(time.perf_counter() - start)
+
+    print(
+        "{:>6} sources: {:>7.1f} MiB  populate {:>7.2f}s  reload {:>7.2f}s  reorder {:>7.2f}s  "
+        "frame mean {:>6.2f}ms  max {:>6.2f}ms".format(
+            source_count,
+            (rss_after - rss_before) / 2**20,
+            populate_time,
+            reload_time,
+            reorder_time,
+            1000 * sum(frame_times) / len(frame_times),
+            1000 * max(frame_times),
+        )
+    )
+
+    source_list.close()
+    source_list.deleteLater()
+    app.processEvents()
+    session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sources", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    app = QApplication([])
+    load_font("Montserrat")
+    load_font("Source_Sans_Pro")
+    for source_count in args.sources:
+        measure(app, source_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Measure the memory a metadata sync allocates while it stores the remote data of a synthetic
+instance, first into an empty local database and then again unchanged.
+
+Usage:
+
+    python -m benchmarks.sync_memory --sources 30000
+"""
+import argparse
+import resource
+import time
+import tracemalloc
+from typing import Dict
+
+from securedrop_client.storage import update_local_storage
+
+from .synthetic import add_users, make_database, make_remote_data, make_users
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sources", type=int, default=30000)
+    parser.add_argument("--users", type=int, default=5)
+    args = parser.parse_args()
+
+    sdc_home, session_maker = make_database()
+    session = session_maker()
+    users = make_users(args.users)
+    add_users(session, users)
+    sources, submissions, replies = make_remote_data(args.sources, users=users)
+    print("remote data:   {:>8.1f} MB max RSS".format(max_rss_mb()))
+
+    source_digests = {}  # type: Dict[str, str]
+    for name in ("first sync", "second sync"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        update_local_storage(session, sources, submissions, replies, sdc_home, source_digests)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        session.expunge_all()
+        print(
+            "{:<14} {:>8.1f} MB peak allocated, {:.2f}s".format(
+                name + ":", peak / 1024 / 1024, elapsed
+            )
+        )
+
+    print("{:<14} {:>8.1f} MB max RSS".format("total:", max_rss_mb()))
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Synthetic SecureDrop server data for benchmarks.
+
+The data is deterministic for a given set of arguments, so that runs can be compared.
+"""
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sdclientapi import Reply as SDKReply
+from sdclientapi import Source as SDKSource
+from sdclientapi import Submission as SDKSubmission
+from sdclientapi import User as SDKUser
+from sqlalchemy.orm import Session, scoped_session
+
+from securedrop_client import db
+
+ADJECTIVES = ["abrupt", "brisk", "candid", "dapper", "eager", "fabled", "gallant", "hardy"]
+NOUNS = ["alloy", "beacon", "cipher", "dynamo", "ember", "falcon", "glacier", "harbor"]
+
+KEY_PATH = os.path.join(os.path.dirname(__file__), "..", "tests", "files", "test-key.gpg.pub.asc")
+with open(KEY_PATH) as f:
+    PUBLIC_KEY = f.read()
+
+
+def make_users(count: int) -> List[SDKUser]:
+    return [
+        SDKUser(
+            uuid="user-uuid-{}".format(i),
+            username="journalist{}".format(i),
+            first_name="Journalist",
+            last_name=str(i),
+        )
+        for i in range(count)
+    ]
+
+
+def make_remote_data(
+    source_count: int,
+    messages_per_source: int = 2,
+    files_per_source: int = 1,
+    replies_per_source: int = 2,
+    users: List[SDKUser] = [],
+    seed: int = 0,
+) -> Tuple[List[SDKSource], List[SDKSubmission], List[SDKReply]]:
+    """
+    Return (remote_sources, remote_submissions, remote_replies) as fetched by
+    MetadataSyncJob for an instance with source_count sources.
+    """
+    rng = random.Random(seed)
+    now = datetime(2023, 1, 1)
+    sources = []  # type: List[SDKSource]
+    submissions = []  # type: List[SDKSubmission]
+    replies = []  # type: List[SDKReply]
+    user_uuids = [user.uuid for user in users]
+
+    for i in range(source_count):
+        source_uuid = "source-uuid-{}".format(i)
+        designation = "{} {}".format(rng.choice(ADJECTIVES), rng.choice(NOUNS))
+        filename_designation = designation.replace(" ", "_")
+        interaction_count = messages_per_source + files_per_source + replies_per_source
+        sources.append(
+            SDKSource(
+                add_star_url="",
+                interaction_count=interaction_count,
+                is_flagged=False,
+                is_starred=rng.random() < 0.1,
+                journalist_designation=designation,
+                key={"type": "PGP", "public": PUBLIC_KEY, "fingerprint": "B2FF7FB28EED8CABEBC5"},
+                last_updated=(now - timedelta(minutes=i)).isoformat(),
+                number_of_documents=files_per_source,
+                number_of_messages=messages_per_source,
+                remove_star_url="",
+                replies_url="",
+                submissions_url="",
+                url="",
+                uuid=source_uuid,
+                seen_by=None,
+            )
+        )
+
+        file_counter = 0
+        for kind, count in (("msg", messages_per_source), ("doc.gz", files_per_source)):
+            for j in range(count):
+                file_counter += 1
+                submissions.append(
+                    SDKSubmission(
+                        download_url="",
+                        filename="{}-{}-{}.gpg".format(file_counter, filename_designation, kind),
+                        is_read=False,
+                        size=rng.randint(500, 50000),
+                        source_url="/api/v1/sources/{}".format(source_uuid),
+                        submission_url="",
+                        uuid="submission-uuid-{}-{}".format(i, file_counter),
+                        seen_by=rng.sample(user_uuids, rng.randint(0, len(user_uuids))),
+                    )
+                )
+        for j in range(replies_per_source):
+            file_counter += 1
+            replies.append(
+                SDKReply(
+                    filename="{}-{}-reply.gpg".format(file_counter, filename_designation),
+                    journalist_uuid=rng.choice(user_uuids) if user_uuids else "deleted",
+                    journalist_username="",
+                    journalist_first_name="",
+                    journalist_last_name="",
+                    is_deleted_by_source=False,
+                    reply_url="",
+                    size=rng.randint(500, 5000),
+                    source_url="/api/v1/sources/{}".format(source_uuid),
+                    uuid="reply-uuid-{}-{}".format(i, file_counter),
+                    seen_by=rng.sample(user_uuids, rng.randint(0, len(user_uuids))),
+                )
+            )
+
+    return sources, submissions, replies
+
+
+def make_database(sdc_home: str = "") -> Tuple[str, scoped_session]:
+    """
+    Return the path of a (new, temporary by default) client home directory and a session maker
+    for an empty database in it.
+    """
+    sdc_home = sdc_home or tempfile.mkdtemp()
+    os.makedirs(sdc_home, exist_ok=True)
+    session_maker = db.make_session_maker(sdc_home)
+    db.Base.metadata.create_all(bind=session_maker().get_bind())
+    return sdc_home, session_maker
+
+
+def add_users(session: Session, users: List[SDKUser]) -> None:
+    for user in users:
+        session.add(
+            db.User(
+                uuid=user.uuid,
+                username=user.username,
+                firstname=user.first_name,
+                lastname=user.last_name,
+            )
+        )
+    session.commit()
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future
 from typing import Any, Optional, TypeVar
 
 from PyQt5.QtCore import QObject, pyqtSignal
@@ -88,9 +89,24 @@ class ApiJob(QueueJob):
                 self.failure_signal.emit(e)
                 raise
             else:
-                self.success_signal.emit(result)
+                if isinstance(result, Future):
+                    # The job handed off the rest of its work, so its result is only known once the
+                    # future is done.
+                    result.add_done_callback(self._emit_future_result)
+                else:
+                    self.success_signal.emit(result)
                 break
 
+    def _emit_future_result(self, future: Future) -> None:
+        if future.cancelled():
+            return
+
+        exception = future.exception()
+        if exception:
+            self.failure_signal.emit(exception)
+        else:
+            self.success_signal.emit(future.result())
+
     def call_api(self, api_client: API, session: Session) -> Any:
         """
         Method for making the actual API call and handling the result.
@@ -98,6 +114,9 @@ class ApiJob(QueueJob):
         This MUST resturn a value if the API call and other tasks were successful and MUST raise
         an exception if and only if the tasks failed. Presence of a raise exception indicates a
         failure.
+
+        If the remaining tasks are run elsewhere, this can instead return a Future, which MUST be
+        resolved with the value or the exception.
         """
         raise NotImplementedError
 
@@ -3,12 +3,14 @@ import hashlib
 import logging
 import math
 import os
-from tempfile import NamedTemporaryFile
-from typing import Any, Optional, Tuple, Type, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, NoReturn, Optional, Tuple, Type, Union
 
 from sdclientapi import API, BaseError
 from sdclientapi import Reply as SdkReply
 from sdclientapi import Submission as SdkSubmission
+from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm.session import Session
 
 from securedrop_client.api_jobs.base import SingleObjectApiJob
@@ -18,6 +20,7 @@ from securedrop_client.storage import (
     mark_as_decrypted,
     mark_as_downloaded,
     set_message_or_reply_content,
+    update_source_summary_preview,
 )
 from securedrop_client.utils import safe_move
 
@@ -52,10 +55,15 @@ class DownloadJob(SingleObjectApiJob):
 
     CHUNK_SIZE = 4096
 
-    def __init__(self, data_dir: str, uuid: str) -> None:
+    def __init__(
+        self, data_dir: str, uuid: str, decryption_pool: Optional["DecryptionPool"] = None
+    ) -> None:
         super().__init__(uuid)
         self.data_dir = data_dir
 
+        # If set, the file is decrypted in this pool once downloaded, see decrypt_content()
+        self.decryption_pool = decryption_pool
+
     def _get_realistic_timeout(self, size_in_bytes: int) -> int:
         """
         Return a realistic timeout in seconds based on the size of the download.
@@ -110,6 +118,23 @@ class DownloadJob(SingleObjectApiJob):
         """
         raise NotImplementedError
 
+    def decrypt_content(self, filepath: str) -> str:
+        """
+        Method for decrypting the file, for jobs that use a decryption pool.
+
+        Returns the plaintext content, which the pool passes to store_content().
+
+        This MUST NOT access the database and MUST raise an exception if and only if the decryption
+        fails.
+        """
+        raise NotImplementedError
+
+    def store_content(self, content: str, session: Session) -> None:
+        """
+        Method for storing the plaintext content returned by decrypt_content().
+        """
+        raise NotImplementedError
+
     def get_db_object(self, session: Session) -> Union[File, Message]:
         """
         Get the database object associated with this job.
@@ -130,10 +155,13 @@ class DownloadJob(SingleObjectApiJob):
 
         if db_object.is_downloaded:
             logger.debug(f"item with uuid {self.uuid} already downloaded, now decrypting")
-            self._decrypt(db_object.location(self.data_dir), db_object, session)
-            return db_object.uuid
+            destination = db_object.location(self.data_dir)
+        else:
+            destination = self._download(api_client, db_object, session)
+
+        if self.decryption_pool:
+            return self.decryption_pool.decrypt(self, destination)
 
-        destination = self._download(api_client, db_object, session)
         self._decrypt(destination, db_object, session)
         return db_object.uuid
 
@@ -154,6 +182,7 @@ class DownloadJob(SingleObjectApiJob):
                     .one()
                 )
                 db_object.download_error = download_error
+                update_source_summary_preview(session, db_object)
                 session.commit()
                 exception = DownloadChecksumMismatchException(
                     "Downloaded file had an invalid checksum.", type(db_object), db_object.uuid
@@ -183,27 +212,47 @@ class DownloadJob(SingleObjectApiJob):
         """
         try:
             original_filename = self.call_decrypt(filepath, session)
-            db_object.download_error = None
-            mark_as_decrypted(
-                type(db_object), db_object.uuid, session, original_filename=original_filename
-            )
-            logger.info(f"File decrypted to {os.path.dirname(filepath)}")
         except CryptoError as e:
-            logger.error("Decryption failed")
-            logger.debug(f"Decryption failed: {e}")
-            mark_as_decrypted(type(db_object), db_object.uuid, session, is_decrypted=False)
-            download_error = (
-                session.query(DownloadError)
-                .filter_by(name=DownloadErrorCodes.DECRYPTION_ERROR.name)
-                .one()
-            )
-            db_object.download_error = download_error
-            session.commit()
-            raise DownloadDecryptionException(
-                f"Failed to decrypt file: {os.path.basename(filepath)}",
-                type(db_object),
-                db_object.uuid,
-            ) from e
+            self._mark_as_not_decrypted(filepath, db_object, session, e)
+
+        self._mark_as_decrypted(filepath, db_object, session, original_filename)
+
+    def _mark_as_decrypted(
+        self,
+        filepath: str,
+        db_object: Union[File, Message, Reply],
+        session: Session,
+        original_filename: str,
+    ) -> None:
+        db_object.download_error = None
+        mark_as_decrypted(
+            type(db_object), db_object.uuid, session, original_filename=original_filename
+        )
+        logger.info(f"File decrypted to {os.path.dirname(filepath)}")
+
+    def _mark_as_not_decrypted(
+        self,
+        filepath: str,
+        db_object: Union[File, Message, Reply],
+        session: Session,
+        error: CryptoError,
+    ) -> NoReturn:
+        logger.error("Decryption failed")
+        logger.debug(f"Decryption failed: {error}")
+        mark_as_decrypted(type(db_object), db_object.uuid, session, is_decrypted=False)
+        download_error = (
+            session.query(DownloadError)
+            .filter_by(name=DownloadErrorCodes.DECRYPTION_ERROR.name)
+            .one()
+        )
+        db_object.download_error = download_error
+        update_source_summary_preview(session, db_object)
+        session.commit()
+        raise DownloadDecryptionException(
+            f"Failed to decrypt file: {os.path.basename(filepath)}",
+            type(db_object),
+            db_object.uuid,
+        ) from error
 
     @classmethod
     def _check_file_integrity(cls, etag: str, file_path: str) -> bool:
@@ -242,8 +291,14 @@ class ReplyDownloadJob(DownloadJob):
     Download and decrypt a reply from a source.
     """
 
-    def __init__(self, uuid: str, data_dir: str, gpg: GpgHelper) -> None:
-        super().__init__(data_dir, uuid)
+    def __init__(
+        self,
+        uuid: str,
+        data_dir: str,
+        gpg: GpgHelper,
+        decryption_pool: Optional["DecryptionPool"] = None,
+    ) -> None:
+        super().__init__(data_dir, uuid, decryption_pool)
         self.gpg = gpg
 
     def get_db_object(self, session: Session) -> Reply:
@@ -272,24 +327,33 @@ class ReplyDownloadJob(DownloadJob):
         Decrypt the file located at the given filepath and store its plaintext content in the local
         database.
 
-        The file containing the plaintext should be deleted once the content is stored in the db.
-
         The return value is an empty string; replies have no original filename.
         """
-        with NamedTemporaryFile("w+") as plaintext_file:
+        self.store_content(self.decrypt_content(filepath), session)
+        return ""
+
+    def decrypt_content(self, filepath: str) -> str:
+        """
+        Override DownloadJob.
+
+        The plaintext is read from gpg into memory, without being written to a file.
+        """
+        try:
+            return self.gpg.decrypt_message_or_reply(filepath)
+        finally:
             try:
-                self.gpg.decrypt_submission_or_reply(filepath, plaintext_file.name, is_doc=False)
-                set_message_or_reply_content(
-                    model_type=Reply, uuid=self.uuid, session=session, content=plaintext_file.read()
-                )
-            finally:
-                try:
-                    os.rmdir(os.path.dirname(filepath))
-                except OSError:
-                    msg = f"Could not delete decryption directory: {os.path.dirname(filepath)}"
-                    logger.debug(msg)
+                os.rmdir(os.path.dirname(filepath))
+            except OSError:
+                msg = f"Could not delete decryption directory: {os.path.dirname(filepath)}"
+                logger.debug(msg)
 
-        return ""
+    def store_content(self, content: str, session: Session) -> None:
+        """
+        Override DownloadJob.
+        """
+        set_message_or_reply_content(
+            model_type=Reply, uuid=self.uuid, session=session, content=content
+        )
 
 
 class MessageDownloadJob(DownloadJob):
@@ -297,8 +361,14 @@ class MessageDownloadJob(DownloadJob):
     Download and decrypt a message from a source.
     """
 
-    def __init__(self, uuid: str, data_dir: str, gpg: GpgHelper) -> None:
-        super().__init__(data_dir, uuid)
+    def __init__(
+        self,
+        uuid: str,
+        data_dir: str,
+        gpg: GpgHelper,
+        decryption_pool: Optional["DecryptionPool"] = None,
+    ) -> None:
+        super().__init__(data_dir, uuid, decryption_pool)
         self.uuid = uuid
         self.gpg = gpg
 
@@ -326,27 +396,33 @@ class MessageDownloadJob(DownloadJob):
         Decrypt the file located at the given filepath and store its plaintext content in the local
         database.
 
-        The file containing the plaintext should be deleted once the content is stored in the db.
-
         The return value is an empty string; messages have no original filename.
         """
-        with NamedTemporaryFile("w+") as plaintext_file:
+        self.store_content(self.decrypt_content(filepath), session)
+        return ""
+
+    def decrypt_content(self, filepath: str) -> str:
+        """
+        Override DownloadJob.
+
+        The plaintext is read from gpg into memory, without being written to a file.
+        """
+        try:
+            return self.gpg.decrypt_message_or_reply(filepath)
+        finally:
             try:
-                self.gpg.decrypt_submission_or_reply(filepath, plaintext_file.name, is_doc=False)
-                set_message_or_reply_content(
-                    model_type=Message,
-                    uuid=self.uuid,
-                    session=session,
-                    content=plaintext_file.read(),
-                )
-            finally:
-                try:
-                    os.rmdir(os.path.dirname(filepath))
-                except OSError:
-                    msg = f"Could not delete decryption directory: {os.path.dirname(filepath)}"
-                    logger.debug(msg)
+                os.rmdir(os.path.dirname(filepath))
+            except OSError:
+                msg = f"Could not delete decryption directory: {os.path.dirname(filepath)}"
+                logger.debug(msg)
 
-        return ""
+    def store_content(self, content: str, session: Session) -> None:
+        """
+        Override DownloadJob.
+        """
+        set_message_or_reply_content(
+            model_type=Message, uuid=self.uuid, session=session, content=content
+        )
 
 
 class FileDownloadJob(DownloadJob):
@@ -391,3 +467,109 @@ class FileDownloadJob(DownloadJob):
             filepath, plaintext_filepath, is_doc=True
         )
         return original_filename
+
+
+class DecryptionPool:
+    """
+    Decrypt downloaded messages and replies in a bounded pool of worker threads, each of which
+    waits on its own gpg process, so that items are decrypted concurrently while the main queue
+    moves on to downloading the next ones.
+
+    The decrypted content of each item is stored by a single writer thread, so that database writes
+    are still serialized.
+    """
+
+    def __init__(self, session_maker: scoped_session, max_workers: int) -> None:
+        self.session_maker = session_maker
+        self.decrypt_executor = ThreadPoolExecutor(max_workers, thread_name_prefix="decrypt")
+        self.write_executor = ThreadPoolExecutor(1, thread_name_prefix="decrypt-write")
+
+        # The futures of the items being decrypted, keyed by UUID. A job for an item that is
+        # already being decrypted gets the same future, since the encrypted file is deleted once
+        # decrypted.
+        self.in_progress: Dict[str, Future] = {}
+        self.in_progress_lock = threading.Lock()
+
+    def decrypt(self, job: DownloadJob, filepath: str) -> Future:
+        """
+        Decrypt the file downloaded by the job and store its content.
+
+        Return a future resolved with the UUID of the item, or the exception raised by the job.
+        """
+        with self.in_progress_lock:
+            future = self.in_progress.get(job.uuid)
+            if future:
+                logger.debug(f"item with uuid {job.uuid} already being decrypted")
+                return future
+
+            future = Future()
+            self.in_progress[job.uuid] = future
+
+        self.decrypt_executor.submit(self._decrypt, job, filepath, future)
+        return future
+
+    def _decrypt(self, job: DownloadJob, filepath: str, future: Future) -> None:
+        """
+        Run in a decryption worker.
+        """
+        try:
+            content = job.decrypt_content(filepath)
+        except CryptoError as e:
+            self.write_executor.submit(self._store, job, filepath, "", e, future)
+        except Exception as e:
+            self._finish(job.uuid, future, exception=e)
+        else:
+            self.write_executor.submit(self._store, job, filepath, content, None, future)
+
+    def _store(
+        self,
+        job: DownloadJob,
+        filepath: str,
+        content: str,
+        error: Optional[CryptoError],
+        future: Future,
+    ) -> None:
+        """
+        Run in the writer thread.
+        """
+        session = self.session_maker()
+        try:
+            db_object = job.get_db_object(session)
+            if error:
+                job._mark_as_not_decrypted(filepath, db_object, session, error)
+            job.store_content(content, session)
+            job._mark_as_decrypted(filepath, db_object, session, "")
+        except Exception as e:
+            self._finish(job.uuid, future, exception=e)
+        else:
+            self._finish(job.uuid, future, result=job.uuid)
+        finally:
+            session.close()
+
+    def _finish(
+        self,
+        uuid: str,
+        future: Future,
+        result: Optional[str] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        with self.in_progress_lock:
+            del self.in_progress[uuid]
+
+        if exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def shutdown(self) -> None:
+        """
+        Wait for the items being decrypted, cancel the ones still waiting to be, then stop the
+        worker threads. A cancelled item stays downloaded, and is decrypted by the next job for it.
+        """
+        self.decrypt_executor.shutdown(cancel_futures=True)
+        self.write_executor.shutdown()
+
+        with self.in_progress_lock:
+            for future in self.in_progress.values():
+                future.cancel()
+            self.in_progress.clear()
@@ -1,15 +1,20 @@
 import logging
 import os
-from typing import Any, List, Optional
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, List, Optional, Set
 
-from sdclientapi import API
+from dateutil.parser import parse
+from sdclientapi import API, RequestTimeoutError
+from sdclientapi import Source as SDKSource
 from sdclientapi import User as SDKUser
 from sqlalchemy.orm.session import Session
 
 from securedrop_client import state
 from securedrop_client.api_jobs.base import ApiJob
-from securedrop_client.db import DeletedUser, DraftReply, User
-from securedrop_client.storage import get_remote_data, update_local_storage
+from securedrop_client.crypto import GpgHelper
+from securedrop_client.db import DeletedUser, DraftReply, Source, User
+from securedrop_client.storage import update_local_storage
+from securedrop_client.utils import call_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +27,24 @@ class MetadataSyncJob(ApiJob):
     DEFAULT_REQUEST_TIMEOUT = 60  # sec
     NUMBER_OF_TIMES_TO_RETRY_AN_API_CALL = 2
 
-    def __init__(self, data_dir: str, app_state: Optional[state.State] = None) -> None:
+    # Keys imported in advance after each sync, starting with the most recently updated sources
+    MAX_NEW_KEYS_PER_SYNC = 100
+
+    def __init__(
+        self,
+        data_dir: str,
+        app_state: Optional[state.State] = None,
+        gpg: Optional[GpgHelper] = None,
+    ) -> None:
         super().__init__(remaining_attempts=self.NUMBER_OF_TIMES_TO_RETRY_AN_API_CALL)
         self.data_dir = data_dir
         self._state = app_state
+        self.gpg = gpg
+
+        # Per-source digests of the data returned by the last successful sync, used by
+        # update_local_storage to skip sources that have not changed since then.
+        self._source_digests: Dict[str, str] = {}
+        self._user_uuids: Set[str] = set()
 
     def call_api(self, api_client: API, session: Session) -> Any:
         """
@@ -34,14 +53,18 @@ class MetadataSyncJob(ApiJob):
         Download new metadata, update the local database, import new keys, and
         then the success signal will let the controller know to add any new download
         jobs.
+
+        Returns the UUIDs of the sources that changed, or None if any of them may have changed, so
+        that the GUI only has to reload those.
         """
 
         # TODO: Once https://github.com/freedomofpress/securedrop-client/issues/648, we will want to
         # pass the default request timeout to api calls instead of setting it on the api object
         # directly.
         #
-        # This timeout is used for 3 different requests: `get_sources`, `get_all_submissions`, and
-        # `get_all_replies`
+        # This timeout is used for 4 different requests: `get_users`, `get_sources`,
+        # `get_all_submissions`, and `get_all_replies`. They are sent concurrently, so it is also
+        # the time given to all of them together.
         api_client.default_request_timeout = int(
             os.environ.get("SDEXTENDEDTIMEOUT", self.DEFAULT_REQUEST_TIMEOUT)
         )
@@ -51,12 +74,63 @@ class MetadataSyncJob(ApiJob):
                 f"default_request_timeout={api_client.default_request_timeout}"
             )
 
-        users = api_client.get_users()
+        try:
+            users, sources, submissions, replies = call_concurrently(
+                [
+                    api_client.get_users,
+                    api_client.get_sources,
+                    api_client.get_all_submissions,
+                    api_client.get_all_replies,
+                ],
+                timeout=api_client.default_request_timeout,
+            )
+        except FuturesTimeoutError as e:
+            raise RequestTimeoutError() from e
+
+        logger.info("Fetched {} remote sources.".format(len(sources)))
+        logger.info("Fetched {} remote submissions.".format(len(submissions)))
+        logger.info("Fetched {} remote replies.".format(len(replies)))
+
         MetadataSyncJob._update_users(session, users)
-        sources, submissions, replies = get_remote_data(api_client)
-        update_local_storage(session, sources, submissions, replies, self.data_dir)
+
+        # Seen records are only stored for journalists that exist locally, so unchanged sources
+        # have to be diffed again whenever the set of journalists changes.
+        user_uuids = {user.uuid for user in users}
+        if user_uuids != self._user_uuids:
+            self._source_digests.clear()
+            self._user_uuids = user_uuids
+
+        changed_source_uuids = update_local_storage(
+            session, sources, submissions, replies, self.data_dir, self._source_digests
+        )
         if self._state is not None:
             _update_state(self._state, submissions)
+        self._import_new_keys(session, sources)
+
+        return changed_source_uuids
+
+    def _import_new_keys(self, session: Session, remote_sources: List[SDKSource]) -> None:
+        """
+        Import the keys of sources that have not been imported yet, so that replying to them does
+        not have to wait for an import.
+        """
+        if self.gpg is None:
+            return
+
+        new_sources = [
+            source
+            for source in remote_sources
+            if source.key["fingerprint"] and not self.gpg.is_key_imported(source.key["fingerprint"])
+        ]
+        if not new_sources:
+            return
+
+        new_sources.sort(key=lambda source: parse(source.last_updated), reverse=True)
+        uuids = [source.uuid for source in new_sources[: self.MAX_NEW_KEYS_PER_SYNC]]
+        try:
+            self.gpg.import_new_keys(session.query(Source).filter(Source.uuid.in_(uuids)).all())
+        except OSError as e:
+            logger.error("Could not import new source keys: {}".format(e))
 
     def _update_users(session: Session, remote_users: List[SDKUser]) -> None:
         """
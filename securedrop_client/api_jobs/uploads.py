@@ -16,7 +16,7 @@ from securedrop_client.db import (
     Source,
     User,
 )
-from securedrop_client.storage import update_draft_replies
+from securedrop_client.storage import update_draft_replies, update_source_summaries
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +113,7 @@ class SendReplyJob(SingleObjectApiJob):
             session.add(source)
 
             session.delete(draft_reply_db_object)
+            update_source_summaries(session, [source.id])
             session.commit()
 
             return reply_db_object.uuid
@@ -35,6 +35,7 @@ from PyQt5.QtCore import Qt, QThread, QTimer
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
 from securedrop_client import __version__, export, state
+from securedrop_client.config import Config
 from securedrop_client.database import Database
 from securedrop_client.db import make_session_maker
 from securedrop_client.gui.main import Window
@@ -234,17 +235,19 @@ def start_app(args, qt_args) -> NoReturn:  # type: ignore [no-untyped-def]
 
     prevent_second_instance(app, args.sdc_home)
 
-    session_maker = make_session_maker(args.sdc_home)
+    config = Config.from_home_dir(args.sdc_home)
+    session_maker = make_session_maker(args.sdc_home, config.database_pragmas)
 
     session = session_maker()
     database = Database(session)
     app_state = state.State(database)
 
-    with threads(4) as [
+    with threads(3 + config.file_download_lanes) as [
         export_service_thread,
         sync_thread,
         main_queue_thread,
         file_download_queue_thread,
+        *additional_file_download_queue_threads,
     ]:
         export_service = export.getService()
         export_service.moveToThread(export_service_thread)
@@ -263,8 +266,11 @@ def start_app(args, qt_args) -> NoReturn:  # type: ignore [no-untyped-def]
             sync_thread,
             main_queue_thread,
             file_download_queue_thread,
+            decryption_workers=config.decryption_workers,
+            additional_file_download_queue_threads=additional_file_download_queue_threads,
         )
         controller.setup()
+        app.aboutToQuit.connect(controller.shutdown)
 
         configure_signal_handlers(app)
         timer = QTimer()
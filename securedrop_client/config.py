@@ -1,17 +1,61 @@
 import json
 import logging
 import os
+from typing import Dict, Optional, Union
+
+from securedrop_client.db import DEFAULT_PRAGMAS, is_valid_pragma
 
 logger = logging.getLogger(__name__)
 
+# The number of gpg processes used to decrypt messages and replies at the same time
+DEFAULT_DECRYPTION_WORKERS = min(4, os.cpu_count() or 1)
+
+# The number of files downloaded from the server at the same time
+DEFAULT_FILE_DOWNLOAD_LANES = 2
+
 
 class Config:
 
     CONFIG_NAME = "config.json"
 
-    def __init__(self, journalist_key_fingerprint: str) -> None:
+    def __init__(
+        self,
+        journalist_key_fingerprint: str,
+        database_pragmas: Optional[Dict[str, Union[int, str]]] = None,
+        decryption_workers: Optional[int] = None,
+        file_download_lanes: Optional[int] = None,
+    ) -> None:
         self.journalist_key_fingerprint = journalist_key_fingerprint
 
+        # SQLite pragmas set on every database connection: the defaults, with any of them
+        # overridden in the config file, e.g. {"journal_mode": "DELETE"} to disable WAL.
+        self.database_pragmas = dict(DEFAULT_PRAGMAS)
+        for name, value in (database_pragmas or {}).items():
+            if name not in DEFAULT_PRAGMAS:
+                logger.error("Ignoring unknown database pragma in config: {}".format(name))
+            elif not is_valid_pragma(name, value):
+                logger.error(
+                    "Ignoring invalid value of database pragma {} in config, using {}".format(
+                        name, DEFAULT_PRAGMAS[name]
+                    )
+                )
+            else:
+                self.database_pragmas[name] = value
+
+        self.decryption_workers = DEFAULT_DECRYPTION_WORKERS
+        if decryption_workers is not None:
+            if isinstance(decryption_workers, int) and decryption_workers > 0:
+                self.decryption_workers = decryption_workers
+            else:
+                logger.error("Ignoring invalid decryption_workers in config")
+
+        self.file_download_lanes = DEFAULT_FILE_DOWNLOAD_LANES
+        if file_download_lanes is not None:
+            if isinstance(file_download_lanes, int) and file_download_lanes > 0:
+                self.file_download_lanes = file_download_lanes
+            else:
+                logger.error("Ignoring invalid file_download_lanes in config")
+
     @classmethod
     def from_home_dir(cls, sdc_home: str) -> "Config":
         full_path = os.path.join(sdc_home, Config.CONFIG_NAME)
@@ -24,7 +68,10 @@ class Config:
             json_config = {}
 
         return Config(
-            journalist_key_fingerprint=json_config.get("journalist_key_fingerprint", None)
+            journalist_key_fingerprint=json_config.get("journalist_key_fingerprint", None),
+            database_pragmas=json_config.get("database_pragmas", None),
+            decryption_workers=json_config.get("decryption_workers", None),
+            file_download_lanes=json_config.get("file_download_lanes", None),
         )
 
     @property
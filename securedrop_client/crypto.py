@@ -15,18 +15,27 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import json
 import logging
 import os
 import struct
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
+from typing import IO, BinaryIO, Dict, List, Optional, Set, Tuple, Union, cast
 
 from sqlalchemy.orm import scoped_session
 
 from securedrop_client.config import Config
 from securedrop_client.db import Source
-from securedrop_client.utils import safe_copy, safe_gzip_extract, safe_mkdir
+from securedrop_client.utils import (
+    GZIP_STREAM_CHUNK_SIZE,
+    check_path_traversal,
+    relative_filepath,
+    safe_gunzip_stream,
+    safe_mkdir,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,43 +49,82 @@ GZIP_FILE_IDENTIFICATION = b"\037\213"
 GZIP_FLAG_EXTRA_FIELDS = 4  # gzip.FEXTRA
 GZIP_FLAG_FILENAME = 8  # gzip.FNAME
 
+# Prefix of the lines written by gpg --status-fd
+GPG_STATUS_PREFIX = "[GNUPG:] "
 
-def read_gzip_header_filename(filename: str) -> str:
+# Largest plaintext, in bytes, that is decrypted into memory for a message or reply
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+
+def read_gzip_header(f: BinaryIO) -> str:
     """
-    Extract the original filename from the header of a gzipped file.
+    Read the header of a gzip stream, leaving f positioned at the start of the compressed data, and
+    return the original filename it contains, if any.
 
     Adapted from Python's gzip._GzipReader._read_gzip_header.
     """
     original_filename = ""
-    with open(filename, "rb") as f:
-        gzip_header_identification = f.read(2)
-        if gzip_header_identification != GZIP_FILE_IDENTIFICATION:
-            raise OSError("Not a gzipped file (%r)" % gzip_header_identification)
-
-        (gzip_header_compression_method, gzip_header_flags, _) = struct.unpack("<BBIxx", f.read(8))
-        if gzip_header_compression_method != 8:
-            raise OSError("Unknown compression method")
-
-        if gzip_header_flags & GZIP_FLAG_EXTRA_FIELDS:
-            (extra_len,) = struct.unpack("<H", f.read(2))
-            f.read(extra_len)
-
-        if gzip_header_flags & GZIP_FLAG_FILENAME:
-            fb = b""
-            while True:
-                s = f.read(1)
-                if not s or s == b"\000":
-                    break
-                fb += s
-            original_filename = str(fb, "utf-8")
+    gzip_header_identification = f.read(2)
+    if gzip_header_identification != GZIP_FILE_IDENTIFICATION:
+        raise OSError("Not a gzipped file (%r)" % gzip_header_identification)
+
+    (gzip_header_compression_method, gzip_header_flags, _) = struct.unpack("<BBIxx", f.read(8))
+    if gzip_header_compression_method != 8:
+        raise OSError("Unknown compression method")
+
+    if gzip_header_flags & GZIP_FLAG_EXTRA_FIELDS:
+        (extra_len,) = struct.unpack("<H", f.read(2))
+        f.read(extra_len)
+
+    if gzip_header_flags & GZIP_FLAG_FILENAME:
+        fb = b""
+        while True:
+            s = f.read(1)
+            if not s or s == b"\000":
+                break
+            fb += s
+        original_filename = str(fb, "utf-8")
 
     return original_filename
 
 
+def parse_status(status_output: bytes) -> List[Tuple[str, str]]:
+    """
+    Parse the machine-readable status output of a gpg command, written with --status-fd, into a
+    list of (keyword, arguments) tuples.
+    """
+    status = []
+    for line in status_output.decode(errors="replace").splitlines():
+        if line.startswith(GPG_STATUS_PREFIX):
+            keyword, _, args = line[len(GPG_STATUS_PREFIX) :].partition(" ")
+            status.append((keyword, args))
+    return status
+
+
+def parse_file_status(status_output: bytes) -> Dict[str, List[str]]:
+    """
+    Parse the machine-readable status output of a gpg command that processes several files, e.g.
+    --decrypt-files, into the status keywords reported for each file, keyed by filename.
+    """
+    status = {}  # type: Dict[str, List[str]]
+    current = None  # type: Optional[List[str]]
+    for keyword, args in parse_status(status_output):
+        if keyword == "FILE_START":
+            # FILE_START <what> <filename>
+            current = status.setdefault(args.split(" ", 1)[-1], [])
+        elif keyword == "FILE_DONE":
+            current = None
+        elif current is not None:
+            current.append(keyword)
+    return status
+
+
 class GpgHelper:
     # The extraction path should be the tempdir provided by the system
     EXTRACTION_PATH = str(Path(tempfile.gettempdir()))
 
+    IMPORTED_KEYS_FILENAME = "imported_keys.json"
+
     def __init__(self, sdc_home: str, session_maker: scoped_session, is_qubes: bool) -> None:
         """
         :param sdc_home: Home directory for the SecureDrop client
@@ -90,6 +138,12 @@ class GpgHelper:
         config = Config.from_home_dir(self.sdc_home)
         self.journalist_key_fingerprint = config.journalist_key_fingerprint
 
+        # Fingerprints of the source keys already imported into the keyring, persisted so that
+        # keys are not imported again before every reply, even after a restart
+        self.imported_keys_path = os.path.join(self.sdc_home, self.IMPORTED_KEYS_FILENAME)
+        self.imported_keys_lock = threading.Lock()
+        self.imported_keys = self._load_imported_keys()
+
     def decrypt_submission_or_reply(
         self, filepath: str, plaintext_filepath: str, is_doc: bool = False
     ) -> str:
@@ -98,34 +152,20 @@ class GpgHelper:
         plaintext contents to plaintext_filepath in /tmp. Otherwise, unzip and extract the document
         to the parent directory of plaintext_filepath. The document will be saved as the filename
         in the gzip header if it exists otherwise the plaintext_filepath name will be used.
+
+        The output of gpg is written straight to its destination, decompressing documents as they
+        are decrypted, rather than going through a temporary file first. If decryption fails, the
+        partially written document is removed.
         """
         original_filename = Path(Path(filepath).stem).stem  # Remove one or two suffixes
 
-        err = tempfile.NamedTemporaryFile(suffix=".message-error", delete=False)
-        with tempfile.NamedTemporaryFile(suffix=".message") as out:
-            cmd = self._gpg_cmd_base()
-            cmd.extend(["--decrypt", filepath])
-            res = subprocess.call(cmd, stdout=out, stderr=err)
-
-            if res != 0:
-                # The err tempfile was created with delete=False, so needs to
-                # be explicitly cleaned up. We will do that after we've read the file.
-                err.close()
-
-                with open(err.name) as e:
-                    msg = "GPG Error: {}".format(e.read())
-
-                os.unlink(err.name)
-
-                raise CryptoError(msg)
-
-            # Delete err file
-            err.close()
-            os.unlink(err.name)
-
-            # Delete encrypted file now that it's been successfully decrypted
-            os.unlink(filepath)
+        cmd = self._gpg_cmd_base()
+        cmd.extend(["--decrypt", filepath])
 
+        # The err tempfile was created with delete=False, so needs to be explicitly cleaned up. We
+        # will do that after we've read the file.
+        err = tempfile.NamedTemporaryFile(suffix=".message-error", delete=False)
+        try:
             # If is_doc is True, unzip and extract the document to the parent directory of filepath.
             # The document will be saved as the filename in the gzip header, which should contain
             # the name of the original file that was gzipped. If the name is not in the header, use
@@ -135,14 +175,174 @@ class GpgHelper:
             # in /tmp that will automatically be deleted after decryption because it is a named
             # temporary file.
             if is_doc:
-                original_filename = read_gzip_header_filename(out.name) or original_filename
-                safe_gzip_extract(out.name, filepath, original_filename, self.sdc_home)
+                original_filename = self._decrypt_and_extract(cmd, filepath, original_filename, err)
             else:
-                # plaintext_filepath is a NamedTemporaryFile in /tmp so the base_dir is /tmp
-                safe_copy(out.name, plaintext_filepath, self.EXTRACTION_PATH)
+                self._decrypt_to_file(cmd, plaintext_filepath, err)
+        finally:
+            err.close()
+            os.unlink(err.name)
+
+        # Delete encrypted file now that it's been successfully decrypted
+        os.unlink(filepath)
+
+        return original_filename
+
+    def decrypt_message_or_reply(self, filepath: str, max_size: int = MAX_MESSAGE_SIZE) -> str:
+        """
+        Decrypt the message or reply located at the given filepath and return its plaintext, read
+        straight from the output of gpg.
+
+        Raise CryptoError if decryption fails, or if the plaintext is longer than max_size bytes or
+        is not valid UTF-8.
+        """
+        cmd = self._gpg_cmd_base()
+        cmd.extend(["--decrypt", filepath])
+
+        # An anonymous temporary file, rather than a pipe, so gpg cannot block on writing to stderr
+        with tempfile.TemporaryFile() as err:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+            stdout = cast(BinaryIO, process.stdout)
+            try:
+                plaintext = stdout.read(max_size + 1)
+                if len(plaintext) > max_size:
+                    process.kill()
+            finally:
+                stdout.close()
+                res = process.wait()
+
+            if len(plaintext) > max_size:
+                raise CryptoError(f"Plaintext of {filepath} is larger than {max_size} bytes")
+
+            if res != 0:
+                err.seek(0)
+                raise CryptoError("GPG Error: {}".format(err.read().decode(errors="replace")))
+
+        try:
+            content = plaintext.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CryptoError(f"Plaintext of {filepath} is not valid UTF-8") from e
+
+        # Delete encrypted file now that it's been successfully decrypted
+        os.unlink(filepath)
+
+        return content
+
+    def decrypt_messages_or_replies(
+        self, filepaths: List[str], max_size: int = MAX_MESSAGE_SIZE
+    ) -> Dict[str, Union[str, CryptoError]]:
+        """
+        Decrypt the messages or replies located at the given filepaths with a single gpg process,
+        rather than one per item, and return the plaintext of each one, or the CryptoError it
+        failed with, keyed by filepath. Encrypted files are deleted once decrypted, as with
+        decrypt_message_or_reply.
+
+        gpg can only decrypt several files at once to files, so the plaintexts are written to a
+        private temporary directory that is removed before returning.
+        """
+        if self.is_qubes:  # pragma: no cover
+            # qubes-gpg-client does not support --decrypt-files
+            results = {}  # type: Dict[str, Union[str, CryptoError]]
+            for filepath in filepaths:
+                try:
+                    results[filepath] = self.decrypt_message_or_reply(filepath, max_size)
+                except CryptoError as e:
+                    results[filepath] = e
+            return results
+
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryFile() as err:
+            # gpg names each plaintext after its encrypted file, minus the extension, so link
+            # the encrypted files into tmpdir under names we control.
+            names = {}
+            for i, filepath in enumerate(filepaths):
+                names[f"{i}.gpg"] = filepath
+                os.symlink(os.path.abspath(filepath), os.path.join(tmpdir, f"{i}.gpg"))
+
+            cmd = self._gpg_cmd_base()
+            cmd.extend(["--batch", "--yes", "--status-fd", "1", "--decrypt-files"])
+            cmd.extend(names)
+            process = subprocess.run(cmd, cwd=tmpdir, stdout=subprocess.PIPE, stderr=err)
+            status = parse_file_status(process.stdout)
+
+            results = {}
+            for name, filepath in names.items():
+                plaintext_filepath = os.path.join(tmpdir, name[: -len(".gpg")])
+                try:
+                    results[filepath] = self._read_decrypted_file(
+                        filepath, plaintext_filepath, status.get(name, []), max_size
+                    )
+                except CryptoError as e:
+                    results[filepath] = e
+                else:
+                    os.unlink(filepath)
+
+        return results
+
+    def _read_decrypted_file(
+        self, filepath: str, plaintext_filepath: str, status: List[str], max_size: int
+    ) -> str:
+        """
+        Return the plaintext decrypted from filepath to plaintext_filepath, given the gpg status
+        keywords reported for it.
+        """
+        if "DECRYPTION_OKAY" not in status or "DECRYPTION_FAILED" in status:
+            raise CryptoError(f"GPG Error: could not decrypt {filepath}: {' '.join(status)}")
+
+        if os.path.getsize(plaintext_filepath) > max_size:
+            raise CryptoError(f"Plaintext of {filepath} is larger than {max_size} bytes")
+
+        with open(plaintext_filepath, "rb") as f:
+            plaintext = f.read()
+        try:
+            return plaintext.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CryptoError(f"Plaintext of {filepath} is not valid UTF-8") from e
+
+    def _decrypt_and_extract(
+        self, cmd: list, filepath: str, original_filename: str, err: IO[bytes]
+    ) -> str:
+        """
+        Run the gpg decryption command, decompressing its output as it is produced into the parent
+        directory of filepath, and return the original filename of the document.
+        """
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+        stdout = cast(BinaryIO, process.stdout)
+        extracted_filepath = None
+        try:
+            original_filename = read_gzip_header(stdout) or original_filename
+            extracted_filepath = safe_gunzip_stream(
+                stdout, filepath, original_filename, self.sdc_home
+            )
+        finally:
+            # Let gpg run to completion so that its exit status covers the whole file, and report a
+            # gpg error rather than the extraction error it caused.
+            while stdout.read(GZIP_STREAM_CHUNK_SIZE):
+                pass
+            stdout.close()
+            if process.wait() != 0:
+                if extracted_filepath:
+                    extracted_filepath.unlink()
+                raise self._gpg_error(err)
 
         return original_filename
 
+    def _decrypt_to_file(self, cmd: list, plaintext_filepath: str, err: IO[bytes]) -> None:
+        """
+        Run the gpg decryption command, writing its output to plaintext_filepath.
+        """
+        # plaintext_filepath is a NamedTemporaryFile in /tmp so the base_dir is /tmp
+        check_path_traversal(plaintext_filepath)
+        relative_filepath(plaintext_filepath, self.EXTRACTION_PATH)
+        with open(plaintext_filepath, "wb") as out:
+            Path(plaintext_filepath).chmod(0o600)
+            if subprocess.call(cmd, stdout=out, stderr=err) != 0:
+                out.truncate(0)
+                raise self._gpg_error(err)
+
+    def _gpg_error(self, err: IO[bytes]) -> CryptoError:
+        err.close()
+        with open(err.name) as e:
+            return CryptoError("GPG Error: {}".format(e.read()))
+
     def _gpg_cmd_base(self) -> list:
         if self.is_qubes:  # pragma: no cover
             cmd = ["qubes-gpg-client"]
@@ -152,6 +352,118 @@ class GpgHelper:
         cmd.extend(["--trust-model", "always"])
         return cmd
 
+    def _load_imported_keys(self) -> Set[str]:
+        try:
+            with open(self.imported_keys_path) as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.error("Could not read imported keys, they will be imported again: {}".format(e))
+            return set()
+
+    def _save_imported_keys(self) -> None:
+        """
+        When called imported_keys_lock should be held.
+        """
+        temp_path = self.imported_keys_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(sorted(self.imported_keys), f)
+        os.replace(temp_path, self.imported_keys_path)
+
+    def is_key_imported(self, fingerprint: str) -> bool:
+        """
+        Return whether the key with the given fingerprint has already been imported. A source whose
+        fingerprint changes is therefore imported again.
+        """
+        with self.imported_keys_lock:
+            return fingerprint.upper() in self.imported_keys
+
+    def _set_keys_imported(self, fingerprints: List[str], imported: bool = True) -> None:
+        with self.imported_keys_lock:
+            before = set(self.imported_keys)
+            for fingerprint in fingerprints:
+                if imported:
+                    self.imported_keys.add(fingerprint.upper())
+                else:
+                    self.imported_keys.discard(fingerprint.upper())
+            if self.imported_keys != before:
+                try:
+                    self._save_imported_keys()
+                except OSError as e:
+                    logger.error("Could not save imported keys: {}".format(e))
+
+    def import_new_keys(self, sources: List[Source]) -> None:
+        """
+        Import, in one go, the keys of the given sources that have not already been imported, so
+        that replying to them does not have to wait for an import.
+        """
+        new_sources = [
+            source
+            for source in sources
+            if source.fingerprint and not self.is_key_imported(source.fingerprint)
+        ]
+        if not new_sources:
+            return
+
+        logger.debug("Importing {} new source keys".format(len(new_sources)))
+        for uuid, error in self.import_keys(new_sources).items():
+            if error:
+                logger.debug("Could not import key for source {}: {}".format(uuid, error))
+
+    def import_keys(self, sources: List[Source]) -> Dict[str, Optional[CryptoError]]:
+        """
+        Import the GPG keys of the given sources with a single gpg process, rather than one per
+        source, and return None for each key that was imported, or the CryptoError for each one
+        that was not, keyed by source UUID.
+        """
+        results = {}  # type: Dict[str, Optional[CryptoError]]
+        if self.is_qubes:  # pragma: no cover
+            # qubes-gpg-import-key does not report the status of each key
+            for source in sources:
+                try:
+                    self.import_key(source)
+                    results[source.uuid] = None
+                except CryptoError as e:
+                    results[source.uuid] = e
+            return results
+
+        sources_with_keys = []
+        for source in sources:
+            if source.public_key and source.fingerprint:
+                sources_with_keys.append(source)
+            else:
+                results[source.uuid] = CryptoError(
+                    f"Could not import key: source {source.uuid} has no key"
+                )
+        if not sources_with_keys:
+            return results
+
+        with tempfile.NamedTemporaryFile("w+") as temp_key, tempfile.TemporaryFile() as stderr:
+            temp_key.write("\n".join(source.public_key for source in sources_with_keys))
+            temp_key.flush()
+            cmd = self._gpg_cmd_base()
+            cmd.extend(["--batch", "--status-fd", "1", "--import", temp_key.name])
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=stderr)
+
+        # IMPORT_OK <reason> <fingerprint>
+        imported = {
+            args.split()[-1].upper()
+            for keyword, args in parse_status(process.stdout)
+            if keyword == "IMPORT_OK"
+        }
+
+        for source in sources_with_keys:
+            if source.fingerprint.upper() in imported:
+                results[source.uuid] = None
+            else:
+                results[source.uuid] = CryptoError(f"Could not import key for source {source.uuid}")
+        self._set_keys_imported(
+            [source.fingerprint for source in sources_with_keys if results[source.uuid] is None]
+        )
+
+        return results
+
     def import_key(self, source: Source) -> None:
         """
         Imports a Source's GPG key.
@@ -160,6 +472,8 @@ class GpgHelper:
         if not source.public_key:
             raise CryptoError(f"Could not import key: source {source.uuid} has no key")
         self._import(source.public_key)
+        if source.fingerprint:
+            self._set_keys_imported([source.fingerprint])
 
     def _import(self, key_data: str) -> None:
         """Imports a key to the client GnuPG keyring."""
@@ -198,11 +512,29 @@ class GpgHelper:
         if not (source.fingerprint and source.public_key):
             raise CryptoError(f"Could not encrypt reply: no key for source {source_uuid}")
 
+        if not self.is_key_imported(source.fingerprint):
+            self._import_key_before_encrypting(source)
+            return self._encrypt(source, data)
+
+        try:
+            return self._encrypt(source, data)
+        except CryptoError:
+            # The keyring may have lost the key since it was imported, so import it again
+            logger.debug("Could not encrypt with previously imported key, importing it again")
+            self._set_keys_imported([source.fingerprint], imported=False)
+            self._import_key_before_encrypting(source)
+            return self._encrypt(source, data)
+
+    def _import_key_before_encrypting(self, source: Source) -> None:
         try:
             self.import_key(source)
         except CryptoError as e:
-            raise CryptoError("Could not import key before encrypting reply: {e}") from e
+            raise CryptoError(f"Could not import key before encrypting reply: {e}") from e
 
+    def _encrypt(self, source: Source, data: str) -> str:
+        """
+        Encrypt data to the source, whose key should have been imported, and the journalist.
+        """
         cmd = self._gpg_cmd_base()
 
         with tempfile.NamedTemporaryFile("w+") as content, tempfile.NamedTemporaryFile(
@@ -234,7 +566,7 @@ class GpgHelper:
             except subprocess.CalledProcessError as e:
                 stderr.seek(0)
                 err = stderr.read()
-                raise CryptoError(f"Could not encrypt to source {source_uuid}: {e}\n{err}")
+                raise CryptoError(f"Could not encrypt to source {source.uuid}: {e}\n{err}")
 
             stdout.seek(0)
             return stdout.read()
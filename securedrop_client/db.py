@@ -2,7 +2,7 @@ import datetime
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Union  # noqa: F401
+from typing import Any, Dict, List, Optional, Union  # noqa: F401
 from uuid import uuid4
 
 from sqlalchemy import (
@@ -11,12 +11,14 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     MetaData,
     String,
     Text,
     UniqueConstraint,
     create_engine,
+    event,
     text,
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -35,9 +37,66 @@ metadata = MetaData(naming_convention=convention)
 Base = declarative_base(metadata=metadata)  # type: Any
 
 
-def make_session_maker(home: str) -> scoped_session:
+# The SQLite settings applied to every new connection. The GUI and the sync, main queue and file
+# download threads all use the same database file: in WAL mode readers are not blocked by a writer
+# (and vice versa), and synchronous=NORMAL only syncs the WAL at checkpoints, which is safe against
+# corruption in that mode.
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # negative sizes are in KiB
+    "mmap_size": 64 * 1024 * 1024,
+    "busy_timeout": 5000,  # milliseconds
+}  # type: Dict[str, Union[int, str]]
+
+# The values SQLite accepts for the pragmas set by name, and the pragmas set to a number that
+# cannot be negative
+PRAGMA_NAMED_VALUES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"},
+}
+NON_NEGATIVE_PRAGMAS = {"mmap_size", "busy_timeout"}
+
+
+def is_valid_pragma(name: str, value: Union[int, str]) -> bool:
+    """
+    Return whether the pragma is one of DEFAULT_PRAGMAS, set to a value that SQLite accepts for it.
+    """
+    if name not in DEFAULT_PRAGMAS:
+        return False
+
+    if name in PRAGMA_NAMED_VALUES:
+        return str(value).upper() in PRAGMA_NAMED_VALUES[name]
+
+    if not isinstance(value, int) or isinstance(value, bool):
+        return False
+
+    return value >= 0 or name not in NON_NEGATIVE_PRAGMAS
+
+
+def make_session_maker(
+    home: str, pragmas: Optional[Dict[str, Union[int, str]]] = None
+) -> scoped_session:
+    """
+    Return a session maker for the client database in the home directory, whose connections are
+    configured with the given SQLite pragmas (DEFAULT_PRAGMAS if None).
+    """
     db_path = os.path.join(home, "svs.sqlite")
     engine = create_engine("sqlite:///{}".format(db_path))
+
+    statements = []
+    for name, value in (DEFAULT_PRAGMAS if pragmas is None else pragmas).items():
+        if not is_valid_pragma(name, value):
+            raise ValueError("Invalid SQLite pragma: {} = {}".format(name, value))
+        statements.append("PRAGMA {} = {}".format(name, value))
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
     if os.path.exists(db_path) and oct(os.stat(db_path).st_mode) != "0o100600":
         os.chmod(db_path, 0o600)
     maker = sessionmaker(bind=engine)
@@ -93,9 +152,38 @@ class DeletedUser(User):
         super().__init__(uuid=str(uuid4()), username="deleted")
 
 
+def _resolve_location(item: Any, data_dir: str) -> str:
+    """
+    Return the full path to the file of a File, Message or Reply.
+
+    Resolving a path makes filesystem calls, so the resolved path is kept on the item until the data
+    directory or the item's relative location change (e.g. when the source's designation changes).
+    """
+    relative_location = item.relative_location
+    cached = item.__dict__.get("_location")
+    if cached is not None and cached[0] == (data_dir, relative_location):
+        return cached[1]
+
+    location = str(Path(data_dir).joinpath(relative_location).resolve())
+    item._location = ((data_dir, relative_location), location)
+    return location
+
+
+def resolve_locations(data_dir: str, items: List[Any]) -> List[str]:
+    """
+    Return the full paths to the files of many Files, Messages or Replies, in the same order.
+
+    The data directory is resolved once and the relative locations of the items are joined to it,
+    since they are made of sanitized designations and filenames that have nothing to resolve.
+    """
+    root = Path(data_dir).resolve()
+    return [str(root.joinpath(item.relative_location)) for item in items]
+
+
 class Source(Base):
 
     __tablename__ = "sources"
+    __table_args__ = (Index("ix_sources_last_updated", "last_updated"),)
 
     id = Column(Integer, primary_key=True)
     uuid = Column(String(36), unique=True, nullable=False)
@@ -145,13 +233,32 @@ class Source(Base):
 
     @property
     def journalist_filename(self) -> str:
+        """
+        Return the name of the directory of the source's files, which is derived from the
+        journalist designation and kept until the designation changes.
+        """
+        cached = self.__dict__.get("_journalist_filename")
+        if cached is not None and cached[0] == self.journalist_designation:
+            return cached[1]
+
         valid_chars = "abcdefghijklmnopqrstuvwxyz1234567890-_"
-        return "".join(
+        journalist_filename = "".join(
             [c for c in self.journalist_designation.lower().replace(" ", "_") if c in valid_chars]
         )
+        self._journalist_filename = (self.journalist_designation, journalist_filename)
+        return journalist_filename
 
     @property
     def seen(self) -> bool:
+        """
+        A source is seen once all of its files and messages have been seen.
+
+        The summary of the source, which is loaded along with it, already counts its unseen items,
+        so that the seen state of every source is known without loading their collections.
+        """
+        if self.summary is not None:
+            return self.summary.unseen_count == 0
+
         for item in self.collection:
             if not item.seen:
                 return False
@@ -159,6 +266,44 @@ class Source(Base):
         return True
 
 
+class SourceSummary(Base):
+    """
+    Table that stores, for each source, what the source list shows about its conversation, so
+    that the list can be rendered without loading every source's collection.
+
+    It is kept up to date by the storage functions that change a source's files, messages and
+    replies, see storage.update_source_summaries().
+    """
+
+    __tablename__ = "source_summaries"
+
+    # No more of the preview is ever shown in the source list
+    MAX_PREVIEW_LENGTH = 200
+
+    source_id = Column(Integer, ForeignKey("sources.id"), primary_key=True)
+    source = relationship(
+        "Source",
+        backref=backref("summary", uselist=False, lazy="joined", cascade="delete"),
+    )
+
+    # The uuid of the latest file, message or reply of the source, if any
+    last_activity_uuid = Column(String(36))
+    preview = Column(Text)
+
+    # The number of files and messages that have not been seen by any journalist
+    unseen_count = Column(Integer, server_default=text("0"), nullable=False)
+
+    def __repr__(self) -> str:
+        return "<SourceSummary {}: {}>".format(self.source_id, self.last_activity_uuid)
+
+    @classmethod
+    def make_preview(cls, item: Any) -> str:
+        """
+        Return the first line of the string representation of a file, message or reply.
+        """
+        return str(item).strip().split("\n", 1)[0][: cls.MAX_PREVIEW_LENGTH]
+
+
 class DeletedConversation(Base):
     """
     Table that stores only source UUIDs for conversations (files and messages) that
@@ -204,6 +349,10 @@ class Message(Base):
     __tablename__ = "messages"
     __table_args__ = (
         UniqueConstraint("source_id", "file_counter", name="uq_messages_source_id_file_counter"),
+        # Used to find items that still need to be downloaded or decrypted, see
+        # storage.find_new_*()
+        Index("ix_messages_is_downloaded", "is_downloaded", "source_id"),
+        Index("ix_messages_is_decrypted", "is_decrypted", "source_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -274,17 +423,18 @@ class Message(Base):
     def __repr__(self) -> str:
         return "<Message {}: {}>".format(self.uuid, self.filename)
 
+    @property
+    def relative_location(self) -> Path:
+        """
+        Return the path to the Message's file, relative to the data directory.
+        """
+        return Path(self.source.journalist_filename, Path(self.filename).with_suffix(".txt"))
+
     def location(self, data_dir: str) -> str:
         """
         Return the full path to the Message's file.
         """
-        return str(
-            Path(data_dir)
-            .joinpath(
-                Path(self.source.journalist_filename, Path(self.filename).with_suffix(".txt"))
-            )
-            .resolve()
-        )
+        return _resolve_location(self, data_dir)
 
     @property
     def seen(self) -> bool:
@@ -294,7 +444,7 @@ class Message(Base):
         The `is_read` boolean is used in order to recognize messages that have been downloaded
         before SecureDrop 1.6.0 (before the seen-by feature).
         """
-        if self.seen_messages.count() or self.is_read:
+        if self.seen_messages or self.is_read:
             return True
 
         return False
@@ -325,6 +475,10 @@ class File(Base):
     __tablename__ = "files"
     __table_args__ = (
         UniqueConstraint("source_id", "file_counter", name="uq_messages_source_id_file_counter"),
+        # Used to find items that still need to be downloaded or decrypted, see
+        # storage.find_new_*()
+        Index("ix_files_is_downloaded", "is_downloaded", "source_id"),
+        Index("ix_files_is_decrypted", "is_decrypted", "source_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -387,21 +541,22 @@ class File(Base):
     def __repr__(self) -> str:
         return "<File {}>".format(self.uuid)
 
+    @property
+    def relative_location(self) -> Path:
+        """
+        Return the path to the File's file, relative to the data directory.
+        """
+        return Path(
+            self.source.journalist_filename,
+            "{}-{}-doc".format(self.file_counter, self.source.journalist_filename),
+            self.filename,
+        )
+
     def location(self, data_dir: str) -> str:
         """
         Return the full path to the File's file.
         """
-        return str(
-            Path(data_dir)
-            .joinpath(
-                Path(
-                    self.source.journalist_filename,
-                    "{}-{}-doc".format(self.file_counter, self.source.journalist_filename),
-                    self.filename,
-                )
-            )
-            .resolve()
-        )
+        return _resolve_location(self, data_dir)
 
     @property
     def seen(self) -> bool:
@@ -411,7 +566,7 @@ class File(Base):
         The `is_read` boolean is used in order to recognize files that have been downloaded before
         SecureDrop 1.6.0 (before the seen-by feature).
         """
-        if self.seen_files.count() or self.is_read:
+        if self.seen_files or self.is_read:
             return True
 
         return False
@@ -429,6 +584,10 @@ class Reply(Base):
     __tablename__ = "replies"
     __table_args__ = (
         UniqueConstraint("source_id", "file_counter", name="uq_messages_source_id_file_counter"),
+        # Used to find items that still need to be downloaded or decrypted, see
+        # storage.find_new_*()
+        Index("ix_replies_is_downloaded", "is_downloaded", "source_id"),
+        Index("ix_replies_is_decrypted", "is_decrypted", "source_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -497,17 +656,18 @@ class Reply(Base):
     def __repr__(self) -> str:
         return "<Reply {}: {}>".format(self.uuid, self.filename)
 
+    @property
+    def relative_location(self) -> Path:
+        """
+        Return the path to the Reply's file, relative to the data directory.
+        """
+        return Path(self.source.journalist_filename, Path(self.filename).with_suffix(".txt"))
+
     def location(self, data_dir: str) -> str:
         """
         Return the full path to the Reply's file.
         """
-        return str(
-            Path(data_dir)
-            .joinpath(
-                Path(self.source.journalist_filename, Path(self.filename).with_suffix(".txt"))
-            )
-            .resolve()
-        )
+        return _resolve_location(self, data_dir)
 
     @property
     def seen(self) -> bool:
@@ -673,7 +833,7 @@ class SeenFile(Base):
     id = Column(Integer, primary_key=True)
     file_id = Column(Integer, ForeignKey("files.id"), nullable=False)
     journalist_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    file = relationship("File", backref=backref("seen_files", lazy="dynamic", cascade="all,delete"))
+    file = relationship("File", backref=backref("seen_files", cascade="all,delete"))
     journalist = relationship("User", backref=backref("seen_files"))
 
 
@@ -683,9 +843,7 @@ class SeenMessage(Base):
     id = Column(Integer, primary_key=True)
     message_id = Column(Integer, ForeignKey("messages.id"), nullable=False)
     journalist_id = Column(Integer, ForeignKey("users.id"), nullable=True)
-    message = relationship(
-        "Message", backref=backref("seen_messages", lazy="dynamic", cascade="all,delete")
-    )
+    message = relationship("Message", backref=backref("seen_messages", cascade="all,delete"))
     journalist = relationship("User", backref=backref("seen_messages"))
 
 
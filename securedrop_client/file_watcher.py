@@ -0,0 +1,162 @@
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Set
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal, pyqtSlot
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from securedrop_client import storage
+from securedrop_client.db import File, resolve_locations
+
+logger = logging.getLogger(__name__)
+
+
+class FileWatcher(QObject):
+    """
+    FileWatcher watches the directories of the sources that have downloaded files, so that files
+    deleted from the data directory are marked as not downloaded when they disappear, instead of
+    by checking every downloaded file on every sync.
+
+    Only the directory of each source is watched, rather than each file, which is enough to notice
+    a conversation or a file being deleted along with its directory. Only the files of the
+    directories that changed are then checked.
+    """
+
+    file_missing = pyqtSignal(str, str, str)  # source uuid, file uuid, file name
+
+    # Wait for the deletions to settle, so that deleting a whole conversation causes a single update
+    DEBOUNCE_INTERVAL_MS = 500
+
+    def __init__(self, session: Session, data_dir: str) -> None:
+        super().__init__()
+        self.session = session
+        self.data_dir = data_dir
+
+        # Files that disappear while they are not watched can only be found by scanning the data
+        # directory, e.g. before the watcher is started or when the system limit of watches is hit.
+        self.is_watching_all_files = False
+
+        # The locations of the downloaded files, and the uuids of these files, by watched source
+        # directory
+        self.watched_directories = {}  # type: Dict[str, Dict[str, str]]
+        self.changed_directories = set()  # type: Set[str]
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.DEBOUNCE_INTERVAL_MS)
+        self.timer.timeout.connect(self.update_missing_files)
+
+    def start(self) -> None:
+        """
+        Mark the files that went missing while they were not watched, then watch the others.
+        """
+        self.is_watching_all_files = True
+        try:
+            missing_files = storage.update_missing_files(self.data_dir, self.session)
+        except SQLAlchemyError as e:
+            logger.debug("Could not update missing files: {}".format(e))
+            self.session.rollback()
+            self.is_watching_all_files = False
+            missing_files = []
+
+        self._emit_file_missing(missing_files)
+        self.watch(self.session.query(File).filter_by(is_downloaded=True).all())
+
+    def watch(self, files: List[File]) -> None:
+        """
+        Watch the files, which must have been downloaded.
+        """
+        root = str(Path(self.data_dir).resolve())
+        new_directories = []  # type: List[str]
+        for f, location in zip(files, resolve_locations(self.data_dir, files)):
+            directory = os.path.join(root, f.source.journalist_filename)
+            locations = self.watched_directories.get(directory)
+            if locations is None:
+                locations = self.watched_directories[directory] = {}
+                new_directories.append(directory)
+            locations[location] = f.uuid
+
+        if not new_directories:
+            return
+
+        unwatched_directories = self.watcher.addPaths(new_directories)
+        if unwatched_directories:
+            logger.warning("Could not watch {} directories".format(len(unwatched_directories)))
+            self.is_watching_all_files = False
+            for directory in unwatched_directories:
+                del self.watched_directories[directory]
+
+    def update_missing_files(self) -> None:
+        """
+        Mark the files that are missing from the directories that changed as not downloaded.
+        """
+        directories, self.changed_directories = self.changed_directories, set()
+        missing_locations = {}  # type: Dict[str, str]
+        for directory in directories:
+            for location, uuid in self.watched_directories.get(directory, {}).items():
+                if not os.path.exists(location):
+                    missing_locations[location] = uuid
+        if not missing_locations:
+            return
+
+        try:
+            missing_files = storage.mark_all_as_not_downloaded(
+                missing_locations.values(), self.session
+            )
+        except SQLAlchemyError as e:
+            # The files may be being deleted along with their conversation by the sync, so try
+            # again once it is done.
+            logger.debug("Could not update missing files: {}".format(e))
+            self.session.rollback()
+            self.changed_directories |= directories
+            self.timer.start()
+            return
+
+        for directory in directories:
+            locations = self.watched_directories.get(directory)
+            if locations is None:
+                continue
+            for location in missing_locations.keys() & locations.keys():
+                del locations[location]
+            # A deleted directory is no longer watched, and is watched again once a file is
+            # downloaded to it.
+            if not locations or not os.path.isdir(directory):
+                del self.watched_directories[directory]
+                self.watcher.removePath(directory)
+
+        self._emit_file_missing(missing_files)
+
+    def _emit_file_missing(self, missing_files: List[File]) -> None:
+        for f in missing_files:
+            self.file_missing.emit(f.source.uuid, f.uuid, str(f))
+
+    @pyqtSlot(str, str, str)
+    def on_file_ready(self, source_uuid: str, file_uuid: str, filename: str) -> None:
+        """
+        Watch a file once it has been downloaded.
+        """
+        try:
+            file = self.session.query(File).filter_by(uuid=file_uuid).one_or_none()
+        except SQLAlchemyError as e:
+            # The file can only be found missing by scanning the data directory
+            logger.debug("Could not watch file: {}".format(e))
+            self.session.rollback()
+            self.is_watching_all_files = False
+            return
+
+        if file is not None:
+            self.watch([file])
+
+    @pyqtSlot(str)
+    def _on_directory_changed(self, path: str) -> None:
+        """
+        A file or directory was added to or removed from a watched source directory, or the source
+        directory itself was removed.
+        """
+        self.changed_directories.add(path)
+        self.timer.start()
@@ -20,14 +20,28 @@ from __future__ import annotations
 
 import html
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from gettext import gettext as _
-from typing import Dict, List, Optional, Union  # noqa: F401
+from typing import Any, Dict, List, Optional, Set, Tuple, Union  # noqa: F401
 from uuid import uuid4
 
 import arrow
 import sqlalchemy.orm.exc
-from PyQt5.QtCore import QEvent, QObject, QSize, Qt, QTimer, pyqtBoundSignal, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRect,
+    QSize,
+    Qt,
+    QTimer,
+    pyqtBoundSignal,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt5.QtGui import (
     QBrush,
     QColor,
@@ -35,26 +49,32 @@ from PyQt5.QtGui import (
     QFocusEvent,
     QFont,
     QIcon,
+    QKeyEvent,
     QKeySequence,
     QLinearGradient,
     QMouseEvent,
+    QMovie,
+    QPainter,
     QPalette,
     QResizeEvent,
 )
 from PyQt5.QtWidgets import (
     QAction,
+    QApplication,
     QGridLayout,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMenu,
     QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QSizePolicy,
-    QSpacerItem,
     QStatusBar,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOption,
+    QStyleOptionViewItem,
     QToolButton,
     QVBoxLayout,
     QWidget,
@@ -79,13 +99,13 @@ from securedrop_client.gui.actions import (
     ExportConversationTranscriptAction,
     PrintConversationAction,
 )
-from securedrop_client.gui.base import SecureQLabel, SvgLabel, SvgPushButton, SvgToggleButton
+from securedrop_client.gui.base import SecureQLabel, SvgLabel, SvgPushButton
 from securedrop_client.gui.conversation import DeleteConversationDialog
 from securedrop_client.gui.source import DeleteSourceDialog
 from securedrop_client.logic import Controller
 from securedrop_client.resources import load_css, load_icon, load_image, load_movie
-from securedrop_client.storage import source_exists
-from securedrop_client.utils import humanize_filesize
+from securedrop_client.storage import get_source, load_source_collection
+from securedrop_client.utils import humanize_filesize, longest_increasing_subsequence
 
 logger = logging.getLogger(__name__)
 
@@ -626,12 +646,12 @@ class MainView(QWidget):
 
         # Create SourceList widget
         self.source_list = SourceList()
-        self.source_list.itemSelectionChanged.connect(self.on_source_changed)
         if app_state is not None:
             self.source_list.source_selection_changed.connect(
                 app_state.set_selected_conversation_for_source
             )
             self.source_list.source_selection_cleared.connect(app_state.clear_selected_conversation)
+        self.source_list.source_selection_changed.connect(self.on_source_changed)
 
         # Create widgets
         self.view_holder = QWidget()
@@ -658,9 +678,13 @@ class MainView(QWidget):
         self.controller = controller
         self.source_list.setup(controller)
 
-    def show_sources(self, sources: List[Source]) -> None:
+    def show_sources(
+        self, sources: List[Source], changed_source_uuids: Optional[Set[str]] = None
+    ) -> None:
         """
         Update the sources list in the GUI with the supplied list of sources.
+
+        If changed_source_uuids is supplied, only the listed sources are reloaded.
         """
         # If no sources are supplied, display the EmptyConversationView with the no-sources message.
         #
@@ -679,10 +703,10 @@ class MainView(QWidget):
 
         # If the source list in the GUI is empty, then we will run the optimized initial update.
         # Otherwise, do a regular source list update.
-        if not self.source_list.source_items:
+        if not self.source_list.count():
             self.source_list.initial_update(sources)
         else:
-            deleted_sources = self.source_list.update_sources(sources)
+            deleted_sources = self.source_list.update_sources(sources, changed_source_uuids)
             for source_uuid in deleted_sources:
                 # Then call the function to remove the wrapper and its children.
                 self.delete_conversation(source_uuid)
@@ -696,12 +720,13 @@ class MainView(QWidget):
             if not source:
                 return
 
-            self.controller.session.refresh(source)
+            load_source_collection(self.controller.session, source)
 
             # Immediately show the selected source as seen in the UI and then make a request to mark
             # source as seen.
             self.source_list.source_selected.emit(source.uuid)
             self.controller.mark_seen(source)
+            self.controller.api_sync.on_activity()
 
             # Get or create the SourceConversationWrapper
             if source.uuid in self.source_conversations:
@@ -731,7 +756,7 @@ class MainView(QWidget):
             source = self.source_list.get_selected_source()
             if not source:
                 return
-            self.controller.session.refresh(source)
+            load_source_collection(self.controller.session, source)
             self.controller.mark_seen(source)
             conversation_wrapper = self.source_conversations[source.uuid]
             conversation_wrapper.conversation_view.update_conversation(  # type: ignore [has-type]
@@ -858,36 +883,446 @@ class EmptyConversationView(QWidget):
         self.no_source_selected.show()
 
 
-class SourceListWidgetItem(QListWidgetItem):
-    def __lt__(self, other: "SourceListWidgetItem") -> bool:
+class SourceListRow:
+    """
+    What the source list shows for one source.
+
+    The source list keeps one of these small records per source and paints it on demand, rather
+    than keeping a tree of widgets per source, so that it can hold tens of thousands of sources.
+    """
+
+    # SecureQLabel.MAX_PREVIEW_LENGTH: no more of the preview text is ever shown
+    MAX_PREVIEW_LENGTH = 200
+
+    __slots__ = (
+        "uuid",
+        "designation",
+        "sort_key",
+        "timestamp",
+        "preview",
+        "last_activity_uuid",
+        "conversation_deleted",
+        "has_files",
+        "seen",
+        "is_starred",
+        "star_pending_count",
+        "star_wait_until_next_sync",
+        "deleting",
+        "deleting_conversation",
+        "deletion_scheduled_timestamp",
+    )
+
+    def __init__(self, uuid: str, last_updated: datetime, is_starred: bool) -> None:
+        self.uuid = uuid
+        self.designation = ""
+        self.sort_key = self.make_sort_key(arrow.get(last_updated))
+        self.timestamp = ""
+        self.preview = ""
+        self.last_activity_uuid: Optional[str] = None
+        self.conversation_deleted = False
+        self.has_files = False
+        self.seen = True
+        self.is_starred = is_starred
+        self.star_pending_count = 0
+        self.star_wait_until_next_sync = False
+        self.deleting = False
+        self.deleting_conversation = False
+        self.deletion_scheduled_timestamp: Optional[datetime] = None
+
+    @staticmethod
+    def make_sort_key(last_updated: arrow.Arrow) -> float:
         """
-        Used for ordering widgets by timestamp of last interaction.
+        Return the key that orders rows by the time of the last interaction with their source,
+        newest first, when sorted in ascending order.
         """
-        lw = self.listWidget()
-        me = lw.itemWidget(self)
-        them = lw.itemWidget(other)
-        if me and them:
-            assert isinstance(me, SourceWidget)
-            assert isinstance(them, SourceWidget)
-            my_ts = arrow.get(me.last_updated)
-            other_ts = arrow.get(them.last_updated)
-            return my_ts < other_ts
+        return -last_updated.float_timestamp
+
+    @property
+    def is_being_deleted(self) -> bool:
+        return self.deleting or self.deleting_conversation
+
+    def set_preview(self, text: str) -> None:
+        # Only the first line of the preview is shown.
+        self.preview = text.strip().split("\n", 1)[0][: self.MAX_PREVIEW_LENGTH]
+
+
+class SourceListModel(QAbstractListModel):
+    """
+    The rows of the source list, most recently updated source first.
+
+    The rows are kept in order of their sort keys as they are added and as their keys change, by
+    inserting or moving single rows, so the list never needs to be sorted again.
+    """
+
+    SourceUuidRole = Qt.UserRole + 1
+    RowRole = Qt.UserRole + 2
+    SortKeyRole = Qt.UserRole + 3
+    StarredRole = Qt.UserRole + 4
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+
+        self.rows: List[SourceListRow] = []
+        self.rows_by_uuid: Dict[str, SourceListRow] = {}
+
+        # The sort key of each row, in the same order as the rows, to find positions by bisection.
+        self._sort_keys: List[float] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row.designation
+        if role == self.SourceUuidRole:
+            return row.uuid
+        if role == self.RowRole:
+            return row
+        if role == self.SortKeyRole:
+            return row.sort_key
+        if role == self.StarredRole:
+            return row.is_starred
+        if role == Qt.AccessibleTextRole:
+            if row.is_starred:
+                return _("{}, starred").format(row.designation)
+            return _("{}, not starred").format(row.designation)
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if role != self.SortKeyRole or not index.isValid() or index.row() >= len(self.rows):
+            return False
+
+        self.set_sort_key(self.rows[index.row()], value)
         return True
 
+    def get_row(self, source_uuid: str) -> Optional[SourceListRow]:
+        return self.rows_by_uuid.get(source_uuid)
+
+    def _position(self, row: SourceListRow) -> int:
+        """
+        Return the position of a row of the model, looking among the rows with the same sort key.
+        """
+        position = bisect_left(self._sort_keys, row.sort_key)
+        while self.rows[position] is not row:
+            position += 1
+        return position
+
+    def index_for_uuid(self, source_uuid: str) -> QModelIndex:
+        row = self.rows_by_uuid.get(source_uuid)
+        if row is None:
+            return QModelIndex()
+        return self.index(self._position(row))
+
+    def add_rows(self, rows: List[SourceListRow]) -> None:
+        """
+        Insert each row after the rows with the same or a lower sort key.
+        """
+        for row in rows:
+            position = bisect_right(self._sort_keys, row.sort_key)
+            self.beginInsertRows(QModelIndex(), position, position)
+            self.rows.insert(position, row)
+            self._sort_keys.insert(position, row.sort_key)
+            self.rows_by_uuid[row.uuid] = row
+            self.endInsertRows()
+
+    def remove_row(self, source_uuid: str) -> None:
+        row = self.rows_by_uuid.get(source_uuid)
+        if row is None:
+            return
+
+        position = self._position(row)
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self.rows[position]
+        del self._sort_keys[position]
+        del self.rows_by_uuid[source_uuid]
+        self.endRemoveRows()
+
+    def set_sort_key(self, row: SourceListRow, sort_key: float) -> None:
+        """
+        Set the sort key of a row, moving the row to its new position if it is in the model.
+
+        Persistent indexes, such as the selection, follow the row to its new position.
+        """
+        if sort_key == row.sort_key:
+            return
+
+        if row.uuid not in self.rows_by_uuid:
+            row.sort_key = sort_key
+            return
+
+        old_position = self._position(row)
+        del self._sort_keys[old_position]
+        new_position = bisect_right(self._sort_keys, sort_key)
+        self._sort_keys.insert(new_position, sort_key)
+        row.sort_key = sort_key
+
+        if new_position == old_position:
+            return
+
+        # beginMoveRows takes the destination as a position in the rows before the move
+        destination = new_position + 1 if new_position > old_position else new_position
+        self.beginMoveRows(QModelIndex(), old_position, old_position, QModelIndex(), destination)
+        del self.rows[old_position]
+        self.rows.insert(new_position, row)
+        self.endMoveRows()
+
+    def row_changed(self, source_uuid: str) -> None:
+        index = self.index_for_uuid(source_uuid)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def all_rows_changed(self) -> None:
+        if self.rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1))
+
 
-class SourceList(QListWidget):
+class SourceListDelegate(QStyledItemDelegate):
+    """
+    Paints a row of the source list:
+
+    -------------------------------------------------------------------
+    | ------ | -------- | ------                   | -----------      |
+    | |star| | |spacer| | |name|                   | |paperclip|      |
+    | ------ | -------- | ------                   | -----------      |
+    -------------------------------------------------------------------
+    |        |          | ---------                | -----------      |
+    |        |          | |preview|                | |timestamp|      |
+    |        |          | ---------                | -----------      |
+    -------------------------------------------------------------------
+
+    While a source or its conversation is being deleted, an animation is shown in place of the
+    preview.
+
+    The fonts and colours of the text, and the border below each row, are set in stylesheets for
+    the object names and classes of the widgets a row used to be made of. They are read from hidden
+    widgets with those names and classes, so that the stylesheets still apply.
+    """
+
+    TOP_MARGIN = 11
+    BOTTOM_MARGIN = 7
+    SIDE_MARGIN = 10
+    SPACER = 14
+    BOTTOM_SPACER = 11
+    STAR_WIDTH = 20
+    STAR_ICON_SIZE = 16
+    NAME_HEIGHT = 20
+    PREVIEW_HEIGHT = 17
+    TIMESTAMP_WIDTH = 60
+    PAPERCLIP_SIZE = QSize(11, 17)
+    ROW_HEIGHT = TOP_MARGIN + NAME_HEIGHT + PREVIEW_HEIGHT + BOTTOM_MARGIN + BOTTOM_SPACER
+
+    SOURCE_NAME_CSS = load_css("source_name.css")
+    SOURCE_PREVIEW_CSS = load_css("source_preview.css")
+    SOURCE_TIMESTAMP_CSS = load_css("source_timestamp.css")
+
+    def __init__(self, deletion_animation: QMovie, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+
+        self.deletion_animation = deletion_animation
+
+        # The UUID of the source whose star is under the mouse, if it can be toggled.
+        self.hovered_star_uuid: Optional[str] = None
+
+        self.star_on = load_icon("star_on.svg")
+        self.star_off = load_icon("star_off.svg")
+        self.star_hover = load_icon("star_hover.svg")
+        self.paperclip = load_icon("paperclip.svg")
+        self.paperclip_disabled = load_icon("paperclip-disabled.svg")
+
+        # The border below each row is drawn by the style of this widget, which is a child of the
+        # source list so that the stylesheet of the window applies to it.
+        self.container = QWidget(parent)
+        self.container.setObjectName("SourceWidget_container")
+        self.container.hide()
+
+        # The font and colour of each object name and class, once read from a polished widget
+        self._text_styles: Dict[Tuple[str, str], Tuple[QFont, QColor]] = {}
+
+    def text_style(self, object_name: str, css_class: str, css: str) -> Tuple[QFont, QColor]:
+        """
+        Return the font and colour that the stylesheet gives a label with the supplied object name
+        and class.
+        """
+        key = (object_name, css_class)
+        if key not in self._text_styles:
+            label = QLabel()
+            label.setObjectName(object_name)
+            label.setProperty("class", css_class)
+            label.setStyleSheet(css)
+            label.ensurePolished()
+            self._text_styles[key] = (label.font(), label.palette().color(QPalette.Foreground))
+        return self._text_styles[key]
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def star_rect(self, rect: QRect) -> QRect:
+        """
+        Return the area of the star within the row drawn in the supplied rect.
+        """
+        return QRect(
+            rect.left() + self.SIDE_MARGIN,
+            rect.top() + self.TOP_MARGIN,
+            self.STAR_WIDTH,
+            self.STAR_WIDTH,
+        )
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        row = index.data(SourceListModel.RowRole)
+        if row is None:
+            return
+
+        # Let the style paint the background, so that the selected and hover states of the
+        # stylesheet apply.
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.text = ""
+        style = background.widget.style() if background.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, background, painter, background.widget)
+
+        painter.save()
+
+        selected = bool(option.state & QStyle.State_Selected)
+        rect = option.rect
+        left = rect.left() + self.SIDE_MARGIN
+        right = rect.right() - self.SIDE_MARGIN
+        top = rect.top() + self.TOP_MARGIN
+        bottom_line_top = top + self.NAME_HEIGHT
+        text_left = left + self.STAR_WIDTH + self.SPACER
+        column_left = right - self.TIMESTAMP_WIDTH + 1
+
+        star = self.star_icon(row)
+        if star:
+            star_rect = QRect(0, 0, self.STAR_ICON_SIZE, self.STAR_ICON_SIZE)
+            star_rect.moveCenter(self.star_rect(rect).center())
+            star.paint(painter, star_rect)
+
+        name_rect = QRect(text_left, top, column_left - text_left, self.NAME_HEIGHT)
+        self._draw_elided_text(painter, name_rect, row.designation, self.name_style(row, selected))
+
+        paperclip = self.paperclip_icon(row)
+        if paperclip:
+            paperclip.paint(painter, QRect(QPoint(column_left, top + 1), self.PAPERCLIP_SIZE))
+
+        preview_rect = QRect(
+            text_left, bottom_line_top, column_left - text_left - self.SPACER, self.PREVIEW_HEIGHT
+        )
+        if self.shows_deletion_indicator(row):
+            frame = self.deletion_animation.currentPixmap()
+            frame_top = preview_rect.top() + (preview_rect.height() - frame.height()) // 2
+            painter.drawPixmap(preview_rect.left(), frame_top, frame)
+        else:
+            self._draw_elided_text(painter, preview_rect, row.preview, self.preview_style(row))
+
+        timestamp_rect = QRect(
+            column_left, bottom_line_top, self.TIMESTAMP_WIDTH, self.PREVIEW_HEIGHT
+        )
+        self._draw_elided_text(painter, timestamp_rect, row.timestamp, self.timestamp_style(row))
+
+        painter.restore()
+
+        container = QStyleOption()
+        container.initFrom(self.container)
+        container.rect = QRect(left, rect.top(), right - left + 1, rect.height())
+        self.container.style().drawPrimitive(QStyle.PE_Widget, container, painter, self.container)
+
+    def star_icon(self, row: SourceListRow) -> Optional[QIcon]:
+        """
+        Return the star icon for the row, or None while the source is being deleted.
+        """
+        if row.deleting:
+            return None
+        if row.uuid == self.hovered_star_uuid:
+            return self.star_hover
+        return self.star_on if row.is_starred else self.star_off
+
+    def paperclip_icon(self, row: SourceListRow) -> Optional[QIcon]:
+        """
+        Return the paperclip icon for the row, disabled while the source or its conversation is
+        being deleted, or None if the source has no files.
+        """
+        if not row.has_files:
+            return None
+        return self.paperclip_disabled if row.is_being_deleted else self.paperclip
+
+    def shows_deletion_indicator(self, row: SourceListRow) -> bool:
+        """
+        Return whether the deletion animation is shown in place of the preview of the row.
+        """
+        return row.is_being_deleted
+
+    def name_selector(self, row: SourceListRow, selected: bool) -> Tuple[str, str]:
+        """
+        Return the object name and class that style the name of the row.
+        """
+        if not row.seen:
+            object_name = "SourceWidget_name_unread"
+        elif selected:
+            object_name = "SourceWidget_name_selected"
+        else:
+            object_name = "SourceWidget_name"
+        return object_name, "deleting" if row.deleting else ""
+
+    def preview_selector(self, row: SourceListRow) -> Tuple[str, str]:
+        """
+        Return the object name and class that style the preview of the row.
+        """
+        object_name = "SourceWidget_preview" if row.seen else "SourceWidget_preview_unread"
+        return object_name, "conversation_deleted" if row.conversation_deleted else ""
+
+    def timestamp_selector(self, row: SourceListRow) -> Tuple[str, str]:
+        """
+        Return the object name and class that style the timestamp of the row.
+        """
+        object_name = "SourceWidget_timestamp" if row.seen else "SourceWidget_timestamp_unread"
+        return object_name, "deleting" if row.deleting else ""
+
+    def name_style(self, row: SourceListRow, selected: bool) -> Tuple[QFont, QColor]:
+        return self.text_style(*self.name_selector(row, selected), self.SOURCE_NAME_CSS)
+
+    def preview_style(self, row: SourceListRow) -> Tuple[QFont, QColor]:
+        return self.text_style(*self.preview_selector(row), self.SOURCE_PREVIEW_CSS)
+
+    def timestamp_style(self, row: SourceListRow) -> Tuple[QFont, QColor]:
+        return self.text_style(*self.timestamp_selector(row), self.SOURCE_TIMESTAMP_CSS)
+
+    def _draw_elided_text(
+        self, painter: QPainter, rect: QRect, text: str, style: Tuple[QFont, QColor]
+    ) -> None:
+        """
+        Draw the text as plain text on a single line, eliding it if it does not fit.
+        """
+        font, color = style
+        painter.setFont(font)
+        painter.setPen(color)
+        elided_text = painter.fontMetrics().elidedText(text, Qt.ElideRight, rect.width())
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter | Qt.TextSingleLine, elided_text)
+
+
+class SourceList(QListView):
     """
     Displays the list of sources.
+
+    Each source is a row of a SourceListModel painted by a SourceListDelegate, so the cost of the
+    list in memory and when painting does not depend on how many sources there are.
+
+    A star is toggled by clicking it, or by pressing space once its source is selected.
     """
 
     source_selection_changed = pyqtSignal(state.SourceId)
     source_selection_cleared = pyqtSignal()
 
     NUM_SOURCES_TO_ADD_AT_A_TIME = 32
-    INITIAL_UPDATE_SCROLLBAR_WIDTH = 20
 
     source_selected = pyqtSignal(str)
-    adjust_preview = pyqtSignal(int)
+
+    CONVERSATION_DELETED_TEXT = _("\u2014 All files and messages deleted for this source \u2014")
 
     def __init__(self) -> None:
         super().__init__()
@@ -895,24 +1330,30 @@ class SourceList(QListWidget):
         self.setObjectName("SourceList")
         self.setUniformItemSizes(True)
 
-        # Set layout.
-        layout = QVBoxLayout(self)
-        self.setLayout(layout)
-
         # Disable horizontal scrollbar for SourceList widget
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
-        # Enable ordering.
-        self.setSortingEnabled(True)
+        self.source_model = SourceListModel(self)
+        self.setModel(self.source_model)
 
-        # To hold references to SourceListWidgetItem instances indexed by source UUID.
-        self.source_items: Dict[str, SourceListWidgetItem] = {}
+        # Shown in place of the preview of sources that are being deleted
+        self.deletion_animation = load_movie("loading-bar.gif")
+        self.deletion_animation.setScaledSize(QSize(200, 11))
+        self.deletion_animation.frameChanged.connect(self._on_deletion_animation_frame_changed)
 
-        self.itemSelectionChanged.connect(self._on_item_selection_changed)
+        self.source_delegate = SourceListDelegate(self.deletion_animation, self)
+        self.setItemDelegate(self.source_delegate)
 
-    def resizeEvent(self, event: QResizeEvent) -> None:
-        self.adjust_preview.emit(event.size().width())
-        super().resizeEvent(event)
+        # Track the mouse so that the star under it can be highlighted
+        self.setMouseTracking(True)
+        self.viewport().setCursor(QCursor(Qt.PointingHandCursor))
+
+        # When the most recent sync started, so that syncs which started before the deletion of a
+        # conversation was scheduled do not overwrite its rows.
+        self.sync_started_timestamp = datetime.utcnow()
+
+        self.selectionModel().selectionChanged.connect(self._on_item_selection_changed)
+        self.source_selected.connect(self._on_source_selected)
 
     def setup(self, controller: Controller) -> None:
         self.controller = controller
@@ -923,67 +1364,66 @@ class SourceList(QListWidget):
         self.controller.file_missing.connect(self.set_snippet)
         self.controller.message_download_failed.connect(self.set_snippet)
         self.controller.reply_download_failed.connect(self.set_snippet)
+        self.controller.sync_started.connect(self._on_sync_started)
+        self.controller.conversation_deleted.connect(self._on_conversation_deleted)
+        self.controller.conversation_deletion_successful.connect(
+            self._on_conversation_deletion_successful
+        )
+        self.controller.conversation_deletion_failed.connect(self._on_conversation_deletion_failed)
+        self.controller.source_deleted.connect(self._on_source_deleted)
+        self.controller.source_deletion_failed.connect(self._on_source_deletion_failed)
+        self.controller.authentication_state.connect(self._on_authentication_changed)
+        self.controller.star_update_failed.connect(self._on_star_update_failed)
+        self.controller.star_update_successful.connect(self._on_star_update_successful)
+
+    def count(self) -> int:
+        return self.source_model.rowCount()
 
-    def update_sources(self, sources: List[Source]) -> List[str]:
+    def update_sources(
+        self, sources: List[Source], changed_source_uuids: Optional[Set[str]] = None
+    ) -> List[str]:
         """
         Update the list with the passed in list of sources.
+
+        Rows are added for new sources and removed for sources that are no longer in the list. Of
+        the remaining rows, only those of sources in changed_source_uuids are reloaded, or all of
+        them if it is None.
         """
-        sources_to_update = []
-        sources_to_add = {}
+        sources_to_update = {}
+        sources_to_add = []
         for source in sources:
             try:
-                if source.uuid in self.source_items:
-                    sources_to_update.append(source.uuid)
+                if source.uuid in self.source_model.rows_by_uuid:
+                    sources_to_update[source.uuid] = source
                 else:
-                    sources_to_add[source.uuid] = source
+                    sources_to_add.append(source)
             except sqlalchemy.exc.InvalidRequestError as e:
                 logger.debug(e)
                 continue
 
-        # Delete widgets for sources not in the supplied sourcelist
-        deleted_uuids = []
-        sources_to_delete = [
-            self.source_items[uuid] for uuid in self.source_items if uuid not in sources_to_update
+        # Delete rows for sources not in the supplied sourcelist
+        deleted_uuids = [
+            uuid for uuid in self.source_model.rows_by_uuid if uuid not in sources_to_update
         ]
-        for source_item in sources_to_delete:
-            if source_item.isSelected():
-                self.setCurrentItem(None)
-
-            source_widget = self.itemWidget(source_item)
-            self.takeItem(self.row(source_item))
-            assert isinstance(source_widget, SourceWidget)
-            if source_widget.source_uuid in self.source_items:
-                del self.source_items[source_widget.source_uuid]
-
-            deleted_uuids.append(source_widget.source_uuid)
-            source_widget.deleteLater()
-
-        # Update the remaining widgets
-        for i in range(self.count()):
-            source_widget = self.itemWidget(self.item(i))
-
-            if not source_widget:
-                continue
-
-            assert isinstance(source_widget, SourceWidget)
-            source_widget.reload()
-
-        # Add widgets for new sources
-        for uuid in sources_to_add:
-            source_widget = SourceWidget(
-                self.controller, sources_to_add[uuid], self.source_selected, self.adjust_preview
-            )
-            source_item = SourceListWidgetItem(self)
-            source_item.setSizeHint(source_widget.sizeHint())
-            self.insertItem(0, source_item)
-            self.setItemWidget(source_item, source_widget)
-            self.source_items[uuid] = source_item
-            self.adjust_preview.emit(self.width() - self.INITIAL_UPDATE_SCROLLBAR_WIDTH)
+        for uuid in deleted_uuids:
+            if self.selectionModel().isSelected(self.source_model.index_for_uuid(uuid)):
+                self.setCurrentIndex(QModelIndex())
+            self.source_model.remove_row(uuid)
+
+        # Update the remaining rows
+        if changed_source_uuids is None:
+            for uuid, source in sources_to_update.items():
+                self.reload(self.source_model.rows_by_uuid[uuid], source)
+            self.source_model.all_rows_changed()
+        else:
+            for uuid in changed_source_uuids & sources_to_update.keys():
+                self.reload(self.source_model.rows_by_uuid[uuid], sources_to_update[uuid])
+                self.source_model.row_changed(uuid)
 
-        # Re-sort SourceList to make sure the most recently-updated sources appear at the top
-        self.sortItems(Qt.DescendingOrder)
+        # Add rows for new sources, in order of when their sources were last updated
+        self.source_model.add_rows(self._create_rows(sources_to_add))
 
-        # Return uuids of source widgets that were deleted so we can later delete the corresponding
+        # Return uuids of source rows that were deleted so we can later delete the corresponding
         # conversation widgets
         return deleted_uuids
 
@@ -1001,27 +1441,11 @@ class SourceList(QListWidget):
 
         def schedule_source_management(slice_size: int = slice_size) -> None:
             if not sources:
-                self.adjust_preview.emit(self.width() - self.INITIAL_UPDATE_SCROLLBAR_WIDTH)
                 return
 
             # Process the remaining "slice_size" number of sources.
             sources_slice = sources[:slice_size]
-            for source in sources_slice:
-                try:
-                    source_uuid = source.uuid
-                    source_widget = SourceWidget(
-                        self.controller, source, self.source_selected, self.adjust_preview
-                    )
-                    source_item = SourceListWidgetItem(self)
-                    source_item.setSizeHint(source_widget.sizeHint())
-                    self.insertItem(0, source_item)
-                    self.setItemWidget(source_item, source_widget)
-                    self.source_items[source_uuid] = source_item
-                except sqlalchemy.exc.InvalidRequestError as e:
-                    logger.debug(e)
-
-            # Re-sort SourceList to make sure the most recently-updated sources appear at the top
-            self.sortItems(Qt.DescendingOrder)
+            self.source_model.add_rows(self._create_rows(sources_slice))
 
             # ATTENTION! 32 is an arbitrary number arrived at via
             # experimentation. It adds plenty of sources, but doesn't block
@@ -1034,453 +1458,260 @@ class SourceList(QListWidget):
         # Qt event loop (thus unblocking the UI).
         QTimer.singleShot(1, schedule_source_management)
 
-    def get_selected_source(self) -> Optional[Source]:
-        if not self.selectedItems():
-            return None
-
-        source_item = self.selectedItems()[0]
-        source_widget = self.itemWidget(source_item)
-        assert isinstance(source_widget, SourceWidget)
-        if source_widget and source_exists(self.controller.session, source_widget.source_uuid):
-            return source_widget.source
-        return None  # pragma: nocover
-
-    def get_source_widget(self, source_uuid: str) -> Optional[SourceWidget]:
-        """
-        First try to get the source widget from the cache, then look for it in the SourceList.
-        """
-        try:
-            source_item = self.source_items[source_uuid]
-            source_widget = self.itemWidget(source_item)
-            assert isinstance(source_widget, SourceWidget)
-            return source_widget
-        except KeyError:
-            pass
-
-        for i in range(self.count()):
-            list_item = self.item(i)
-            source_widget = self.itemWidget(list_item)
-            assert isinstance(source_widget, SourceWidget)
-            if source_widget and source_widget.source_uuid == source_uuid:
-                return source_widget
+    def _create_rows(self, sources: List[Source]) -> List[SourceListRow]:
+        rows = []
+        for source in sources:
+            try:
+                row = SourceListRow(source.uuid, source.last_updated, source.is_starred)
+            except sqlalchemy.exc.InvalidRequestError as e:
+                logger.debug(e)
+                continue
 
-        return None
+            self.reload(row, source)
+            rows.append(row)
 
-    @pyqtSlot(str, str, str)
-    def set_snippet(self, source_uuid: str, collection_item_uuid: str, content: str) -> None:
-        """
-        Set the source widget's preview snippet with the supplied content.
+        return rows
 
-        Note: The signal's `collection_item_uuid` is not needed for setting the preview snippet. It
-        is used by other signal handlers.
+    def reload(self, row: SourceListRow, source: Source) -> None:
         """
-        source_widget = self.get_source_widget(source_uuid)
-        if source_widget:
-            source_widget.set_snippet(source_uuid, collection_item_uuid, content)
-
-    @pyqtSlot()
-    def _on_item_selection_changed(self) -> None:
-        source = self.get_selected_source()
-        if source is not None:
-            self.source_selection_changed.emit(state.SourceId(source.uuid))
-        else:
-            self.source_selection_cleared.emit()
-
-
-class SourcePreview(SecureQLabel):
-    PREVIEW_WIDTH_DIFFERENCE = 140
-
-    def __init__(self) -> None:
-        super().__init__()
+        Updates the row with the current values from the source.
 
-    def adjust_preview(self, width: int) -> None:
-        """
-        This is a workaround to the workaround for https://bugreports.qt.io/browse/QTBUG-85498.
-        Since QLabels containing text with long strings that cannot be wrapped have to have a fixed
-        width in order to fit within the scroll list widget, we have to override the normal resizing
-        logic.
+        The caller is responsible for telling the model that the row changed.
         """
-        new_width = width - self.PREVIEW_WIDTH_DIFFERENCE
-        if self.width() == new_width:
+        # If the account or conversation is being deleted, do not update the row
+        if row.is_being_deleted:
             return
 
-        self.setFixedWidth(new_width)
-        self.max_length = self.width()
-        self.refresh_preview_text()
-
-
-class ConversationDeletionIndicator(QWidget):
-    """
-    Shown when a source's conversation content is being deleted.
-    """
-
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.hide()
-
-        self.setObjectName("ConversationDeletionIndicator")
-
-        palette = QPalette()
-        palette.setBrush(QPalette.Background, QBrush(QColor("#9495b9")))
-        palette.setBrush(QPalette.Foreground, QBrush(QColor("#ffffff")))
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
-
-        deletion_message = QLabel(_("Deleting files and messages..."))
-        deletion_message.setWordWrap(False)
-
-        self.animation = load_movie("loading-cubes.gif")
-        self.animation.setScaledSize(QSize(50, 50))
-
-        spinner = QLabel()
-        spinner.setMovie(self.animation)
-
-        layout = QGridLayout()
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(0)
-        layout.addWidget(deletion_message, 0, 0, Qt.AlignRight | Qt.AlignVCenter)
-        layout.addWidget(spinner, 0, 1, Qt.AlignLeft | Qt.AlignVCenter)
-        layout.setColumnStretch(0, 9)
-        layout.setColumnStretch(1, 7)
-
-        self.setLayout(layout)
-
-    def start(self) -> None:
-        self.animation.start()
-        self.show()
-
-    def stop(self) -> None:
-        self.animation.stop()
-        self.hide()
-
-
-class SourceDeletionIndicator(QWidget):
-    """
-    Shown when a source is being deleted.
-    """
-
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.hide()
-
-        self.setObjectName("SourceDeletionIndicator")
-
-        palette = QPalette()
-        palette.setBrush(QPalette.Background, QBrush(QColor("#9495b9")))
-        palette.setBrush(QPalette.Foreground, QBrush(QColor("#ffffff")))
-        self.setPalette(palette)
-        self.setAutoFillBackground(True)
-
-        self.deletion_message = QLabel(_("Deleting source account..."))
-        self.deletion_message.setWordWrap(False)
-
-        self.animation = load_movie("loading-cubes.gif")
-        self.animation.setScaledSize(QSize(50, 50))
-
-        spinner = QLabel()
-        spinner.setMovie(self.animation)
-
-        layout = QGridLayout()
-        layout.setContentsMargins(20, 20, 20, 20)
-        layout.setSpacing(0)
-
-        layout.addWidget(self.deletion_message, 0, 0, Qt.AlignRight | Qt.AlignVCenter)
-        layout.addWidget(spinner, 0, 1, Qt.AlignLeft | Qt.AlignVCenter)
-        layout.setColumnStretch(0, 9)
-        layout.setColumnStretch(1, 7)
-
-        self.setLayout(layout)
-
-    def start(self) -> None:
-        self.animation.start()
-        self.show()
-
-    def stop(self) -> None:
-        self.animation.stop()
-        self.hide()
-
-
-class SourceWidgetDeletionIndicator(QLabel):
-    """
-    Shown in the source list when a source's conversation content is being deleted.
-    """
-
-    def __init__(self) -> None:
-        super().__init__()
-
-        self.hide()
-
-        self.setObjectName("SourceWidgetDeletionIndicator")
+        # If the sync started before the deletion finished, then the sync is stale and we do
+        # not want to update the row.
+        if (
+            row.deletion_scheduled_timestamp
+            and self.sync_started_timestamp < row.deletion_scheduled_timestamp
+        ):
+            return
 
-        self.animation = load_movie("loading-bar.gif")
-        self.animation.setScaledSize(QSize(200, 11))
+        try:
+            self.controller.session.refresh(source)
+            row.designation = source.journalist_designation
+            last_updated = arrow.get(source.last_updated)
+            row.timestamp = _(last_updated.format("MMM D"))
+            self.source_model.set_sort_key(row, SourceListRow.make_sort_key(last_updated))
+            row.has_files = source.document_count != 0
+            self._update_snippet(row, source)
+            self._update_star(row, source.is_starred)
 
-        self.setMovie(self.animation)
+            # When not authenticated we always show the source as having been seen
+            row.seen = (
+                not self.controller.is_authenticated
+                or source.summary is None
+                or source.summary.unseen_count == 0
+            )
+        except sqlalchemy.exc.InvalidRequestError as e:
+            logger.debug(f"Could not update SourceList row for source {row.uuid}: {e}")
 
-    def start(self) -> None:
-        self.animation.start()
-        self.show()
+    def _update_snippet(self, row: SourceListRow, source: Source) -> None:
+        # The preview comes from the source summary, so that the source's collection does not
+        # need to be loaded.
+        summary = source.summary
 
-    def stop(self) -> None:
-        self.animation.stop()
-        self.hide()
+        # If the source collection is empty yet the interaction_count is greater than zero, then we
+        # known that the conversation has been deleted.
+        if summary is None or summary.last_activity_uuid is None:
+            row.last_activity_uuid = None
+            if source.interaction_count > 0:
+                self._set_snippet_to_conversation_deleted(row)
+            return
 
+        row.last_activity_uuid = summary.last_activity_uuid
+        row.conversation_deleted = False
+        row.set_preview(summary.preview or "")
 
-class SourceWidget(QWidget):
-    """
-    Used to display summary information about a source in the list view.
-    """
+    def _set_snippet_to_conversation_deleted(self, row: SourceListRow) -> None:
+        row.conversation_deleted = True
+        row.preview = self.CONVERSATION_DELETED_TEXT
 
-    TOP_MARGIN = 11
-    BOTTOM_MARGIN = 7
-    SIDE_MARGIN = 10
-    SPACER = 14
-    BOTTOM_SPACER = 11
-    STAR_WIDTH = 20
-    TIMESTAMP_WIDTH = 60
+    def _update_star(self, row: SourceListRow, is_starred: bool) -> None:
+        """
+        If the star was updated via the Journalist Interface or by another instance of the client,
+        then the row will not match the server and will need to be updated.
+        """
+        if not self.controller.is_authenticated:
+            return
 
-    SOURCE_NAME_CSS = load_css("source_name.css")
-    SOURCE_PREVIEW_CSS = load_css("source_preview.css")
-    SOURCE_TIMESTAMP_CSS = load_css("source_timestamp.css")
+        # Wait until ongoing star jobs are finished before checking if it matches with the server
+        if row.star_pending_count > 0:
+            return
 
-    CONVERSATION_DELETED_TEXT = _("\u2014 All files and messages deleted for this source \u2014")
+        # Wait until next sync to avoid the possibility of updating the star with outdated source
+        # information in case the server just received the star request.
+        if row.star_wait_until_next_sync:
+            row.star_wait_until_next_sync = False
+            return
 
-    def __init__(
-        self,
-        controller: Controller,
-        source: Source,
-        source_selected_signal: pyqtBoundSignal,
-        adjust_preview: pyqtBoundSignal,
-    ):
-        super().__init__()
+        row.is_starred = is_starred
 
-        self.controller = controller
-        self.controller.sync_started.connect(self._on_sync_started)
-        self.controller.conversation_deleted.connect(self._on_conversation_deleted)
-        controller.conversation_deletion_successful.connect(
-            self._on_conversation_deletion_successful
-        )
-        self.controller.conversation_deletion_failed.connect(self._on_conversation_deletion_failed)
-        self.controller.source_deleted.connect(self._on_source_deleted)
-        self.controller.source_deletion_failed.connect(self._on_source_deletion_failed)
-        self.controller.authentication_state.connect(self._on_authentication_changed)
-        source_selected_signal.connect(self._on_source_selected)
-        adjust_preview.connect(self._on_adjust_preview)
-
-        self.source: Source = source
-        self.seen = self.source.seen
-        self.source_uuid: str = self.source.uuid
-        self.last_updated: sqlalchemy.DateTime = self.source.last_updated
-        self.selected = False
-        self.deletion_scheduled_timestamp = datetime.utcnow()
-        self.sync_started_timestamp = datetime.utcnow()
+    def toggle_star(self, source_uuid: str) -> None:
+        """
+        Tell the controller to make an API call to update the source's starred field.
+        """
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
 
-        self.deleting_conversation = False
-        self.deleting = False
+        # Show an error message when not authenticated
+        if not self.controller.is_authenticated:
+            self.controller.on_action_requiring_login()
+            return
 
-        self.setCursor(QCursor(Qt.PointingHandCursor))
+        self.controller.update_star(row.uuid, row.is_starred)
+        row.is_starred = not row.is_starred
+        row.star_pending_count += 1
+        row.star_wait_until_next_sync = True
+        self._set_hovered_star(None)
+        self.source_model.row_changed(row.uuid)
 
-        retain_space = self.sizePolicy()
-        retain_space.setRetainSizeWhenHidden(True)
-        self.star = StarToggleButton(self.controller, self.source_uuid, source.is_starred)
-        self.star.setSizePolicy(retain_space)
-        self.star.setFixedWidth(self.STAR_WIDTH)
-        self.name = QLabel()
-        self.name.setObjectName("SourceWidget_name")
-        self.preview = SourcePreview()
-        self.preview.setObjectName("SourceWidget_preview")
-        self.deletion_indicator = SourceWidgetDeletionIndicator()
-
-        self.paperclip = SvgLabel("paperclip.svg", QSize(11, 17))  # Set to size provided in the svg
-        self.paperclip.setObjectName("SourceWidget_paperclip")
-        self.paperclip.setFixedSize(QSize(11, 17))
-        self.paperclip.setSizePolicy(retain_space)
-
-        self.paperclip_disabled = SvgLabel("paperclip-disabled.svg", QSize(11, 17))
-        self.paperclip_disabled.setObjectName("SourceWidget_paperclip")
-        self.paperclip_disabled.setFixedSize(QSize(11, 17))
-        self.paperclip_disabled.setSizePolicy(retain_space)
-        self.paperclip_disabled.hide()
-
-        self.timestamp = QLabel()
-        self.timestamp.setSizePolicy(retain_space)
-        self.timestamp.setFixedWidth(self.TIMESTAMP_WIDTH)
-        self.timestamp.setObjectName("SourceWidget_timestamp")
-
-        # Create source_widget:
-        # -------------------------------------------------------------------
-        # | ------ | -------- | ------                   | -----------      |
-        # | |star| | |spacer| | |name|                   | |paperclip|      |
-        # | ------ | -------- | ------                   | -----------      |
-        # -------------------------------------------------------------------
-        # |        |          | ---------                | -----------      |
-        # |        |          | |preview|                | |timestamp|      |
-        # |        |          | ---------                | -----------      |
-        # ------------------------------------------- -----------------------
-        # Column 0, 1, and 3 are fixed. Column 2 stretches.
-        self.source_widget = QWidget()
-        self.source_widget.setObjectName("SourceWidget_container")
-        source_widget_layout = QGridLayout()
-        source_widget_layout.setSpacing(0)
-        source_widget_layout.setContentsMargins(0, self.TOP_MARGIN, 0, self.BOTTOM_MARGIN)
-        source_widget_layout.addWidget(self.star, 0, 0, 1, 1)
-        self.spacer = QWidget()
-        self.spacer.setFixedWidth(self.SPACER)
-        source_widget_layout.addWidget(self.spacer, 0, 1, 1, 1)
-        source_widget_layout.addWidget(self.name, 0, 2, 1, 1)
-        source_widget_layout.addWidget(self.paperclip, 0, 3, 1, 1)
-        source_widget_layout.addWidget(self.paperclip_disabled, 0, 3, 1, 1)
-        source_widget_layout.addWidget(self.preview, 1, 2, 1, 1, alignment=Qt.AlignLeft)
-        source_widget_layout.addWidget(self.deletion_indicator, 1, 2, 1, 1)
-        source_widget_layout.addWidget(self.timestamp, 1, 3, 1, 1)
-        source_widget_layout.addItem(QSpacerItem(self.BOTTOM_SPACER, self.BOTTOM_SPACER))
-        self.source_widget.setLayout(source_widget_layout)
-        layout = QHBoxLayout(self)
-        self.setLayout(layout)
-        layout.setContentsMargins(self.SIDE_MARGIN, 0, self.SIDE_MARGIN, 0)
-        layout.setSpacing(0)
-        layout.addWidget(self.source_widget)
+    def get_selected_source(self) -> Optional[Source]:
+        selected_indexes = self.selectionModel().selectedIndexes()
+        if not selected_indexes:
+            return None
 
-        self.reload()
+        source_uuid = selected_indexes[0].data(SourceListModel.SourceUuidRole)
+        return get_source(self.controller.session, source_uuid)
 
-    @pyqtSlot(int)
-    def _on_adjust_preview(self, width: int) -> None:
-        self.setFixedWidth(width)
-        self.preview.adjust_preview(width)
+    def get_source_row(self, source_uuid: str) -> Optional[SourceListRow]:
+        return self.source_model.get_row(source_uuid)
 
-    def reload(self) -> None:
+    @pyqtSlot(str, str, str)
+    def set_snippet(self, source_uuid: str, collection_item_uuid: str, content: str) -> None:
         """
-        Updates the displayed values with the current values from self.source.
+        Set the source's preview snippet to the supplied content, if the collection item is the
+        latest activity of the source.
         """
-        # If the account or conversation is being deleted, do not update the source widget
-        if self.deleting or self.deleting_conversation:
+        row = self.source_model.get_row(source_uuid)
+        if row is None or not content:
             return
 
-        # If the sync started before the deletion finished, then the sync is stale and we do
-        # not want to update the source widget.
-        if self.sync_started_timestamp < self.deletion_scheduled_timestamp:
+        # If the account or conversation is being deleted, do not update the row
+        if row.is_being_deleted:
             return
 
-        try:
-            self.controller.session.refresh(self.source)
-            self.last_updated = self.source.last_updated
-            self.timestamp.setText(_(arrow.get(self.source.last_updated).format("MMM D")))
-            self.name.setText(self.source.journalist_designation)
-
-            self.set_snippet(self.source_uuid)
+        if collection_item_uuid != row.last_activity_uuid:
+            return
 
-            if self.source.document_count == 0:
-                self.paperclip.hide()
-                self.paperclip_disabled.hide()
+        row.conversation_deleted = False
+        row.set_preview(content)
+        self.source_model.row_changed(source_uuid)
 
-            if not self.source.server_collection and self.source.interaction_count > 0:
-                self.preview.setProperty("class", "conversation_deleted")
-            else:
-                self.preview.setProperty("class", "")
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        """
+        Toggle the star of the selected source when space is pressed.
+        """
+        if event.key() == Qt.Key_Space and event.modifiers() == Qt.NoModifier:
+            index = self.currentIndex()
+            if index.isValid() and self.selectionModel().isSelected(index):
+                row = index.data(SourceListModel.RowRole)
+                if not row.deleting:  # The star is hidden while the source is being deleted
+                    self.toggle_star(row.uuid)
+                return
 
-            self.star.update(self.source.is_starred)
+        super().keyPressEvent(event)
 
-            self.end_deletion()
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """
+        Toggle the star under the mouse instead of selecting its source.
+        """
+        if event.button() == Qt.LeftButton:
+            row = self._star_row_at(event.pos())
+            if row is not None:
+                self.toggle_star(row.uuid)
+                return
 
-            if self.source.document_count == 0:
-                self.paperclip.hide()
-                self.paperclip_disabled.hide()
+        super().mousePressEvent(event)
 
-            self.star.update(self.source.is_starred)
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        row = self._star_row_at(event.pos()) if self.controller.is_authenticated else None
+        self._set_hovered_star(row.uuid if row else None)
+        super().mouseMoveEvent(event)
 
-            # When not authenticated we always show the source as having been seen
-            self.seen = True if not self.controller.is_authenticated else self.source.seen
-            self.update_styles()
-        except sqlalchemy.exc.InvalidRequestError as e:
-            logger.debug(f"Could not update SourceWidget for source {self.source_uuid}: {e}")
+    def viewportEvent(self, event: QEvent) -> bool:
+        if event.type() == QEvent.Leave:
+            self._set_hovered_star(None)
+        return super().viewportEvent(event)
 
-    @pyqtSlot(str, str, str)
-    def set_snippet(
-        self, source_uuid: str, collection_uuid: Optional[str] = None, content: Optional[str] = None
-    ) -> None:
+    def _star_row_at(self, position: QPoint) -> Optional[SourceListRow]:
         """
-        Update the preview snippet if the source_uuid matches our own.
+        Return the row whose star is at the supplied position in the viewport, if any.
         """
-        if source_uuid != self.source_uuid:
-            return
+        index = self.indexAt(position)
+        if not index.isValid():
+            return None
 
-        # If the account or conversation is being deleted, do not update the source widget
-        if self.deleting or self.deleting_conversation:
-            return
+        row = index.data(SourceListModel.RowRole)
+        if row.deleting:  # The star is hidden while the source is being deleted
+            return None
 
-        # If the source collection is empty yet the interaction_count is greater than zero, then we
-        # known that the conversation has been deleted.
-        if not self.source.server_collection:
-            if self.source.interaction_count > 0:
-                self.set_snippet_to_conversation_deleted()
-        else:
-            last_activity = self.source.server_collection[-1]
-            if collection_uuid and collection_uuid != last_activity.uuid:
-                return
+        if not self.source_delegate.star_rect(self.visualRect(index)).contains(position):
+            return None
 
-            self.preview.setProperty("class", "")
-            self.preview.setText(content) if content else self.preview.setText(str(last_activity))
-            self.preview.adjust_preview(self.width())
-            self.update_styles()
-
-    def set_snippet_to_conversation_deleted(self) -> None:
-        self.preview.setProperty("class", "conversation_deleted")
-        self.preview.setText(self.CONVERSATION_DELETED_TEXT)
-        self.preview.adjust_preview(self.width())
-        self.update_styles()
-
-    def update_styles(self) -> None:
-        if self.seen:
-            self.name.setStyleSheet("")
-            if self.selected:
-                self.name.setObjectName("SourceWidget_name_selected")
-            else:
-                self.name.setObjectName("SourceWidget_name")
-            self.name.setStyleSheet(self.SOURCE_NAME_CSS)
+        return row
+
+    def _set_hovered_star(self, source_uuid: Optional[str]) -> None:
+        previous_source_uuid = self.source_delegate.hovered_star_uuid
+        if source_uuid == previous_source_uuid:
+            return
 
-            self.timestamp.setStyleSheet("")
-            self.timestamp.setObjectName("SourceWidget_timestamp")
-            self.timestamp.setStyleSheet(self.SOURCE_TIMESTAMP_CSS)
+        self.source_delegate.hovered_star_uuid = source_uuid
+        for uuid in (previous_source_uuid, source_uuid):
+            if uuid:
+                self.source_model.row_changed(uuid)
 
-            self.preview.setStyleSheet("")
-            self.preview.setObjectName("SourceWidget_preview")
-            self.preview.setStyleSheet(self.SOURCE_PREVIEW_CSS)
+    def _update_deletion_animation(self) -> None:
+        if any(row.is_being_deleted for row in self.source_model.rows):
+            self.deletion_animation.start()
         else:
-            self.name.setStyleSheet("")
-            self.name.setObjectName("SourceWidget_name_unread")
-            self.name.setStyleSheet(self.SOURCE_NAME_CSS)
+            self.deletion_animation.stop()
 
-            self.timestamp.setStyleSheet("")
-            self.timestamp.setObjectName("SourceWidget_timestamp_unread")
-            self.timestamp.setStyleSheet(self.SOURCE_TIMESTAMP_CSS)
+    @pyqtSlot(int)
+    def _on_deletion_animation_frame_changed(self, frame_number: int) -> None:
+        self.viewport().update()
 
-            self.preview.setStyleSheet("")
-            self.preview.setObjectName("SourceWidget_preview_unread")
-            self.preview.setStyleSheet(self.SOURCE_PREVIEW_CSS)
+    @pyqtSlot()
+    def _on_item_selection_changed(self) -> None:
+        source = self.get_selected_source()
+        if source is not None:
+            self.source_selection_changed.emit(state.SourceId(source.uuid))
+        else:
+            self.source_selection_cleared.emit()
 
     @pyqtSlot(bool)
     def _on_authentication_changed(self, authenticated: bool) -> None:
         """
-        When the user logs out, show source as seen.
+        When the user logs out, show all sources as seen and stop highlighting stars, which can
+        no longer be toggled. When the user logs in, forget about star updates that will never
+        complete.
         """
+        for row in self.source_model.rows:
+            if authenticated:
+                row.star_pending_count = 0
+            else:
+                row.seen = True
+
         if not authenticated:
-            self.seen = True
-            self.update_styles()
+            self._set_hovered_star(None)
+
+        self.source_model.all_rows_changed()
 
     @pyqtSlot(str)
     def _on_source_selected(self, selected_source_uuid: str) -> None:
         """
-        Show selected widget as having been seen.
+        Show selected source as having been seen.
         """
-        if self.source_uuid == selected_source_uuid:
-            self.seen = True
-            self.selected = True
-            self.update_styles()
-        else:
-            self.selected = False
-            self.update_styles()
+        row = self.source_model.get_row(selected_source_uuid)
+        if row is None:
+            return
+
+        row.seen = True
+        self.source_model.row_changed(selected_source_uuid)
 
     @pyqtSlot(datetime)
     def _on_sync_started(self, timestamp: datetime) -> None:
@@ -1488,216 +1719,172 @@ class SourceWidget(QWidget):
 
     @pyqtSlot(str)
     def _on_conversation_deleted(self, source_uuid: str) -> None:
-        if self.source_uuid == source_uuid:
-            self.start_conversation_deletion()
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
+
+        row.deleting_conversation = True
+        self._update_deletion_animation()
+        self.source_model.row_changed(source_uuid)
 
     @pyqtSlot(str, datetime)
     def _on_conversation_deletion_successful(self, source_uuid: str, timestamp: datetime) -> None:
-        if self.source_uuid == source_uuid:
-            self.deletion_scheduled_timestamp = timestamp
-            self.set_snippet_to_conversation_deleted()
-            self.end_conversation_deletion()
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
+
+        row.deletion_scheduled_timestamp = timestamp
+        self._set_snippet_to_conversation_deleted(row)
+        row.deleting_conversation = False
+        self._update_deletion_animation()
+        self.source_model.row_changed(source_uuid)
 
     @pyqtSlot(str)
     def _on_conversation_deletion_failed(self, source_uuid: str) -> None:
-        if self.source_uuid == source_uuid:
-            self.end_conversation_deletion()
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
+
+        row.deleting_conversation = False
+        self._update_deletion_animation()
+        self.source_model.row_changed(source_uuid)
 
     @pyqtSlot(str)
     def _on_source_deleted(self, source_uuid: str) -> None:
-        if self.source_uuid == source_uuid:
-            self.start_account_deletion()
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
+
+        row.deleting = True
+        self._update_deletion_animation()
+        self.source_model.row_changed(source_uuid)
 
     @pyqtSlot(str)
     def _on_source_deletion_failed(self, source_uuid: str) -> None:
-        if self.source_uuid == source_uuid:
-            self.end_account_deletion()
-
-    def end_account_deletion(self) -> None:
-        self.end_deletion()
-        self.star.show()
-        self.name.setProperty("class", "")
-        self.timestamp.setProperty("class", "")
-        self.update_styles()
-        self.deleting = False
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
 
-    def end_conversation_deletion(self) -> None:
-        self.end_deletion()
-        self.deleting_conversation = False
+        row.deleting = False
+        self._update_deletion_animation()
+        self.source_model.row_changed(source_uuid)
 
-    def end_deletion(self) -> None:
-        self.deletion_indicator.stop()
-        self.update_styles()
-        self.preview.show()
-        self.timestamp.show()
-        self.paperclip_disabled.hide()
-        if self.source.document_count != 0:
-            self.paperclip.show()
+    @pyqtSlot(str, bool)
+    def _on_star_update_failed(self, source_uuid: str, is_starred: bool) -> None:
+        """
+        If the star update failed to update on the server, toggle back to previous state.
+        """
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
 
-    def start_account_deletion(self) -> None:
-        self.deleting = True
-        self.start_deletion()
-        self.name.setProperty("class", "deleting")
-        self.timestamp.setProperty("class", "deleting")
-        self.star.hide()
-        self.update_styles()
+        row.is_starred = is_starred
+        row.star_pending_count -= 1
+        self.source_model.row_changed(source_uuid)
 
-    def start_conversation_deletion(self) -> None:
-        self.deleting_conversation = True
-        self.start_deletion()
+    @pyqtSlot(str)
+    def _on_star_update_successful(self, source_uuid: str) -> None:
+        """
+        If the star update succeeded, decrement the pending count so the sync can update the star.
+        """
+        row = self.source_model.get_row(source_uuid)
+        if row is None:
+            return
 
-    def start_deletion(self) -> None:
-        self.preview.hide()
-        self.paperclip.hide()
-        if self.source.document_count != 0:
-            self.paperclip_disabled.show()
-        self.deletion_indicator.start()
+        row.star_pending_count -= 1
 
 
-class StarToggleButton(SvgToggleButton):
+class ConversationDeletionIndicator(QWidget):
     """
-    A button that shows whether or not a source is starred
+    Shown when a source's conversation content is being deleted.
     """
 
-    def __init__(self, controller: Controller, source_uuid: str, is_starred: bool) -> None:
-        super().__init__(on="star_on.svg", off="star_off.svg", svg_size=QSize(16, 16))
+    def __init__(self) -> None:
+        super().__init__()
 
-        self.controller = controller
-        self.source_uuid = source_uuid
-        self.is_starred = is_starred
-        self.pending_count = 0
-        self.wait_until_next_sync = False
+        self.hide()
+
+        self.setObjectName("ConversationDeletionIndicator")
 
-        self.controller.authentication_state.connect(self.on_authentication_changed)
-        self.controller.star_update_failed.connect(self.on_star_update_failed)
-        self.controller.star_update_successful.connect(self.on_star_update_successful)
-        self.installEventFilter(self)
+        palette = QPalette()
+        palette.setBrush(QPalette.Background, QBrush(QColor("#9495b9")))
+        palette.setBrush(QPalette.Foreground, QBrush(QColor("#ffffff")))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
 
-        self.setObjectName("StarToggleButton")
-        self.setFixedSize(QSize(20, 20))
+        deletion_message = QLabel(_("Deleting files and messages..."))
+        deletion_message.setWordWrap(False)
 
-        self.pressed.connect(self.on_pressed)
-        self.setCheckable(True)
-        self.setChecked(self.is_starred)
+        self.animation = load_movie("loading-cubes.gif")
+        self.animation.setScaledSize(QSize(50, 50))
 
-        if not self.controller.is_authenticated:
-            self.disable_toggle()
+        spinner = QLabel()
+        spinner.setMovie(self.animation)
 
-    def disable_toggle(self) -> None:
-        """
-        Unset `checkable` so that the star cannot be toggled.
+        layout = QGridLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(0)
+        layout.addWidget(deletion_message, 0, 0, Qt.AlignRight | Qt.AlignVCenter)
+        layout.addWidget(spinner, 0, 1, Qt.AlignLeft | Qt.AlignVCenter)
+        layout.setColumnStretch(0, 9)
+        layout.setColumnStretch(1, 7)
 
-        Disconnect the `pressed` signal from previous handler and connect it to the offline handler.
-        """
-        self.pressed.disconnect()
-        self.pressed.connect(self.on_pressed_offline)
+        self.setLayout(layout)
 
-        # If the source is starred, we must update the icon so that the off state continues to show
-        # the source as starred. We could instead disable the button, which will continue to show
-        # the star as checked, but Qt will also gray out the star, which we don't want.
-        if self.is_starred:
-            self.set_icon(on="star_on.svg", off="star_on.svg")
-        self.setCheckable(False)
+    def start(self) -> None:
+        self.animation.start()
+        self.show()
 
-    def enable_toggle(self) -> None:
-        """
-        Enable the widget.
+    def stop(self) -> None:
+        self.animation.stop()
+        self.hide()
 
-        Disconnect the pressed signal from previous handler, set checkable so that the star can be
-        toggled, and connect to the online toggle handler.
 
-        Note: We must update the icon in case it was modified after being disabled.
-        """
-        self.pressed.disconnect()
-        self.pressed.connect(self.on_pressed)
-        self.setCheckable(True)
-        self.set_icon(on="star_on.svg", off="star_off.svg")  # Undo icon change from disable_toggle
+class SourceDeletionIndicator(QWidget):
+    """
+    Shown when a source is being deleted.
+    """
 
-    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
-        """
-        If the button is checkable then we show a hover state.
-        """
-        if not self.isCheckable():
-            return QObject.event(obj, event)
+    def __init__(self) -> None:
+        super().__init__()
 
-        t = event.type()
-        if t == QEvent.HoverEnter:
-            self.setIcon(load_icon("star_hover.svg"))
-        elif t == QEvent.HoverLeave or t == QEvent.MouseButtonPress:
-            self.set_icon(on="star_on.svg", off="star_off.svg")
+        self.hide()
 
-        return QObject.event(obj, event)
+        self.setObjectName("SourceDeletionIndicator")
 
-    @pyqtSlot(bool)
-    def on_authentication_changed(self, authenticated: bool) -> None:
-        """
-        Set up handlers based on whether or not the user is authenticated. Connect to 'pressed'
-        event instead of 'toggled' event when not authenticated because toggling will be disabled.
-        """
-        if authenticated:
-            self.pending_count = 0
-            self.enable_toggle()
-            self.setChecked(self.is_starred)
-        else:
-            self.disable_toggle()
+        palette = QPalette()
+        palette.setBrush(QPalette.Background, QBrush(QColor("#9495b9")))
+        palette.setBrush(QPalette.Foreground, QBrush(QColor("#ffffff")))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
 
-    @pyqtSlot()
-    def on_pressed(self) -> None:
-        """
-        Tell the controller to make an API call to update the source's starred field.
-        """
-        self.controller.update_star(self.source_uuid, self.isChecked())
-        self.is_starred = not self.is_starred
-        self.pending_count = self.pending_count + 1
-        self.wait_until_next_sync = True
+        self.deletion_message = QLabel(_("Deleting source account..."))
+        self.deletion_message.setWordWrap(False)
 
-    @pyqtSlot()
-    def on_pressed_offline(self) -> None:
-        """
-        Show error message when not authenticated.
-        """
-        self.controller.on_action_requiring_login()
+        self.animation = load_movie("loading-cubes.gif")
+        self.animation.setScaledSize(QSize(50, 50))
 
-    @pyqtSlot(bool)
-    def update(self, is_starred: bool) -> None:
-        """
-        If star was updated via the Journalist Interface or by another instance of the client, then
-        self.is_starred will not match the server and will need to be updated.
-        """
-        if not self.controller.is_authenticated:
-            return
+        spinner = QLabel()
+        spinner.setMovie(self.animation)
 
-        # Wait until ongoing star jobs are finished before checking if it matches with the server
-        if self.pending_count > 0:
-            return
+        layout = QGridLayout()
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(0)
 
-        # Wait until next sync to avoid the possibility of updating the star with outdated source
-        # information in case the server just received the star request.
-        if self.wait_until_next_sync:
-            self.wait_until_next_sync = False
-            return
+        layout.addWidget(self.deletion_message, 0, 0, Qt.AlignRight | Qt.AlignVCenter)
+        layout.addWidget(spinner, 0, 1, Qt.AlignLeft | Qt.AlignVCenter)
+        layout.setColumnStretch(0, 9)
+        layout.setColumnStretch(1, 7)
 
-        if self.is_starred != is_starred:
-            self.is_starred = is_starred
-            self.setChecked(self.is_starred)
+        self.setLayout(layout)
 
-    @pyqtSlot(str, bool)
-    def on_star_update_failed(self, source_uuid: str, is_starred: bool) -> None:
-        """
-        If the star update failed to update on the server, toggle back to previous state.
-        """
-        if self.source_uuid == source_uuid:
-            self.is_starred = is_starred
-            self.pending_count = self.pending_count - 1
-            QTimer.singleShot(250, lambda: self.setChecked(self.is_starred))
+    def start(self) -> None:
+        self.animation.start()
+        self.show()
 
-    @pyqtSlot(str)
-    def on_star_update_successful(self, source_uuid: str) -> None:
-        """
-        If the star update succeeded, set pending to False so the sync can update the star field
-        """
-        if self.source_uuid == source_uuid:
-            self.pending_count = self.pending_count - 1
+    def stop(self) -> None:
+        self.animation.stop()
+        self.hide()
 
 
 class SenderIcon(QWidget):
@@ -2523,6 +2710,8 @@ class FileWidget(QWidget):
 
 class ConversationScrollArea(QScrollArea):
 
+    resized = pyqtSignal()
+
     MARGIN_BOTTOM = 28
     MARGIN_LEFT = 38
     MARGIN_RIGHT = 20
@@ -2565,6 +2754,8 @@ class ConversationScrollArea(QScrollArea):
         for widget in self.findChildren(SpeechBubble):
             widget.adjust_width(self.widget().width())
 
+        self.resized.emit()
+
     def add_widget_to_conversation(
         self, index: int, widget: QWidget, alignment_flag: Qt.AlignmentFlag
     ) -> None:
@@ -2663,6 +2854,12 @@ class ConversationView(QWidget):
 
     SCROLL_BAR_WIDTH = 15
 
+    # How many of the latest items of a conversation are rendered when it is opened, and how many
+    # earlier items are rendered each time the user scrolls close to the top or the rendered items
+    # do not fill the view, so that opening a long conversation does not create a widget for each
+    # of its items.
+    WINDOW_SIZE = 50
+
     def __init__(
         self,
         source_db_object: Source,
@@ -2682,6 +2879,15 @@ class ConversationView(QWidget):
         # To hold currently displayed messages.
         self.current_messages = {}  # type: Dict[str, Union[FileWidget, MessageWidget, ReplyWidget]]
 
+        # The latest items of the conversation are rendered, at least this many of them, along with
+        # any earlier items that are already rendered. The items before them are not rendered yet.
+        self.min_rendered_item_count = self.WINDOW_SIZE
+        self.unrendered_item_count = 0
+
+        # If set, the distance from the bottom of the conversation to keep the view scrolled to
+        # once the conversation's layout has been updated.
+        self.scroll_distance_from_bottom = None  # type: Optional[int]
+
         self.deletion_scheduled_timestamp = datetime.utcnow()
         self.sync_started_timestamp = datetime.utcnow()
 
@@ -2708,11 +2914,13 @@ class ConversationView(QWidget):
         # Completely unintuitive way to ensure the view remains scrolled to the bottom.
         sb = self._scroll.verticalScrollBar()
         sb.rangeChanged.connect(self.update_conversation_position)
+        sb.valueChanged.connect(self._on_scrolled)
+        self._scroll.resized.connect(self._fill_view)
 
         main_layout.addWidget(self._scroll)
 
         try:
-            self.update_conversation(self.source.collection)
+            self.update_conversation(load_source_collection(self.controller.session, self.source))
         except sqlalchemy.exc.InvalidRequestError as e:
             logger.debug("Error initializing ConversationView: %s", e)
 
@@ -2769,10 +2977,10 @@ class ConversationView(QWidget):
         conversation, this method does two things:
 
         * Checks if the conversation item already exists in the conversation.
-          If so, it checks that it's still in the same position. If it isn't,
-          the item is removed from its current position and re-added at the
-          new position. Then the index meta-data on the widget is updated to
-          reflect this change.
+          If so, it checks that it's still in the same position relative to the
+          other existing items. If it isn't, the item is removed from its
+          current position and re-added at the new position. Then the index
+          meta-data on the widget is updated to reflect this change.
         * If the item is a new item, this is created (as before) and inserted
           into the conversation at the correct index.
 
@@ -2780,70 +2988,170 @@ class ConversationView(QWidget):
         defines where they currently are. This is the attribute that's checked
         when the new conversation state (i.e. the collection argument) is
         passed into this method in case of a mismatch between where the widget
-        has been and now is in terms of its index in the conversation.
+        has been and now is in terms of its index in the conversation. Only the
+        widgets outside of the longest run of widgets that are still in order
+        are moved, so that inserting or deleting an item does not move all of the
+        widgets after it.
+
+        Only the items from the start of the rendered window onwards are rendered (see
+        _get_window_start), so the index of a widget is its position in the window.
+
+        The collection is expected to have been loaded by load_source_collection, along with
+        everything needed to render its items.
         """
-        self.controller.session.refresh(self.source)
+        window_start = self._get_window_start(collection)
+        self.unrendered_item_count = window_start
+        window = collection[window_start:]
+
+        # Open a conversation whose earliest items are not rendered at its latest items.
+        if window_start > 0 and not self.current_messages:
+            self.scroll_distance_from_bottom = 0
 
         # Keep a temporary copy of the current conversation so we can delete any
         # items corresponding to deleted items in the source collection.
         current_conversation = self.current_messages.copy()
 
-        for index, conversation_item in enumerate(collection):
-            item_widget = current_conversation.get(conversation_item.uuid)
+        # The uuids and widgets of the items that are still in the conversation, in the new order
+        # of their items. Those in the longest subsequence whose previous indexes are still in
+        # order stay where they are in the layout, and the others are moved.
+        existing_widgets = []
+        for conversation_item in window:
+            item_widget = current_conversation.pop(conversation_item.uuid, None)
             if item_widget:
-                # FIXME: Item types cannot be defines as (FileWidget, MessageWidget, ReplyWidget)
-                # because one test mocks MessageWidget.
-                assert isinstance(item_widget, (FileWidget, SpeechBubble))
-                current_conversation.pop(conversation_item.uuid)
-                if item_widget.index != index:
-                    # The existing widget is out of order.
-                    # Remove / re-add it and update index details.
+                existing_widgets.append((conversation_item.uuid, item_widget))
+        widgets_in_order = longest_increasing_subsequence([w.index for _, w in existing_widgets])
+        moved_uuids = {
+            uuid for i, (uuid, _) in enumerate(existing_widgets) if i not in widgets_in_order
+        }
+
+        # Update the layout in one go rather than after each widget is moved.
+        self._scroll.widget().setUpdatesEnabled(False)
+        try:
+            # If any items remain in current_conversation, they are no longer in the
+            # source collection and should be removed from both the layout and the conversation
+            # dict. Note that an item may be removed from the source collection if it is deleted
+            # by another user (a journalist using the Web UI is able to delete individual
+            # submissions).
+            for item_widget in current_conversation.values():
+                logger.debug("Deleting item: {}".format(item_widget.uuid))
+                self.current_messages.pop(item_widget.uuid)
+                item_widget.deleteLater()
+                self._scroll.remove_widget_from_conversation(item_widget)
+
+            for uuid, item_widget in existing_widgets:
+                if uuid in moved_uuids:
                     self._scroll.remove_widget_from_conversation(item_widget)
-                    item_widget.index = index
-                    if isinstance(item_widget, ReplyWidget):
-                        self._scroll.add_widget_to_conversation(index, item_widget, Qt.AlignRight)
-                    else:
-                        self._scroll.add_widget_to_conversation(index, item_widget, Qt.AlignLeft)
-                # Check if text in item has changed, then update the
-                # widget to reflect this change.
-                if not isinstance(item_widget, FileWidget):
-                    if (
-                        item_widget.message.text() != conversation_item.content
-                    ) and conversation_item.content:
-                        item_widget.message.setText(conversation_item.content)
-
-                    # If the item widget is not a FileWidget, retrieve the latest list of
-                    # usernames of the users who have seen it.
-                    item_widget.update_seen_by_list(conversation_item.seen_by_list)
-
-                # TODO: Once the SDK supports the new /users endpoint, this code can be replaced so
-                # that we can also update user accounts in the local db who have not sent replies.
-                if isinstance(item_widget, ReplyWidget):
-                    self.controller.session.refresh(conversation_item)
-                    self.controller.session.refresh(conversation_item.journalist)
-                    item_widget.sender = conversation_item.journalist
-            else:
-                # add a new item to be displayed.
-                if isinstance(conversation_item, Message):
-                    self.add_message(conversation_item, index)
-                elif isinstance(conversation_item, (DraftReply, Reply)):
-                    self.add_reply(conversation_item, conversation_item.journalist, index)
+
+            for index, conversation_item in enumerate(window):
+                item_widget = self.current_messages.get(conversation_item.uuid)
+                if item_widget:
+                    is_moved = conversation_item.uuid in moved_uuids
+                    self._update_item_widget(index, item_widget, conversation_item, is_moved)
                 else:
-                    self.add_file(conversation_item, index)
-
-        # If any items remain in current_conversation, they are no longer in the
-        # source collection and should be removed from both the layout and the conversation
-        # dict. Note that an item may be removed from the source collection if it is deleted
-        # by another user (a journalist using the Web UI is able to delete individual
-        # submissions).
-        for item_widget in current_conversation.values():
-            logger.debug("Deleting item: {}".format(item_widget.uuid))
-            self.current_messages.pop(item_widget.uuid)
-            item_widget.deleteLater()
-            self._scroll.remove_widget_from_conversation(item_widget)
+                    # add a new item to be displayed.
+                    if isinstance(conversation_item, Message):
+                        self.add_message(conversation_item, index)
+                    elif isinstance(conversation_item, (DraftReply, Reply)):
+                        self.add_reply(conversation_item, conversation_item.journalist, index)
+                    else:
+                        self.add_file(conversation_item, index)
+        finally:
+            self._scroll.widget().setUpdatesEnabled(True)
 
         self.update_deletion_markers()
         self.conversation_updated.emit()
+        self._fill_view()
+
+    def _update_item_widget(
+        self,
+        index: int,
+        item_widget: QWidget,
+        conversation_item: Union[DraftReply, File, Message, Reply],
+        is_moved: bool,
+    ) -> None:
+        """
+        Update the widget of an existing conversation item, re-adding it to the layout at the
+        given index if it was removed from the layout to be moved.
+        """
+        # FIXME: Item types cannot be defines as (FileWidget, MessageWidget, ReplyWidget)
+        # because one test mocks MessageWidget.
+        assert isinstance(item_widget, (FileWidget, SpeechBubble))
+        if is_moved:
+            # The existing widget was out of order. Re-add it.
+            if isinstance(item_widget, ReplyWidget):
+                self._scroll.add_widget_to_conversation(index, item_widget, Qt.AlignRight)
+            else:
+                self._scroll.add_widget_to_conversation(index, item_widget, Qt.AlignLeft)
+        item_widget.index = index
+
+        # Check if text in item has changed, then update the
+        # widget to reflect this change.
+        if not isinstance(item_widget, FileWidget):
+            if (
+                item_widget.message.text() != conversation_item.content
+            ) and conversation_item.content:
+                item_widget.message.setText(conversation_item.content)
+
+            # If the item widget is not a FileWidget, retrieve the latest list of
+            # usernames of the users who have seen it.
+            item_widget.update_seen_by_list(conversation_item.seen_by_list)
+
+        # TODO: Once the SDK supports the new /users endpoint, this code can be replaced so
+        # that we can also update user accounts in the local db who have not sent replies.
+        if isinstance(item_widget, ReplyWidget):
+            item_widget.sender = conversation_item.journalist
+
+    def _get_window_start(self, collection: list) -> int:
+        """
+        Return the index in the collection of the first item to render: the earliest item that is
+        already rendered, unless fewer than min_rendered_item_count items would be rendered.
+        """
+        window_start = max(0, len(collection) - self.min_rendered_item_count)
+        for index, conversation_item in enumerate(collection[:window_start]):
+            if conversation_item.uuid in self.current_messages:
+                return index
+
+        return window_start
+
+    def render_earlier_items(self) -> None:
+        """
+        Render the next WINDOW_SIZE items before the ones that are already rendered, without moving
+        the items in view.
+        """
+        if not self.unrendered_item_count:
+            return
+
+        scroll_bar = self._scroll.verticalScrollBar()
+        self.scroll_distance_from_bottom = scroll_bar.maximum() - scroll_bar.value()
+        self.min_rendered_item_count = len(self.current_messages) + self.WINDOW_SIZE
+        try:
+            self.update_conversation(load_source_collection(self.controller.session, self.source))
+        except sqlalchemy.exc.InvalidRequestError as e:
+            logger.debug(f"Could not render earlier conversation items: {e}")
+
+    @pyqtSlot()
+    def _fill_view(self) -> None:
+        """
+        Render earlier items while the rendered items do not fill the view, since the view cannot
+        be scrolled up to them until they do.
+        """
+        if not self.unrendered_item_count or not self._scroll.isVisible():
+            return
+
+        if self._scroll.widget().sizeHint().height() <= self._scroll.viewport().height():
+            self.render_earlier_items()
+
+    @pyqtSlot(int)
+    def _on_scrolled(self, value: int) -> None:
+        """
+        Render earlier items once the user scrolls to within a page of the top of the rendered
+        items, unless the view is waiting to be scrolled back into place.
+        """
+        if self.scroll_distance_from_bottom is not None:
+            return
+
+        if value <= self._scroll.verticalScrollBar().pageStep():
+            self.render_earlier_items()
 
     def add_file(self, file: File, index: int) -> None:
         """
@@ -2867,8 +3175,13 @@ class ConversationView(QWidget):
         """
         Handler called when a new item is added to the conversation. Ensures
         it's scrolled to the bottom and thus visible.
+
+        When earlier items have been rendered above the items in view, keeps those in view instead.
         """
-        if self.reply_flag and max_val > 0:
+        if self.scroll_distance_from_bottom is not None and max_val > 0:
+            self._scroll.verticalScrollBar().setValue(max_val - self.scroll_distance_from_bottom)
+            self.scroll_distance_from_bottom = None
+        elif self.reply_flag and max_val > 0:
             self._scroll.verticalScrollBar().setValue(max_val)
             self.reply_flag = False
 
@@ -2946,8 +3259,9 @@ class ConversationView(QWidget):
         self.reply_flag = True
         if source_uuid == self.source.uuid:
             try:
-                self.controller.session.refresh(self.source)
-                self.update_conversation(self.source.collection)
+                self.update_conversation(
+                    load_source_collection(self.controller.session, self.source)
+                )
             except sqlalchemy.exc.InvalidRequestError as e:
                 logger.debug(e)
 
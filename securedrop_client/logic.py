@@ -24,7 +24,7 @@ import uuid
 from datetime import datetime
 from gettext import gettext as _
 from gettext import ngettext
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Set, Type, Union
 
 import arrow
 import sdclientapi
@@ -36,6 +36,7 @@ from sqlalchemy.orm.session import sessionmaker
 from securedrop_client import db, state, storage
 from securedrop_client.api_jobs.base import ApiInaccessibleError
 from securedrop_client.api_jobs.downloads import (
+    DecryptionPool,
     DownloadChecksumMismatchException,
     DownloadDecryptionException,
     DownloadException,
@@ -60,7 +61,9 @@ from securedrop_client.api_jobs.uploads import (
     SendReplyJobError,
     SendReplyJobTimeoutError,
 )
+from securedrop_client.config import DEFAULT_DECRYPTION_WORKERS
 from securedrop_client.crypto import GpgHelper
+from securedrop_client.file_watcher import FileWatcher
 from securedrop_client.queue import ApiJobQueue
 from securedrop_client.sync import ApiSync
 from securedrop_client.utils import check_dir_permissions
@@ -323,6 +326,8 @@ class Controller(QObject):
         sync_thread: Optional[QThread] = None,
         main_queue_thread: Optional[QThread] = None,
         file_download_queue_thread: Optional[QThread] = None,
+        decryption_workers: int = DEFAULT_DECRYPTION_WORKERS,
+        additional_file_download_queue_threads: Optional[List[QThread]] = None,
     ) -> None:
         """
         The hostname, gui and session objects are used to coordinate with the
@@ -380,7 +385,11 @@ class Controller(QObject):
 
         # Queue that handles running API job
         self.api_job_queue = ApiJobQueue(
-            self.api, self.session_maker, self.main_queue_thread, self.file_download_queue_thread
+            self.api,
+            self.session_maker,
+            self.main_queue_thread,
+            self.file_download_queue_thread,
+            additional_file_download_queue_threads,
         )
         self.api_job_queue.cleared.connect(self.on_queue_cleared)
         self.api_job_queue.paused.connect(self.on_queue_paused)
@@ -392,9 +401,18 @@ class Controller(QObject):
 
         self.gpg = GpgHelper(home, self.session_maker, proxy)
 
+        # Messages and replies are decrypted concurrently once downloaded
+        self.decryption_workers = decryption_workers
+        self.decryption_pool = DecryptionPool(self.session_maker, self.decryption_workers)
+
         # File data.
         self.data_dir = os.path.join(self.home, "data")
 
+        # Downloaded files that are deleted from the data directory are marked as not downloaded
+        self.file_watcher = FileWatcher(self.session, self.data_dir)
+        self.file_watcher.file_missing.connect(self.file_missing)
+        self.file_ready.connect(self.file_watcher.on_file_ready)
+
         # Background sync to keep client up-to-date with server changes
         self.api_sync = ApiSync(
             self.api, self.session_maker, self.gpg, self.data_dir, self.sync_thread, state
@@ -455,6 +473,7 @@ class Controller(QObject):
         self.gui.setup(self)
 
         storage.clear_download_errors(self.session)
+        self.file_watcher.start()
 
     def call_api(  # type: ignore [no-untyped-def]
         self,
@@ -637,13 +656,14 @@ class Controller(QObject):
     def on_sync_started(self) -> None:
         self.sync_started.emit(datetime.utcnow())
 
-    def on_sync_success(self) -> None:
+    def on_sync_success(self, changed_source_uuids: Optional[Set[str]] = None) -> None:
         """
         Called when synchronization of data via the API queue succeeds.
 
             * Set last sync flag
+            * Update the sources that changed, or all of them if changed_source_uuids is None
             * Download new messages and replies
-            * Update missing files so that they can be re-downloaded
+            * Update missing files so that they can be re-downloaded, if some could not be watched
             * Update authenticated user if name changed
             * Resume queues if they were paused because of a network error since syncing was
               successful
@@ -652,10 +672,13 @@ class Controller(QObject):
             f.write(arrow.now().format())
         self.show_last_sync()
 
-        missing_files = storage.update_missing_files(self.data_dir, self.session)
-        for missed_file in missing_files:
-            self.file_missing.emit(missed_file.source.uuid, missed_file.uuid, str(missed_file))
-        self.update_sources()
+        # Missing files are found as they disappear, unless some of them could not be watched
+        if not self.file_watcher.is_watching_all_files:
+            missing_files = storage.update_missing_files(self.data_dir, self.session)
+            for missed_file in missing_files:
+                self.file_missing.emit(missed_file.source.uuid, missed_file.uuid, str(missed_file))
+        if changed_source_uuids is None or changed_source_uuids:
+            self.update_sources(changed_source_uuids)
         self.gui.refresh_current_source_conversation()
         self.download_new_messages()
         self.download_new_replies()
@@ -709,12 +732,15 @@ class Controller(QObject):
         """
         self.gui.show_last_sync(self.get_last_sync())
 
-    def update_sources(self) -> None:
+    def update_sources(self, changed_source_uuids: Optional[Set[str]] = None) -> None:
         """
         Display the updated list of sources with those found in local storage.
+
+        If changed_source_uuids is supplied, only the sources with those UUIDs have changed since
+        the list was last updated, apart from sources that have been added or deleted.
         """
         sources = list(storage.get_local_sources(self.session))
-        self.gui.show_sources(sources)
+        self.gui.show_sources(sources, changed_source_uuids)
 
     def mark_seen(self, source: db.Source) -> None:
         """
@@ -791,8 +817,8 @@ class Controller(QObject):
     def logout(self) -> None:
         """
         If the token is not already invalid, make an api call to logout and invalidate the token.
-        Then mark all pending draft replies as failed, stop the queues, and show the user as logged
-        out in the GUI.
+        Then mark all pending draft replies as failed, stop the queues and the decryption of
+        downloaded items, and show the user as logged out in the GUI.
         """
 
         # clear error status in case queue was paused resulting in a permanent error message
@@ -805,10 +831,22 @@ class Controller(QObject):
 
         self.api_sync.stop()
         self.api_job_queue.stop()
+
+        # A pool cannot be started again once shut down, and the jobs that are still running keep
+        # a reference to it, so the next login gets a new one.
+        self.decryption_pool.shutdown()
+        self.decryption_pool = DecryptionPool(self.session_maker, self.decryption_workers)
+
         self.gui.logout()
 
         self.is_authenticated = False
 
+    def shutdown(self) -> None:
+        """
+        Stop decrypting downloaded messages and replies before the application exits.
+        """
+        self.decryption_pool.shutdown()
+
     def invalidate_token(self) -> None:
         self.api = None
         self.authenticated_user = None
@@ -827,12 +865,12 @@ class Controller(QObject):
 
         if object_type == db.Reply:
             job = ReplyDownloadJob(
-                uuid, self.data_dir, self.gpg
+                uuid, self.data_dir, self.gpg, self.decryption_pool
             )  # type: Union[ReplyDownloadJob, MessageDownloadJob, FileDownloadJob]
             job.success_signal.connect(self.on_reply_download_success)
             job.failure_signal.connect(self.on_reply_download_failure)
         elif object_type == db.Message:
-            job = MessageDownloadJob(uuid, self.data_dir, self.gpg)
+            job = MessageDownloadJob(uuid, self.data_dir, self.gpg, self.decryption_pool)
             job.success_signal.connect(self.on_message_download_success)
             job.failure_signal.connect(self.on_message_download_failure)
         elif object_type == db.File:
@@ -1118,6 +1156,7 @@ class Controller(QObject):
 
     def on_reply_success(self, reply_uuid: str) -> None:
         logger.info(f"{reply_uuid} sent successfully")
+        self.api_sync.on_activity()
         self.session.commit()
         reply = storage.get_reply(self.session, reply_uuid)
         self.reply_succeeded.emit(reply.source.uuid, reply_uuid, reply.content)
@@ -2,7 +2,7 @@ import itertools
 import logging
 import threading
 from queue import PriorityQueue
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from PyQt5.QtCore import QObject, QThread, pyqtBoundSignal, pyqtSignal, pyqtSlot
 from sdclientapi import API, RequestTimeoutError, ServerConnectionError
@@ -82,6 +82,13 @@ class RunnableQueue(QObject):
     job and continue on to processing the next job. The job itself is responsible for emitting the
     success and failure signals, so when an unexpected error occurs, it should emit the failure
     signal so that the Controller can respond accordingly.
+
+    A RunnableQueue created with a peer becomes another lane of the peer's queue: the lanes share
+    one lock, duplicate jobs are detected across all of them, and a lane whose own queue is empty
+    takes the next ApiJob from the busiest other lane. A RequestTimeoutError or
+    ServerConnectionError in any lane pauses all of them, and no job is taken from a paused lane,
+    so that the lanes back off together until each of them is resumed. Each lane still clears on
+    its own.
     """
 
     # These are the priorities for processing jobs. Lower numbers corresponds to a higher priority.
@@ -112,6 +119,7 @@ class RunnableQueue(QObject):
         api_client: API,
         session_maker: scoped_session,
         queue_updated_signal: Optional[pyqtBoundSignal] = None,
+        peer: Optional["RunnableQueue"] = None,
     ) -> None:
         super().__init__()
         self.api_client = api_client
@@ -124,20 +132,30 @@ class RunnableQueue(QObject):
         # stability. For more info, see : https://bugs.python.org/issue17794
         self.order_number = itertools.count()
         self.current_job = None  # type: Optional[QueueJob]
+        self.is_paused = False
 
         # Hold when reading/writing self.current_job or mutating queue state
-        self.condition_add_or_remove_job = threading.Condition()
+        if peer is None:
+            self.condition_add_or_remove_job = threading.Condition()
+            self.lanes = [self]  # type: List[RunnableQueue]
+        else:
+            self.condition_add_or_remove_job = peer.condition_add_or_remove_job
+            self.lanes = peer.lanes
+            self.lanes.append(self)
 
         self.resume.connect(self.process)
 
     def _check_for_duplicate_jobs(self, job: QueueJob) -> bool:
         """
         Queued jobs are stored on self.queue.queue. The currently executing job is
-        stored on self.current_job. We check that the job to be added is not among them.
+        stored on self.current_job. We check that the job to be added is not among them, in this
+        lane or any other.
         """
-        in_progress_jobs = [in_progress_job for priority, in_progress_job in self.queue.queue]
-        if self.current_job is not None:
-            in_progress_jobs.append(self.current_job)
+        in_progress_jobs = []  # type: List[QueueJob]
+        for lane in self.lanes:
+            in_progress_jobs.extend(in_progress_job for _, in_progress_job in lane.queue.queue)
+            if lane.current_job is not None:
+                in_progress_jobs.append(lane.current_job)
         if job in in_progress_jobs:
             logger.debug("Duplicate job {}, skipping".format(job))
             return True
@@ -168,7 +186,7 @@ class RunnableQueue(QObject):
             job.order_number = current_order_number
             priority = self.JOB_PRIORITIES[type(job)]
             self.queue.put_nowait((priority, job))
-            self.condition_add_or_remove_job.notify()
+            self.condition_add_or_remove_job.notify_all()
 
     def _re_add_job(self, job: QueueJob) -> None:
         """
@@ -184,12 +202,45 @@ class RunnableQueue(QObject):
         job.remaining_attempts = DEFAULT_NUM_ATTEMPTS
         priority = self.JOB_PRIORITIES[type(job)]
         self.queue.put_nowait((priority, job))
-        self.condition_add_or_remove_job.notify()
+        self.condition_add_or_remove_job.notify_all()
+
+    def _pause_lanes(self) -> None:
+        """
+        Add a PauseQueueJob to every lane that is not already going to pause, so that all of them
+        stop sending requests after their current job.
+        """
+        with self.condition_add_or_remove_job:
+            for lane in self.lanes:
+                if not any(isinstance(job, PauseQueueJob) for _, job in lane.queue.queue):
+                    lane.add_job(PauseQueueJob())
+
+    def _next_lane(self) -> Optional["RunnableQueue"]:
+        """
+        Return the lane to take the next job from: this one if it has queued jobs, otherwise the
+        other lane with the most queued jobs whose next job is an ApiJob. Control jobs
+        (ClearQueueJob, PauseQueueJob) are never taken from another lane, nor is any job taken from
+        a paused lane. Return None if there is nothing to process.
+
+        When called condition_add_or_remove_job should be held.
+        """
+        if not self.queue.empty():
+            return self
+        peers = [
+            lane
+            for lane in self.lanes
+            if lane is not self
+            and not lane.is_paused
+            and not lane.queue.empty()
+            and isinstance(lane.queue.queue[0][1], ApiJob)
+        ]
+        if not peers:
+            return None
+        return max(peers, key=lambda lane: lane.queue.qsize())
 
     @pyqtSlot()
     def process(self) -> None:
         """
-        Process the next job in the queue.
+        Process the next job in the queue, or in another lane if this lane's queue is empty.
 
         If the job is a ClearQueueJob, call _clear() and return from the processing loop so that
         the processing thread can quit.
@@ -198,7 +249,7 @@ class RunnableQueue(QObject):
         that no more jobs are processed until the queue resumes.
 
         If the job raises RequestTimeoutError or ServerConnectionError, then:
-        (1) Add a PauseQueuejob to the queue
+        (1) Add a PauseQueuejob to the queue of every lane
         (2) Add the job back to the queue so that it can be reprocessed once the queue is resumed.
 
         If the job raises ApiInaccessibleError, then:
@@ -209,10 +260,17 @@ class RunnableQueue(QObject):
 
         Note: Generic exceptions are handled in _do_call_api.
         """
+        with self.condition_add_or_remove_job:
+            self.is_paused = False
+            self.condition_add_or_remove_job.notify_all()
+
         while True:
             with self.condition_add_or_remove_job:
-                self.condition_add_or_remove_job.wait_for(lambda: not self.queue.empty())
-                priority, self.current_job = self.queue.get(block=False)
+                lane = self._next_lane()
+                while lane is None:
+                    self.condition_add_or_remove_job.wait()
+                    lane = self._next_lane()
+                priority, self.current_job = lane.queue.get(block=False)
 
             if isinstance(self.current_job, ClearQueueJob):
                 with self.condition_add_or_remove_job:
@@ -221,9 +279,10 @@ class RunnableQueue(QObject):
                 return
 
             if isinstance(self.current_job, PauseQueueJob):
-                self.paused.emit()
                 with self.condition_add_or_remove_job:
                     self.current_job = None
+                    self.is_paused = True
+                self.paused.emit()
                 return
 
             try:
@@ -238,7 +297,7 @@ class RunnableQueue(QObject):
                 return
             except (RequestTimeoutError, ServerConnectionError) as e:
                 logger.debug("{}: {}".format(type(e).__name__, e))
-                self.add_job(PauseQueueJob())
+                self._pause_lanes()
                 with self.condition_add_or_remove_job:
                     job, self.current_job = self.current_job, None
                     self._re_add_job(job)
@@ -255,6 +314,9 @@ class ApiJobQueue(QObject):
     """
     ApiJobQueue is the queue manager of two FIFO priority queues that process jobs of type ApiJob.
 
+    File downloads can be spread across several lanes, each processed in its own thread, so that
+    downloading all files of a conversation is not limited to one request at a time. The first lane
+    is download_file_queue; one more lane is created for each of additional_download_file_threads.
 
     The queue manager starts the queues when a new auth token is provided to ensure jobs are able to
     make their requests. It stops the queues whenever a MetadataSyncJob, which runs in a continuous
@@ -277,43 +339,58 @@ class ApiJobQueue(QObject):
         session_maker: scoped_session,
         main_thread: QThread,
         download_file_thread: QThread,
+        additional_download_file_threads: Optional[List[QThread]] = None,
     ) -> None:
         super().__init__(None)
 
         self.main_thread = main_thread
         self.download_file_thread = download_file_thread
+        self.additional_download_file_threads = additional_download_file_threads or []
 
         self.main_queue = RunnableQueue(
             api_client, session_maker, queue_updated_signal=self.main_queue_updated
         )
         self.download_file_queue = RunnableQueue(api_client, session_maker)
+        self.additional_download_file_queues = [
+            RunnableQueue(api_client, session_maker, peer=self.download_file_queue)
+            for thread in self.additional_download_file_threads
+        ]
 
         self.main_queue.moveToThread(self.main_thread)
-        self.download_file_queue.moveToThread(self.download_file_thread)
-
         self.main_thread.started.connect(self.main_queue.process)
-        self.download_file_thread.started.connect(self.download_file_queue.process)
-
         self.main_queue.paused.connect(self.on_main_queue_paused)
-        self.download_file_queue.paused.connect(self.on_file_download_queue_paused)
-
         self.main_queue.cleared.connect(self.on_main_queue_cleared)
-        self.download_file_queue.cleared.connect(self.on_file_download_queue_cleared)
+
+        for thread, queue in self._download_file_lanes():
+            queue.moveToThread(thread)
+            thread.started.connect(queue.process)
+            queue.paused.connect(self.on_file_download_queue_paused)
+            queue.cleared.connect(self.on_file_download_queue_cleared)
+
+    def _download_file_lanes(self) -> List[Tuple[QThread, RunnableQueue]]:
+        """
+        Return the (thread, queue) pair of every file download lane.
+        """
+        return [(self.download_file_thread, self.download_file_queue)] + list(
+            zip(self.additional_download_file_threads, self.additional_download_file_queues)
+        )
 
     def start(self, api_client: API) -> None:
         """
         Start the queues whenever a new api token is provided.
         """
         self.main_queue.api_client = api_client
-        self.download_file_queue.api_client = api_client
+        for thread, queue in self._download_file_lanes():
+            queue.api_client = api_client
 
         if not self.main_thread.isRunning():
             self.main_thread.start()
             logger.debug("Started main queue")
 
-        if not self.download_file_thread.isRunning():
-            self.download_file_thread.start()
-            logger.debug("Started file download queue")
+        for thread, queue in self._download_file_lanes():
+            if not thread.isRunning():
+                thread.start()
+                logger.debug("Started file download queue")
 
     def stop(self) -> None:
         """
@@ -326,10 +403,11 @@ class ApiJobQueue(QObject):
             self.main_thread.quit()
             logger.debug("Asked main queue thread to quit")
 
-        if self.download_file_thread.isRunning():
-            self.download_file_queue.add_job(ClearQueueJob())
-            self.download_file_thread.quit()
-            logger.debug("Asked file-download queue thread to quit")
+        for thread, queue in self._download_file_lanes():
+            if thread.isRunning():
+                queue.add_job(ClearQueueJob())
+                thread.quit()
+                logger.debug("Asked file-download queue thread to quit")
 
     @pyqtSlot()
     def on_main_queue_paused(self) -> None:
@@ -370,9 +448,10 @@ class ApiJobQueue(QObject):
         if self.main_thread.isRunning():
             logger.debug("Resuming main queue")
             self.main_queue.resume.emit()
-        if self.download_file_thread.isRunning():
-            logger.debug("Resuming download queue")
-            self.download_file_queue.resume.emit()
+        for thread, queue in self._download_file_lanes():
+            if thread.isRunning():
+                logger.debug("Resuming download queue")
+                queue.resume.emit()
 
     @pyqtSlot(object)
     def enqueue(self, job: ApiJob) -> None:
@@ -384,6 +463,11 @@ class ApiJobQueue(QObject):
             return
 
         if isinstance(job, FileDownloadJob):
-            self.download_file_queue.add_job(job)
+            # Idle lanes take queued jobs from busy ones, so this only has to be a good first guess
+            thread, queue = min(
+                self._download_file_lanes(),
+                key=lambda lane: lane[1].queue.qsize() + (lane[1].current_job is not None),
+            )
+            queue.add_job(job)
         else:
             self.main_queue.add_job(job)
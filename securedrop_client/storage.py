@@ -19,23 +19,28 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+import hashlib
 import logging
 import os
 import re
 import shutil
+from collections import defaultdict
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from dateutil.parser import parse
-from sdclientapi import API
 from sdclientapi import Reply as SDKReply
 from sdclientapi import Source as SDKSource
 from sdclientapi import Submission as SDKSubmission
-from sqlalchemy import and_, desc, or_
+from sqlalchemy import and_, desc, exists, func, or_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm.session import Session
+from sqlalchemy.orm.util import identity_key
 
 from securedrop_client.db import (
     DeletedConversation,
@@ -51,9 +56,11 @@ from securedrop_client.db import (
     SeenMessage,
     SeenReply,
     Source,
+    SourceSummary,
     User,
+    resolve_locations,
 )
-from securedrop_client.utils import SourceCache, chronometer
+from securedrop_client.utils import chronometer
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +71,12 @@ VALID_FILENAME = re.compile(
     r"^(?P<index>\d+)\-[a-z0-9-_]*(?P<file_type>msg|doc\.(gz|zip)|reply)\.gpg$"
 ).match
 
+# Above this many changed sources, a delta sync falls back to a full sync.
+DELTA_SYNC_MAX_CHANGED_SOURCES = 500
+
+# The default maximum number of bound parameters in a single SQLite statement before 3.32.0.
+SQLITE_MAX_VARIABLE_NUMBER = 999
+
 
 def get_local_sources(session: Session) -> List[Source]:
     """
@@ -108,53 +121,112 @@ def get_local_replies(session: Session) -> List[Reply]:
     return session.query(Reply).all()
 
 
-def get_remote_data(api: API) -> Tuple[List[SDKSource], List[SDKSubmission], List[SDKReply]]:
+def sanitize_submissions_or_replies(
+    remote_sdk_objects: Union[List[SDKSubmission], List[SDKReply]]
+) -> Union[List[SDKSubmission], List[SDKReply]]:
     """
-    Given an authenticated connection to the SecureDrop API, get sources,
-    submissions and replies from the remote server and return a tuple
-    containing lists of objects representing this data:
+    Return submissions or replies that contain invalid strings, e.g. '1-../../traversed-msg'.
 
-    (remote_sources, remote_submissions, remote_replies)
+    The remote list itself is returned when all of its objects are valid, which is the usual case,
+    so that large syncs do not hold a second copy of it.
     """
-    remote_sources = api.get_sources()
-    remote_submissions = api.get_all_submissions()
-    remote_replies = api.get_all_replies()
+    malformed = [obj for obj in remote_sdk_objects if not VALID_FILENAME(obj.filename)]
+    if not malformed:
+        return remote_sdk_objects
 
-    logger.info("Fetched {} remote sources.".format(len(remote_sources)))
-    logger.info("Fetched {} remote submissions.".format(len(remote_submissions)))
-    logger.info("Fetched {} remote replies.".format(len(remote_replies)))
+    for obj in malformed:
+        logger.error("Malformed filename")
+        logger.debug(f"Malformed filename: {obj.filename}")
+    malformed_ids = {id(obj) for obj in malformed}
+    return [obj for obj in remote_sdk_objects if id(obj) not in malformed_ids]
 
-    return (remote_sources, remote_submissions, remote_replies)
 
+def sanitize_sources(remote_sdk_objects: List[SDKSource]) -> List[SDKSource]:
+    """
+    Return sources that contain invalid strings, e.g. '1-../../traversed-msg'.
 
-def sanitize_submissions_or_replies(
-    remote_sdk_objects: Union[List[SDKSubmission], List[SDKReply]]
-) -> Union[List[SDKSubmission], List[SDKReply]]:
+    As with sanitize_submissions_or_replies, the remote list itself is returned when all of its
+    sources are valid.
     """
-    Return submissions or replies that contain invalid strings, e.g. '1-../../traversed-msg'.
+    malformed = [
+        obj
+        for obj in remote_sdk_objects
+        if not VALID_JOURNALIST_DESIGNATION(obj.journalist_designation)
+    ]
+    if not malformed:
+        return remote_sdk_objects
+
+    for obj in malformed:
+        logger.error("Malformed journalist_designation")
+        logger.debug(f"Malformed journalist_designation: {obj.journalist_designation}")
+    malformed_ids = {id(obj) for obj in malformed}
+    return [obj for obj in remote_sdk_objects if id(obj) not in malformed_ids]
+
+
+def _split_submissions(
+    remote_submissions: List[SDKSubmission], source_uuids: Optional[Set[str]] = None
+) -> Tuple[List[SDKSubmission], List[SDKSubmission]]:
+    """
+    Return the (messages, files) among the remote submissions, keeping only those of the given
+    sources if any, in a single pass over what can be hundreds of thousands of submissions.
     """
-    sanitized_sdk_objects = []
-    for obj in remote_sdk_objects:
-        if not VALID_FILENAME(obj.filename):
-            logger.error("Malformed filename")
-            logger.debug(f"Malformed filename: {obj.filename}")
+    messages = []  # type: List[SDKSubmission]
+    files = []  # type: List[SDKSubmission]
+    for submission in remote_submissions:
+        if source_uuids is not None and submission.source_uuid not in source_uuids:
             continue
-        sanitized_sdk_objects.append(obj)
-    return sanitized_sdk_objects
+        if submission.filename.endswith("msg.gpg"):
+            messages.append(submission)
+        else:
+            files.append(submission)
+    return messages, files
 
 
-def sanitize_sources(remote_sdk_objects: List[SDKSource]) -> List[SDKSource]:
+def get_remote_source_digests(
+    remote_sources: List[SDKSource],
+    remote_submissions: List[SDKSubmission],
+    remote_replies: List[SDKReply],
+) -> Dict[str, str]:
     """
-    Return sources that contain invalid strings, e.g. '1-../../traversed-msg'.
+    Return a digest, keyed by source UUID, of everything the sync stores locally about each remote
+    source: the source's own fields plus those of its submissions and replies.
+
+    Two syncs that return the same digest for a source would leave its local records unchanged,
+    so the second one can skip it entirely.
     """
-    sanitized_sdk_objects = []
-    for obj in remote_sdk_objects:
-        if not VALID_JOURNALIST_DESIGNATION(obj.journalist_designation):
-            logger.error("Malformed journalist_designation")
-            logger.debug(f"Malformed journalist_designation: {obj.journalist_designation}")
-            continue
-        sanitized_sdk_objects.append(obj)
-    return sanitized_sdk_objects
+    items_by_source_uuid = defaultdict(list)  # type: Dict[str, List[Tuple]]
+    for submission in remote_submissions:
+        items_by_source_uuid[submission.source_uuid].append(
+            (
+                submission.uuid,
+                submission.filename,
+                submission.size,
+                submission.is_read,
+                submission.download_url,
+                sorted(submission.seen_by),
+            )
+        )
+    for reply in remote_replies:
+        items_by_source_uuid[reply.source_uuid].append(
+            (reply.uuid, reply.filename, reply.size, reply.journalist_uuid, sorted(reply.seen_by))
+        )
+
+    digests = {}
+    for source in remote_sources:
+        fields = (
+            source.journalist_designation,
+            source.is_flagged,
+            source.interaction_count,
+            source.is_starred,
+            source.last_updated,
+            source.number_of_documents,
+            source.key["public"],
+            source.key["fingerprint"],
+            sorted(items_by_source_uuid[source.uuid]),
+        )
+        digests[source.uuid] = hashlib.sha256(repr(fields).encode("utf-8")).hexdigest()
+
+    return digests
 
 
 def update_local_storage(
@@ -163,19 +235,25 @@ def update_local_storage(
     remote_submissions: List[SDKSubmission],
     remote_replies: List[SDKReply],
     data_dir: str,
-) -> None:
+    source_digests: Optional[Dict[str, str]] = None,
+) -> Optional[Set[str]]:
     """
     Given a database session and collections of remote sources, submissions and
     replies from the SecureDrop API, ensures the local database is updated
     with this data.
+
+    If source_digests is supplied, the sync runs in delta mode: sources whose digest (see
+    get_remote_source_digests) matches the one recorded by the previous successful sync are
+    skipped along with their submissions and replies, so only new, changed or deleted records are
+    loaded into the session. The dictionary is updated in place with the digests of this sync.
+
+    Returns the UUIDs of the sources a delta sync updated, added or deleted, or None after a full
+    sync, which may have changed any source.
     """
     remote_sources = sanitize_sources(remote_sources)
     remote_submissions = sanitize_submissions_or_replies(remote_submissions)
     remote_replies = sanitize_submissions_or_replies(remote_replies)
 
-    remote_messages = [x for x in remote_submissions if x.filename.endswith("msg.gpg")]
-    remote_files = [x for x in remote_submissions if not x.filename.endswith("msg.gpg")]
-
     # Get list of locally-modified conversations and sources that have been scheduled
     # for deletion on the server. The first sync is skipped for these conversations to avoid
     # potentially re-downloading deleted data.
@@ -183,13 +261,51 @@ def update_local_storage(
     skip_conversation_uuids = [x.uuid for x in skip_conversations]
     skip_source_uuids = [x.uuid for x in skip_sources]
 
+    changed_source_uuids = None  # type: Optional[Set[str]]
+    if source_digests is not None:
+        new_source_digests = get_remote_source_digests(
+            remote_sources, remote_submissions, remote_replies
+        )
+        changed_source_uuids = _get_changed_source_uuids(
+            session,
+            source_digests,
+            new_source_digests,
+            set(skip_conversation_uuids) | set(skip_source_uuids),
+        )
+        # Forget the previous digests until this sync has succeeded, so that a sync interrupted by
+        # an error is followed by a full one.
+        source_digests.clear()
+
+    if changed_source_uuids is None:
+        local_sources = get_local_sources(session)
+        local_files: Callable[[Session], List[File]] = get_local_files
+        local_messages: Callable[[Session], List[Message]] = get_local_messages
+        local_replies: Callable[[Session], List[Reply]] = get_local_replies
+    else:
+        logger.info("Delta sync of {} changed sources".format(len(changed_source_uuids)))
+        remote_sources = [x for x in remote_sources if x.uuid in changed_source_uuids]
+        remote_replies = [x for x in remote_replies if x.source_uuid in changed_source_uuids]
+
+        local_sources = _get_local_items_by_source_uuids(session, Source, changed_source_uuids)
+        local_files = partial(
+            _get_local_items_by_source_uuids, model=File, source_uuids=changed_source_uuids
+        )
+        local_messages = partial(
+            _get_local_items_by_source_uuids, model=Message, source_uuids=changed_source_uuids
+        )
+        local_replies = partial(
+            _get_local_items_by_source_uuids, model=Reply, source_uuids=changed_source_uuids
+        )
+
+    remote_messages, remote_files = _split_submissions(remote_submissions, changed_source_uuids)
+
     # The following update_* functions may change the database state.
     # Because of that, each get_local_* function needs to be called just before
     # its respective update_* function.
     with chronometer(logger, "update_sources"):
         update_sources(
             remote_sources,
-            get_local_sources(session),
+            local_sources,
             skip_conversation_uuids,
             skip_source_uuids,
             session,
@@ -199,7 +315,7 @@ def update_local_storage(
     with chronometer(logger, "update_files"):
         update_files(
             remote_files,
-            get_local_files(session),
+            local_files(session),
             skip_conversation_uuids,
             skip_source_uuids,
             session,
@@ -209,7 +325,7 @@ def update_local_storage(
     with chronometer(logger, "update_messages"):
         update_messages(
             remote_messages,
-            get_local_messages(session),
+            local_messages(session),
             skip_conversation_uuids,
             skip_source_uuids,
             session,
@@ -219,7 +335,7 @@ def update_local_storage(
     with chronometer(logger, "update_replies"):
         update_replies(
             remote_replies,
-            get_local_replies(session),
+            local_replies(session),
             skip_conversation_uuids,
             skip_source_uuids,
             session,
@@ -240,6 +356,80 @@ def update_local_storage(
     # there is only ever one sync happening at a given time.
     _cleanup_flagged_locally_deleted(session, skip_conversations, skip_sources)
 
+    with chronometer(logger, "update_source_summaries"):
+        if changed_source_uuids is None:
+            update_source_summaries(session)
+        else:
+            changed_source_ids = _get_ids_by_uuid(session, Source, list(changed_source_uuids))
+            update_source_summaries(session, changed_source_ids.values())
+
+    # The update_* functions above only flush their changes, so that the sync is committed in a
+    # single transaction.
+    session.commit()
+
+    # Sources that were skipped because they were deleted locally must be diffed again next sync.
+    if source_digests is not None:
+        source_digests.update(
+            {
+                uuid: digest
+                for uuid, digest in new_source_digests.items()
+                if uuid not in skip_conversation_uuids and uuid not in skip_source_uuids
+            }
+        )
+
+    return changed_source_uuids
+
+
+def _get_changed_source_uuids(
+    session: Session,
+    previous_source_digests: Dict[str, str],
+    remote_source_digests: Dict[str, str],
+    skip_uuids: Set[str],
+) -> Optional[Set[str]]:
+    """
+    Helper function that returns the UUIDs of the sources a delta sync needs to update: remote
+    sources that are new or have changed since the previous sync, local sources that no longer
+    exist on the server, and sources flagged as locally deleted.
+
+    Returns None if a full sync is needed instead, either because there is no previous sync to
+    compare against or because too many sources have changed for a delta sync to pay off.
+    """
+    if not previous_source_digests:
+        return None
+
+    local_source_uuids = {uuid for (uuid,) in session.query(Source.uuid)}
+    changed_source_uuids = {
+        uuid
+        for uuid, digest in remote_source_digests.items()
+        if previous_source_digests.get(uuid) != digest or uuid not in local_source_uuids
+    }
+    changed_source_uuids |= local_source_uuids - remote_source_digests.keys()
+    changed_source_uuids |= skip_uuids
+
+    if len(changed_source_uuids) > DELTA_SYNC_MAX_CHANGED_SOURCES:
+        return None
+
+    return changed_source_uuids
+
+
+def _get_local_items_by_source_uuids(
+    session: Session,
+    model: Union[Type[Source], Type[File], Type[Message], Type[Reply]],
+    source_uuids: Set[str],
+) -> List[Any]:
+    """
+    Helper function that returns the local sources, or the files, messages or replies belonging
+    to sources, with the given UUIDs.
+    """
+    if not source_uuids:
+        return []
+
+    query = session.query(model)
+    if model != Source:
+        query = query.join(Source)
+
+    return query.filter(Source.uuid.in_(source_uuids)).all()
+
 
 def _get_flagged_locally_deleted(
     session: Session,
@@ -280,7 +470,7 @@ def _cleanup_flagged_locally_deleted(
         logger.debug("Removing source {} from deletedsource table".format(item.uuid))
         session.delete(item)
 
-    session.commit()
+    session.flush()
 
 
 def lazy_setattr(o: Any, a: str, v: Any) -> None:
@@ -294,6 +484,98 @@ def lazy_setattr(o: Any, a: str, v: Any) -> None:
         setattr(o, a, v)
 
 
+def _get_ids_by_uuid(
+    session: Session, model: Any, uuids: Optional[List[str]] = None
+) -> Dict[str, int]:
+    """
+    Helper function that returns the ids of the model's records, keyed by UUID, in as few queries
+    as SQLite's limit on the number of bound parameters allows. If uuids is None, all records are
+    returned.
+    """
+    if uuids is None:
+        return {uuid: id for uuid, id in session.query(model.uuid, model.id)}
+
+    ids_by_uuid = {}  # type: Dict[str, int]
+    for i in range(0, len(uuids), SQLITE_MAX_VARIABLE_NUMBER):
+        query = session.query(model.uuid, model.id).filter(
+            model.uuid.in_(uuids[i : i + SQLITE_MAX_VARIABLE_NUMBER])
+        )
+        ids_by_uuid.update({uuid: id for uuid, id in query})
+    return ids_by_uuid
+
+
+def _bulk_insert(session: Session, model: Any, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Helper function that inserts rows into the model's table with a single executemany statement,
+    in the session's current transaction, and returns the ids of the new records keyed by UUID.
+
+    Unlike adding ORM objects one by one, this does not require flushing the session after each
+    new record in order to learn its id.
+    """
+    if not rows:
+        return {}
+
+    session.execute(model.__table__.insert(), rows)
+    return _get_ids_by_uuid(session, model, [row["uuid"] for row in rows])
+
+
+def add_seen_records(
+    session: Session,
+    model: Union[Type[SeenFile], Type[SeenMessage], Type[SeenReply]],
+    seen_by: Dict[int, List[str]],
+) -> None:
+    """
+    Add a seen record for each journalist that saw each of the files, messages or replies in
+    seen_by, which maps the ids of the local records to the UUIDs of the journalists that saw them.
+
+    The journalists' ids and the seen records that already exist for these items are each loaded
+    once, so that only the missing records are inserted, with a single executemany statement.
+
+    Do not add seen records for journalists missing from the local db. If the journalist account
+    needs to be created or deleted, wait until the server says so.
+    """
+    if not any(seen_by.values()):
+        return
+
+    item_id_key, item_model, seen_records_key = {
+        SeenFile: ("file_id", File, "seen_files"),
+        SeenMessage: ("message_id", Message, "seen_messages"),
+        SeenReply: ("reply_id", Reply, "seen_replies"),
+    }[model]
+    item_id_column = getattr(model, item_id_key)
+    journalist_ids_by_uuid = _get_ids_by_uuid(session, User)
+
+    item_ids = [item_id for item_id, journalist_uuids in seen_by.items() if journalist_uuids]
+    existing = set()  # type: Set[Tuple[int, int]]
+    for i in range(0, len(item_ids), SQLITE_MAX_VARIABLE_NUMBER):
+        query = session.query(item_id_column, model.journalist_id).filter(
+            item_id_column.in_(item_ids[i : i + SQLITE_MAX_VARIABLE_NUMBER])
+        )
+        existing.update(query)
+
+    missing = {
+        (item_id, journalist_ids_by_uuid[journalist_uuid])
+        for item_id, journalist_uuids in seen_by.items()
+        for journalist_uuid in journalist_uuids
+        if journalist_uuid in journalist_ids_by_uuid
+    } - existing
+    if missing:
+        session.execute(
+            model.__table__.insert(),
+            [
+                {item_id_column.key: item_id, "journalist_id": journalist_id}
+                for item_id, journalist_id in sorted(missing)
+            ],
+        )
+
+        # The records were inserted without the ORM, so expire the seen records of the items that
+        # are loaded in the session for their seen state to be reloaded when it is next read.
+        for item_id in {item_id for item_id, _ in missing}:
+            item = session.identity_map.get(identity_key(item_model, item_id))
+            if item is not None:
+                session.expire(item, [seen_records_key])
+
+
 def update_sources(
     remote_sources: List[SDKSource],
     local_sources: List[Source],
@@ -316,6 +598,7 @@ def update_sources(
       local database.
     """
     local_sources_by_uuid = {s.uuid: s for s in local_sources}
+    new_sources = []  # type: List[Dict[str, Any]]
     for source in remote_sources:
         if source.uuid in skip_uuids_deleted_source:
             # Source was locally deleted and sync data is stale
@@ -355,21 +638,24 @@ def update_sources(
             logger.debug("Updated source {}".format(source.uuid))
         else:
             # A new source to be added to the database.
-            ns = Source(
-                uuid=source.uuid,
-                journalist_designation=source.journalist_designation,
-                is_flagged=source.is_flagged,
-                interaction_count=source.interaction_count,
-                is_starred=source.is_starred,
-                last_updated=parse(source.last_updated),
-                document_count=source.number_of_documents,
-                public_key=source.key["public"],
-                fingerprint=source.key["fingerprint"],
+            new_sources.append(
+                dict(
+                    uuid=source.uuid,
+                    journalist_designation=source.journalist_designation,
+                    is_flagged=source.is_flagged,
+                    interaction_count=source.interaction_count,
+                    is_starred=source.is_starred,
+                    last_updated=parse(source.last_updated),
+                    document_count=source.number_of_documents,
+                    public_key=source.key["public"],
+                    fingerprint=source.key["fingerprint"],
+                )
             )
-            session.add(ns)
 
             logger.debug("Added new source {}".format(source.uuid))
 
+    _bulk_insert(session, Source, new_sources)
+
     # The uuids remaining in local_uuids do not exist on the remote server, so
     # delete the related records.
     for deleted_source in local_sources_by_uuid.values():
@@ -377,7 +663,7 @@ def update_sources(
         delete_source_collection(deleted_source.journalist_filename, data_dir)
         session.delete(deleted_source)
 
-    session.commit()
+    session.flush()
 
 
 def update_files(
@@ -439,7 +725,8 @@ def __update_submissions(
       from the local database.
     """
     local_submissions_by_uuid = {s.uuid: s for s in local_submissions}
-    source_cache = SourceCache(session)
+    new_submissions = []  # type: List[SDKSubmission]
+    seen_by = {}  # type: Dict[int, List[str]]
 
     for submission in remote_submissions:
 
@@ -456,10 +743,7 @@ def __update_submissions(
             lazy_setattr(local_submission, "is_read", submission.is_read)
             lazy_setattr(local_submission, "download_url", submission.download_url)
 
-            if model == File:
-                add_seen_file_records(local_submission.id, submission.seen_by, session)
-            elif model == Message:
-                add_seen_message_records(local_submission.id, submission.seen_by, session)
+            seen_by[local_submission.id] = submission.seen_by
 
             # Removing the UUID from local_uuids ensures this record won't be
             # deleted at the end of this function.
@@ -473,24 +757,39 @@ def __update_submissions(
             continue
         else:
             # A new submission to be added to the database.
-            source = source_cache.get(submission.source_uuid)
-            if source:
-                ns = model(
-                    source_id=source.id,
-                    uuid=submission.uuid,
-                    size=submission.size,
-                    filename=submission.filename,
-                    download_url=submission.download_url,
-                    is_read=submission.is_read,
+            new_submissions.append(submission)
+
+    # New submissions are inserted in bulk.
+    if new_submissions:
+        source_ids_by_uuid = _get_ids_by_uuid(session, Source)
+        new_rows = []
+        for submission in new_submissions:
+            source_id = source_ids_by_uuid.get(submission.source_uuid)
+            if source_id:
+                new_rows.append(
+                    dict(
+                        source_id=source_id,
+                        uuid=submission.uuid,
+                        size=submission.size,
+                        filename=submission.filename,
+                        file_counter=int(submission.filename.split("-")[0]),
+                        download_url=submission.download_url,
+                        is_read=submission.is_read,
+                    )
                 )
-                session.add(ns)
-                session.flush()
-                if model == File:
-                    add_seen_file_records(ns.id, submission.seen_by, session)
-                elif model == Message:
-                    add_seen_message_records(ns.id, submission.seen_by, session)
                 logger.debug(f"Added {model.__name__} {submission.uuid}")
 
+        new_ids_by_uuid = _bulk_insert(session, model, new_rows)
+        for submission in new_submissions:
+            if submission.uuid in new_ids_by_uuid:
+                seen_by[new_ids_by_uuid[submission.uuid]] = submission.seen_by
+
+    # Seen records of both existing and new submissions are reconciled in one pass.
+    if model == File:
+        add_seen_records(session, SeenFile, seen_by)
+    elif model == Message:
+        add_seen_records(session, SeenMessage, seen_by)
+
     # The uuids remaining in local_uuids do not exist on the remote server, so
     # delete the related records.
     # We will also collect the journalist designations of deleted submissions to
@@ -510,7 +809,7 @@ def __update_submissions(
                 f"Tried to delete submission {deleted_submission.uuid}, but "
                 "it was already deleted locally."
             )
-    session.commit()
+    session.flush()
 
     # Check if we left any empty directories when deleting file submissions
     if model.__name__ == File.__name__:
@@ -522,72 +821,6 @@ def __update_submissions(
                 logger.error("Could not check {}".format(directory_name))
 
 
-def add_seen_file_records(file_id: int, journalist_uuids: List[str], session: Session) -> None:
-    """
-    Add a seen record for each journalist that saw the file.
-    """
-    for journalist_uuid in journalist_uuids:
-        journalist = session.query(User).filter_by(uuid=journalist_uuid).one_or_none()
-
-        # Do not add seen record if journalist is missing from the local db. If the
-        # journalist account needs to be created or deleted, wait until the server says so.
-        if not journalist:
-            return
-
-        seen_file = (
-            session.query(SeenFile)
-            .filter_by(file_id=file_id, journalist_id=journalist.id)
-            .one_or_none()
-        )
-        if not seen_file:
-            seen_file = SeenFile(file_id=file_id, journalist_id=journalist.id)
-            session.add(seen_file)
-
-
-def add_seen_message_records(msg_id: int, journalist_uuids: List[str], session: Session) -> None:
-    """
-    Add a seen record for each journalist that saw the message.
-    """
-    for journalist_uuid in journalist_uuids:
-        journalist = session.query(User).filter_by(uuid=journalist_uuid).one_or_none()
-
-        # Do not add seen record if journalist is missing from the local db. If the
-        # journalist account needs to be created or deleted, wait until the server says so.
-        if not journalist:
-            return
-
-        seen_message = (
-            session.query(SeenMessage)
-            .filter_by(message_id=msg_id, journalist_id=journalist.id)
-            .one_or_none()
-        )
-        if not seen_message:
-            seen_message = SeenMessage(message_id=msg_id, journalist_id=journalist.id)
-            session.add(seen_message)
-
-
-def add_seen_reply_records(reply_id: int, journalist_uuids: List[str], session: Session) -> None:
-    """
-    Add a seen record for each journalist that saw the reply.
-    """
-    for journalist_uuid in journalist_uuids:
-        journalist = session.query(User).filter_by(uuid=journalist_uuid).one_or_none()
-
-        # Do not add seen record if journalist is missing from the local db. If the
-        # journalist account needs to be created or deleted, wait until the server says so.
-        if not journalist:
-            return
-
-        seen_reply = (
-            session.query(SeenReply)
-            .filter_by(reply_id=reply_id, journalist_id=journalist.id)
-            .one_or_none()
-        )
-        if not seen_reply:
-            seen_reply = SeenReply(reply_id=reply_id, journalist_id=journalist.id)
-            session.add(seen_reply)
-
-
 def update_replies(
     remote_replies: List[SDKReply],
     local_replies: List[Reply],
@@ -607,7 +840,10 @@ def update_replies(
     local_replies_by_uuid = {r.uuid: r for r in local_replies}
     deleted_user = session.query(User).filter_by(username="deleted").one_or_none()
     user_cache: Dict[str, User] = {}
-    source_cache = SourceCache(session)
+    source_ids_by_uuid = None  # type: Optional[Dict[str, int]]
+    new_replies = []  # type: List[SDKReply]
+    new_rows = []  # type: List[Dict[str, Any]]
+    seen_by = {}  # type: Dict[int, List[str]]
     for reply in remote_replies:
 
         # If the source account was just deleted locally (and is either deleted or scheduled
@@ -636,7 +872,7 @@ def update_replies(
                 if not user:
                     user = DeletedUser()
                     session.add(user)
-                    session.commit()
+                    session.flush()  # flush so that we can retrieve the generated `id`
                     deleted_user = user
 
             # Add the retrieved or newly created "deleted" user to the cache
@@ -649,7 +885,7 @@ def update_replies(
             lazy_setattr(local_reply, "size", reply.size)
             lazy_setattr(local_reply, "filename", reply.filename)
 
-            add_seen_reply_records(local_reply.id, reply.seen_by, session)
+            seen_by[local_reply.id] = reply.seen_by
 
             del local_replies_by_uuid[reply.uuid]
             logger.debug("Updated reply {}".format(reply.uuid))
@@ -662,43 +898,50 @@ def update_replies(
 
         else:
             # A new reply to be added to the database.
-            source = source_cache.get(reply.source_uuid)
-            if not source:
+            if source_ids_by_uuid is None:
+                source_ids_by_uuid = _get_ids_by_uuid(session, Source)
+            source_id = source_ids_by_uuid.get(reply.source_uuid)
+            if not source_id:
                 logger.error(f"No source found for reply {reply.uuid}")
                 continue
 
-            nr = Reply(
-                uuid=reply.uuid,
-                journalist_id=user.id,
-                source_id=source.id,
-                filename=reply.filename,
-                size=reply.size,
-            )
-            session.add(nr)
-            session.flush()
-
-            add_seen_reply_records(nr.id, reply.seen_by, session)
-
-            # All replies fetched from the server have succeeded in being sent,
-            # so we should delete the corresponding draft locally if it exists.
-            try:
-                draft_reply_db_object = session.query(DraftReply).filter_by(uuid=reply.uuid).one()
-
-                update_draft_replies(
-                    session,
-                    draft_reply_db_object.source.id,
-                    draft_reply_db_object.timestamp,
-                    draft_reply_db_object.file_counter,
-                    nr.file_counter,
-                    commit=False,
+            new_replies.append(reply)
+            new_rows.append(
+                dict(
+                    uuid=reply.uuid,
+                    journalist_id=user.id,
+                    source_id=source_id,
+                    filename=reply.filename,
+                    file_counter=int(reply.filename.split("-")[0]),
+                    size=reply.size,
                 )
-                session.delete(draft_reply_db_object)
-
-            except NoResultFound:
-                pass  # No draft locally stored corresponding to this reply.
-
+            )
             logger.debug("Added new reply {}".format(reply.uuid))
 
+    # New replies are inserted in bulk, then the seen records of both existing and new replies are
+    # reconciled in one pass.
+    new_ids_by_uuid = _bulk_insert(session, Reply, new_rows)
+    seen_by.update({new_ids_by_uuid[r.uuid]: r.seen_by for r in new_replies})
+    add_seen_records(session, SeenReply, seen_by)
+
+    # All replies fetched from the server have succeeded in being sent,
+    # so we should delete the corresponding draft locally if it exists.
+    if new_rows:
+        new_file_counters_by_uuid = {row["uuid"]: row["file_counter"] for row in new_rows}
+        for draft_reply_db_object in session.query(DraftReply).all():
+            if draft_reply_db_object.uuid not in new_file_counters_by_uuid:
+                continue  # No reply fetched from the server corresponds to this draft.
+
+            update_draft_replies(
+                session,
+                draft_reply_db_object.source.id,
+                draft_reply_db_object.timestamp,
+                draft_reply_db_object.file_counter,
+                new_file_counters_by_uuid[draft_reply_db_object.uuid],
+                commit=False,
+            )
+            session.delete(draft_reply_db_object)
+
     # The uuids remaining in local_uuids do not exist on the remote server, so
     # delete the related records.
     for deleted_reply in local_replies_by_uuid.values():
@@ -712,7 +955,98 @@ def update_replies(
                     deleted_reply.uuid
                 )
             )
-    session.commit()
+    session.flush()
+
+
+def update_source_summaries(session: Session, source_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Bring the SourceSummary of each of the sources with the given ids, or of every source if
+    source_ids is None, up to date with the source's files, messages and replies. Missing summaries
+    are created.
+
+    The caller is responsible for committing the session.
+    """
+    if source_ids is None:
+        source_ids = [id for (id,) in session.query(Source.id)]
+    else:
+        source_ids = list(source_ids)
+
+    for i in range(0, len(source_ids), SQLITE_MAX_VARIABLE_NUMBER):
+        _update_source_summaries(session, source_ids[i : i + SQLITE_MAX_VARIABLE_NUMBER])
+
+
+def _update_source_summaries(session: Session, source_ids: List[int]) -> None:
+    """
+    Helper function that updates the summaries of the sources with the given ids, with a fixed
+    number of queries.
+    """
+    latest_items = {}  # type: Dict[int, Union[File, Message, Reply]]
+    # Of the items with the same file counter, the reply wins over the file and the file over the
+    # message, as in Source.server_collection.
+    for model in [Message, File, Reply]:
+        latest_file_counters = (
+            session.query(model.source_id, func.max(model.file_counter).label("file_counter"))
+            .filter(model.source_id.in_(source_ids))
+            .group_by(model.source_id)
+            .subquery()
+        )
+        query = session.query(model).join(
+            latest_file_counters,
+            and_(
+                model.source_id == latest_file_counters.c.source_id,
+                model.file_counter == latest_file_counters.c.file_counter,
+            ),
+        )
+        for item in query:
+            latest_item = latest_items.get(item.source_id)
+            if latest_item is None or item.file_counter >= latest_item.file_counter:
+                latest_items[item.source_id] = item
+
+    # Replies and draft replies are always seen, see Source.seen
+    unseen_counts = defaultdict(int)  # type: Dict[int, int]
+    for model, seen_item_id in [(Message, SeenMessage.message_id), (File, SeenFile.file_id)]:
+        query = (
+            session.query(model.source_id, func.count(model.id))
+            .filter(
+                model.source_id.in_(source_ids),
+                model.is_read == False,  # noqa: E712
+                ~exists().where(seen_item_id == model.id),
+            )
+            .group_by(model.source_id)
+        )
+        for source_id, unseen_count in query:
+            unseen_counts[source_id] += unseen_count
+
+    summaries = {
+        summary.source_id: summary
+        for summary in session.query(SourceSummary).filter(SourceSummary.source_id.in_(source_ids))
+    }
+    for source_id in source_ids:
+        summary = summaries.get(source_id)
+        if summary is None:
+            summary = SourceSummary(source_id=source_id)
+            session.add(summary)
+
+        item = latest_items.get(source_id)
+        if item is None:
+            lazy_setattr(summary, "last_activity_uuid", None)
+            lazy_setattr(summary, "preview", None)
+        else:
+            lazy_setattr(summary, "last_activity_uuid", item.uuid)
+            lazy_setattr(summary, "preview", SourceSummary.make_preview(item))
+        lazy_setattr(summary, "unseen_count", unseen_counts[source_id])
+
+
+def update_source_summary_preview(session: Session, item: Union[File, Message, Reply]) -> None:
+    """
+    Update the preview of the item's source after the item changed, if it is the latest activity
+    of the source.
+
+    The caller is responsible for committing the session.
+    """
+    summary = session.query(SourceSummary).get(item.source_id)
+    if summary is not None and summary.last_activity_uuid == item.uuid:
+        lazy_setattr(summary, "preview", SourceSummary.make_preview(item))
 
 
 def create_or_update_user(
@@ -748,16 +1082,61 @@ def create_or_update_user(
 def update_missing_files(data_dir: str, session: Session) -> List[File]:
     """
     Update files that are marked as downloaded yet missing from the filesystem.
+
+    The data directory is walked once to find the files it contains, rather than checking for
+    each downloaded file in turn, and the missing files are marked as not downloaded in bulk.
     """
     files_that_have_been_downloaded = session.query(File).filter_by(is_downloaded=True).all()
-    files_that_are_missing = []
-    for f in files_that_have_been_downloaded:
-        if not os.path.exists(f.location(data_dir)):
-            files_that_are_missing.append(f)
-            mark_as_not_downloaded(f.uuid, session)
+    if not files_that_have_been_downloaded:
+        return []
+
+    present_paths = _find_paths_on_disk(data_dir)
+    locations = resolve_locations(data_dir, files_that_have_been_downloaded)
+    files_that_are_missing = [
+        f
+        for f, location in zip(files_that_have_been_downloaded, locations)
+        if location not in present_paths
+    ]
+    if not files_that_are_missing:
+        return []
+
+    missing_ids = [f.id for f in files_that_are_missing]
+    for i in range(0, len(missing_ids), SQLITE_MAX_VARIABLE_NUMBER):
+        session.query(File).filter(
+            File.id.in_(missing_ids[i : i + SQLITE_MAX_VARIABLE_NUMBER])
+        ).update({File.is_downloaded: False, File.is_decrypted: None}, synchronize_session=False)
+
+    # The files are already loaded, so update them in place rather than reloading them.
+    for f in files_that_are_missing:
+        set_committed_value(f, "is_downloaded", False)
+        set_committed_value(f, "is_decrypted", None)
+        update_source_summary_preview(session, f)
+    session.commit()
+
     return files_that_are_missing
 
 
+def _find_paths_on_disk(data_dir: str) -> Set[str]:
+    """
+    Return the paths of all the files under the data directory, which is resolved the same way as
+    in resolve_locations.
+    """
+    paths = set()  # type: Set[str]
+    directories = [str(Path(data_dir).resolve())]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    else:
+                        paths.add(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+    return paths
+
+
 def update_draft_replies(
     session: Session,
     source_id: int,
@@ -810,7 +1189,7 @@ def update_draft_replies(
 
 
 def find_new_files(session: Session) -> List[File]:
-    q = session.query(File).join(Source).filter_by(is_downloaded=False)
+    q = session.query(File).join(Source).filter(File.is_downloaded == False)  # noqa: E712
     q = q.order_by(desc(Source.last_updated))
     return q.all()
 
@@ -871,8 +1250,33 @@ def mark_as_not_downloaded(uuid: str, session: Session) -> None:
     db_obj.is_downloaded = False
     db_obj.is_decrypted = None
     session.add(db_obj)
+    update_source_summary_preview(session, db_obj)
+    session.commit()
+
+
+def mark_all_as_not_downloaded(uuids: Iterable[str], session: Session) -> List[File]:
+    """
+    Mark the downloaded Files with the given UUIDs as not downloaded in the database, in a single
+    transaction, and return them.
+    """
+    uuids = list(uuids)
+    files = []  # type: List[File]
+    for i in range(0, len(uuids), SQLITE_MAX_VARIABLE_NUMBER):
+        files.extend(
+            session.query(File)
+            .filter(File.uuid.in_(uuids[i : i + SQLITE_MAX_VARIABLE_NUMBER]))
+            .filter_by(is_downloaded=True)
+            .all()
+        )
+
+    for f in files:
+        f.is_downloaded = False
+        f.is_decrypted = None
+        update_source_summary_preview(session, f)
     session.commit()
 
+    return files
+
 
 def mark_as_downloaded(
     model_type: Union[Type[File], Type[Message], Type[Reply]], uuid: str, session: Session
@@ -883,6 +1287,7 @@ def mark_as_downloaded(
     db_obj = session.query(model_type).filter_by(uuid=uuid).one()
     db_obj.is_downloaded = True
     session.add(db_obj)
+    update_source_summary_preview(session, db_obj)
     session.commit()
 
 
@@ -914,6 +1319,7 @@ def mark_as_decrypted(
         db_obj.filename = original_filename
 
     session.add(db_obj)
+    update_source_summary_preview(session, db_obj)
     session.commit()
 
 
@@ -927,6 +1333,7 @@ def set_message_or_reply_content(
     db_obj = session.query(model_type).filter_by(uuid=uuid).one_or_none()
     db_obj.content = content
     session.add(db_obj)
+    update_source_summary_preview(session, db_obj)
     session.commit()
 
 
@@ -1050,6 +1457,9 @@ def _delete_source_collection_from_db(session: Session, source: Source) -> None:
             logger.debug(f"Could not add source {source.uuid} to deletedconversation table: {e}")
             session.rollback()
 
+        # Clear the source's summary along with its conversation
+        update_source_summaries(session, [source.id])
+
     try:
         session.commit()
     except SQLAlchemyError as e:
@@ -1066,6 +1476,10 @@ def source_exists(session: Session, source_uuid: str) -> bool:
         return False
 
 
+def get_source(session: Session, uuid: str) -> Optional[Source]:
+    return session.query(Source).filter_by(uuid=uuid).one_or_none()
+
+
 def get_file(session: Session, uuid: str) -> File:
     return session.query(File).filter_by(uuid=uuid).one()
 
@@ -1078,6 +1492,46 @@ def get_reply(session: Session, uuid: str) -> Reply:
     return session.query(Reply).filter_by(uuid=uuid).one()
 
 
+def load_source_collection(
+    session: Session, source: Source
+) -> List[Union[File, Message, Reply, DraftReply]]:
+    """
+    Refresh the source and load its conversation in a fixed number of queries, no matter how
+    many items it contains: one for the source and one per type of item and of seen record.
+
+    The items are loaded along with everything needed to render them (journalists, seen
+    records, download errors and send statuses), so that iterating the returned collection does
+    not emit any further queries.
+
+    Like Session.refresh, raises an InvalidRequestError (NoResultFound) if the source no longer
+    exists.
+    """
+    # The items join their source by default, which would reset the collections already loaded
+    # when the query populates existing objects, so they are given the source from the session
+    # instead.
+    session.query(Source).filter_by(id=source.id).options(
+        selectinload(Source.messages).lazyload(Message.source),
+        selectinload(Source.files).lazyload(File.source),
+        selectinload(Source.replies).lazyload(Reply.source),
+        selectinload(Source.draftreplies).lazyload(DraftReply.source),
+        selectinload(Source.messages).joinedload(Message.download_error),
+        selectinload(Source.messages)
+        .selectinload(Message.seen_messages)
+        .joinedload(SeenMessage.journalist),
+        selectinload(Source.files).joinedload(File.download_error),
+        selectinload(Source.files).selectinload(File.seen_files).joinedload(SeenFile.journalist),
+        selectinload(Source.replies).joinedload(Reply.journalist),
+        selectinload(Source.replies).joinedload(Reply.download_error),
+        selectinload(Source.replies)
+        .selectinload(Reply.seen_replies)
+        .joinedload(SeenReply.journalist),
+        selectinload(Source.draftreplies).joinedload(DraftReply.journalist),
+        selectinload(Source.draftreplies).joinedload(DraftReply.send_status),
+    ).populate_existing().one()
+
+    return source.collection
+
+
 def mark_all_pending_drafts_as_failed(session: Session) -> List[DraftReply]:
     """
     Mark as failed those pending replies that originate from other sessions (PIDs).
@@ -1113,4 +1567,5 @@ def clear_download_errors(session: Session) -> None:
     session.execute("""UPDATE files SET download_error_id = null;""")
     session.execute("""UPDATE messages SET download_error_id = null;""")
     session.execute("""UPDATE replies SET download_error_id = null;""")
+    update_source_summaries(session)
     session.commit()
@@ -1,8 +1,10 @@
 import logging
-from typing import Optional
+import random
+from collections import Counter
+from typing import Optional, Set
 
 from PyQt5.QtCore import QObject, QThread, QTimer, pyqtBoundSignal, pyqtSignal
-from sdclientapi import API
+from sdclientapi import API, RequestTimeoutError, ServerConnectionError
 from sqlalchemy.orm import scoped_session
 
 from securedrop_client import state
@@ -13,16 +15,87 @@ from securedrop_client.crypto import GpgHelper
 logger = logging.getLogger(__name__)
 
 
+class SyncScheduler:
+    """
+    SyncScheduler decides how long to wait before the next sync, from the outcome of the previous
+    ones:
+
+    * after a sync that changed some sources, wait TIME_BETWEEN_SYNCS_MS
+    * after consecutive syncs that changed nothing, wait twice as long each time, up to
+      MAX_IDLE_TIME_BETWEEN_SYNCS_MS
+    * after user activity, wait no longer than TIME_BETWEEN_SYNCS_MS again
+    * after consecutive syncs that could not reach the server, back off exponentially up to
+      MAX_BACKOFF_MS, with jitter so that clients do not all retry at the same time
+
+    Each decision is logged along with its reason. The number of decisions made for each reason is
+    kept in `decisions`, and the last wait in `interval`.
+    """
+
+    TIME_BETWEEN_SYNCS_MS = 1000 * 15  # fifteen seconds between syncs
+    MAX_IDLE_TIME_BETWEEN_SYNCS_MS = 1000 * 60 * 2  # two minutes between syncs when idle
+    MAX_BACKOFF_MS = 1000 * 60 * 5  # five minutes between syncs when the server is unreachable
+
+    def __init__(self) -> None:
+        self.interval = self.TIME_BETWEEN_SYNCS_MS
+        self.idle_sync_count = 0
+        self.failed_sync_count = 0
+        self.decisions = Counter()  # type: Counter[str]
+
+    def after_success(self, changed_source_uuids: Optional[Set[str]] = None) -> int:
+        """
+        Return the time to wait after a successful sync, which changed the sources with the given
+        UUIDs, or any of them if None.
+        """
+        self.failed_sync_count = 0
+        if changed_source_uuids is None or changed_source_uuids:
+            self.idle_sync_count = 0
+            return self._decide("changes", self.TIME_BETWEEN_SYNCS_MS)
+
+        self.idle_sync_count += 1
+        interval = min(
+            self.TIME_BETWEEN_SYNCS_MS * 2**self.idle_sync_count,
+            self.MAX_IDLE_TIME_BETWEEN_SYNCS_MS,
+        )
+        return self._decide("no_changes", interval)
+
+    def after_failure(self, error: Exception) -> int:
+        """
+        Return the time to wait after a failed sync.
+        """
+        if not isinstance(error, (RequestTimeoutError, ServerConnectionError)):
+            return self._decide("failure", self.TIME_BETWEEN_SYNCS_MS)
+
+        self.failed_sync_count += 1
+        backoff = min(
+            self.TIME_BETWEEN_SYNCS_MS * 2 ** (self.failed_sync_count - 1), self.MAX_BACKOFF_MS
+        )
+        return self._decide("unreachable", int(backoff * random.uniform(0.5, 1)))
+
+    def after_activity(self) -> int:
+        """
+        Return the longest time to wait after user activity.
+        """
+        self.idle_sync_count = 0
+        return self._decide("activity", min(self.interval, self.TIME_BETWEEN_SYNCS_MS))
+
+    def _decide(self, reason: str, interval: int) -> int:
+        self.interval = interval
+        self.decisions[reason] += 1
+        logger.debug(f"Next sync in {interval}ms ({reason})")
+        return interval
+
+
 class ApiSync(QObject):
     """
-    ApiSync continuously syncs, waiting 15 seconds between task completion.
+    ApiSync continuously syncs, waiting between task completion for as long as its SyncScheduler
+    decides.
     """
 
     sync_started = pyqtSignal()
-    sync_success = pyqtSignal()
+    sync_success = pyqtSignal("PyQt_PyObject")  # Optional[Set[str]]
     sync_failure = pyqtSignal(Exception)
 
-    TIME_BETWEEN_SYNCS_MS = 1000 * 15  # fifteen seconds between syncs
+    TIME_BETWEEN_SYNCS_MS = SyncScheduler.TIME_BETWEEN_SYNCS_MS
 
     def __init__(
         self,
@@ -53,7 +126,10 @@ class ApiSync(QObject):
 
         self.sync_thread.started.connect(self.api_sync_bg_task.sync)
 
+        # The timer is restarted once each sync is over, so that syncs never overlap.
+        self.scheduler = SyncScheduler()
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.setInterval(self.TIME_BETWEEN_SYNCS_MS)
         self.timer.timeout.connect(self.sync)
 
@@ -80,18 +156,30 @@ class ApiSync(QObject):
             logger.debug("Stopping sync thread")
             self.sync_thread.quit()
 
-    def on_sync_success(self) -> None:
+    def on_sync_success(self, changed_source_uuids: Optional[Set[str]] = None) -> None:
         """
-        Start another sync on success.
+        Schedule another sync on success, passing on the UUIDs of the sources that changed, or None
+        if any of them may have changed.
         """
-        self.sync_success.emit()
+        self.timer.start(self.scheduler.after_success(changed_source_uuids))
+        self.sync_success.emit(changed_source_uuids)
 
     def on_sync_failure(self, result: Exception) -> None:
         """
-        Only start another sync on failure if the reason is a timeout request.
+        Schedule another sync on failure, later if the server could not be reached.
         """
+        self.timer.start(self.scheduler.after_failure(result))
         self.sync_failure.emit(result)
 
+    def on_activity(self) -> None:
+        """
+        Sync sooner after user activity, if the next sync was scheduled later because the previous
+        ones changed nothing.
+        """
+        interval = self.scheduler.after_activity()
+        if self.timer.isActive() and self.timer.remainingTime() > interval:
+            self.timer.start(interval)
+
     def sync(self) -> None:
         """
         Start an immediate sync.
@@ -125,7 +213,7 @@ class ApiSyncBackgroundTask(QObject):
         self.on_sync_success = on_sync_success
         self.on_sync_failure = on_sync_failure
 
-        self.job = MetadataSyncJob(self.data_dir, app_state)
+        self.job = MetadataSyncJob(self.data_dir, app_state, gpg)
         self.job.success_signal.connect(self.on_sync_success)
         self.job.failure_signal.connect(self.on_sync_failure)
 
@@ -1,16 +1,17 @@
-import gzip
 import logging
 import math
 import os
 import shutil
+import struct
 import time
+import zlib
+from bisect import bisect_left
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import wait
 from contextlib import contextmanager
 from pathlib import Path
-from typing import BinaryIO, Dict, Generator, Optional, Union
-
-from sqlalchemy.orm.session import Session
-
-from securedrop_client import db
+from typing import Any, BinaryIO, Callable, Generator, List, Optional, Sequence, Set, Union
 
 
 def safe_mkdir(
@@ -57,21 +58,70 @@ def safe_mkdir(
     check_all_permissions(relative_path, base_path)
 
 
-def safe_gzip_extract(
-    gzip_file_path: str, dest_path: str, original_filename: str, base_path: str
-) -> None:
+# Size of the chunks read from, and decompressed into, a gzip stream
+GZIP_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def safe_gunzip_stream(
+    src_file: BinaryIO, dest_path: str, original_filename: str, base_path: str
+) -> Path:
     """
-    Safely unzip a file specified by gzip_file_path to dest_path, replacing filename with
-    original_filename.
+    Safely decompress the body of a gzip stream read from src_file, which should be positioned just
+    after the gzip header, to dest_path, replacing filename with original_filename. Return the path
+    of the decompressed file.
+
+    The stream is decompressed a chunk at a time, so memory use does not depend on its size. The
+    trailing CRC and size are checked; any data after the first gzip member is ignored. If the
+    stream cannot be decompressed, the partially written file is removed.
     """
     dest_dir = Path(dest_path).parent
     safe_mkdir(base_path, str(dest_dir))
 
     dest_path_with_original_filename = dest_dir.joinpath(original_filename)
-    with gzip.open(gzip_file_path, "rb") as src_file, open(
-        dest_path_with_original_filename, "wb"
-    ) as dest_file:
-        safe_copyfileobj(src_file, dest_file, base_path)
+    check_path_traversal(dest_path_with_original_filename)
+    # An absolute original_filename would replace dest_dir altogether
+    relative_filepath(dest_path_with_original_filename, dest_dir.resolve())
+
+    try:
+        with open(dest_path_with_original_filename, "wb") as dest_file:
+            dest_path_with_original_filename.chmod(0o600)
+            _gunzip_body(src_file, dest_file)
+    except Exception:
+        dest_path_with_original_filename.unlink()
+        raise
+
+    return dest_path_with_original_filename
+
+
+def _gunzip_body(src_file: BinaryIO, dest_file: BinaryIO) -> None:
+    """
+    Decompress the deflate data read from src_file into dest_file and check it against the gzip
+    trailer that follows it.
+
+    Adapted from Python's gzip._GzipReader.
+    """
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    crc = 0
+    size = 0
+    while not decompressor.eof:
+        chunk = decompressor.unconsumed_tail or src_file.read(GZIP_STREAM_CHUNK_SIZE)
+        if not chunk:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        data = decompressor.decompress(chunk, GZIP_STREAM_CHUNK_SIZE)
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        dest_file.write(data)
+
+    trailer = decompressor.unused_data
+    if len(trailer) < 8:
+        trailer += src_file.read(8 - len(trailer))
+    if len(trailer) < 8:
+        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+    expected_crc, expected_size = struct.unpack("<II", trailer[:8])
+    if expected_crc != crc:
+        raise OSError("CRC check failed")
+    if expected_size != size & 0xFFFFFFFF:
+        raise OSError("Incorrect length of data produced")
 
 
 def safe_move(src_path: str, dest_path: str, dest_base_path: str) -> None:
@@ -86,32 +136,6 @@ def safe_move(src_path: str, dest_path: str, dest_base_path: str) -> None:
     Path(dest_path).chmod(0o600)
 
 
-def safe_copy(src_path: str, dest_path: str, dest_base_path: str) -> None:
-    """
-    Safely copy a file specified by src_path to dest_path.
-
-    TODO: Figure out a clearer way to safely copy to a temporary file that gets
-    deleted right away. We may need a safe_decrypt function in the future.
-    """
-    check_path_traversal(src_path)
-    check_path_traversal(dest_path)
-    relative_filepath(dest_path, dest_base_path)
-    shutil.copy(src_path, dest_path)
-    Path(dest_path).chmod(0o600)
-
-
-def safe_copyfileobj(src_file: gzip.GzipFile, dest_file: BinaryIO, dest_base_path: str) -> None:
-    """
-    Safely copy src_file to dest_file.
-    """
-    check_path_traversal(src_file.name)
-    check_path_traversal(dest_file.name)
-    # Ensure directories of dest_file are created safely if they don't exist
-    safe_mkdir(dest_base_path, Path(dest_file.name).parent)
-    shutil.copyfileobj(src_file, dest_file)
-    Path(dest_file.name).chmod(0o600)
-
-
 def relative_filepath(filepath: Union[str, Path], base_dir: Union[str, Path]) -> Path:
     """
     Raise ValueError if the filepath is not relative to the supplied base_dir or if base_dir is not
@@ -192,6 +216,34 @@ def humanize_filesize(filesize: int) -> str:
         return "{}MB".format(math.floor(filesize / 1024**2))
 
 
+def longest_increasing_subsequence(values: List[int]) -> Set[int]:
+    """
+    Returns the positions in values of one of their longest strictly increasing subsequences, in
+    O(n log n) time.
+    """
+    # tail_values[k] is the smallest value that ends an increasing subsequence of length k + 1,
+    # found at position tail_positions[k]
+    tail_values = []  # type: List[int]
+    tail_positions = []  # type: List[int]
+    previous_positions = []  # type: List[Optional[int]]
+    for position, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        previous_positions.append(tail_positions[k - 1] if k > 0 else None)
+        if k == len(tail_values):
+            tail_values.append(value)
+            tail_positions.append(position)
+        else:
+            tail_values[k] = value
+            tail_positions[k] = position
+
+    positions = set()
+    next_position = tail_positions[-1] if tail_positions else None
+    while next_position is not None:
+        positions.add(next_position)
+        next_position = previous_positions[next_position]
+    return positions
+
+
 @contextmanager
 def chronometer(logger: logging.Logger, description: str) -> Generator:
     """
@@ -205,18 +257,29 @@ def chronometer(logger: logging.Logger, description: str) -> Generator:
         logger.info(f"{description} duration: {elapsed:.4f}s")
 
 
-class SourceCache(object):
+def call_concurrently(
+    functions: Sequence[Callable[[], Any]], timeout: Optional[float] = None
+) -> List[Any]:
     """
-    Caches Sources by UUID.
+    Call each function in its own thread and return their results in the same order.
+
+    The timeout is shared by all the calls. Raise the first exception raised by the functions, or
+    concurrent.futures.TimeoutError if they have not all returned in time, once the calls that are
+    still running have returned, so that none of them outlives this call. The functions are
+    expected to time out on their own, e.g. with a request timeout.
     """
+    executor = ThreadPoolExecutor(len(functions))
+    try:
+        futures = [executor.submit(function) for function in functions]
+        done, not_done = wait(futures, timeout, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            exception = future.exception() if future in done else None
+            if exception is not None:
+                raise exception
 
-    def __init__(self, session: Session) -> None:
-        super().__init__()
-        self.cache: Dict[str, db.Source] = {}
-        self.session = session
+        if not_done:
+            raise FuturesTimeoutError()
 
-    def get(self, source_uuid: str) -> Optional[db.Source]:
-        if source_uuid not in self.cache:
-            source = self.session.query(db.Source).filter_by(uuid=source_uuid).first()
-            self.cache[source_uuid] = source
-        return self.cache.get(source_uuid)
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True)
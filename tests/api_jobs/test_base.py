@@ -1,3 +1,5 @@
+from concurrent.futures import Future
+
 import pytest
 from sdclientapi import AuthError, RequestTimeoutError, ServerConnectionError
 
@@ -52,6 +54,39 @@ def test_ApiJob_success(mocker):
     assert not api_job.failure_signal.emit.called
 
 
+def test_ApiJob_success_when_future_done(mocker):
+    """
+    If call_api returns a future, the success signal is only emitted once it is done.
+    """
+    future = Future()
+    api_job_cls = dummy_job_factory(mocker, future)
+    api_job = api_job_cls()
+
+    api_job._do_call_api(mocker.MagicMock(), mocker.MagicMock())
+
+    assert not api_job.success_signal.emit.called
+    future.set_result("wat")
+    api_job.success_signal.emit.assert_called_once_with("wat")
+    assert not api_job.failure_signal.emit.called
+
+
+def test_ApiJob_failure_when_future_done(mocker):
+    """
+    If call_api returns a future, the failure signal is emitted with the future's exception.
+    """
+    future = Future()
+    api_job_cls = dummy_job_factory(mocker, future)
+    api_job = api_job_cls()
+    exception = Exception("oh no")
+
+    api_job._do_call_api(mocker.MagicMock(), mocker.MagicMock())
+
+    assert not api_job.failure_signal.emit.called
+    future.set_exception(exception)
+    api_job.failure_signal.emit.assert_called_once_with(exception)
+    assert not api_job.success_signal.emit.called
+
+
 def test_ApiJob_auth_error(mocker):
     return_value = AuthError("oh no")
     api_job_cls = dummy_job_factory(mocker, return_value)
@@ -1,5 +1,6 @@
 import math
 import os
+import threading
 from typing import Tuple
 
 import pytest
@@ -7,6 +8,7 @@ from sdclientapi import BaseError
 from sdclientapi import Submission as SdkSubmission
 
 from securedrop_client.api_jobs.downloads import (
+    DecryptionPool,
     DownloadChecksumMismatchException,
     DownloadDecryptionException,
     DownloadJob,
@@ -57,8 +59,8 @@ def test_ReplyDownloadJob_no_download_or_decrypt(mocker, homedir, session, sessi
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job_1 = ReplyDownloadJob(reply_is_decrypted_false.uuid, homedir, gpg)
     job_2 = ReplyDownloadJob(reply_is_decrypted_none.uuid, homedir, gpg)
-    mocker.patch.object(job_1.gpg, "decrypt_submission_or_reply")
-    mocker.patch.object(job_2.gpg, "decrypt_submission_or_reply")
+    mocker.patch.object(job_1.gpg, "decrypt_message_or_reply", return_value="hi")
+    mocker.patch.object(job_2.gpg, "decrypt_message_or_reply", return_value="hi")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     path = os.path.join(homedir, "data")
@@ -84,7 +86,7 @@ def test_ReplyDownloadJob_message_already_decrypted(mocker, homedir, session, se
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = ReplyDownloadJob(reply.uuid, homedir, gpg)
-    decrypt_fn = mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    decrypt_fn = mocker.patch.object(job.gpg, "decrypt_message_or_reply")
     api_client = mocker.MagicMock()
     download_fn = mocker.patch.object(api_client, "download_reply")
 
@@ -104,7 +106,7 @@ def test_ReplyDownloadJob_message_already_downloaded(mocker, homedir, session, s
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = ReplyDownloadJob(reply.uuid, homedir, gpg)
-    mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    mocker.patch.object(job.gpg, "decrypt_message_or_reply", return_value="hi")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     download_fn = mocker.patch.object(api_client, "download_reply")
@@ -128,7 +130,7 @@ def test_ReplyDownloadJob_happiest_path(mocker, homedir, session, session_maker)
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = ReplyDownloadJob(reply.uuid, homedir, gpg)
-    mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    mocker.patch.object(job.gpg, "decrypt_message_or_reply", return_value="hi")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     data_dir = os.path.join(homedir, "data")
@@ -158,8 +160,8 @@ def test_MessageDownloadJob_no_download_or_decrypt(mocker, homedir, session, ses
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job_1 = MessageDownloadJob(message_is_decrypted_false.uuid, homedir, gpg)
     job_2 = MessageDownloadJob(message_is_decrypted_none.uuid, homedir, gpg)
-    mocker.patch.object(job_1.gpg, "decrypt_submission_or_reply")
-    mocker.patch.object(job_2.gpg, "decrypt_submission_or_reply")
+    mocker.patch.object(job_1.gpg, "decrypt_message_or_reply", return_value="hi")
+    mocker.patch.object(job_2.gpg, "decrypt_message_or_reply", return_value="hi")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     path = os.path.join(homedir, "data")
@@ -187,7 +189,7 @@ def test_MessageDownloadJob_message_already_decrypted(
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = MessageDownloadJob(message.uuid, homedir, gpg)
-    decrypt_fn = mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    decrypt_fn = mocker.patch.object(job.gpg, "decrypt_message_or_reply")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     download_fn = mocker.patch.object(api_client, "download_submission")
@@ -210,7 +212,7 @@ def test_MessageDownloadJob_message_already_downloaded(
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = MessageDownloadJob(message.uuid, homedir, gpg)
-    mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    mocker.patch.object(job.gpg, "decrypt_message_or_reply", return_value="hi")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     download_fn = mocker.patch.object(api_client, "download_submission")
@@ -234,7 +236,7 @@ def test_MessageDownloadJob_happiest_path(mocker, homedir, session, session_make
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = MessageDownloadJob(message.uuid, homedir, gpg)
-    mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    mocker.patch.object(job.gpg, "decrypt_message_or_reply", return_value="hi")
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     data_dir = os.path.join(homedir, "data")
@@ -261,7 +263,7 @@ def test_MessageDownloadJob_with_base_error(mocker, homedir, session, session_ma
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     mocker.patch.object(api_client, "download_submission", side_effect=BaseError)
-    decrypt_fn = mocker.patch.object(job.gpg, "decrypt_submission_or_reply")
+    decrypt_fn = mocker.patch.object(job.gpg, "decrypt_message_or_reply")
 
     with pytest.raises(BaseError):
         job.call_api(api_client, session)
@@ -286,7 +288,7 @@ def test_MessageDownloadJob_with_crypto_error(
     session.commit()
     gpg = GpgHelper(homedir, session_maker, is_qubes=False)
     job = MessageDownloadJob(message.uuid, homedir, gpg)
-    mocker.patch.object(job.gpg, "decrypt_submission_or_reply", side_effect=CryptoError)
+    mocker.patch.object(job.gpg, "decrypt_message_or_reply", side_effect=CryptoError)
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
     path = os.path.join(homedir, "data")
@@ -300,6 +302,130 @@ def test_MessageDownloadJob_with_crypto_error(
     assert message.is_decrypted is False
 
 
+def test_MessageDownloadJob_with_decryption_pool(mocker, homedir, session, session_maker):
+    """
+    Test that, with a decryption pool, call_api returns once the message is downloaded and a future
+    resolved once the message is decrypted and its content stored.
+    """
+    message = factory.Message(
+        source=factory.Source(), is_downloaded=False, is_decrypted=None, content=None
+    )
+    session.add(message)
+    session.commit()
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    pool = DecryptionPool(session_maker, 2)
+    job = MessageDownloadJob(message.uuid, homedir, gpg, pool)
+    mocker.patch.object(job, "decrypt_content", return_value="hello")
+    api_client = mocker.MagicMock()
+    api_client.default_request_timeout = mocker.MagicMock()
+    data_dir = os.path.join(homedir, "data")
+    api_client.download_submission = mocker.MagicMock(return_value=("", data_dir))
+
+    future = job.call_api(api_client, session)
+
+    assert future.result(timeout=5) == message.uuid
+    pool.shutdown()
+    session.refresh(message)
+    assert message.content == "hello"
+    assert message.is_downloaded is True
+    assert message.is_decrypted is True
+    assert not pool.in_progress
+
+
+def test_ReplyDownloadJob_with_decryption_pool_crypto_error(
+    mocker, homedir, session, session_maker, download_error_codes
+):
+    """
+    Test that, with a decryption pool, a decryption error resolves the future with a
+    DownloadDecryptionException and marks the reply as not decrypted.
+    """
+    reply = factory.Reply(
+        source=factory.Source(), is_downloaded=True, is_decrypted=None, content=None
+    )
+    session.add(reply)
+    session.commit()
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    pool = DecryptionPool(session_maker, 2)
+    job = ReplyDownloadJob(reply.uuid, homedir, gpg, pool)
+    mocker.patch.object(job.gpg, "decrypt_message_or_reply", side_effect=CryptoError)
+
+    future = job.call_api(mocker.MagicMock(), session)
+
+    assert isinstance(future.exception(timeout=5), DownloadDecryptionException)
+    pool.shutdown()
+    session.refresh(reply)
+    assert reply.content is None
+    assert reply.is_decrypted is False
+    assert reply.download_error is not None
+
+
+def test_DecryptionPool_decrypts_item_once(mocker, homedir, session, session_maker):
+    """
+    Test that a job for an item that is already being decrypted gets the same future.
+    """
+    message = factory.Message(source=factory.Source(), is_downloaded=True, is_decrypted=None)
+    session.add(message)
+    session.commit()
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    pool = DecryptionPool(session_maker, 2)
+    decrypting = threading.Event()
+    job = MessageDownloadJob(message.uuid, homedir, gpg, pool)
+    decrypt_content = mocker.patch.object(
+        job, "decrypt_content", side_effect=lambda filepath: decrypting.wait(5) and "hello"
+    )
+    same_job = MessageDownloadJob(message.uuid, homedir, gpg, pool)
+
+    future = job.call_api(mocker.MagicMock(), session)
+    same_future = same_job.call_api(mocker.MagicMock(), session)
+    decrypting.set()
+
+    assert same_future is future
+    assert future.result(timeout=5) == message.uuid
+    pool.shutdown()
+    decrypt_content.assert_called_once_with(message.location(homedir))
+
+
+def test_DecryptionPool_shutdown_cancels_waiting_items(mocker, homedir, session, session_maker):
+    """
+    Test that shutting down waits for the item being decrypted, and cancels the items still waiting
+    for a worker.
+    """
+    message = factory.Message(source=factory.Source(), is_downloaded=True, is_decrypted=None)
+    waiting_message = factory.Message(
+        source=factory.Source(), is_downloaded=True, is_decrypted=None
+    )
+    session.add_all([message, waiting_message])
+    session.commit()
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    pool = DecryptionPool(session_maker, 1)
+    started = threading.Event()
+    decrypting = threading.Event()
+
+    def decrypt_content(filepath):
+        started.set()
+        decrypting.wait(5)
+        return "hello"
+
+    job = MessageDownloadJob(message.uuid, homedir, gpg, pool)
+    mocker.patch.object(job, "decrypt_content", side_effect=decrypt_content)
+    waiting_job = MessageDownloadJob(waiting_message.uuid, homedir, gpg, pool)
+    waiting_decrypt_content = mocker.patch.object(waiting_job, "decrypt_content")
+
+    future = job.call_api(mocker.MagicMock(), session)
+    assert started.wait(5)
+    waiting_future = waiting_job.call_api(mocker.MagicMock(), session)
+    threading.Timer(0.1, decrypting.set).start()
+    pool.shutdown()
+
+    assert future.result(timeout=0) == message.uuid
+    assert waiting_future.cancelled()
+    waiting_decrypt_content.assert_not_called()
+    assert not pool.in_progress
+    session.refresh(waiting_message)
+    assert waiting_message.is_downloaded is True
+    assert waiting_message.is_decrypted is None
+
+
 def test_FileDownloadJob_message_already_decrypted(mocker, homedir, session, session_maker):
     """
     Test that call_api just returns uuid if already decrypted.
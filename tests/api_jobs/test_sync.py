@@ -1,6 +1,11 @@
 import os
+import threading
 import unittest
 from collections import namedtuple
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+import pytest
+from sdclientapi import RequestTimeoutError
 
 from securedrop_client import state
 from securedrop_client.api_jobs.sync import MetadataSyncJob, _update_state
@@ -94,9 +99,7 @@ def test_MetadataSyncJob_updates_application_state(mocker, homedir, session, ses
     some_message = factory.RemoteMessage()
     another_file = factory.RemoteFile()
     submissions = [some_file, some_message, another_file]
-    mocker.patch(
-        "securedrop_client.api_jobs.sync.get_remote_data", return_value=([], submissions, [])
-    )
+    api_client.get_all_submissions.return_value = submissions
 
     app_state = state.State()
     state_updater = mocker.patch("securedrop_client.api_jobs.sync._update_state")
@@ -311,10 +314,6 @@ def test_MetadataSyncJob_success(mocker, homedir, session, session_maker):
         key={"type": "PGP", "public": PUB_KEY, "fingerprint": "123456ABC"}
     )
 
-    mock_get_remote_data = mocker.patch(
-        "securedrop_client.api_jobs.sync.get_remote_data", return_value=([mock_source], [], [])
-    )
-
     user = factory.User(uuid="mock1", username="mock1", firstname="mock1", lastname="mock1")
     session.add(user)
 
@@ -322,10 +321,11 @@ def test_MetadataSyncJob_success(mocker, homedir, session, session_maker):
 
     user = {"uuid": "mock1", "username": "mock1", "first_name": "mock1", "last_name": "mock1"}
     mocker.patch.object(api_client, "get_current_user", return_value=user)
+    api_client.get_sources.return_value = [mock_source]
 
     job.call_api(api_client, session)
 
-    assert mock_get_remote_data.call_count == 1
+    assert api_client.get_sources.call_count == 1
 
 
 def test_MetadataSyncJob_success_current_user_name_change(mocker, homedir, session, session_maker):
@@ -335,10 +335,6 @@ def test_MetadataSyncJob_success_current_user_name_change(mocker, homedir, sessi
         key={"type": "PGP", "public": PUB_KEY, "fingerprint": "123456ABC"}
     )
 
-    mock_get_remote_data = mocker.patch(
-        "securedrop_client.api_jobs.sync.get_remote_data", return_value=([mock_source], [], [])
-    )
-
     user = factory.User(uuid="mock1", username="mock1", firstname="mock1", lastname="mock1")
     session.add(user)
 
@@ -346,10 +342,11 @@ def test_MetadataSyncJob_success_current_user_name_change(mocker, homedir, sessi
 
     user = {"uuid": "mock2", "username": "mock2", "first_name": "mock2", "last_name": "mock2"}
     mocker.patch.object(api_client, "get_current_user", return_value=user)
+    api_client.get_sources.return_value = [mock_source]
 
     job.call_api(api_client, session)
 
-    assert mock_get_remote_data.call_count == 1
+    assert api_client.get_sources.call_count == 1
 
 
 def test_MetadataSyncJob_success_with_missing_key(mocker, homedir, session, session_maker):
@@ -360,13 +357,111 @@ def test_MetadataSyncJob_success_with_missing_key(mocker, homedir, session, sess
 
     mock_source = factory.RemoteSource(key={"type": "PGP", "public": "", "fingerprint": ""})
 
-    mock_get_remote_data = mocker.patch(
-        "securedrop_client.api_jobs.sync.get_remote_data", return_value=([mock_source], [], [])
-    )
-
     api_client = mocker.MagicMock()
     api_client.default_request_timeout = mocker.MagicMock()
+    api_client.get_sources.return_value = [mock_source]
 
     job.call_api(api_client, session)
 
-    assert mock_get_remote_data.call_count == 1
+    assert api_client.get_sources.call_count == 1
+
+
+def test_MetadataSyncJob_passes_source_digests_to_update_local_storage(
+    mocker, homedir, session, session_maker
+):
+    """
+    Check that source digests persist between syncs but are discarded when journalists change.
+    """
+    api_client = mocker.MagicMock()
+    api_client.get_users = mocker.MagicMock(return_value=[factory.RemoteUser()])
+    api_client.get_sources = mocker.MagicMock(return_value=[])
+    api_client.get_all_submissions = mocker.MagicMock(return_value=[])
+    api_client.get_all_replies = mocker.MagicMock(return_value=[])
+    update_local_storage = mocker.patch("securedrop_client.api_jobs.sync.update_local_storage")
+
+    job = MetadataSyncJob(homedir)
+    job.call_api(api_client, session)
+    source_digests = update_local_storage.call_args[0][5]
+    assert source_digests is job._source_digests
+
+    source_digests["source-uuid"] = "digest"
+    job.call_api(api_client, session)
+    assert job._source_digests == {"source-uuid": "digest"}
+
+    api_client.get_users.return_value = [factory.RemoteUser()]
+    job.call_api(api_client, session)
+    assert job._source_digests == {}
+
+
+def test_MetadataSyncJob_returns_changed_source_uuids(mocker, homedir, session, session_maker):
+    """
+    Check that the sync's result is the set of changed source UUIDs from update_local_storage, so
+    that the GUI only reloads those sources.
+    """
+    api_client = mocker.MagicMock()
+    api_client.get_users = mocker.MagicMock(return_value=[factory.RemoteUser()])
+    api_client.get_sources = mocker.MagicMock(return_value=[])
+    api_client.get_all_submissions = mocker.MagicMock(return_value=[])
+    api_client.get_all_replies = mocker.MagicMock(return_value=[])
+    mocker.patch(
+        "securedrop_client.api_jobs.sync.update_local_storage", return_value={"source-uuid"}
+    )
+
+    job = MetadataSyncJob(homedir)
+
+    assert job.call_api(api_client, session) == {"source-uuid"}
+
+
+def test_MetadataSyncJob_imports_new_source_keys(mocker, homedir, session, session_maker):
+    """
+    Ensure that the keys of sources whose keys have not been imported yet are imported after
+    syncing, most recently updated sources first.
+    """
+    api_client = mocker.patch("securedrop_client.logic.sdclientapi.API")
+    api_client.get_users = mocker.MagicMock(return_value=[])
+    imported_source = factory.RemoteSource(key={"public": PUB_KEY, "fingerprint": "A" * 40})
+    old_source = factory.RemoteSource(last_updated="2020-01-01T00:00:00.000000Z")
+    new_source = factory.RemoteSource(last_updated="2021-01-01T00:00:00.000000Z")
+    api_client.get_sources = mocker.MagicMock(
+        return_value=[imported_source, old_source, new_source]
+    )
+    api_client.get_all_submissions = mocker.MagicMock(return_value=[])
+    api_client.get_all_replies = mocker.MagicMock(return_value=[])
+    gpg = mocker.MagicMock()
+    gpg.is_key_imported.side_effect = lambda fingerprint: fingerprint == "A" * 40
+
+    job = MetadataSyncJob(homedir, gpg=gpg)
+    job.MAX_NEW_KEYS_PER_SYNC = 1
+    job.call_api(api_client, session)
+
+    local_sources = gpg.import_new_keys.call_args[0][0]
+    assert [source.uuid for source in local_sources] == [new_source.uuid]
+
+
+def test_MetadataSyncJob_fetches_users_sources_submissions_and_replies_concurrently(
+    mocker, homedir, session
+):
+    """
+    Ensure the four requests are each sent at the same time, and that running out of time is
+    handled like any request timeout.
+    """
+    api_client = mocker.patch("securedrop_client.logic.sdclientapi.API")
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fetch(result):
+        barrier.wait()  # only returns once all of the requests are being sent
+        return result
+
+    api_client.get_users = lambda: fetch([factory.RemoteUser()])
+    api_client.get_sources = lambda: fetch([])
+    api_client.get_all_submissions = lambda: fetch([])
+    api_client.get_all_replies = lambda: fetch([])
+    job = MetadataSyncJob(homedir)
+
+    job.call_api(api_client, session)
+
+    mocker.patch(
+        "securedrop_client.api_jobs.sync.call_concurrently", side_effect=FuturesTimeoutError()
+    )
+    with pytest.raises(RequestTimeoutError):
+        job.call_api(api_client, session)
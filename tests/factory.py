@@ -63,6 +63,14 @@ def Source(**attrs):
     return db.Source(**defaults)
 
 
+def SourceSummary(**attrs):
+    defaults = dict(last_activity_uuid=None, preview=None, unseen_count=0)
+
+    defaults.update(attrs)
+
+    return db.SourceSummary(**defaults)
+
+
 def Message(**attrs):
     global MESSAGE_COUNT
     MESSAGE_COUNT += 1
@@ -27,16 +27,16 @@ def test_download_file(functional_test_logged_in_context, qtbot, mocker):
     gui, controller = functional_test_logged_in_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the last first in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
 
     # Select the second source in the list to avoid marking unseen sources as seen
-    source_id = list(gui.main_view.source_list.source_items.keys())[1]
-    source_item = gui.main_view.source_list.source_items[source_id]
-    source_widget = gui.main_view.source_list.itemWidget(source_item)
-    qtbot.mouseClick(source_widget, Qt.LeftButton)
+    source_id = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())[1]
+    source_list = gui.main_view.source_list
+    source_rect = source_list.visualRect(source_list.source_model.index_for_uuid(source_id))
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=source_rect.center())
     qtbot.wait(TIME_CLICK_ACTION)
 
     def conversation_with_file_is_rendered():
@@ -21,14 +21,16 @@ def test_offline_delete_source_attempt(functional_test_offline_context, qtbot, m
     gui, controller = functional_test_offline_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the first source in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
-    source_ids = list(gui.main_view.source_list.source_items.keys())
-    first_source_item = gui.main_view.source_list.source_items[source_ids[0]]
-    first_source_widget = gui.main_view.source_list.itemWidget(first_source_item)
-    qtbot.mouseClick(first_source_widget, Qt.LeftButton)
+    source_ids = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())
+    source_list = gui.main_view.source_list
+    first_source_rect = source_list.visualRect(
+        source_list.source_model.index_for_uuid(source_ids[0])
+    )
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=first_source_rect.center())
     qtbot.wait(TIME_CLICK_ACTION)
 
     def check_for_conversation():
@@ -22,22 +22,25 @@ def test_offline_star_source(functional_test_offline_context, qtbot):
     gui, controller = functional_test_offline_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the first source in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
-    source_ids = list(gui.main_view.source_list.source_items.keys())
-    first_source_item = gui.main_view.source_list.source_items[source_ids[0]]
-    first_source_widget = gui.main_view.source_list.itemWidget(first_source_item)
-    qtbot.mouseClick(first_source_widget, Qt.LeftButton)
+    source_ids = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())
+    source_list = gui.main_view.source_list
+    first_source_rect = source_list.visualRect(
+        source_list.source_model.index_for_uuid(source_ids[0])
+    )
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=first_source_rect.center())
     qtbot.wait(TIME_CLICK_ACTION)
+    first_source_row = source_list.get_source_row(source_ids[0])
+    first_source_star = source_list.source_delegate.star_rect(first_source_rect).center()
 
     # Store state before attempting to star
-    is_starred = first_source_widget.star.is_starred
-    is_checked = first_source_widget.star.isChecked()
+    is_starred = first_source_row.is_starred
 
     # Attempt to star the source
-    qtbot.mouseClick(first_source_widget.star, Qt.LeftButton)
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=first_source_star)
 
     def sign_in_required_error():
         msg = gui.top_pane.error_status_bar.status_bar.currentMessage()
@@ -46,5 +49,4 @@ def test_offline_star_source(functional_test_offline_context, qtbot):
     qtbot.waitUntil(sign_in_required_error, timeout=TIME_RENDER_CONV_VIEW)
 
     # Verify that star state did not change
-    assert first_source_widget.star.is_starred == is_starred
-    assert first_source_widget.star.isChecked() == is_checked
+    assert first_source_row.is_starred == is_starred
@@ -5,6 +5,7 @@ import pytest
 from flaky import flaky
 from PyQt5.QtCore import Qt
 
+from securedrop_client import storage
 from tests.conftest import TIME_CLICK_ACTION, TIME_RENDER_SOURCE_LIST
 
 
@@ -17,23 +18,24 @@ def test_unseen_source_becomes_seen_on_click(functional_test_logged_in_context,
     gui, controller = functional_test_logged_in_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the first source in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
-    source_ids = list(gui.main_view.source_list.source_items.keys())
-    unseen_source_widget = None
+    source_ids = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())
+    source_list = gui.main_view.source_list
+    unseen_source_row = None
     for source_id in source_ids:
-        source_item = gui.main_view.source_list.source_items[source_id]
-        source_widget = gui.main_view.source_list.itemWidget(source_item)
-        if not source_widget.source.seen:
-            unseen_source_widget = source_widget
-            assert not unseen_source_widget.seen
-            qtbot.mouseClick(source_widget, Qt.LeftButton)
+        source = storage.get_source(controller.session, source_id)
+        if not source.seen:
+            unseen_source_row = source_list.get_source_row(source_id)
+            assert not unseen_source_row.seen
+            source_rect = source_list.visualRect(source_list.source_model.index_for_uuid(source_id))
+            qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=source_rect.center())
             qtbot.wait(TIME_CLICK_ACTION)
             break
 
-    assert unseen_source_widget.seen
+    assert unseen_source_row.seen
 
 
 @flaky
@@ -45,15 +47,15 @@ def test_seen_and_unseen(functional_test_logged_in_context, qtbot, mocker):
     gui, controller = functional_test_logged_in_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the first source in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
-    source_ids = list(gui.main_view.source_list.source_items.keys())
+    source_ids = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())
     for source_id in source_ids:
-        source_item = gui.main_view.source_list.source_items[source_id]
-        source_widget = gui.main_view.source_list.itemWidget(source_item)
-        if source_widget.source.seen:
-            assert source_widget.seen
+        source = storage.get_source(controller.session, source_id)
+        source_row = gui.main_view.source_list.get_source_row(source_id)
+        if source.seen:
+            assert source_row.seen
         else:
-            assert not source_widget.seen
+            assert not source_row.seen
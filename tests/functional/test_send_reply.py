@@ -20,14 +20,16 @@ def test_send_reply_to_source(functional_test_logged_in_context, qtbot, mocker):
     gui, controller = functional_test_logged_in_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the last source in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
-    source_ids = list(gui.main_view.source_list.source_items.keys())
-    last_source_item = gui.main_view.source_list.source_items[source_ids[0]]
-    last_source_widget = gui.main_view.source_list.itemWidget(last_source_item)
-    qtbot.mouseClick(last_source_widget, Qt.LeftButton)
+    source_ids = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())
+    source_list = gui.main_view.source_list
+    last_source_rect = source_list.visualRect(
+        source_list.source_model.index_for_uuid(source_ids[0])
+    )
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=last_source_rect.center())
     qtbot.wait(TIME_CLICK_ACTION)
 
     def check_for_conversation():
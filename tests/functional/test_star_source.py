@@ -21,24 +21,26 @@ def test_star_source(functional_test_logged_in_context, qtbot, mocker):
     gui, controller = functional_test_logged_in_context
 
     def check_for_sources():
-        assert len(list(gui.main_view.source_list.source_items.keys()))
+        assert len(list(gui.main_view.source_list.source_model.rows_by_uuid.keys()))
 
     # Select the first source in the source list
     qtbot.waitUntil(check_for_sources, timeout=TIME_RENDER_SOURCE_LIST)
-    source_ids = list(gui.main_view.source_list.source_items.keys())
-    first_source_item = gui.main_view.source_list.source_items[source_ids[0]]
-    first_source_widget = gui.main_view.source_list.itemWidget(first_source_item)
-    qtbot.mouseClick(first_source_widget, Qt.LeftButton)
+    source_ids = list(gui.main_view.source_list.source_model.rows_by_uuid.keys())
+    source_list = gui.main_view.source_list
+    first_source_rect = source_list.visualRect(
+        source_list.source_model.index_for_uuid(source_ids[0])
+    )
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=first_source_rect.center())
     qtbot.wait(TIME_CLICK_ACTION)
+    first_source_row = source_list.get_source_row(source_ids[0])
+    first_source_star = source_list.source_delegate.star_rect(first_source_rect).center()
 
     # Verify that the source is starred after clicking on the star widget
-    qtbot.mouseClick(first_source_widget.star, Qt.LeftButton)
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=first_source_star)
     qtbot.wait(TIME_CLICK_ACTION)
-    assert first_source_widget.star.is_starred is True
-    assert first_source_widget.star.isChecked() is True
+    assert first_source_row.is_starred is True
 
     # Verify that the source is not starred after clicking on the star widget again
-    qtbot.mouseClick(first_source_widget.star, Qt.LeftButton)
+    qtbot.mouseClick(source_list.viewport(), Qt.LeftButton, pos=first_source_star)
     qtbot.wait(TIME_CLICK_ACTION)
-    assert first_source_widget.star.is_starred is False
-    assert first_source_widget.star.isChecked() is False
+    assert first_source_row.is_starred is False
@@ -264,7 +264,11 @@ def test_show_sources(mocker):
     w = Window()
     w.main_view = mocker.MagicMock()
     w.show_sources([1, 2, 3])
-    w.main_view.show_sources.assert_called_once_with([1, 2, 3])
+    w.main_view.show_sources.assert_called_once_with([1, 2, 3], None)
+
+    w.main_view.show_sources.reset_mock()
+    w.show_sources([1, 2, 3], {"2"})
+    w.main_view.show_sources.assert_called_once_with([1, 2, 3], {"2"})
 
 
 def test_update_error_status_default(mocker):
@@ -10,10 +10,10 @@ from unittest.mock import Mock, PropertyMock
 import arrow
 import sqlalchemy
 import sqlalchemy.orm.exc
-from PyQt5.QtCore import QEvent, QPointF, QSize, Qt
+from PyQt5.QtCore import QEvent, QPersistentModelIndex, QPointF, QRect, QSize, Qt
 from PyQt5.QtGui import QFocusEvent, QMouseEvent, QMovie, QResizeEvent
 from PyQt5.QtTest import QTest
-from PyQt5.QtWidgets import QVBoxLayout, QWidget
+from PyQt5.QtWidgets import QLabel, QStyleOptionViewItem, QVBoxLayout, QWidget
 from sqlalchemy.orm import attributes, scoped_session, sessionmaker
 
 from securedrop_client import db, logic, storage
@@ -33,17 +33,15 @@ from securedrop_client.gui.widgets import (
     ReplyTextEdit,
     ReplyTextEditPlaceholder,
     ReplyWidget,
-    SecureQLabel,
     SenderIcon,
     SourceConversationWrapper,
     SourceList,
-    SourceListWidgetItem,
+    SourceListDelegate,
+    SourceListModel,
+    SourceListRow,
     SourceMenu,
-    SourcePreview,
     SourceProfileShortWidget,
-    SourceWidget,
     SpeechBubble,
-    StarToggleButton,
     SyncIcon,
     TopPane,
     UserButton,
@@ -531,21 +529,17 @@ def test_MainView_show_sources_with_none_selected(mocker):
     """
     mv = MainView(None)
 
-    # Set up SourceList so that SourceList.get_selected_source() returns a source
+    # Set up SourceList so that it has a source but none is selected
     mv.source_list = SourceList()
-    source_widget = SourceWidget(
-        mocker.MagicMock(), factory.Source(uuid="stub_uuid"), mocker.MagicMock(), mocker.MagicMock()
-    )
-    source_item = SourceListWidgetItem(mv.source_list)
-    mv.source_list.setItemWidget(source_item, source_widget)
-    mv.source_list.source_items["stub_uuid"] = source_item
+    mv.source_list.controller = mocker.MagicMock()
+    mv.source_list.update_sources([factory.Source(uuid="stub_uuid")])
     mocker.patch.object(mv.source_list, "update_sources")
 
     mv.empty_conversation_view = mocker.MagicMock()
 
     mv.show_sources([1, 2, 3])
 
-    mv.source_list.update_sources.assert_called_once_with([1, 2, 3])
+    mv.source_list.update_sources.assert_called_once_with([1, 2, 3], None)
     mv.empty_conversation_view.show_no_source_selected_message.assert_called_once_with()
     mv.empty_conversation_view.show.assert_called_once_with()
 
@@ -556,7 +550,7 @@ def test_MainView_show_sources_from_cold_start(mocker):
     """
     mv = MainView(None)
     mv.source_list = mocker.MagicMock()
-    mv.source_list.source_items = {}
+    mv.source_list.count.return_value = 0
     mv.empty_conversation_view = mocker.MagicMock()
 
     mv.show_sources([])
@@ -574,11 +568,24 @@ def test_MainView_show_sources_with_no_sources_at_all(mocker):
 
     mv.show_sources([])
 
-    mv.source_list.update_sources.assert_called_once_with([])
+    mv.source_list.update_sources.assert_called_once_with([], None)
     mv.empty_conversation_view.show_no_sources_message.assert_called_once_with()
     mv.empty_conversation_view.show.assert_called_once_with()
 
 
+def test_MainView_show_sources_passes_on_changed_source_uuids(mocker):
+    """
+    Ensure the UUIDs of the sources that changed are passed to the source list widget.
+    """
+    mv = MainView(None)
+    mv.source_list = mocker.MagicMock()
+    mv.empty_conversation_view = mocker.MagicMock()
+
+    mv.show_sources([1, 2, 3], {"2"})
+
+    mv.source_list.update_sources.assert_called_once_with([1, 2, 3], {"2"})
+
+
 def test_MainView_show_sources_when_sources_are_deleted(mocker):
     """
     Ensure that show_sources also deletes the SourceConversationWrapper for a deleted source.
@@ -638,7 +645,6 @@ def test_MainView_on_source_changed(mocker):
     mv.source_list = mocker.MagicMock()
     mv.source_list.get_selected_source = mocker.MagicMock(return_value=factory.Source())
     mv.controller = mocker.MagicMock(is_authenticated=True)
-    mocker.patch("securedrop_client.gui.widgets.source_exists", return_value=True)
     scw = mocker.MagicMock()
     mocker.patch("securedrop_client.gui.widgets.SourceConversationWrapper", return_value=scw)
 
@@ -659,9 +665,8 @@ def test_MainView_on_source_changed_does_not_raise_InvalidRequestError(mocker):
     mv.source_list.get_selected_source = mocker.MagicMock(return_value=factory.Source())
     mv.controller = mocker.MagicMock(is_authenticated=True)
     ex = sqlalchemy.exc.InvalidRequestError()
-    mv.controller.session.refresh.side_effect = ex
+    mocker.patch("securedrop_client.gui.widgets.load_source_collection", side_effect=ex)
 
-    mocker.patch("securedrop_client.gui.widgets.source_exists", return_value=True)
     scw = mocker.MagicMock()
     mocker.patch("securedrop_client.gui.widgets.SourceConversationWrapper", return_value=scw)
     mock_logger = mocker.MagicMock()
@@ -842,10 +847,10 @@ def test_MainView_refresh_source_conversations(homedir, mocker, qtbot, session_m
     )
     mv.on_source_changed()
 
-    assert len(mv.source_list.source_items) == 2
+    assert mv.source_list.count() == 2
 
     scw1 = mv.source_conversations[source1.uuid]
-    sw1 = mv.source_list.get_source_widget(source1.uuid)
+    row1 = mv.source_list.get_source_row(source1.uuid)
 
     assert mv.isVisible()
     assert scw1.isVisible()
@@ -856,7 +861,7 @@ def test_MainView_refresh_source_conversations(homedir, mocker, qtbot, session_m
     assert not scw1.conversation_view.isHidden()
     assert scw1.deletion_indicator.isHidden()
     assert scw1.conversation_deletion_indicator.isHidden()
-    assert sw1.deletion_indicator.isHidden()
+    assert not row1.deleting_conversation
 
     controller.delete_conversation(source1)
 
@@ -871,7 +876,7 @@ def test_MainView_refresh_source_conversations(homedir, mocker, qtbot, session_m
     assert scw1.conversation_view.isHidden()
     assert scw1.deletion_indicator.isHidden()
     assert not scw1.conversation_deletion_indicator.isHidden()
-    assert not sw1.deletion_indicator.isHidden()
+    assert row1.deleting_conversation
 
     # ensure that a refresh does not hide the deletion animation since the success or failure
     # signals should be the only way to stop/hide the animation
@@ -958,70 +963,131 @@ def test_EmptyConversationView_show_no_source_selected_message(mocker):
     assert not ecv.no_source_selected.isHidden()
 
 
-def test_SourceList_get_selected_source(mocker):
+def test_SourceList_get_selected_source(mocker, session):
     """
-    Maintains the selected item if present in new list
+    Returns the source of the selected row, if any.
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
+    sl.controller.session = session
     sources = [factory.Source(), factory.Source()]
+    for source in sources:
+        session.add(source)
+    session.commit()
     sl.update_sources(sources)
 
     assert sl.get_selected_source() is None
 
-    sl.setCurrentItem(sl.itemAt(1, 0))  # select source2
+    sl.setCurrentIndex(sl.source_model.index_for_uuid(sources[1].uuid))  # select source2
 
     current_source = sl.get_selected_source()
 
     assert current_source.id == sources[1].id
 
 
+def test_SourceList_selection_changed_emits_selected_source(mocker, session):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.session = session
+    source = factory.Source()
+    session.add(source)
+    session.commit()
+    sl.update_sources([source])
+    source_selection_changed = mocker.MagicMock()
+    source_selection_cleared = mocker.MagicMock()
+    sl.source_selection_changed.connect(source_selection_changed)
+    sl.source_selection_cleared.connect(source_selection_cleared)
+
+    sl.setCurrentIndex(sl.source_model.index(0))
+    source_selection_changed.assert_called_once_with(source.uuid)
+
+    sl.clearSelection()
+    source_selection_cleared.assert_called_once_with()
+
+
 def test_SourceList_update_adds_new_sources(mocker):
     """
-    Check a new SourceWidget for each passed-in source is created and no widgets are cleared or
-    removed.
+    Check a new row for each passed-in source is created and no rows are removed.
     """
     sl = SourceList()
+    sl.controller = mocker.MagicMock()
+
+    sources = [factory.Source(), factory.Source(), factory.Source()]
+    deleted_uuids = sl.update_sources(sources)
 
-    sl.clear = mocker.MagicMock()
-    sl.insertItem = mocker.MagicMock()
-    sl.takeItem = mocker.MagicMock()
-    sl.setItemWidget = mocker.MagicMock()
+    assert sl.count() == len(sources)
+    assert set(sl.source_model.rows_by_uuid) == {source.uuid for source in sources}
+    assert not sl.selectionModel().hasSelection()
+    assert deleted_uuids == []
+
+
+def test_SourceList_update_only_reloads_changed_sources(mocker):
+    """
+    Ensure that when the changed sources are supplied, only their rows are reloaded, while rows
+    are still added for new sources and removed for deleted ones.
+    """
+    sl = SourceList()
     sl.controller = mocker.MagicMock()
-    sl.setCurrentItem = mocker.MagicMock()
+    sources = [factory.Source(), factory.Source(), factory.Source()]
+    sl.update_sources(sources)
+    # The rows of the indexes shift once the new source's row is inserted, so read their
+    # sources as soon as they change.
+    changed_uuids = []
+    sl.source_model.dataChanged.connect(
+        lambda top_left, bottom_right: changed_uuids.append(
+            top_left.data(SourceListModel.SourceUuidRole)
+        )
+    )
+    sl.reload = mocker.MagicMock()
 
-    mock_sw = mocker.MagicMock()
-    mock_lwi = mocker.MagicMock()
-    mocker.patch("securedrop_client.gui.widgets.SourceWidget", mock_sw)
-    mocker.patch("securedrop_client.gui.widgets.SourceListWidgetItem", mock_lwi)
+    new_source = factory.Source()
+    deleted_uuids = sl.update_sources(
+        [sources[0], sources[1], new_source], {sources[1].uuid, sources[2].uuid, new_source.uuid}
+    )
 
-    sources = [mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()]
+    assert deleted_uuids == [sources[2].uuid]
+    assert set(sl.source_model.rows_by_uuid) == {sources[0].uuid, sources[1].uuid, new_source.uuid}
+    reloaded_uuids = [call.args[1].uuid for call in sl.reload.call_args_list]
+    assert sorted(reloaded_uuids) == sorted([sources[1].uuid, new_source.uuid])
+    assert changed_uuids == [sources[1].uuid]
+
+
+def test_SourceList_update_with_no_changed_sources_reloads_nothing(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sources = [factory.Source(), factory.Source()]
     sl.update_sources(sources)
+    data_changed = mocker.MagicMock()
+    sl.source_model.dataChanged.connect(data_changed)
+    sl.reload = mocker.MagicMock()
+
+    assert sl.update_sources(sources, set()) == []
 
-    assert mock_sw.call_count == len(sources)
-    assert mock_lwi.call_count == len(sources)
-    assert sl.insertItem.call_count == len(sources)
-    assert sl.setItemWidget.call_count == len(sources)
-    assert len(sl.source_items) == len(sources)
-    assert sl.setCurrentItem.call_count == 0
-    sl.clear.assert_not_called()
-    sl.takeItem.assert_not_called()
-    mock_sw.deleteLater.assert_not_called()
+    sl.reload.assert_not_called()
+    data_changed.assert_not_called()
+
+
+def test_SourceList_update_sorts_sources_by_last_updated(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    old = factory.Source(last_updated=datetime(2021, 1, 1))
+    new = factory.Source(last_updated=datetime(2022, 1, 1))
+    sl.update_sources([old, new])
+
+    assert [row.uuid for row in sl.source_model.rows] == [new.uuid, old.uuid]
+
+    old.last_updated = datetime(2023, 1, 1)
+    sl.update_sources([old, new])
+
+    assert [row.uuid for row in sl.source_model.rows] == [old.uuid, new.uuid]
 
 
 def test_SourceList_initial_update_adds_new_sources(mocker):
     """
-    Check a new SourceWidget for each passed-in source is created and no widgets are cleared or
-    removed.
+    Check that the initial update adds the sources in batches.
     """
     sl = SourceList()
-
-    sl.clear = mocker.MagicMock()
     sl.add_source = mocker.MagicMock()
-    sl.setItemWidget = mocker.MagicMock()
-    sl.currentRow = mocker.MagicMock(return_value=0)
-    sl.item = mocker.MagicMock()
-    sl.item().isSelected.return_value = True
     sources = [mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()]
     sl.initial_update(sources)
     sl.add_source.assert_called_once_with(sources)
@@ -1029,11 +1095,12 @@ def test_SourceList_initial_update_adds_new_sources(mocker):
 
 def test_SourceList_update_when_source_deleted(mocker, session, session_maker, homedir):
     """
-    Test that SourceWidget.update gracefully continues when source is deleted during an update.
+    Test that SourceList.update_sources gracefully continues when a source is deleted during an
+    update.
 
-    When SourceList.update calls SourceWidget.update and that SourceWidget's source has been
-    deleted by another ongoing sync, then SourceList.update should silently continue since the
-    ongoing sync will handle the deletion of the source's widgets.
+    When SourceList.update_sources reloads a row and that row's source has been deleted by another
+    ongoing sync, then SourceList.update_sources should silently continue since the ongoing sync
+    will handle the deletion of the source's row.
     """
     mock_gui = mocker.MagicMock()
     controller = logic.Controller("http://localhost", mock_gui, session_maker, homedir, None)
@@ -1043,8 +1110,7 @@ def test_SourceList_update_when_source_deleted(mocker, session, session_maker, h
     session.add(source)
     session.commit()
 
-    # construct the SourceWidget with the source fetched in its
-    # controller's session
+    # fetch the source in the controller's session
     oss = controller.session.query(db.Source).filter_by(id=source.id).one()
 
     # add it to the SourceList
@@ -1052,24 +1118,24 @@ def test_SourceList_update_when_source_deleted(mocker, session, session_maker, h
     sl.setup(controller)
     deleted_uuids = sl.update_sources([oss])
     assert not deleted_uuids
-    assert len(sl.source_items) == 1
+    assert sl.count() == 1
 
     # now delete it to simulate what happens during a sync
     session.delete(source)
     session.commit()
 
-    # now verify that updating does not raise an exception, and that the SourceWidget still exists
+    # now verify that updating does not raise an exception, and that the row still exists
     # since the sync will end up calling update again and delete it
     deleted_uuids = sl.update_sources([source])
     assert len(deleted_uuids) == 0
     assert not deleted_uuids
-    assert len(sl.source_items) == 1
+    assert sl.count() == 1
 
     # finish sync simulation where a local source is deleted
     deleted_uuids = sl.update_sources([])
     assert len(deleted_uuids) == 1
     assert source.uuid in deleted_uuids
-    assert len(sl.source_items) == 0
+    assert sl.count() == 0
 
 
 def test_SourceList_add_source_starts_timer(mocker, session_maker, homedir):
@@ -1095,27 +1161,20 @@ class DeletedSource(Mock):
         raise sqlalchemy.exc.InvalidRequestError()
 
 
-def test_SourceList_initial_update_does_not_raise_exc_and_no_widget_created(mocker, qtbot):
+def test_SourceList_initial_update_does_not_raise_exc_and_no_row_created(mocker, qtbot):
     """
-    This is a regression test to make sure we raise an exception when adding a new source **before**
-    we add a SourceWidget to the SourceList and try to insert into the source_items map.
+    Make sure no row is added for a source which was deleted before it could be added.
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    # Make sure SourceWidget constructor doesn't raise
-    source_widget = SourceWidget(
-        sl.controller, factory.Source(), mark_seen_signal, mocker.MagicMock()
-    )
-    mocker.patch("securedrop_client.gui.widgets.SourceWidget", return_value=source_widget)
     source = DeletedSource()
     sl.initial_update([source])
 
-    def assert_no_source_widget_exists():
+    def assert_no_row_exists():
         assert sl.count() == 0
-        assert len(sl.source_items) == 0
+        assert len(sl.source_model.rows_by_uuid) == 0
 
-    qtbot.waitUntil(assert_no_source_widget_exists, timeout=2)
+    qtbot.waitUntil(assert_no_row_exists, timeout=2)
 
 
 def test_SourceList_update_does_not_raise_exc(mocker):
@@ -1125,18 +1184,6 @@ def test_SourceList_update_does_not_raise_exc(mocker):
     sl.update_sources([source])
 
 
-def test_SourceList_update_does_not_raise_exc_when_itemWidget_is_none(mocker):
-    sl = SourceList()
-    sl.controller = mocker.MagicMock()
-    source = factory.Source()
-    sl.update_sources(
-        [source]
-    )  # first add the source so that the next time the same source is updated
-
-    sl.itemWidget = mocker.MagicMock(return_value=None)
-    sl.update_sources([source])  # does not raise exception
-
-
 def test_SourceList_update_maintains_selection(mocker):
     """
     Maintains the selected item if present in new list
@@ -1146,33 +1193,37 @@ def test_SourceList_update_maintains_selection(mocker):
     sources = [factory.Source(), factory.Source()]
     sl.update_sources(sources)
 
-    sl.setCurrentItem(sl.itemAt(0, 0))  # select the first source
+    sl.setCurrentIndex(sl.source_model.index_for_uuid(sources[0].uuid))
     sl.update_sources(sources)
 
-    assert sl.currentItem()
-    assert sl.itemWidget(sl.currentItem()).source.id == sources[0].id
+    assert sl.currentIndex().data(SourceListModel.SourceUuidRole) == sources[0].uuid
+    assert sl.selectionModel().isSelected(sl.source_model.index_for_uuid(sources[0].uuid))
 
-    sl.setCurrentItem(sl.itemAt(1, 0))  # select the second source
+    sl.setCurrentIndex(sl.source_model.index_for_uuid(sources[1].uuid))
     sl.update_sources(sources)
 
-    assert sl.currentItem()
-    assert sl.itemWidget(sl.currentItem()).source.id == sources[1].id
+    assert sl.currentIndex().data(SourceListModel.SourceUuidRole) == sources[1].uuid
+    assert sl.selectionModel().isSelected(sl.source_model.index_for_uuid(sources[1].uuid))
 
 
-def test_SourceList_update_with_pre_selected_source_maintains_selection(mocker):
+def test_SourceList_update_maintains_selection_when_sources_are_reordered(mocker):
     """
-    Check that an existing source widget that is selected remains selected.
+    Check that the selection follows the selected source when it moves in the list.
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
-    sl.update_sources([factory.Source(), factory.Source()])
-    second_item = sl.itemAt(1, 0)
-    sl.setCurrentItem(second_item)  # select the second source
-    mocker.patch.object(second_item, "isSelected", return_value=True)
+    old = factory.Source(last_updated=datetime(2021, 1, 1))
+    new = factory.Source(last_updated=datetime(2022, 1, 1))
+    sl.update_sources([old, new])
+    sl.setCurrentIndex(sl.source_model.index_for_uuid(old.uuid))
+    assert sl.currentIndex().row() == 1
 
-    sl.update_sources([factory.Source(), factory.Source()])
+    old.last_updated = datetime(2023, 1, 1)
+    sl.update_sources([old, new])
 
-    assert second_item.isSelected() is True
+    assert sl.currentIndex().row() == 0
+    assert sl.currentIndex().data(SourceListModel.SourceUuidRole) == old.uuid
+    assert sl.selectionModel().isSelected(sl.currentIndex())
 
 
 def test_SourceList_update_removes_selected_item_results_in_no_current_selection(mocker):
@@ -1183,15 +1234,16 @@ def test_SourceList_update_removes_selected_item_results_in_no_current_selection
     sl.controller = mocker.MagicMock()
     sl.update_sources([factory.Source(uuid="new"), factory.Source(uuid="newer")])
 
-    sl.setCurrentItem(sl.itemAt(0, 0))  # select source with uuid='newer'
+    sl.setCurrentIndex(sl.source_model.index(0))  # select source with uuid='newer'
     sl.update_sources([factory.Source(uuid="new")])  # delete source with uuid='newer'
 
-    assert not sl.currentItem()
+    assert not sl.currentIndex().isValid()
+    assert not sl.selectionModel().hasSelection()
 
 
 def test_SourceList_update_removes_item_from_end_of_list(mocker):
     """
-    Check that the item is removed from the source list and dict if the source no longer exists.
+    Check that the row is removed from the source list if the source no longer exists.
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
@@ -1201,14 +1253,13 @@ def test_SourceList_update_removes_item_from_end_of_list(mocker):
     assert sl.count() == 3
     sl.update_sources([factory.Source(uuid="newer"), factory.Source(uuid="newest")])
     assert sl.count() == 2
-    assert sl.itemWidget(sl.item(0)).source.uuid == "newest"
-    assert sl.itemWidget(sl.item(1)).source.uuid == "newer"
-    assert len(sl.source_items) == 2
+    assert [row.uuid for row in sl.source_model.rows] == ["newest", "newer"]
+    assert len(sl.source_model.rows_by_uuid) == 2
 
 
 def test_SourceList_update_removes_item_from_middle_of_list(mocker):
     """
-    Check that the item is removed from the source list and dict if the source no longer exists.
+    Check that the row is removed from the source list if the source no longer exists.
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
@@ -1218,14 +1269,13 @@ def test_SourceList_update_removes_item_from_middle_of_list(mocker):
     assert sl.count() == 3
     sl.update_sources([factory.Source(uuid="new"), factory.Source(uuid="newest")])
     assert sl.count() == 2
-    assert sl.itemWidget(sl.item(0)).source.uuid == "newest"
-    assert sl.itemWidget(sl.item(1)).source.uuid == "new"
-    assert len(sl.source_items) == 2
+    assert [row.uuid for row in sl.source_model.rows] == ["newest", "new"]
+    assert len(sl.source_model.rows_by_uuid) == 2
 
 
 def test_SourceList_update_removes_item_from_beginning_of_list(mocker):
     """
-    Check that the item is removed from the source list and dict if the source no longer exists.
+    Check that the row is removed from the source list if the source no longer exists.
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
@@ -1235,9 +1285,8 @@ def test_SourceList_update_removes_item_from_beginning_of_list(mocker):
     assert sl.count() == 3
     sl.update_sources([factory.Source(uuid="new"), factory.Source(uuid="newer")])
     assert sl.count() == 2
-    assert sl.itemWidget(sl.item(0)).source.uuid == "newer"
-    assert sl.itemWidget(sl.item(1)).source.uuid == "new"
-    assert len(sl.source_items) == 2
+    assert [row.uuid for row in sl.source_model.rows] == ["newer", "new"]
+    assert len(sl.source_model.rows_by_uuid) == 2
 
 
 def test_SourceList_add_source_closure_adds_sources(mocker):
@@ -1247,15 +1296,7 @@ def test_SourceList_add_source_closure_adds_sources(mocker):
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
-    sl.insertItem = mocker.MagicMock()
-    sl.setItemWidget = mocker.MagicMock()
-    sl.setCurrentItem = mocker.MagicMock()
-
-    mock_sw = mocker.MagicMock()
-    mock_lwi = mocker.MagicMock()
-    mocker.patch("securedrop_client.gui.widgets.SourceWidget", mock_sw)
-    mocker.patch("securedrop_client.gui.widgets.SourceListWidgetItem", mock_lwi)
-    sources = [mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()]
+    sources = [factory.Source(), factory.Source(), factory.Source()]
     mock_timer = mocker.MagicMock()
     mocker.patch("securedrop_client.gui.widgets.QTimer", mock_timer)
     sl.add_source(sources, 1)
@@ -1266,12 +1307,9 @@ def test_SourceList_add_source_closure_adds_sources(mocker):
     sl.add_source = mocker.MagicMock()
     # Call the inner function (as if the timer had completed).
     inner_fn()
-    assert mock_sw.call_count == 1
-    assert mock_lwi.call_count == 1
-    assert sl.insertItem.call_count == 1
-    assert sl.setItemWidget.call_count == 1
-    assert len(sl.source_items) == 1
-    assert sl.setCurrentItem.call_count == 0
+    assert sl.count() == 1
+    assert sl.source_model.rows[0].uuid == sources[0].uuid
+    assert not sl.selectionModel().hasSelection()
     sl.add_source.assert_called_once_with(sources[1:], 2)
 
 
@@ -1282,14 +1320,6 @@ def test_SourceList_add_source_closure_exits_on_no_more_sources(mocker):
     """
     sl = SourceList()
     sl.controller = mocker.MagicMock()
-    sl.addItem = mocker.MagicMock()
-    sl.setItemWidget = mocker.MagicMock()
-    sl.setCurrentItem = mocker.MagicMock()
-
-    mock_sw = mocker.MagicMock()
-    mock_lwi = mocker.MagicMock()
-    mocker.patch("securedrop_client.gui.widgets.SourceWidget", mock_sw)
-    mocker.patch("securedrop_client.gui.widgets.SourceListWidgetItem", mock_lwi)
     sources = []
     mock_timer = mocker.MagicMock()
     mocker.patch("securedrop_client.gui.widgets.QTimer", mock_timer)
@@ -1301,78 +1331,35 @@ def test_SourceList_add_source_closure_exits_on_no_more_sources(mocker):
     sl.add_source = mocker.MagicMock()
     # Call the inner function (as if the timer had completed).
     assert inner_fn() is None
-    assert mock_sw.call_count == 0
-    assert mock_lwi.call_count == 0
-    assert sl.addItem.call_count == 0
-    assert sl.setItemWidget.call_count == 0
-    assert len(sl.source_items) == 0
-    assert sl.setCurrentItem.call_count == 0
+    assert sl.count() == 0
     assert sl.add_source.call_count == 0
 
 
-def test_SourceList_set_snippet(mocker):
-    """
-    Handle the emitted event in the expected manner.
-    """
-    sl = SourceList()
-    mark_seen_signal = mocker.MagicMock()
-    source_widget = SourceWidget(
-        mocker.MagicMock(), factory.Source(uuid="mock_uuid"), mark_seen_signal, mocker.MagicMock()
-    )
-    source_widget.set_snippet = mocker.MagicMock()
-    source_item = SourceListWidgetItem(sl)
-    sl.setItemWidget(source_item, source_widget)
-    sl.source_items = {"mock_uuid": source_item}
-
-    sl.set_snippet("mock_uuid", "msg_uuid", "msg_content")
-
-    source_widget.set_snippet.assert_called_once_with("mock_uuid", "msg_uuid", "msg_content")
-
-
-def test_SourceList_get_source_widget(mocker):
+def test_SourceList_get_source_row(mocker):
     sl = SourceList()
     sl.controller = mocker.MagicMock()
     sl.update_sources([factory.Source(uuid="mock_uuid")])
-    sl.source_items = {}
 
-    source_widget = sl.get_source_widget("mock_uuid")
+    row = sl.get_source_row("mock_uuid")
 
-    assert source_widget.source_uuid == "mock_uuid"
-    assert source_widget == sl.itemWidget(sl.item(0))
+    assert row.uuid == "mock_uuid"
+    assert row is sl.source_model.index(0).data(SourceListModel.RowRole)
 
 
-def test_SourceList_get_source_widget_does_not_exist(mocker):
+def test_SourceList_get_source_row_does_not_exist(mocker):
     sl = SourceList()
     sl.controller = mocker.MagicMock()
-    mock_source = factory.Source(uuid="mock_uuid")
-    sl.update_sources([mock_source])
-    sl.source_items = {}
-
-    source_widget = sl.get_source_widget("uuid_for_source_not_in_list")
-
-    assert source_widget is None
-
-
-def test_SourceList_get_source_widget_if_one_exists_in_cache(mocker):
-    sl = SourceList()
-    mark_seen_signal = mocker.MagicMock()
-    source_widget = SourceWidget(
-        mocker.MagicMock(), factory.Source(uuid="mock_uuid"), mark_seen_signal, mocker.MagicMock()
-    )
-    source_item = SourceListWidgetItem(sl)
-    sl.setItemWidget(source_item, source_widget)
-    sl.source_items["mock_uuid"] = source_item
+    sl.update_sources([factory.Source(uuid="mock_uuid")])
 
-    assert sl.get_source_widget("mock_uuid") == source_widget
+    assert sl.get_source_row("uuid_for_source_not_in_list") is None
 
 
-def test_SourceWidget_init_for_seen_source(mocker, session):
+def test_SourceList_reload_for_seen_source(mocker, session):
     """
-    The source widget is properly initialised with the supplied seen source.
+    The row of a source whose items have all been seen is shown as seen.
     """
     controller = mocker.MagicMock()
     controller.authenticated_user = factory.User(id=1)
-    controller.mark_seen = mocker.MagicMock()
     source = factory.Source()
 
     seen_file = factory.File(source=source)
@@ -1409,23 +1396,23 @@ def test_SourceWidget_init_for_seen_source(mocker, session):
     session.add(db.SeenMessage(message_id=seen_message_for_another_user.id, journalist_id=666))
     session.add(db.SeenReply(reply_id=seen_reply_for_another_user.id, journalist_id=666))
 
+    storage.update_source_summaries(session)
     session.commit()
 
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
+    sl = SourceList()
+    sl.controller = controller
+    sl.update_sources([source])
 
-    assert sw.source == source
-    assert sw.seen
+    assert sl.get_source_row(source.uuid).seen
 
 
-def test_SourceWidget_init_for_seen_source_with_legacy_data(mocker, session):
+def test_SourceList_reload_for_seen_source_with_legacy_data(mocker, session):
     """
-    The source widget is properly initialised with the supplied seen source. The source has files,
-    messages, and replies with seen records as well as without seen records, where just the is_read
-    boolean is set to test legacy data as well.
+    The row of a source is shown as seen when its files, messages, and replies have seen records
+    as well as no seen records, where just the is_read boolean is set to test legacy data as well.
     """
     controller = mocker.MagicMock()
     controller.authenticated_user = factory.User(id=1)
-    controller.mark_seen = mocker.MagicMock()
     source = factory.Source()
 
     seen_file = factory.File(source=source)
@@ -1470,22 +1457,23 @@ def test_SourceWidget_init_for_seen_source_with_legacy_data(mocker, session):
     session.add(db.SeenMessage(message_id=seen_message_for_another_user.id, journalist_id=666))
     session.add(db.SeenReply(reply_id=seen_reply_for_another_user.id, journalist_id=666))
 
+    storage.update_source_summaries(session)
     session.commit()
 
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
+    sl = SourceList()
+    sl.controller = controller
+    sl.update_sources([source])
 
-    assert sw.source == source
-    assert sw.seen
+    assert sl.get_source_row(source.uuid).seen
 
 
-def test_SourceWidget_init_for_seen_source_legacy_only(mocker, session):
+def test_SourceList_reload_for_seen_source_legacy_only(mocker, session):
     """
-    The source widget is properly initialised with the supplied seen source. The source has files
-    and messages without seen records where just the is_read boolean is set to test legacy data.
+    The row of a source is shown as seen when its files and messages have no seen records but
+    have the legacy is_read boolean set.
     """
     controller = mocker.MagicMock()
     controller.authenticated_user = factory.User(id=1)
-    controller.mark_seen = mocker.MagicMock()
     source = factory.Source()
 
     seen_file = factory.File(source=source, is_read=1)
@@ -1509,23 +1497,24 @@ def test_SourceWidget_init_for_seen_source_legacy_only(mocker, session):
     session.add(draft_reply_from_current_user)
     session.add(draft_reply_from_another_user)
 
+    storage.update_source_summaries(session)
     session.commit()
 
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
+    sl = SourceList()
+    sl.controller = controller
+    sl.update_sources([source])
 
-    assert sw.source == source
-    assert sw.source.seen
-    assert sw.seen
+    assert source.seen
+    assert sl.get_source_row(source.uuid).seen
 
 
-def test_SourceWidget_init_for_unseen_source(mocker, session):
+def test_SourceList_reload_for_unseen_source(mocker, session):
     """
-    The source widget is properly initialised with the supplied unseen source. The source has some
-    files and messages with seen records set and some without.
+    The row of a source is shown as unseen when some of its files and messages have seen records
+    and some do not.
     """
     controller = mocker.MagicMock()
     controller.authenticated_user = factory.User(id=1)
-    controller.mark_seen = mocker.MagicMock()
     source = factory.Source()
 
     seen_file = factory.File(source=source)
@@ -1569,22 +1558,23 @@ def test_SourceWidget_init_for_unseen_source(mocker, session):
     session.add(db.SeenMessage(message_id=seen_message_for_another_user.id, journalist_id=666))
     session.add(db.SeenReply(reply_id=seen_reply_for_another_user.id, journalist_id=666))
 
+    storage.update_source_summaries(session)
     session.commit()
 
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
+    sl = SourceList()
+    sl.controller = controller
+    sl.update_sources([source])
 
-    assert sw.source == source
-    assert not sw.seen
+    assert not sl.get_source_row(source.uuid).seen
 
 
-def test_SourceWidget_init_for_unseen_source_legacy_only(mocker, session):
+def test_SourceList_reload_for_unseen_source_legacy_only(mocker, session):
     """
-    The source widget is properly initialised with the supplied unseen source. The source has some
-    files and messages with is_read set and some without.
+    The row of a source is shown as unseen when some of its files and messages have is_read set
+    and some do not.
     """
     controller = mocker.MagicMock()
     controller.authenticated_user = factory.User(id=1)
-    controller.mark_seen = mocker.MagicMock()
     source = factory.Source()
 
     seen_file = factory.File(source=source, is_read=1)
@@ -1615,458 +1605,499 @@ def test_SourceWidget_init_for_unseen_source_legacy_only(mocker, session):
     session.add(draft_reply_from_current_user)
     session.add(draft_reply_from_another_user)
 
+    storage.update_source_summaries(session)
     session.commit()
 
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
-
-    assert sw.source == source
-    assert not sw.seen
+    sl = SourceList()
+    sl.controller = controller
+    sl.update_sources([source])
 
+    assert not sl.get_source_row(source.uuid).seen
 
-def test_SourceWidget_html_init(mocker):
-    """
-    The source widget is initialised with the given source name, with
-    HTML escaped properly.
-    """
-    controller = mocker.MagicMock()
-    mock_source = mocker.MagicMock()
-    mock_source.journalist_designation = "foo <b>bar</b> baz"
-    mark_seen_signal = mocker.MagicMock()
 
-    sw = SourceWidget(controller, mock_source, mark_seen_signal, mocker.MagicMock())
-    sw.name = mocker.MagicMock()
-    sw.summary_layout = mocker.MagicMock()
+def test_SourceList_reload_when_not_authenticated_shows_source_as_seen(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = False
+    source = factory.Source()
+    mocker.patch("securedrop_client.db.Source.seen", new_callable=PropertyMock, return_value=False)
 
-    mocker.patch("securedrop_client.gui.base.SvgLabel")
-    sw.reload()
+    sl.update_sources([source])
 
-    sw.name.setText.assert_called_once_with("foo <b>bar</b> baz")
+    assert sl.get_source_row(source.uuid).seen
 
 
-def test_SourceWidget__on_adjust_preview(mocker):
+def test_SourceList_reload_html_designation(mocker):
     """
-    Ensure width of the source widget is set to the width passed into adjust_preview.
+    The row holds the designation as it is, since it is painted as plain text.
     """
     sl = SourceList()
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.preview = mocker.MagicMock()
-    source_item = SourceListWidgetItem(sl)
-    sl.setItemWidget(source_item, sw)
+    sl.controller = mocker.MagicMock()
+    source = factory.Source(journalist_designation="foo <b>bar</b> baz")
 
-    sw._on_adjust_preview(100)
+    sl.update_sources([source])
 
-    assert sw.width() == 100
-    sw.preview.adjust_preview.assert_called_with(100)
+    assert sl.get_source_row(source.uuid).designation == "foo <b>bar</b> baz"
+    assert sl.source_model.index(0).data() == "foo <b>bar</b> baz"
 
 
-def test_SourceList_resizeEvent(mocker):
+def test_SourceList_reload_keeps_only_the_first_line_of_the_latest_message(mocker):
+    """
+    Only as much of the preview as could be shown is kept.
+    """
     sl = SourceList()
-    sl.adjust_preview = mocker.MagicMock()
-    sl.resizeEvent(QResizeEvent(QSize(100, 100), QSize(100, 100)))
-    sl.adjust_preview.emit.assert_called_once_with(100)
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    source.summary = factory.SourceSummary(last_activity_uuid="msg-uuid", preview="  hello\nthere")
 
+    sl.update_sources([source])
+    assert sl.get_source_row(source.uuid).preview == "hello"
 
-def test_SourcePreview_adjust_preview(mocker):
-    preview = SourcePreview()
-    preview.refresh_preview_text = mocker.MagicMock()
-    preview.adjust_preview(400)
-    preview.refresh_preview_text.assert_called_once_with()
-    assert preview.max_length == 400 - preview.PREVIEW_WIDTH_DIFFERENCE
-    assert preview.width() == 400 - preview.PREVIEW_WIDTH_DIFFERENCE
+    source.summary.preview = "a" * 251
+    sl.update_sources([source])
+    assert sl.get_source_row(source.uuid).preview == "a" * SourceListRow.MAX_PREVIEW_LENGTH
 
 
-def test_SourceWidget_update_styles_to_read(mocker):
+def test_SourceList_reload_attachment_icon(mocker):
     """
-    Ensure styles are updated so that the source widget appears read when seen is True.
+    Attachment icon indicates document count
     """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = True
-    name = mocker.patch.object(sw, "name")
-    timestamp = mocker.patch.object(sw, "timestamp")
-    preview = mocker.patch.object(sw, "preview")
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source(document_count=1)
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    assert sl.source_delegate.paperclip_icon(row) is sl.source_delegate.paperclip
 
-    sw.update_styles()
+    source.document_count = 0
 
-    name.setObjectName.assert_called_with("SourceWidget_name")
-    timestamp.setObjectName.assert_called_with("SourceWidget_timestamp")
-    preview.setObjectName.assert_called_with("SourceWidget_preview")
+    sl.update_sources([source])
+    assert sl.source_delegate.paperclip_icon(row) is None
 
 
-def test_SourceWidget_update_styles_to_read_selected(mocker):
+def test_SourceList_reload_does_not_raise_exception(mocker):
     """
-    Ensure styles are updated so that the source widget appears read and selected when seen and
-    selected are True.
+    If the source no longer exists in the local data store, ensure the SourceList just logs and
+    does not raise an exception.
     """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = True
-    sw.selected = True
-    name = mocker.patch.object(sw, "name")
-    timestamp = mocker.patch.object(sw, "timestamp")
-    preview = mocker.patch.object(sw, "preview")
-
-    sw.update_styles()
-
-    name.setObjectName.assert_called_with("SourceWidget_name_selected")
-    timestamp.setObjectName.assert_called_with("SourceWidget_timestamp")
-    preview.setObjectName.assert_called_with("SourceWidget_preview")
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source(document_count=1)
+    row = SourceListRow(source.uuid, source.last_updated, source.is_starred)
+    ex = sqlalchemy.exc.InvalidRequestError()
+    sl.controller.session.refresh.side_effect = ex
+    mock_logger = mocker.MagicMock()
+    mocker.patch("securedrop_client.gui.widgets.logger", mock_logger)
+    sl.reload(row, source)
+    assert mock_logger.debug.call_count == 1
 
 
-def test_test_SourceWidget_update_styles_to_unread(mocker):
+def test_SourceList_reload_skips_row_if_deletion_in_progress(mocker):
     """
-    Ensure styles are updated so that the source widget appears unread when seen is False.
+    If the source is being deleted, do not update its row.
     """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = False
-    name = mocker.patch.object(sw, "name")
-    timestamp = mocker.patch.object(sw, "timestamp")
-    preview = mocker.patch.object(sw, "preview")
-
-    sw.update_styles()
-
-    name.setObjectName.assert_called_with("SourceWidget_name_unread")
-    timestamp.setObjectName.assert_called_with("SourceWidget_timestamp_unread")
-    preview.setObjectName.assert_called_with("SourceWidget_preview_unread")
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    row = SourceListRow(source.uuid, source.last_updated, source.is_starred)
+    row.deleting = True
+    sl.reload(row, source)
+    sl.controller.session.refresh.assert_not_called()
+    assert row.designation == ""
 
 
-def test_SourceWidget__on_authentication_changed(mocker):
+def test_SourceList_reload_skips_row_if_sync_is_stale(mocker):
     """
-    Ensure that:
-
-    * The source widget always displays as having been seen if user is offline.
-    * The source widget's seen status remains unchanged when the authentication status changes
-      to the user being online. (Seen status will be corrected in `SourceWidget.update`.)
+    If the sync started before the source was scheduled for deletion, do not update its row.
     """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = False
-    sw.update_styles = mocker.MagicMock()
-
-    sw._on_authentication_changed(authenticated=False)
-
-    sw.update_styles.assert_called_once_with()
-    assert sw.seen
-    sw._on_authentication_changed(authenticated=False)
-    assert sw.seen
-    sw._on_authentication_changed(authenticated=True)
-    assert sw.seen
-    sw.seen = False
-    sw._on_authentication_changed(authenticated=True)
-    assert not sw.seen
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    row = SourceListRow(source.uuid, source.last_updated, source.is_starred)
+    sl._on_sync_started(datetime.now())
+    row.deletion_scheduled_timestamp = datetime.now()
+    sl.reload(row, source)
+    sl.controller.session.refresh.assert_not_called()
+    assert row.designation == ""
 
 
-def test_SourceWidget__on_source_selected(mocker, session):
+def test_SourceList_reload_skips_row_if_conversation_deletion_in_progress(mocker):
     """
-    Ensure the source widget is selected and seen status updates to True when it's selected.
+    If the source conversation is being deleted, do not update its row.
     """
-    controller = mocker.MagicMock()
-    controller.authenticated_user = factory.User(id=1)
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
     source = factory.Source()
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = False
-    sw.update_styles = mocker.MagicMock()
-
-    sw._on_source_selected(source.uuid)
+    row = SourceListRow(source.uuid, source.last_updated, source.is_starred)
+    row.deleting_conversation = True
+    sl.reload(row, source)
+    sl.controller.session.refresh.assert_not_called()
+    assert row.designation == ""
 
-    assert sw.seen
-    assert sw.selected
-    sw.update_styles.assert_called_once_with()
 
-
-def test_SourceWidget__on_source_selected_skips_op_if_uuid_does_not_match(mocker):
+def test_SourceList_set_snippet(mocker, session_maker, session, homedir):
     """
-    Ensure the source widget is not selected and seen status remains the same if uuid does not match
-    the selected source.
+    Snippets are set as expected.
     """
-    controller = mocker.MagicMock()
-    source = factory.Source()
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = False
-    sw.update_styles = mocker.MagicMock()
+    mock_gui = mocker.MagicMock()
+    controller = logic.Controller("http://localhost", mock_gui, session_maker, homedir, None)
+    source = factory.Source(document_count=1)
+    f = factory.File(source=source)
+    session.add(f)
+    session.add(source)
+    session.commit()
+    storage.update_source_summaries(session)
+    session.commit()
 
-    sw._on_source_selected("some-other-uuid")
+    sl = SourceList()
+    sl.setup(controller)
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    assert row.preview == "File: " + f.filename
 
-    assert not sw.seen
-    assert not sw.selected
-    sw.update_styles.assert_called_with()
+    sl.set_snippet(source.uuid, f.uuid, "something new")
+    assert row.preview == "something new"
 
+    # check when a different collection item is specified
+    sl.set_snippet(source.uuid, "mock_file_uuid", "something else")
+    assert row.preview == "something new"
+
+    # check when a different source is specified
+    sl.set_snippet("not-the-source-uuid", f.uuid, "something else")
+    assert row.preview == "something new"
+
+    # check when the source has been deleted that it is ignored
+    session.delete(source)
+    session.commit()
+    sl.update_sources([])
+    sl.set_snippet(source.uuid, f.uuid, "something else")
+    assert row.preview == "something new"
 
-def test_SourceWidget__on_source_selected_skips_op_if_already_seen(mocker):
-    controller = mocker.MagicMock()
-    source = factory.Source()
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
-    sw.seen = True
-    sw.update_styles = mocker.MagicMock()
 
-    sw._on_source_selected(source.uuid)
+def test_SourceList_set_snippet_draft_only(mocker, session_maker, session, homedir):
+    """
+    Snippets/previews do not include draft messages.
+    """
+    mock_gui = mocker.MagicMock()
+    controller = logic.Controller("http://localhost", mock_gui, session_maker, homedir, None)
+    source = factory.Source(document_count=1)
+    f = factory.File(source=source)
+    reply = factory.DraftReply(source=source)
+    session.add(f)
+    session.add(source)
+    session.add(reply)
+    session.commit()
+    storage.update_source_summaries(session)
+    session.commit()
 
-    sw.seen = True
-    sw.update_styles.assert_called_once_with()
+    sl = SourceList()
+    sl.setup(controller)
+    sl.update_sources([source])
+    sl.set_snippet(source.uuid, reply.uuid, "draft")
+    assert sl.get_source_row(source.uuid).preview == "File: " + f.filename
 
 
-def test_SourceWidget__on_sync_started(mocker):
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    timestamp = datetime.now()
-    sw._on_sync_started(timestamp)
-    assert sw.sync_started_timestamp == timestamp
+def test_SourceList_set_snippet_emits_data_changed(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    message = factory.Message(source=source, content="hello")
+    source.summary = factory.SourceSummary(last_activity_uuid=message.uuid, preview="hello")
+    sl.update_sources([source])
+    data_changed = mocker.MagicMock()
+    sl.source_model.dataChanged.connect(data_changed)
 
+    sl.set_snippet(source.uuid, message.uuid, "hi")
 
-def test_SourceWidget__on_conversation_deletion_successful(mocker):
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    timestamp = datetime.now()
-    sw._on_conversation_deletion_successful(sw.source.uuid, timestamp)
-    assert sw.deletion_scheduled_timestamp == timestamp
-    assert sw.preview.text() == "\u2014 All files and messages deleted for this source \u2014"
-    assert sw.deleting_conversation is False
-    assert sw.deletion_indicator.isHidden()
+    assert data_changed.call_count == 1
+    assert data_changed.call_args[0][0].row() == 0
 
 
-def test_SourceWidget_update_attachment_icon(mocker):
+def test_SourceList__on_authentication_changed(mocker):
     """
-    Attachment icon identicates document count
-    """
-    controller = mocker.MagicMock()
-    source = factory.Source(document_count=1)
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
+    Ensure that:
 
-    sw.reload()
-    assert not sw.paperclip.isHidden()
+    * Sources are always displayed as having been seen if user is offline.
+    * The seen status remains unchanged when the authentication status changes to the user being
+      online. (Seen status will be corrected when the source list is next updated.)
+    * Star updates which were pending when the user went offline are forgotten.
+    """
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    row.seen = False
+    row.star_pending_count = 1
 
-    source.document_count = 0
+    sl._on_authentication_changed(authenticated=False)
 
-    sw.reload()
-    assert sw.paperclip.isHidden()
+    assert row.seen
+    assert row.star_pending_count == 1
+    sl._on_authentication_changed(authenticated=True)
+    assert row.seen
+    assert row.star_pending_count == 0
+    row.seen = False
+    sl._on_authentication_changed(authenticated=True)
+    assert not row.seen
 
 
-def test_SourceWidget_update_does_not_raise_exception(mocker):
+def test_SourceList__on_source_selected(mocker):
     """
-    If the source no longer exists in the local data store, ensure the SourceWidget just logs and
-    does not raise an exception.
+    Ensure the source is shown as selected and seen status updates to True when it's selected.
     """
-    controller = mocker.MagicMock()
-    source = factory.Source(document_count=1)
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
-    ex = sqlalchemy.exc.InvalidRequestError()
-    controller.session.refresh.side_effect = ex
-    mock_logger = mocker.MagicMock()
-    mocker.patch("securedrop_client.gui.widgets.logger", mock_logger)
-    sw.reload()
-    assert mock_logger.debug.call_count == 1
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    row.seen = False
 
+    sl.source_selected.emit(source.uuid)
 
-def test_SourceWidget_update_skips_setting_snippet_if_deletion_in_progress(mocker):
-    """
-    If the source is being deleted, do not update the snippet.
-    """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.deleting = True
-    sw.set_snippet = mocker.MagicMock()
-    sw.reload()
-    sw.set_snippet.assert_not_called()
+    assert row.seen
+    assert sl.source_delegate.name_selector(row, selected=True) == (
+        "SourceWidget_name_selected",
+        "",
+    )
 
 
-def test_SourceWidget_update_skips_setting_snippet_if_sync_is_stale(mocker):
+def test_SourceList__on_source_selected_skips_op_if_uuid_does_not_match(mocker):
     """
-    If the sync started before the source was scheduled for deletion, do not update the snippet.
+    Ensure the seen status remains the same if uuid does not match the selected source.
     """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.sync_started_timestamp = datetime.now()
-    sw.deletion_scheduled_timestamp = datetime.now()
-    sw.set_snippet = mocker.MagicMock()
-    sw.reload()
-    sw.set_snippet.assert_not_called()
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    row.seen = False
 
+    sl.source_selected.emit("some-other-uuid")
 
-def test_SourceWidget_update_skips_setting_snippet_if_conversation_deletion_in_progress(mocker):
-    """
-    If the source conversation is being deleted, do not update the snippet.
-    """
-    sw = SourceWidget(mocker.MagicMock(), factory.Source(), mocker.MagicMock(), mocker.MagicMock())
-    sw.deleting_conversation = True
-    sw.set_snippet = mocker.MagicMock()
-    sw.reload()
-    sw.set_snippet.assert_not_called()
+    assert not row.seen
+    assert sl.source_delegate.name_selector(row, selected=False) == (
+        "SourceWidget_name_unread",
+        "",
+    )
 
 
-def test_SourceWidget_set_snippet_draft_only(mocker, session_maker, session, homedir):
-    """
-    Snippets/previews do not include draft messages.
-    """
-    mock_gui = mocker.MagicMock()
-    controller = logic.Controller("http://localhost", mock_gui, session_maker, homedir, None)
-    source = factory.Source(document_count=1)
-    mark_seen_signal = mocker.MagicMock()
-    f = factory.File(source=source)
-    reply = factory.DraftReply(source=source)
-    session.add(f)
-    session.add(source)
-    session.add(reply)
-    session.commit()
+def test_SourceList__on_source_selected_skips_op_if_already_seen(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    row.seen = True
+    row_changed = mocker.patch.object(sl.source_model, "row_changed")
 
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
-    sw.set_snippet(source.uuid, reply.uuid, f.filename)
-    assert sw.preview.text() == "File: " + f.filename
+    sl.source_selected.emit(source.uuid)
 
+    assert row.seen
+    row_changed.assert_called_once_with(source.uuid)
 
-def test_SourceWidget_set_snippet(mocker, session_maker, session, homedir):
-    """
-    Snippets are set as expected.
-    """
-    mock_gui = mocker.MagicMock()
-    controller = logic.Controller("http://localhost", mock_gui, session_maker, homedir, None)
-    source = factory.Source(document_count=1)
-    mark_seen_signal = mocker.MagicMock()
-    f = factory.File(source=source)
-    session.add(f)
-    session.add(source)
-    session.commit()
 
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
-    sw.set_snippet(source.uuid, "mock_file_uuid", f.filename)
-    assert sw.preview.text() == "File: " + f.filename
+def test_SourceList__on_sync_started(mocker):
+    sl = SourceList()
+    timestamp = datetime.now()
+    sl._on_sync_started(timestamp)
+    assert sl.sync_started_timestamp == timestamp
 
-    # check when a different source is specified
-    sw.set_snippet("not-the-source-uuid", "mock_file_uuid", "something new")
-    assert sw.preview.text() == "File: " + f.filename
 
-    source_uuid = source.uuid
-    session.delete(source)
-    session.commit()
+def test_SourceList__on_conversation_deletion_successful(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    source = factory.Source()
+    sl.update_sources([source])
+    sl._on_conversation_deleted(source.uuid)
+    timestamp = datetime.now()
 
-    # check when the source has been deleted that it catches sqlalchemy.exc.InvalidRequestError
-    sw.set_snippet(source_uuid, "mock_file_uuid", "something new")
+    sl._on_conversation_deletion_successful(source.uuid, timestamp)
 
+    row = sl.get_source_row(source.uuid)
+    assert row.deletion_scheduled_timestamp == timestamp
+    assert row.preview == "\u2014 All files and messages deleted for this source \u2014"
+    assert row.deleting_conversation is False
+    assert not sl.source_delegate.shows_deletion_indicator(row)
+    assert sl.deletion_animation.state() == QMovie.NotRunning
 
-def test_SourceWidget_update_truncate_latest_msg(mocker):
-    """
-    If the latest message in the conversation is longer than 150 characters,
-    truncate and add "..." to the end.
-    """
-    controller = mocker.MagicMock()
-    source = mocker.MagicMock()
-    source.journalist_designation = "Testy McTestface"
-    source.collection = [factory.Message(content="a" * 151)]
-    source.server_collection = source.collection
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
 
-    sw.reload()
-    assert sw.preview.text().endswith("...")
+def test_SourceList__on_source_deleted(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123")])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
 
+    sl._on_source_deleted("123")
 
-def test_SourceWidget__on_source_deleted(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, factory.Source(uuid="123"), mark_seen_signal, mocker.MagicMock())
-    sw._on_source_deleted("123")
-    assert sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert sw.paperclip.isHidden()
-    assert sw.preview.isHidden()
-    assert not sw.timestamp.isHidden()
-    assert not sw.deletion_indicator.isHidden()
-    assert sw.preview.text() == ""
+    assert delegate.star_icon(row) is None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is None
+    assert delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert row.preview == ""
+    assert sl.deletion_animation.state() == QMovie.Running
 
     # simulate set_snippet after the source is deleted but before sync
-    sw.set_snippet("123")
-    assert sw.preview.text() == ""
+    row.last_activity_uuid = "msg_uuid"
+    sl.set_snippet("123", "msg_uuid", "something new")
+    assert row.preview == ""
 
 
-def test_SourceWidget__on_source_deleted_wrong_uuid(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    source = factory.Source(uuid="123")
-    source.document_count = mocker.MagicMock(return_value=1)
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
-    sw._on_source_deleted("321")
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert not sw.paperclip.isHidden()
-    assert not sw.preview.isHidden()
-    assert sw.deletion_indicator.isHidden()
-    assert not sw.timestamp.isHidden()
-
-
-def test_SourceWidget__on_source_deletion_failed(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, factory.Source(uuid="123"), mark_seen_signal, mocker.MagicMock())
-    sw._on_source_deleted("123")
+def test_SourceList__on_source_deleted_wrong_uuid(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123", document_count=1)])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
 
-    sw._on_source_deletion_failed("123")
+    sl._on_source_deleted("321")
 
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert sw.paperclip.isHidden()
-    assert not sw.preview.isHidden()
-    assert sw.deletion_indicator.isHidden()
-    assert not sw.timestamp.isHidden()
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is delegate.paperclip
+    assert not delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert sl.deletion_animation.state() == QMovie.NotRunning
 
 
-def test_SourceWidget__on_source_deletion_failed_wrong_uuid(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, factory.Source(uuid="123"), mark_seen_signal, mocker.MagicMock())
-    sw._on_source_deleted("123")
+def test_SourceList__on_source_deletion_failed(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123")])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
+    sl._on_source_deleted("123")
 
-    sw._on_source_deletion_failed("321")
+    sl._on_source_deletion_failed("123")
 
-    assert sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert sw.paperclip.isHidden()
-    assert sw.preview.isHidden()
-    assert not sw.deletion_indicator.isHidden()
-    assert not sw.timestamp.isHidden()
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is None
+    assert not delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert sl.deletion_animation.state() == QMovie.NotRunning
 
 
-def test_SourceWidget__on_source_conversation_deleted_with_empty_collection(
-    mocker, session, source
-):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
+def test_SourceList__on_source_deletion_failed_wrong_uuid(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123")])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
+    sl._on_source_deleted("123")
+
+    sl._on_source_deletion_failed("321")
+
+    assert delegate.star_icon(row) is None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is None
+    assert delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert sl.deletion_animation.state() == QMovie.Running
+
 
+def test_SourceList__on_source_conversation_deleted_with_empty_collection(mocker, session):
     source = factory.Source()
     session.add(source)
     session.commit()
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    delegate = sl.source_delegate
 
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
-    sw._on_conversation_deleted(source.uuid)
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert not sw.timestamp.isHidden()
-    # with an empty collection, all paperclips are hidden
-    assert sw.paperclip.isHidden()
-    assert sw.paperclip_disabled.isHidden()
-    assert sw.preview.isHidden()
-    assert not sw.deletion_indicator.isHidden()
+    sl._on_conversation_deleted(source.uuid)
 
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert row.timestamp
+    # with an empty collection, no paperclip is shown
+    assert delegate.paperclip_icon(row) is None
+    assert delegate.shows_deletion_indicator(row)
+    assert sl.deletion_animation.state() == QMovie.Running
 
-def test_SourceWidget__on_source_conversation_deleted_with_document(mocker, session):
-    controller = mocker.MagicMock()
 
+def test_SourceList__on_source_conversation_deleted_with_document(mocker, session):
     source = factory.Source()
     session.add(source)
-
     doc = factory.File(source=source)
     session.add(doc)
     source.document_count = len(source.files)
     session.commit()
-
     assert source.document_count == 1
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([source])
+    row = sl.get_source_row(source.uuid)
+    delegate = sl.source_delegate
+
+    sl._on_conversation_deleted(source.uuid)
 
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
-    sw._on_conversation_deleted(source.uuid)
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert not sw.timestamp.isHidden()
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert row.timestamp
     # with a collection, the paperclip is shown during deletion, but disabled
-    assert sw.paperclip.isHidden()
-    assert not sw.paperclip_disabled.isHidden()
-    assert sw.preview.isHidden()
-    assert not sw.deletion_indicator.isHidden()
+    assert delegate.paperclip_icon(row) is delegate.paperclip_disabled
+    assert delegate.shows_deletion_indicator(row)
+    assert sl.deletion_animation.state() == QMovie.Running
+
+
+def test_SourceList__on_source_conversation_deleted_wrong_uuid(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123", document_count=1)])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
+
+    sl._on_conversation_deleted("321")
+
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is delegate.paperclip
+    assert not delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert sl.deletion_animation.state() == QMovie.NotRunning
+
+
+def test_SourceList__on_source_conversation_deletion_failed(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123")])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
+    sl._on_conversation_deleted("123")
+
+    sl._on_conversation_deletion_failed("123")
+
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is None
+    assert not delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert sl.deletion_animation.state() == QMovie.NotRunning
+
+
+def test_SourceList__on_source_conversation_deletion_failed_wrong_uuid(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([factory.Source(uuid="123")])
+    row = sl.get_source_row("123")
+    delegate = sl.source_delegate
+    sl._on_conversation_deleted("123")
+
+    sl._on_conversation_deletion_failed("321")
+
+    assert delegate.star_icon(row) is not None
+    assert row.designation
+    assert delegate.paperclip_icon(row) is None
+    assert delegate.shows_deletion_indicator(row)
+    assert row.timestamp
+    assert sl.deletion_animation.state() == QMovie.Running
 
 
-def test_SourceWidget_preview_after_conversation_deleted(mocker, session, i18n):
+def test_SourceList_preview_after_conversation_deleted(mocker, session, i18n):
     # a source with non-zero interaction count, but zero submissions,
     # has had its conversation deleted
     source = factory.Source()
@@ -2074,468 +2105,534 @@ def test_SourceWidget_preview_after_conversation_deleted(mocker, session, i18n):
     source.interaction_count = 3
     session.commit()
 
-    controller = mocker.MagicMock()
-    sw = SourceWidget(controller, source, mocker.MagicMock(), mocker.MagicMock())
-    sw.reload()
-    assert sw.preview.property("class") == "conversation_deleted"
-    assert sw.preview.text() == _("\u2014 All files and messages deleted for this source \u2014")
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.update_sources([source])
 
+    row = sl.get_source_row(source.uuid)
+    assert row.conversation_deleted
+    assert row.preview == _("— All files and messages deleted for this source —")
 
-def test_SourceWidget__on_source_conversation_deleted_wrong_uuid(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    source = factory.Source(uuid="123")
-    source.document_count = mocker.MagicMock(return_value=1)
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
-    sw._on_conversation_deleted("321")
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert not sw.paperclip.isHidden()
-    assert not sw.preview.isHidden()
-    assert sw.deletion_indicator.isHidden()
-    assert not sw.timestamp.isHidden()
-
-
-def test_SourceWidget__on_source_conversation_deletion_failed(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, factory.Source(uuid="123"), mark_seen_signal, mocker.MagicMock())
-    sw._on_conversation_deleted("123")
 
-    sw._on_conversation_deletion_failed("123")
+def test_SourceList_toggle_star_to_starred(mocker):
+    """
+    Ensure toggling the star of an unstarred source stars it.
+    """
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=False)])
 
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert sw.paperclip.isHidden()
-    assert not sw.preview.isHidden()
-    assert sw.deletion_indicator.isHidden()
-    assert not sw.timestamp.isHidden()
+    sl.toggle_star("mock_uuid")
 
+    sl.controller.update_star.assert_called_once_with("mock_uuid", False)
+    row = sl.get_source_row("mock_uuid")
+    assert row.is_starred
+    assert row.star_pending_count == 1
+    assert row.star_wait_until_next_sync
 
-def test_SourceWidget__on_source_conversation_deletion_failed_wrong_uuid(mocker, session, source):
-    controller = mocker.MagicMock()
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, factory.Source(uuid="123"), mark_seen_signal, mocker.MagicMock())
-    sw._on_conversation_deleted("123")
 
-    sw._on_conversation_deletion_failed("321")
+def test_SourceList_toggle_star_to_unstarred(mocker):
+    """
+    Ensure toggling the star of a starred source unstars it.
+    """
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=True)])
 
-    assert not sw.star.isHidden()
-    assert not sw.name.isHidden()
-    assert sw.paperclip.isHidden()
-    assert sw.preview.isHidden()
-    assert not sw.deletion_indicator.isHidden()
-    assert not sw.timestamp.isHidden()
+    sl.toggle_star("mock_uuid")
 
+    sl.controller.update_star.assert_called_once_with("mock_uuid", True)
+    assert not sl.get_source_row("mock_uuid").is_starred
 
-def test_SourceWidget_uses_SecureQLabel(mocker):
+
+def test_SourceList_toggle_star_offline(mocker):
     """
-    Ensure the source widget preview uses SecureQLabel and is not injectable
+    Ensure the star cannot be toggled when offline.
     """
-    controller = mocker.MagicMock()
-    source = mocker.MagicMock()
-    source.journalist_designation = "Testy McTestface"
-    source.collection = [factory.Message(content="a" * 121)]
-    mark_seen_signal = mocker.MagicMock()
-    sw = SourceWidget(controller, source, mark_seen_signal, mocker.MagicMock())
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = False
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=True)])
 
-    sw.reload()
-    assert isinstance(sw.preview, SecureQLabel)
+    sl.toggle_star("mock_uuid")
 
-    sw.preview.setTextFormat = mocker.MagicMock()
-    sw.preview.setText("<b>bad text</b>")
-    sw.reload()
-    sw.preview.setTextFormat.assert_called_with(Qt.PlainText)
+    sl.controller.on_action_requiring_login.assert_called_once_with()
+    sl.controller.update_star.assert_not_called()
+    row = sl.get_source_row("mock_uuid")
+    assert row.is_starred
+    assert sl.source_delegate.star_icon(row) is sl.source_delegate.star_on
 
 
-def test_StarToggleButton_init_source_starred(mocker):
-    controller = mocker.MagicMock()
-    source = factory.Source(is_starred=True)
+def test_SourceList_toggle_star_for_source_not_in_list(mocker):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
 
-    stb = StarToggleButton(controller, source.uuid, source.is_starred)
+    sl.toggle_star("mock_uuid")
 
-    assert stb.source_uuid == source.uuid
-    assert stb.isChecked() is True
+    sl.controller.update_star.assert_not_called()
 
 
-def test_StarToggleButton_init_source_unstarred(mocker):
-    controller = mocker.MagicMock()
-    source = factory.Source(is_starred=False)
+def test_SourceList_click_on_star_toggles_star_without_selecting_source(mocker, qtbot):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=False)])
+    sl.show()
+    qtbot.waitExposed(sl)
+    rect = sl.visualRect(sl.source_model.index(0))
 
-    stb = StarToggleButton(controller, source.uuid, source.is_starred)
+    data_changed = mocker.MagicMock()
+    sl.source_model.dataChanged.connect(data_changed)
 
-    assert stb.source_uuid == source.uuid
-    assert stb.isChecked() is False
+    QTest.mouseClick(sl.viewport(), Qt.LeftButton, pos=sl.source_delegate.star_rect(rect).center())
 
+    sl.controller.update_star.assert_called_once_with("mock_uuid", False)
+    assert not sl.selectionModel().hasSelection()
+    index = sl.source_model.index(0)
+    assert index.data(SourceListModel.StarredRole) is True
+    assert index.data(Qt.AccessibleTextRole).endswith(", starred")
+    assert data_changed.call_args[0][0] == index
 
-def test_StarToggleButton_eventFilter_when_checked(mocker):
-    """
-    Ensure the hover events are handled properly when star is checked and online.
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", True)
-    stb.pressed = mocker.MagicMock()
-    stb.setIcon = mocker.MagicMock()
-    stb.set_icon = mocker.MagicMock()
-    load_icon_fn = mocker.patch("securedrop_client.gui.widgets.load_icon")
+    QTest.mouseClick(sl.viewport(), Qt.LeftButton, pos=rect.center())
 
-    # Hover enter
-    test_event = QEvent(QEvent.HoverEnter)
-    stb.eventFilter(stb, test_event)
-    assert stb.setIcon.call_count == 1
-    load_icon_fn.assert_called_once_with("star_hover.svg")
+    assert sl.controller.update_star.call_count == 1
+    assert sl.selectionModel().isSelected(sl.source_model.index(0))
 
-    # Hover leave
-    test_event = QEvent(QEvent.HoverLeave)
-    stb.eventFilter(stb, test_event)
-    stb.set_icon.assert_called_once_with(on="star_on.svg", off="star_off.svg")
 
-    # Authentication change
-    stb.on_authentication_changed(True)
-    assert stb.isCheckable() is True
-    stb.pressed.disconnect.assert_called_once_with()
-    stb.pressed.connect.assert_called_once_with(stb.on_pressed)
+def test_SourceList_space_toggles_star_of_selected_source(mocker, qtbot):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=False)])
+    sl.show()
+    qtbot.waitExposed(sl)
+    index = sl.source_model.index(0)
 
+    # nothing happens until a source is selected
+    QTest.keyClick(sl, Qt.Key_Space)
+    sl.controller.update_star.assert_not_called()
 
-def test_StarToggleButton_eventFilter_when_not_checked(mocker):
-    """
-    Ensure the hover events are handled properly when star is checked and online.
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", False)
-    stb.pressed = mocker.MagicMock()
-    stb.setIcon = mocker.MagicMock()
-    stb.set_icon = mocker.MagicMock()
-    load_icon_fn = mocker.patch("securedrop_client.gui.widgets.load_icon")
+    sl.clearSelection()
+    sl.setCurrentIndex(index)
+    QTest.keyClick(sl, Qt.Key_Space)
 
-    # Hover enter
-    test_event = QEvent(QEvent.HoverEnter)
-    stb.eventFilter(stb, test_event)
-    assert stb.setIcon.call_count == 1
-    load_icon_fn.assert_called_once_with("star_hover.svg")
+    sl.controller.update_star.assert_called_once_with("mock_uuid", False)
+    assert index.data(SourceListModel.StarredRole) is True
+    assert index.data(Qt.AccessibleTextRole).endswith(", starred")
+    assert sl.selectionModel().isSelected(index)
 
-    # Hover leave
-    test_event = QEvent(QEvent.HoverLeave)
-    stb.eventFilter(stb, test_event)
-    stb.set_icon.assert_called_once_with(on="star_on.svg", off="star_off.svg")
+    QTest.keyClick(sl, Qt.Key_Space)
 
-    # Authentication change
-    stb.on_authentication_changed(True)
-    assert stb.isCheckable() is True
-    stb.pressed.disconnect.assert_called_once_with()
-    stb.pressed.connect.assert_called_once_with(stb.on_pressed)
+    sl.controller.update_star.assert_called_with("mock_uuid", True)
+    assert index.data(SourceListModel.StarredRole) is False
+    assert index.data(Qt.AccessibleTextRole).endswith(", not starred")
 
+    # the star of a source that is being deleted is hidden and cannot be toggled
+    sl._on_source_deleted("mock_uuid")
+    QTest.keyClick(sl, Qt.Key_Space)
+    assert sl.controller.update_star.call_count == 2
 
-def test_StarToggleButton_eventFilter_when_checked_and_offline(mocker):
-    """
-    Ensure the hover events do not change the icon when offline and that the star icon is set to
-    off='star_on.svg' when checked and offline.
-    """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", True)
-    stb.pressed = mocker.MagicMock()
-    stb.setIcon = mocker.MagicMock()
-    stb.set_icon = mocker.MagicMock()
-    load_icon_fn = mocker.patch("securedrop_client.gui.widgets.load_icon")
-
-    # Authentication change
-    stb.on_authentication_changed(False)
-    assert stb.isCheckable() is False
-    stb.set_icon.assert_called_with(on="star_on.svg", off="star_on.svg")
-    stb.pressed.disconnect.assert_called_once_with()
-    stb.pressed.connect.assert_called_once_with(stb.on_pressed_offline)
 
-    # Hover enter
-    test_event = QEvent(QEvent.HoverEnter)
-    stb.eventFilter(stb, test_event)
-    stb.setIcon.assert_not_called()
-    load_icon_fn.assert_not_called()
+def test_SourceList_click_on_hidden_star_selects_source(mocker, qtbot):
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid")])
+    sl._on_source_deleted("mock_uuid")
+    sl.show()
+    qtbot.waitExposed(sl)
+    rect = sl.visualRect(sl.source_model.index(0))
 
-    # Hover leave
-    test_event = QEvent(QEvent.HoverLeave)
-    stb.eventFilter(stb, test_event)
-    stb.setIcon.assert_not_called()
+    QTest.mouseClick(sl.viewport(), Qt.LeftButton, pos=sl.source_delegate.star_rect(rect).center())
 
+    sl.controller.update_star.assert_not_called()
+    assert sl.selectionModel().isSelected(sl.source_model.index(0))
 
-def test_StarToggleButton_eventFilter_when_not_checked_and_offline(mocker):
+
+def test_SourceList_hovering_over_star(mocker, qtbot):
     """
-    Ensure the hover events do not change the icon when offline and that the star icon is set to
-    off='star_on.svg' when unchecked and offline.
+    Ensure the star under the mouse is highlighted when it can be toggled.
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", False)
-    stb.pressed = mocker.MagicMock()
-    stb.setIcon = mocker.MagicMock()
-    stb.set_icon = mocker.MagicMock()
-    load_icon_fn = mocker.patch("securedrop_client.gui.widgets.load_icon")
-
-    # Authentication change
-    stb.on_authentication_changed(False)
-    assert stb.isCheckable() is False
-    stb.pressed.disconnect.assert_called_once_with()
-    stb.pressed.connect.assert_called_once_with(stb.on_pressed_offline)
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=True)])
+    sl.show()
+    qtbot.waitExposed(sl)
+    rect = sl.visualRect(sl.source_model.index(0))
+    row = sl.get_source_row("mock_uuid")
 
-    # Hover enter
-    test_event = QEvent(QEvent.HoverEnter)
-    stb.eventFilter(stb, test_event)
-    stb.setIcon.assert_not_called()
-    load_icon_fn.assert_not_called()
+    QTest.mouseMove(sl.viewport(), sl.source_delegate.star_rect(rect).center())
+    assert sl.source_delegate.hovered_star_uuid == "mock_uuid"
+    assert sl.source_delegate.star_icon(row) is sl.source_delegate.star_hover
 
-    # Hover leave
-    test_event = QEvent(QEvent.HoverLeave)
-    stb.eventFilter(stb, test_event)
-    stb.setIcon.assert_not_called()
+    QTest.mouseMove(sl.viewport(), rect.center())
+    assert sl.source_delegate.hovered_star_uuid is None
+    assert sl.source_delegate.star_icon(row) is sl.source_delegate.star_on
+
+    QTest.mouseMove(sl.viewport(), sl.source_delegate.star_rect(rect).center())
+    sl._on_authentication_changed(False)
+    assert sl.source_delegate.hovered_star_uuid is None
+
+    sl.controller.is_authenticated = False
+    QTest.mouseMove(sl.viewport(), rect.center())
+    QTest.mouseMove(sl.viewport(), sl.source_delegate.star_rect(rect).center())
+    assert sl.source_delegate.hovered_star_uuid is None
 
 
-def test_StarToggleButton_on_authentication_changed_while_authenticated_and_checked(mocker):
+def test_SourceList_update_star(mocker):
     """
-    If on_authentication_changed is set up correctly, then toggling a checked button should result
-    in the button being unchecked.
+    Ensure reloading a row syncs the star state with the server if there are no pending jobs and
+    we're not waiting until the next sync (in order to avoid the "ghost" issue where the row is
+    reloaded with an outdated state between a star job finishing and a sync).
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", True)
-    stb.on_pressed = mocker.MagicMock()
-    stb.on_authentication_changed(True)
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    row = SourceListRow("mock_uuid", datetime.now(), True)
+
+    # Should not change because we wait until next sync
+    row.star_pending_count = 0
+    row.star_wait_until_next_sync = True
+    sl._update_star(row, False)
+    assert row.is_starred is True
+    sl._update_star(row, True)
+    assert row.is_starred is True
 
-    stb.click()
+    # Should update to match value provided by update because there are no pending star jobs and
+    # wait_until_next_sync is False, meaning a sync already occurred after the star job finished
+    row.is_starred = True
+    row.star_pending_count = 0
+    row.star_wait_until_next_sync = False
+    sl._update_star(row, False)
+    assert row.is_starred is False
+    sl._update_star(row, True)
+    assert row.is_starred is True
 
-    stb.on_pressed.assert_called_once_with()
-    assert stb.isChecked() is False
+    # Should not change because there are pending star jobs
+    row.is_starred = True
+    row.star_pending_count = 1
+    row.star_wait_until_next_sync = True
+    sl._update_star(row, False)
+    assert row.is_starred is True
+    sl._update_star(row, True)
+    assert row.is_starred is True
+    # Still should not change because there are pending star jobs
+    row.star_wait_until_next_sync = False
+    sl._update_star(row, False)
+    assert row.is_starred is True
+    sl._update_star(row, True)
+    assert row.is_starred is True
 
 
-def test_StarToggleButton_on_authentication_changed_while_authenticated_and_not_checked(mocker):
+def test_SourceList_update_star_when_not_authenticated(mocker):
     """
-    If on_authentication_changed is set up correctly, then calling toggle on an unchecked button
-    should result in the button being unchecked.
+    Ensure the star does not change if the user is not authenticated.
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", False)
-    stb.on_pressed = mocker.MagicMock()
-    stb.on_authentication_changed(True)
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = False
+    row = SourceListRow("mock_uuid", datetime.now(), True)
 
-    stb.click()
+    # Star stays on
+    sl._update_star(row, False)
+    assert row.is_starred is True
 
-    stb.on_pressed.assert_called_once_with()
-    assert stb.isChecked() is True
+    # Star stays off
+    row.is_starred = False
+    sl._update_star(row, True)
+    assert row.is_starred is False
 
 
-def test_StarToggleButton_on_authentication_changed_while_offline_mode_and_not_checked(mocker):
+def test_SourceList__on_star_update_failed(mocker):
     """
-    Ensure on_authentication_changed is set up correctly for offline mode.
+    Ensure the star is toggled to the state provided in the failure handler and that the pending
+    count is decremented if the source uuid matches.
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", False)
-    stb.on_pressed_offline = mocker.MagicMock()
-    stb.on_pressed = mocker.MagicMock()
-    stb.on_authentication_changed(False)
-
-    stb.click()
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=False)])
+    row = sl.get_source_row("mock_uuid")
 
-    stb.on_pressed_offline.assert_called_once_with()
-    stb.on_pressed.assert_not_called()
-    assert stb.isChecked() is False
+    sl.toggle_star("mock_uuid")
+    assert row.is_starred is True
+    assert row.star_pending_count == 1
+    sl._on_star_update_failed("mock_uuid", is_starred=False)
+    assert row.is_starred is False
+    assert row.star_pending_count == 0
 
 
-def test_StarToggleButton_on_authentication_changed_while_offline_mode_and_checked(mocker):
+def test_SourceList__on_star_update_failed_for_non_matching_source_uuid(mocker):
     """
-    Ensure on_authentication_changed is set up correctly for offline mode.
+    Ensure the star is not toggled and that the pending count stays the same if the source uuid
+    does not match.
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", True)
-    stb.on_pressed_offline = mocker.MagicMock()
-    stb.on_pressed = mocker.MagicMock()
-    stb.on_authentication_changed(False)
-
-    stb.click()
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=False)])
+    row = sl.get_source_row("mock_uuid")
 
-    stb.on_pressed_offline.assert_called_once_with()
-    stb.on_pressed.assert_not_called()
-    assert stb.isCheckable() is False
-    assert stb.is_starred is True
+    sl.toggle_star("mock_uuid")
+    assert row.is_starred is True
+    assert row.star_pending_count == 1
+    sl._on_star_update_failed("some_other_uuid", is_starred=False)
+    assert row.is_starred is True
+    assert row.star_pending_count == 1
 
 
-def test_StarToggleButton_on_pressed_toggles_to_starred(mocker):
+def test_SourceList__on_star_update_successful(mocker):
     """
-    Ensure pressing the star button toggles from unstarred to starred.
+    Ensure that the pending count is decremented if the source uuid matches.
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", False)
-
-    stb.click()
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sl.update_sources([factory.Source(uuid="mock_uuid", is_starred=True)])
+    row = sl.get_source_row("mock_uuid")
+
+    sl.toggle_star("mock_uuid")
+    assert row.star_pending_count == 1
+    sl._on_star_update_successful("mock_uuid")
+    assert row.star_pending_count == 0
+    sl._on_star_update_successful("some_other_uuid")
+    assert row.star_pending_count == 0
+
+
+def test_SourceListModel_data(mocker):
+    model = SourceListModel()
+    row = SourceListRow("mock_uuid", datetime.now(), False)
+    row.designation = "foo bar"
+    model.add_rows([row])
+
+    index = model.index(0)
+    assert model.rowCount() == 1
+    assert model.rowCount(index) == 0
+    assert index.data() == "foo bar"
+    assert index.data(SourceListModel.SourceUuidRole) == "mock_uuid"
+    assert index.data(SourceListModel.RowRole) is row
+    assert index.data(SourceListModel.StarredRole) is False
+    assert index.data(Qt.AccessibleTextRole) == "foo bar, not starred"
+    assert index.data(Qt.DecorationRole) is None
+    row.is_starred = True
+    assert index.data(SourceListModel.StarredRole) is True
+    assert index.data(Qt.AccessibleTextRole) == "foo bar, starred"
+    assert model.data(model.index(1)) is None
+
+
+def test_SourceListModel_index_for_uuid(mocker):
+    model = SourceListModel()
+    rows = [SourceListRow(str(i), datetime(2021, 1, 1 + i), False) for i in range(3)]
+    model.add_rows(rows)
+
+    assert model.index_for_uuid("2").row() == 0
+    assert model.index_for_uuid("0").row() == 2
+    assert not model.index_for_uuid("not-in-model").isValid()
+
+    model.remove_row("2")
+    assert not model.index_for_uuid("2").isValid()
+    assert model.index_for_uuid("0").row() == 1
+
+    # removing a row that does not exist does nothing
+    model.remove_row("2")
+    assert model.rowCount() == 2
+
+
+def test_SourceListModel_add_rows_in_order(mocker):
+    """
+    Ensure rows are inserted newest first, and after existing rows with the same sort key.
+    """
+    model = SourceListModel()
+    model.add_rows([SourceListRow("b", datetime(2021, 1, 2), False)])
+    model.add_rows(
+        [
+            SourceListRow("a", datetime(2021, 1, 3), False),
+            SourceListRow("d", datetime(2021, 1, 1), False),
+            SourceListRow("c", datetime(2021, 1, 2), False),
+        ]
+    )
 
-    stb.controller.update_star.assert_called_once_with("mock_uuid", False)
-    assert stb.isChecked()
+    assert [row.uuid for row in model.rows] == ["a", "b", "c", "d"]
+    assert [model.index(i).data(SourceListModel.SortKeyRole) for i in range(4)] == sorted(
+        row.sort_key for row in model.rows
+    )
 
 
-def test_StarToggleButton_on_pressed_toggles_to_unstarred(mocker):
+def test_SourceListModel_set_sort_key_moves_row(mocker):
     """
-    Ensure pressing the star button toggles from starred to unstarred.
+    Ensure a row whose sort key changes is moved to its new position, and that persistent
+    indexes follow it.
     """
-    controller = mocker.MagicMock()
-    stb = StarToggleButton(controller, "mock_uuid", True)
+    model = SourceListModel()
+    rows = [SourceListRow(str(i), datetime(2021, 1, 1 + i), False) for i in range(4)]
+    model.add_rows(rows)
+    assert [row.uuid for row in model.rows] == ["3", "2", "1", "0"]
+    persistent_index = QPersistentModelIndex(model.index_for_uuid("1"))
 
-    stb.click()
+    model.set_sort_key(rows[1], SourceListRow.make_sort_key(arrow.get(datetime(2022, 1, 1))))
+    assert [row.uuid for row in model.rows] == ["1", "3", "2", "0"]
+    assert persistent_index.row() == 0
 
-    stb.controller.update_star.assert_called_once_with("mock_uuid", True)
-    assert not stb.isChecked()
+    model.set_sort_key(rows[1], SourceListRow.make_sort_key(arrow.get(datetime(2020, 1, 1))))
+    assert [row.uuid for row in model.rows] == ["3", "2", "0", "1"]
+    assert persistent_index.row() == 3
 
+    # a new key that keeps the row in place does not move it
+    model.set_sort_key(rows[1], SourceListRow.make_sort_key(arrow.get(datetime(2019, 1, 1))))
+    assert [row.uuid for row in model.rows] == ["3", "2", "0", "1"]
+    assert model.index_for_uuid("1").row() == 3
 
-def test_StarToggleButton_on_pressed_offline(mocker):
-    """
-    Ensure toggle is disabled when offline.
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = False
-    stb = StarToggleButton(controller, "mock_uuid", True)
 
-    stb.click()
+def test_SourceListModel_set_sort_key_for_row_not_in_model(mocker):
+    model = SourceListModel()
+    row = SourceListRow("mock_uuid", datetime(2021, 1, 1), False)
 
-    stb.controller.on_action_requiring_login.assert_called_once_with()
+    model.set_sort_key(row, -1.0)
 
+    assert row.sort_key == -1.0
+    assert model.rowCount() == 0
 
-def test_StarToggleButton_on_pressed_offline_when_checked(mocker):
-    """
-    Ensure correct star icon images are loaded for the disabled button.
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = False
-    source = factory.Source(is_starred=True)
-    stb = StarToggleButton(controller, source.uuid, source.is_starred)
-    set_icon_fn = mocker.patch("securedrop_client.gui.base.SvgToggleButton.set_icon")
 
-    stb.on_authentication_changed(False)
-    assert stb.isCheckable() is False
-    set_icon_fn.assert_called_with(on="star_on.svg", off="star_on.svg")
+def test_SourceListModel_setData(mocker):
+    model = SourceListModel()
+    rows = [SourceListRow(str(i), datetime(2021, 1, 1 + i), False) for i in range(2)]
+    model.add_rows(rows)
 
-    stb.click()
-    stb.controller.on_action_requiring_login.assert_called_once_with()
+    assert [row.uuid for row in model.rows] == ["1", "0"]
 
+    # give the oldest row a key newer than the newest row
+    assert model.setData(model.index(1), rows[1].sort_key - 1, SourceListModel.SortKeyRole)
+    assert [row.uuid for row in model.rows] == ["0", "1"]
 
-def test_StarToggleButton_update(mocker):
-    """
-    Ensure update syncs the star state with the server if there are no pending jobs and we're not
-    waiting until the next sync (in order to avoid the "ghost" issue where update is called with an
-    outdated state between a star job finishing and a sync).
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", True)
+    assert not model.setData(model.index(0), "foo", Qt.EditRole)
+    assert not model.setData(model.index(2), -1.0, SourceListModel.SortKeyRole)
 
-    # Should not change because we wait until next sync
-    stb.pending_count = 0
-    stb.wait_until_next_sync = True
-    stb.update(False)
-    assert stb.isChecked() is True
-    stb.update(True)
-    assert stb.isChecked() is True
 
-    # Should update to match value provided by update because there are no pending star jobs and
-    # wait_until_next_sync is False, meaning a sync already occurred after the star job finished
-    stb.setChecked(True)
-    stb.pending_count = 0
-    stb.wait_until_next_sync = False
-    stb.update(False)
-    assert stb.isChecked() is False
-    stb.update(True)
-    assert stb.isChecked() is True
+def test_SourceListDelegate_sizeHint(mocker):
+    delegate = SourceListDelegate(QMovie())
+    option = QStyleOptionViewItem()
+    option.rect = QRect(0, 0, 400, 10)
 
-    # Should not change because there are pending star jobs
-    stb.setChecked(True)
-    stb.pending_count = 1
-    stb.wait_until_next_sync = True
-    stb.update(False)
-    assert stb.isChecked() is True
-    stb.update(True)
-    assert stb.isChecked() is True
-    # Still should not change because there are pending star jobs
-    stb.wait_until_next_sync = False
-    stb.update(False)
-    assert stb.isChecked() is True
-    stb.update(True)
-    assert stb.isChecked() is True
+    size = delegate.sizeHint(option, mocker.MagicMock())
+
+    assert size == QSize(400, 66)
 
 
-def test_StarToggleButton_update_when_not_authenticated(mocker):
+def test_SourceListDelegate_name_selector(mocker):
     """
-    Ensure the button state does not change if the user is not authenticated.
+    Ensure the name of a source is styled according to whether it is read, selected, or deleted.
     """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = False
-    source = factory.Source(is_starred=True)
-    stb = StarToggleButton(controller, source.uuid, source.is_starred)
+    delegate = SourceListDelegate(QMovie())
+    row = SourceListRow("mock_uuid", datetime.now(), False)
 
-    # Button stays checked
-    stb.update(False)
-    assert stb.is_starred is True
+    row.seen = True
+    assert delegate.name_selector(row, False) == ("SourceWidget_name", "")
+    assert delegate.name_selector(row, True) == ("SourceWidget_name_selected", "")
 
-    # Button stays unchecked
-    stb.is_starred = False
-    stb.update(True)
-    assert stb.is_starred is False
+    row.seen = False
+    assert delegate.name_selector(row, False) == ("SourceWidget_name_unread", "")
+    assert delegate.name_selector(row, True) == ("SourceWidget_name_unread", "")
 
+    row.seen = True
+    row.deleting = True
+    assert delegate.name_selector(row, False) == ("SourceWidget_name", "deleting")
+    assert delegate.name_selector(row, True) == ("SourceWidget_name_selected", "deleting")
 
-def test_StarToggleButton_on_star_update_failed(mocker):
+
+def test_SourceListDelegate_preview_and_timestamp_selectors(mocker):
     """
-    Ensure the button is toggled to the state provided in the failure handler and that the pending
-    count is decremented if the source uuid matches.
+    Ensure the preview and timestamp of a source are styled according to whether it is read or
+    deleted.
     """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", False)
+    delegate = SourceListDelegate(QMovie())
+    row = SourceListRow("mock_uuid", datetime.now(), False)
 
-    stb.click()
-    assert stb.is_starred is True
-    assert stb.pending_count == 1
-    stb.on_star_update_failed("mock_uuid", is_starred=False)
-    assert stb.is_starred is False
-    assert stb.pending_count == 0
+    row.seen = True
+    assert delegate.preview_selector(row) == ("SourceWidget_preview", "")
+    assert delegate.timestamp_selector(row) == ("SourceWidget_timestamp", "")
 
+    row.seen = False
+    assert delegate.preview_selector(row) == ("SourceWidget_preview_unread", "")
+    assert delegate.timestamp_selector(row) == ("SourceWidget_timestamp_unread", "")
 
-def test_StarToggleButton_on_star_update_failed_for_non_matching_source_uuid(mocker):
-    """
-    Ensure the button is not toggled and that the pending count stays the same if the source uuid
-    does not match.
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", False)
+    row.seen = True
+    row.conversation_deleted = True
+    assert delegate.preview_selector(row) == ("SourceWidget_preview", "conversation_deleted")
 
-    stb.click()
-    assert stb.is_starred is True
-    assert stb.pending_count == 1
-    stb.on_star_update_failed("some_other_uuid", is_starred=False)
-    assert stb.is_starred is True
-    assert stb.pending_count == 1
+    row.deleting = True
+    assert delegate.timestamp_selector(row) == ("SourceWidget_timestamp", "deleting")
 
 
-def test_StarToggleButton_on_star_update_successful(mocker):
-    """
-    Ensure that the pending count is decremented if the source uuid matches.
-    """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", True)
+def test_SourceListDelegate_styles_are_read_from_stylesheets(mocker):
+    delegate = SourceListDelegate(QMovie())
+    row = SourceListRow("mock_uuid", datetime.now(), False)
+
+    read_font, color = delegate.name_style(row, False)
+    assert read_font.family() == "Montserrat"
+    assert read_font.pixelSize() == 13
+    assert not read_font.italic()
+    assert color.name() == "#383838"
+    assert delegate.name_style(row, True)[1].name() == "#2a319d"
+
+    font, color = delegate.preview_style(row)
+    assert font.family() == "Source Sans Pro"
+    assert font.pixelSize() == 13
+    assert color.name() == "#383838"
+
+    row.seen = False
+    font, color = delegate.name_style(row, False)
+    assert font.weight() > read_font.weight()
+    assert color.name() == "#000000"
+    assert delegate.preview_style(row)[1].name() == "#000000"
+    assert delegate.timestamp_style(row)[1].name() == "#000000"
+
+    row.seen = True
+    row.deleting = True
+    font, color = delegate.name_style(row, False)
+    assert font.italic()
+    assert color.name() == "#8e8e92"
+    assert delegate.name_style(row, True)[1].name() == "#797fc3"
+    assert delegate.timestamp_style(row)[0].italic()
 
-    stb.click()
-    assert stb.pending_count == 1
-    stb.on_star_update_successful("mock_uuid")
-    assert stb.pending_count == 0
+    row.conversation_deleted = True
+    assert delegate.preview_style(row)[1].name() == "#8e8e92"
 
 
-def test_StarToggleButton_on_star_update_successful_for_non_matching_source_uuid(mocker):
+def test_SourceListDelegate_text_style_is_read_once(mocker):
+    delegate = SourceListDelegate(QMovie())
+    row = SourceListRow("mock_uuid", datetime.now(), False)
+    label = mocker.patch("securedrop_client.gui.widgets.QLabel", wraps=QLabel)
+
+    assert delegate.preview_style(row) is delegate.preview_style(row)
+    assert label.call_count == 1
+
+
+def test_SourceList_paints_rows(mocker, qtbot):
     """
-    Ensure that the pending count is not decremented if the source uuid does not match.
+    Ensure rows in every state can be painted.
     """
-    controller = mocker.MagicMock()
-    controller.is_authenticated = True
-    stb = StarToggleButton(controller, "mock_uuid", True)
+    sl = SourceList()
+    sl.controller = mocker.MagicMock()
+    sl.controller.is_authenticated = True
+    sources = [factory.Source(document_count=1, is_starred=True) for i in range(4)]
+    sources[0].messages = [factory.Message(source=sources[0], content="<b>hello</b>")]
+    sl.update_sources(sources)
+    sl._on_source_deleted(sources[1].uuid)
+    sl._on_conversation_deleted(sources[2].uuid)
+    sl.get_source_row(sources[3].uuid).seen = False
+    sl.setCurrentIndex(sl.source_model.index(0))
+    sl.resize(500, 300)
+    sl.show()
+    qtbot.waitExposed(sl)
 
-    stb.click()
-    assert stb.pending_count == 1
-    stb.on_star_update_successful("some_other_uuid")
-    assert stb.pending_count == 1
+    paint = mocker.spy(sl.source_delegate, "paint")
+    image = sl.grab()
+
+    assert not image.isNull()
+    assert paint.call_count == len(sources)
 
 
 def test_SpeechBubble_init(mocker):
@@ -5042,6 +5139,160 @@ def test_update_conversation_position_updates(mocker, session):
     assert reply_widget.index == 2  # re-ordered.
 
 
+def test_update_conversation_only_moves_widgets_that_are_out_of_order(mocker, session):
+    """
+    When widgets are out of order, only those outside of the longest run of widgets that are still
+    in order are moved, and all of them end up at the index of their item.
+    """
+    source = factory.Source()
+    messages = [
+        factory.Message(filename="{}-source-msg.gpg".format(i), source=source) for i in range(1, 5)
+    ]
+    session.add_all(messages)
+    session.commit()
+    controller = mocker.MagicMock(authenticated_user=factory.User())
+    cv = ConversationView(source, controller)
+    first_widget = cv.current_messages[messages[0].uuid]
+    first_widget.index = 5
+    remove_widget = mocker.spy(cv._scroll, "remove_widget_from_conversation")
+
+    cv.update_conversation(cv.source.collection)
+
+    remove_widget.assert_called_once_with(first_widget)
+    for index, message in enumerate(messages):
+        assert cv._scroll.conversation_layout.itemAt(index).widget().uuid == message.uuid
+        assert cv.current_messages[message.uuid].index == index
+
+
+def test_update_conversation_renders_only_the_latest_items(mocker, session):
+    """
+    Only the latest WINDOW_SIZE items of a long conversation are rendered when it is opened, and
+    the conversation is opened at its latest items. Items that are already rendered stay rendered.
+    """
+    mocker.patch.object(ConversationView, "WINDOW_SIZE", 2)
+    source = factory.Source()
+    messages = [
+        factory.Message(filename="{}-source-msg.gpg".format(i), source=source) for i in range(1, 5)
+    ]
+    session.add_all(messages)
+    session.commit()
+    controller = mocker.MagicMock(authenticated_user=factory.User())
+
+    cv = ConversationView(source, controller)
+
+    assert set(cv.current_messages) == {messages[2].uuid, messages[3].uuid}
+    assert cv._scroll.conversation_layout.count() == 2
+    assert cv.current_messages[messages[2].uuid].index == 0
+    assert cv.unrendered_item_count == 2
+    assert cv.scroll_distance_from_bottom == 0
+
+    new_message = factory.Message(filename="5-source-msg.gpg", source=source)
+    session.add(new_message)
+    session.commit()
+
+    cv.update_conversation(cv.source.collection)
+
+    assert set(cv.current_messages) == {messages[2].uuid, messages[3].uuid, new_message.uuid}
+    assert cv.current_messages[new_message.uuid].index == 2
+    assert cv.unrendered_item_count == 2
+
+
+def test_ConversationView_render_earlier_items(mocker, session):
+    """
+    Rendering earlier items adds up to WINDOW_SIZE items before the rendered ones, and keeps the
+    view at the same distance from the bottom of the conversation.
+    """
+    mocker.patch.object(ConversationView, "WINDOW_SIZE", 2)
+    source = factory.Source()
+    messages = [
+        factory.Message(filename="{}-source-msg.gpg".format(i), source=source) for i in range(1, 6)
+    ]
+    session.add_all(messages)
+    session.commit()
+    controller = mocker.MagicMock(authenticated_user=factory.User())
+    cv = ConversationView(source, controller)
+    cv.scroll_distance_from_bottom = None
+    cv._scroll.verticalScrollBar().maximum = mocker.MagicMock(return_value=1000)
+    cv._scroll.verticalScrollBar().value = mocker.MagicMock(return_value=100)
+
+    cv.render_earlier_items()
+
+    assert len(cv.current_messages) == 4
+    assert cv.current_messages[messages[1].uuid].index == 0
+    assert cv.current_messages[messages[4].uuid].index == 3
+    assert cv.unrendered_item_count == 1
+    assert cv.scroll_distance_from_bottom == 900
+
+    cv.scroll_distance_from_bottom = None
+    cv.render_earlier_items()
+    cv.render_earlier_items()
+
+    assert len(cv.current_messages) == 5
+    assert cv.unrendered_item_count == 0
+
+
+def test_ConversationView_renders_earlier_items_until_view_is_filled(mocker, session):
+    """
+    Earlier items of a short conversation are rendered until they fill the view, since it cannot be
+    scrolled up to them otherwise.
+    """
+    mocker.patch.object(ConversationView, "WINDOW_SIZE", 2)
+    source = factory.Source()
+    messages = [
+        factory.Message(filename="{}-source-msg.gpg".format(i), source=source) for i in range(1, 6)
+    ]
+    session.add_all(messages)
+    session.commit()
+    controller = mocker.MagicMock(session=session, authenticated_user=factory.User())
+    cv = ConversationView(source, controller)
+    assert cv.unrendered_item_count == 3
+
+    cv.resize(800, 5000)
+    cv.show()
+
+    assert set(cv.current_messages) == {message.uuid for message in messages}
+    assert cv.unrendered_item_count == 0
+    assert cv.current_messages[messages[0].uuid].index == 0
+
+
+def test_ConversationView__on_scrolled(mocker):
+    """
+    Earlier items are rendered when the view is scrolled to within a page of the top, unless the
+    view is about to be scrolled back into place.
+    """
+    cv = ConversationView(factory.Source(), mocker.MagicMock())
+    cv.render_earlier_items = mocker.MagicMock()
+    page_step = cv._scroll.verticalScrollBar().pageStep()
+
+    cv._on_scrolled(page_step + 1)
+    assert cv.render_earlier_items.call_count == 0
+
+    cv.scroll_distance_from_bottom = 0
+    cv._on_scrolled(0)
+    assert cv.render_earlier_items.call_count == 0
+
+    cv.scroll_distance_from_bottom = None
+    cv._on_scrolled(page_step)
+    assert cv.render_earlier_items.call_count == 1
+
+
+def test_ConversationView_update_conversation_position_keeps_distance_from_bottom(mocker):
+    """
+    Once the range of the scroll bar changes, the view is scrolled back to the same distance from
+    the bottom of the conversation.
+    """
+    cv = ConversationView(factory.Source(), mocker.MagicMock())
+    cv._scroll.verticalScrollBar().setValue = mocker.MagicMock()
+    cv.scroll_distance_from_bottom = 900
+
+    cv.update_conversation_position(0, 0)
+    cv._scroll.verticalScrollBar().setValue.assert_not_called()
+
+    cv.update_conversation_position(0, 2000)
+    cv._scroll.verticalScrollBar().setValue.assert_called_once_with(1100)
+    assert cv.scroll_distance_from_bottom is None
+
+
 def test_update_conversation_content_updates(mocker, session):
     """
     Subsequent calls to update_conversation update the content of the conversation_item
@@ -5094,8 +5345,8 @@ def test_update_conversation_content_updates(mocker, session):
     second_session.add(message)
     second_session.commit()
 
-    # Second call of update_conversation
-    cv.update_conversation(cv.source.collection)
+    # Second call of update_conversation, with the collection reloaded as its callers do
+    cv.update_conversation(storage.load_source_collection(session, cv.source))
 
     # Check that the widget was updated with the expected content.
     assert mock_msg_widget_res.message.setText.call_args[0][0] == expected_content
@@ -5125,6 +5376,40 @@ def test_update_conversation_updates_sender(mocker, homedir, session_maker, sess
     assert cv.current_messages[reply.uuid].sender_icon.initials == reply.journalist.initials
 
 
+def test_update_conversation_does_not_query_loaded_items(mocker, homedir, session_maker, session):
+    """
+    Ensure updating a conversation from a collection loaded by load_source_collection does not
+    query the items, their seen records or their senders again.
+    """
+    source = factory.Source()
+    journalist = factory.User()
+    session.add_all([source, journalist])
+    for i in range(3):
+        message = factory.Message(source=source, filename=f"{2 * i + 1}-source-msg.gpg")
+        reply = factory.Reply(
+            source=source, journalist=journalist, filename=f"{2 * i + 2}-source-reply.gpg"
+        )
+        session.add_all([message, reply, db.SeenReply(reply=reply, journalist=journalist)])
+    session.commit()
+    controller = logic.Controller(
+        "http://localhost", mocker.MagicMock(), session_maker, homedir, None
+    )
+    controller.authenticated_user = journalist
+    controller.update_authenticated_user = mocker.MagicMock()
+    cv = ConversationView(source, controller)
+    collection = storage.load_source_collection(controller.session, source)
+    statements = []
+    sqlalchemy.event.listen(
+        controller.session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    cv.update_conversation(collection)
+
+    assert [x for x in statements if x.startswith("SELECT")] == []
+
+
 def test_update_conversation_calls_updates_sender_for_authenticated_user(
     mocker, homedir, session_maker, session
 ):
@@ -55,7 +55,8 @@ def main_window(mocker, homedir, mock_export_service):
                 factory.Reply(source=source, filename="3-yellow-reply.gpg"),
             ]
         )
-        source_list.setCurrentItem(source_list.item(0))
+        mocker.patch("securedrop_client.gui.widgets.get_source", return_value=source)
+        source_list.setCurrentIndex(source_list.model().index(0))
         gui.main_view.on_source_changed()
 
         yield gui
@@ -111,7 +112,8 @@ def main_window_no_key(mocker, homedir, mock_export_service):
                 factory.Reply(source=source, filename="3-yellow-reply.gpg"),
             ]
         )
-        source_list.setCurrentItem(source_list.item(0))
+        mocker.patch("securedrop_client.gui.widgets.get_source", return_value=source)
+        source_list.setCurrentIndex(source_list.model().index(0))
         gui.main_view.on_source_changed()
 
         yield gui
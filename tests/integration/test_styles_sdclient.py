@@ -66,17 +66,15 @@ def test_class_name_matches_css_object_name(mocker, main_window):
     "EmptyConversationView" in empty_conversation_view.no_source_selected.objectName()
     source_list = main_view.source_list
 
-    source_widget = source_list.itemWidget(source_list.item(0))
-    assert "SourceWidget" == source_widget.__class__.__name__
-    assert "SourceWidget" in source_widget.name.objectName()
-    assert "SourceWidget" in source_widget.preview.objectName()
-    assert "SourceWidget" in source_widget.deletion_indicator.objectName()
-    assert "SourceWidget" in source_widget.paperclip.objectName()
-    assert "SourceWidget" in source_widget.timestamp.objectName()
-    assert "SourceWidget" in source_widget.source_widget.objectName()
-    star = source_widget.star
-    assert "StarToggleButton" == star.__class__.__name__
-    assert "StarToggleButton" in star.objectName()
+    assert "SourceList" == source_list.objectName()
+    assert "SourceListModel" == source_list.model().__class__.__name__
+    delegate = source_list.itemDelegate()
+    assert "SourceListDelegate" == delegate.__class__.__name__
+    row = source_list.currentIndex().data(source_list.source_model.RowRole)
+    assert "SourceWidget" in delegate.name_selector(row, selected=True)[0]
+    assert "SourceWidget" in delegate.preview_selector(row)[0]
+    assert "SourceWidget" in delegate.timestamp_selector(row)[0]
+    assert "SourceWidget" in delegate.container.objectName()
 
     wrapper = main_view.view_layout.itemAt(0).widget()
     assert "SourceConversationWrapper" == wrapper.__class__.__name__
@@ -285,27 +283,23 @@ def test_styles_for_main_view(mocker, main_window):
 
 def test_styles_source_list(mocker, main_window):
     source_list = main_window.main_view.source_list
-    source_widget = source_list.itemWidget(source_list.item(0))
-    preview = source_widget.preview
-    assert "Source Sans Pro" == preview.font().family()
-    QFont.Normal == preview.font().weight()
-    13 == preview.font().pixelSize()
-    assert "#383838" == preview.palette().color(QPalette.Foreground).name()
-    deletion_indicator = source_widget.deletion_indicator
-    assert "Source Sans Pro" == deletion_indicator.font().family()
-    QFont.Normal == deletion_indicator.font().weight()
-    13 == deletion_indicator.font().pixelSize()
-    assert "#000000" == deletion_indicator.palette().color(QPalette.Foreground).name()
-    name = source_widget.name
-    assert "Montserrat" == name.font().family()
-    QFont.Normal == name.font().weight()
-    13 == name.font().pixelSize()
-    assert "#2a319d" == name.palette().color(QPalette.Foreground).name()
-    timestamp = source_widget.timestamp
-    assert "Montserrat" == timestamp.font().family()
-    QFont.Normal == timestamp.font().weight()
-    13 == timestamp.font().pixelSize()
-    assert "#383838" == timestamp.palette().color(QPalette.Foreground).name()
+    delegate = source_list.itemDelegate()
+    row = source_list.currentIndex().data(source_list.source_model.RowRole)
+    preview_font, preview_color = delegate.preview_style(row)
+    assert "Source Sans Pro" == preview_font.family()
+    QFont.Normal == preview_font.weight()
+    13 == preview_font.pixelSize()
+    assert "#383838" == preview_color.name()
+    name_font, name_color = delegate.name_style(row, selected=True)
+    assert "Montserrat" == name_font.family()
+    QFont.Normal == name_font.weight()
+    13 == name_font.pixelSize()
+    assert "#2a319d" == name_color.name()
+    timestamp_font, timestamp_color = delegate.timestamp_style(row)
+    assert "Montserrat" == timestamp_font.family()
+    QFont.Normal == timestamp_font.weight()
+    13 == timestamp_font.pixelSize()
+    assert "#383838" == timestamp_color.name()
 
 
 def test_styles_for_conversation_view(mocker, main_window):
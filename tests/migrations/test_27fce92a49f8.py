@@ -0,0 +1,96 @@
+import os
+import subprocess
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import scoped_session
+
+
+class UpgradeTester:
+    """Every source has a summary of its latest item and of its unseen items."""
+
+    def __init__(self, homedir: str, session: scoped_session) -> None:
+        subprocess.check_call(["sqlite3", os.path.join(homedir, "svs.sqlite"), ".databases"])
+        self.session = session
+
+    def load_data(self):
+        self.session.execute(
+            text(
+                """
+                INSERT INTO sources (id, uuid, journalist_designation, interaction_count)
+                VALUES
+                (1, 'source-1', 'foo bar', 4),
+                (2, 'source-2', 'baz qux', 0);
+                """
+            )
+        )
+        self.session.execute(text("INSERT INTO users (id, uuid, username) VALUES (1, 'u', 'user')"))
+        self.session.execute(
+            text(
+                """
+                INSERT INTO messages
+                (id, uuid, filename, file_counter, size, download_url, is_downloaded,
+                is_decrypted, is_read, content, source_id, last_updated)
+                VALUES
+                (1, 'message-1', '1-foo-msg.gpg', 1, 1, 'url', 1, 1, 0, 'seen', 1, 0),
+                (2, 'message-2', '2-foo-msg.gpg', 2, 1, 'url', 1, 1, 0, 'unseen', 1, 0);
+                """
+            )
+        )
+        self.session.execute(
+            text("INSERT INTO seen_messages (message_id, journalist_id) VALUES (1, 1)")
+        )
+        self.session.execute(
+            text(
+                """
+                INSERT INTO files
+                (id, uuid, filename, file_counter, size, download_url, is_downloaded, is_read,
+                source_id, last_updated)
+                VALUES
+                (1, 'file-3', '3-foo-doc.gz.gpg', 3, 1, 'url', 0, 1, 1, 0);
+                """
+            )
+        )
+        self.session.execute(
+            text(
+                """
+                INSERT INTO replies
+                (id, uuid, filename, file_counter, is_downloaded, is_decrypted, content,
+                source_id, last_updated)
+                VALUES
+                (1, 'reply-4', '4-foo-reply.gpg', 4, 1, 1, '  hello
+                there', 1, 0);
+                """
+            )
+        )
+        self.session.commit()
+
+    def check_upgrade(self):
+        summaries = {
+            source_id: (last_activity_uuid, preview, unseen_count)
+            for source_id, last_activity_uuid, preview, unseen_count in self.session.execute(
+                text(
+                    """
+                    SELECT source_id, last_activity_uuid, preview, unseen_count
+                    FROM source_summaries
+                    """
+                )
+            )
+        }
+        assert summaries == {1: ("reply-4", "hello", 1), 2: (None, None, 0)}
+
+
+class DowngradeTester:
+    """The source_summaries table does not exist."""
+
+    def __init__(self, homedir: str, session: scoped_session) -> None:
+        subprocess.check_call(["sqlite3", os.path.join(homedir, "svs.sqlite"), ".databases"])
+        self.session = session
+
+    def load_data(self):
+        pass
+
+    def check_downgrade(self):
+        with pytest.raises(OperationalError):
+            self.session.execute(text("SELECT * FROM source_summaries"))
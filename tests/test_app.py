@@ -20,6 +20,8 @@ from securedrop_client.app import (
     run,
     start_app,
 )
+from securedrop_client.config import DEFAULT_DECRYPTION_WORKERS, DEFAULT_FILE_DOWNLOAD_LANES
+from securedrop_client.db import DEFAULT_PRAGMAS
 from tests.helper import app  # noqa: F401
 
 
@@ -147,10 +149,13 @@ def test_start_app(homedir, mocker):
     mock_controller = mocker.patch("securedrop_client.app.Controller")
     mocker.patch("securedrop_client.app.prevent_second_instance")
     mocker.patch("securedrop_client.app.sys")
-    mocker.patch("securedrop_client.app.make_session_maker", return_value=mock_session_maker)
+    mock_make_session_maker = mocker.patch(
+        "securedrop_client.app.make_session_maker", return_value=mock_session_maker
+    )
 
     start_app(mock_args, mock_qt_args)
 
+    mock_make_session_maker.assert_called_once_with(homedir, DEFAULT_PRAGMAS)
     mock_app.assert_called_once_with(mock_qt_args)
     mock_win.assert_called_once_with(app_state)
     mock_controller.assert_called_once_with(
@@ -164,7 +169,12 @@ def test_start_app(homedir, mocker):
         mocker.ANY,
         mocker.ANY,
         mocker.ANY,
+        decryption_workers=DEFAULT_DECRYPTION_WORKERS,
+        additional_file_download_queue_threads=mocker.ANY,
     )
+    additional_threads = mock_controller.call_args[1]["additional_file_download_queue_threads"]
+    assert len(additional_threads) == DEFAULT_FILE_DOWNLOAD_LANES - 1
+    mock_app().aboutToQuit.connect.assert_called_once_with(mock_controller().shutdown)
 
 
 PERMISSIONS_CASES = [
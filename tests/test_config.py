@@ -1,6 +1,8 @@
+import json
 import os
 
-from securedrop_client.config import Config
+from securedrop_client.config import DEFAULT_DECRYPTION_WORKERS, DEFAULT_FILE_DOWNLOAD_LANES, Config
+from securedrop_client.db import DEFAULT_PRAGMAS, make_session_maker
 
 
 def test_missing_file(homedir):
@@ -28,3 +30,86 @@ def test_missing_journalist_key_fpr(homedir):
 
     assert config.journalist_key_fingerprint is None
     assert config.is_valid is False
+
+
+def test_database_pragmas_default(homedir):
+    """
+    If the config file does not override any database pragma, the defaults are used.
+    """
+    config = Config.from_home_dir(homedir)
+
+    assert config.database_pragmas == DEFAULT_PRAGMAS
+
+
+def test_database_pragmas_override(homedir):
+    """
+    Database pragmas in the config file override the defaults, and unknown ones are ignored.
+    """
+    config_path = os.path.join(homedir, Config.CONFIG_NAME)
+    with open(config_path, "w") as f:
+        f.write(json.dumps({"database_pragmas": {"journal_mode": "DELETE", "foo": "bar"}}))
+
+    config = Config.from_home_dir(homedir)
+
+    assert config.database_pragmas["journal_mode"] == "DELETE"
+    assert config.database_pragmas["synchronous"] == DEFAULT_PRAGMAS["synchronous"]
+    assert "foo" not in config.database_pragmas
+
+
+def test_database_pragmas_invalid_values(homedir):
+    """
+    Database pragmas in the config file with a value SQLite does not accept are ignored, so that
+    the client can still open its database.
+    """
+    config_path = os.path.join(homedir, Config.CONFIG_NAME)
+    with open(config_path, "w") as f:
+        f.write(
+            json.dumps(
+                {
+                    "database_pragmas": {
+                        "journal_mode": "wall",
+                        "synchronous": "full",
+                        "cache_size": "lots",
+                        "busy_timeout": -1,
+                    }
+                }
+            )
+        )
+
+    config = Config.from_home_dir(homedir)
+
+    assert config.database_pragmas["journal_mode"] == DEFAULT_PRAGMAS["journal_mode"]
+    assert config.database_pragmas["synchronous"] == "full"
+    assert config.database_pragmas["cache_size"] == DEFAULT_PRAGMAS["cache_size"]
+    assert config.database_pragmas["busy_timeout"] == DEFAULT_PRAGMAS["busy_timeout"]
+    make_session_maker(homedir, config.database_pragmas)
+
+
+def test_decryption_workers(homedir):
+    """
+    The number of decryption workers can be set in the config file, and invalid values are ignored.
+    """
+    config_path = os.path.join(homedir, Config.CONFIG_NAME)
+    with open(config_path, "w") as f:
+        f.write(json.dumps({"decryption_workers": 8}))
+    assert Config.from_home_dir(homedir).decryption_workers == 8
+
+    with open(config_path, "w") as f:
+        f.write(json.dumps({"decryption_workers": 0}))
+    assert Config.from_home_dir(homedir).decryption_workers == DEFAULT_DECRYPTION_WORKERS
+
+
+def test_file_download_lanes(homedir):
+    """
+    The number of file download lanes can be set in the config file, and invalid values are ignored.
+    """
+    config_path = os.path.join(homedir, Config.CONFIG_NAME)
+    assert Config.from_home_dir(homedir).file_download_lanes == DEFAULT_FILE_DOWNLOAD_LANES
+
+    with open(config_path, "w") as f:
+        f.write(json.dumps({"file_download_lanes": 4}))
+    assert Config.from_home_dir(homedir).file_download_lanes == 4
+
+    with open(config_path, "w") as f:
+        f.write(json.dumps({"file_download_lanes": "4"}))
+    assert Config.from_home_dir(homedir).file_download_lanes == DEFAULT_FILE_DOWNLOAD_LANES
@@ -1,11 +1,14 @@
+import gzip
+import io
 import os
+import shutil
 import struct
 import subprocess
 import tempfile
 
 import pytest
 
-from securedrop_client.crypto import CryptoError, GpgHelper, read_gzip_header_filename
+from securedrop_client.crypto import CryptoError, GpgHelper, parse_file_status, read_gzip_header
 from tests import factory
 
 with open(os.path.join(os.path.dirname(__file__), "files", "test-key.gpg.pub.asc")) as f:
@@ -75,10 +78,13 @@ def test_gzip_header_without_filename(homedir, config, mocker, session_maker):
     mocker.patch("os.unlink")
 
     # pretend the gzipped file header lacked the original filename
-    mock_read_gzip_header_filename = mocker.patch(
-        "securedrop_client.crypto.read_gzip_header_filename"
+    def read_gzip_header_without_filename(f):
+        read_gzip_header(f)
+        return ""
+
+    mocker.patch(
+        "securedrop_client.crypto.read_gzip_header", side_effect=read_gzip_header_without_filename
     )
-    mock_read_gzip_header_filename.return_value = ""
 
     test_gzip = "tests/files/test-doc.gz.gpg"
     output_filename = "test-doc"
@@ -89,30 +95,117 @@ def test_gzip_header_without_filename(homedir, config, mocker, session_maker):
     os.remove(expected_output_filename)
 
 
-def test_read_gzip_header_filename_with_bad_file(homedir):
-    with tempfile.NamedTemporaryFile() as tf:
-        tf.write(b"test")
-        tf.seek(0)
-        with pytest.raises(OSError, match=r"Not a gzipped file"):
-            read_gzip_header_filename(tf.name)
+def test_decrypt_message_or_reply(homedir, config, session_maker, tmp_path):
+    """
+    Ensure that the plaintext of a message is returned and the encrypted file removed.
+    """
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    gpg._import(PUB_KEY)
+    gpg._import(JOURNO_KEY)
+    filepath = tmp_path / "1-test-doc.gz.gpg"
+    shutil.copy("tests/files/test-doc.gz.gpg", filepath)
+
+    with pytest.raises(CryptoError, match="not valid UTF-8"):
+        gpg.decrypt_message_or_reply(str(filepath))  # gzipped, so not text
+    assert filepath.exists()
+
+    with pytest.raises(CryptoError, match="larger than 10 bytes"):
+        gpg.decrypt_message_or_reply(str(filepath), max_size=10)
+    assert filepath.exists()
+
+    message_filepath = tmp_path / "1-msg.gpg"
+    cmd = gpg._gpg_cmd_base()
+    cmd.extend(["--encrypt", "-r", gpg.journalist_key_fingerprint, "-o", str(message_filepath)])
+    subprocess.run(cmd, input="hello \u2713".encode(), check=True)
+
+    assert gpg.decrypt_message_or_reply(str(message_filepath)) == "hello \u2713"
+    assert not message_filepath.exists()
+
+
+def test_decrypt_message_or_reply_gpg_error(homedir, config, session_maker, tmp_path):
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    filepath = tmp_path / "1-msg.gpg"
+    filepath.write_bytes(b"not encrypted")
+
+    with pytest.raises(CryptoError, match="GPG Error"):
+        gpg.decrypt_message_or_reply(str(filepath))
+    assert filepath.exists()
+
+
+def test_decrypt_messages_or_replies(homedir, config, session_maker, tmp_path):
+    """
+    Check that several messages are decrypted at once and the result for each one is reported.
+    """
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    gpg._import(JOURNO_KEY)
+    filepaths = [str(tmp_path / f"{i}-msg.gpg") for i in range(3)]
+    for i, filepath in enumerate(filepaths[:2]):
+        cmd = gpg._gpg_cmd_base()
+        cmd.extend(["--encrypt", "-r", gpg.journalist_key_fingerprint, "-o", filepath])
+        subprocess.run(cmd, input=f"message {i}".encode(), check=True)
+    with open(filepaths[2], "w") as f:
+        f.write("not encrypted")
+    missing_filepath = str(tmp_path / "3-msg.gpg")
+
+    results = gpg.decrypt_messages_or_replies(filepaths + [missing_filepath])
+
+    assert results[filepaths[0]] == "message 0"
+    assert results[filepaths[1]] == "message 1"
+    assert isinstance(results[filepaths[2]], CryptoError)
+    assert isinstance(results[missing_filepath], CryptoError)
+    assert os.listdir(tmp_path) == ["2-msg.gpg"]  # decrypted files are deleted
+
+
+def test_decrypt_messages_or_replies_too_large(homedir, config, session_maker, tmp_path):
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    gpg._import(JOURNO_KEY)
+    filepath = str(tmp_path / "1-msg.gpg")
+    cmd = gpg._gpg_cmd_base()
+    cmd.extend(["--encrypt", "-r", gpg.journalist_key_fingerprint, "-o", filepath])
+    subprocess.run(cmd, input=b"message", check=True)
+
+    results = gpg.decrypt_messages_or_replies([filepath], max_size=3)
+
+    assert isinstance(results[filepath], CryptoError)
+    assert "larger than 3 bytes" in str(results[filepath])
+    assert os.path.exists(filepath)
+
+
+def test_parse_file_status():
+    status_output = b"""[GNUPG:] FILE_START 3 0.gpg
+[GNUPG:] BEGIN_DECRYPTION
+[GNUPG:] DECRYPTION_OKAY
+[GNUPG:] END_DECRYPTION
+[GNUPG:] FILE_DONE
+gpg: some other output
+[GNUPG:] FILE_START 3 file name with spaces.gpg
+[GNUPG:] NODATA 1
+[GNUPG:] FILE_DONE
+"""
+    assert parse_file_status(status_output) == {
+        "0.gpg": ["BEGIN_DECRYPTION", "DECRYPTION_OKAY", "END_DECRYPTION"],
+        "file name with spaces.gpg": ["NODATA"],
+    }
+
+
+def test_read_gzip_header_with_bad_file():
+    with pytest.raises(OSError, match=r"Not a gzipped file"):
+        read_gzip_header(io.BytesIO(b"test"))
 
 
-def test_read_gzip_header_filename_with_bad_compression_method(homedir):
+def test_read_gzip_header_with_bad_compression_method():
     # 9 is a bad method
     header = struct.pack("<BBBBIxxHBBcccc", 31, 139, 9, 12, 0, 2, 1, 1, b"a", b"b", b"c", b"\0")
-    with tempfile.NamedTemporaryFile() as tf:
-        tf.write(header)
-        tf.seek(0)
-        with pytest.raises(OSError, match=r"Unknown compression method"):
-            read_gzip_header_filename(tf.name)
+    with pytest.raises(OSError, match=r"Unknown compression method"):
+        read_gzip_header(io.BytesIO(header))
 
 
-def test_read_gzip_header_filename(homedir):
+def test_read_gzip_header():
     header = struct.pack("<BBBBIxxHBBcccc", 31, 139, 8, 12, 0, 2, 1, 1, b"a", b"b", b"c", b"\0")
-    with tempfile.NamedTemporaryFile() as tf:
-        tf.write(header)
-        tf.seek(0)
-        assert "abc" == read_gzip_header_filename(tf.name)
+    stream = io.BytesIO(header + b"body")
+
+    assert "abc" == read_gzip_header(stream)
+    assert stream.read() == b"body"
 
 
 def test_subprocess_raises_exception(homedir, config, mocker, session_maker):
@@ -125,7 +218,9 @@ def test_subprocess_raises_exception(homedir, config, mocker, session_maker):
     test_gzip = "tests/files/test-doc.gz.gpg"
     output_filename = "test-doc"
 
-    mock_gpg = mocker.patch("subprocess.call", return_value=1)
+    mock_gpg = mocker.patch("subprocess.Popen")
+    mock_gpg.return_value.stdout = io.BytesIO(b"")
+    mock_gpg.return_value.wait.return_value = 1
     mock_unlink = mocker.patch("os.unlink")
 
     with pytest.raises(CryptoError):
@@ -136,6 +231,40 @@ def test_subprocess_raises_exception(homedir, config, mocker, session_maker):
     assert mock_unlink.call_count == 1
 
 
+def test_gpg_failure_after_extraction_removes_document(homedir, config, mocker, session_maker):
+    """
+    Ensure that a document is removed if gpg fails after all of its output has been extracted,
+    since the output cannot be trusted.
+    """
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+    filepath = os.path.join(homedir, "data", "1-doc.gz.gpg")
+
+    mock_gpg = mocker.patch("subprocess.Popen")
+    mock_gpg.return_value.stdout = io.BytesIO(gzip.compress(b"content"))
+    mock_gpg.return_value.wait.return_value = 2
+
+    with pytest.raises(CryptoError):
+        gpg.decrypt_submission_or_reply(filepath, "1-doc", is_doc=True)
+
+    assert os.listdir(os.path.join(homedir, "data")) == []
+
+
+def test_message_failure_leaves_plaintext_empty(homedir, config, mocker, session_maker):
+    gpg = GpgHelper(homedir, session_maker, is_qubes=False)
+
+    def write_partial_output(cmd, stdout, stderr):
+        stdout.write(b"partial")
+        return 2
+
+    mocker.patch("subprocess.call", side_effect=write_partial_output)
+    mocker.patch("os.unlink")
+
+    with tempfile.NamedTemporaryFile() as plaintext_file:
+        with pytest.raises(CryptoError):
+            gpg.decrypt_submission_or_reply("1-msg.gpg", plaintext_file.name, is_doc=False)
+        assert plaintext_file.read() == b""
+
+
 def test_import_key(homedir, config, session_maker):
     """
     Check the happy path that we can import a single PGP key.
@@ -156,6 +285,23 @@ def test_import_nonexistent_key(homedir, config, session_maker):
         helper.import_key(source)
 
 
+def test_import_keys(homedir, config, session_maker):
+    """
+    Check that several keys are imported at once and the result for each source is reported.
+    """
+    source = factory.Source()
+    source_without_key = factory.Source(public_key=None)
+    source_with_bad_key = factory.Source(public_key="not a key", fingerprint="B" * 40)
+    helper = GpgHelper(homedir, session_maker, is_qubes=False)
+
+    results = helper.import_keys([source, source_without_key, source_with_bad_key])
+
+    assert results[source.uuid] is None
+    assert isinstance(results[source_without_key.uuid], CryptoError)
+    assert isinstance(results[source_with_bad_key.uuid], CryptoError)
+    assert source.fingerprint in subprocess.check_output(helper._gpg_cmd_base() + ["-k"]).decode()
+
+
 def test_import_key_gpg_call_fail(homedir, config, mocker, session_maker):
     """
     Check that a `CryptoError` is raised if calling `gpg` fails.
@@ -207,6 +353,68 @@ def test_encrypt(homedir, source, config, mocker, session_maker):
     assert decrypted == plaintext
 
 
+def test_encrypt_imports_source_key_once(homedir, source, config, mocker, session_maker):
+    """
+    Check that a source key is imported before the first reply only, even after a restart.
+    """
+    helper = GpgHelper(homedir, session_maker, is_qubes=False)
+    helper._import(JOURNO_KEY)
+    import_fn = mocker.spy(helper, "_import")
+
+    assert helper.encrypt_to_source(source["uuid"], "one")
+    assert helper.encrypt_to_source(source["uuid"], "two")
+    assert import_fn.call_count == 1
+    assert helper.is_key_imported(source["fingerprint"])
+
+    restarted_helper = GpgHelper(homedir, session_maker, is_qubes=False)
+    import_fn = mocker.spy(restarted_helper, "_import")
+    assert restarted_helper.encrypt_to_source(source["uuid"], "three")
+    assert import_fn.call_count == 0
+
+
+def test_encrypt_imports_source_key_missing_from_keyring(
+    homedir, source, config, mocker, session_maker
+):
+    """
+    Check that a source key recorded as imported is imported again if encryption fails, in case
+    the keyring no longer has it.
+    """
+    helper = GpgHelper(homedir, session_maker, is_qubes=False)
+    helper._import(JOURNO_KEY)
+    helper._set_keys_imported([source["fingerprint"]])
+    import_fn = mocker.spy(helper, "_import")
+
+    assert helper.encrypt_to_source(source["uuid"], "bueller?")
+    assert import_fn.call_count == 1
+    assert helper.is_key_imported(source["fingerprint"])
+
+
+def test_import_new_keys(homedir, config, mocker, session_maker):
+    """
+    Check that only the keys that have not been imported yet are imported.
+    """
+    helper = GpgHelper(homedir, session_maker, is_qubes=False)
+    imported_source = factory.Source(fingerprint="A" * 40)
+    new_source = factory.Source()
+    helper._set_keys_imported([imported_source.fingerprint])
+    import_keys_fn = mocker.spy(helper, "import_keys")
+
+    helper.import_new_keys([imported_source, new_source])
+    helper.import_new_keys([imported_source, new_source])
+
+    import_keys_fn.assert_called_once_with([new_source])
+    assert helper.is_key_imported(new_source.fingerprint)
+
+
+def test_imported_keys_file_unreadable(homedir, config, session_maker):
+    with open(os.path.join(homedir, GpgHelper.IMPORTED_KEYS_FILENAME), "w") as f:
+        f.write("{not json")
+
+    helper = GpgHelper(homedir, session_maker, is_qubes=False)
+
+    assert helper.imported_keys == set()
+
+
 def test_encrypt_fail(homedir, config, mocker, session_maker, session):
     """
     Check that a `CryptoError` is raised if the call to `gpg` fails.
@@ -0,0 +1,187 @@
+import os
+import shutil
+
+from PyQt5.QtTest import QSignalSpy
+from sqlalchemy.exc import SQLAlchemyError
+
+from securedrop_client import storage
+from securedrop_client.file_watcher import FileWatcher
+from tests import factory
+
+
+def add_file_to_data_dir(data_dir, file):
+    location = file.location(data_dir)
+    os.makedirs(os.path.dirname(location), exist_ok=True)
+    with open(location, "w") as f:
+        f.write("content")
+
+
+def source_dir(data_dir, source):
+    return os.path.join(os.path.realpath(data_dir), source.journalist_filename)
+
+
+def test_FileWatcher_start(homedir, session):
+    """
+    Ensure the files that went missing before the watcher was started are marked as not
+    downloaded, and that the directories of the others are watched.
+    """
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    present_file = factory.File(source=source, filename="1-foo-doc.gz.gpg")
+    other_present_file = factory.File(source=source, filename="3-foo-doc.gz.gpg")
+    missing_file = factory.File(source=source, filename="2-foo-doc.gz.gpg")
+    session.add_all([source, present_file, other_present_file, missing_file])
+    session.commit()
+    add_file_to_data_dir(data_dir, present_file)
+    add_file_to_data_dir(data_dir, other_present_file)
+    file_watcher = FileWatcher(session, data_dir)
+    file_missing_emissions = QSignalSpy(file_watcher.file_missing)
+
+    file_watcher.start()
+
+    assert file_watcher.is_watching_all_files
+    assert file_watcher.watcher.files() == []
+    assert file_watcher.watcher.directories() == [source_dir(data_dir, source)]
+    assert file_watcher.watched_directories == {
+        source_dir(data_dir, source): {
+            present_file.location(data_dir): present_file.uuid,
+            other_present_file.location(data_dir): other_present_file.uuid,
+        }
+    }
+    assert len(file_missing_emissions) == 1
+    assert file_missing_emissions[0] == [source.uuid, missing_file.uuid, str(missing_file)]
+    assert missing_file.is_downloaded is False
+
+
+def test_FileWatcher_watch_when_a_directory_cannot_be_watched(homedir, session):
+    """
+    Ensure the watcher tells that not all files are watched when the directory of one of them
+    cannot be.
+    """
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    file = factory.File(source=source)
+    session.add_all([source, file])
+    session.commit()
+    file_watcher = FileWatcher(session, data_dir)
+    file_watcher.start()
+
+    file_watcher.watch([file])
+
+    assert not file_watcher.is_watching_all_files
+    assert file_watcher.watched_directories == {}
+
+
+def test_FileWatcher_on_file_ready(homedir, session):
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    file = factory.File(source=source, filename="1-foo-doc.gz.gpg")
+    other_file = factory.File(source=source, filename="2-foo-doc.gz.gpg")
+    session.add_all([source, file, other_file])
+    session.commit()
+    add_file_to_data_dir(data_dir, file)
+    add_file_to_data_dir(data_dir, other_file)
+    file_watcher = FileWatcher(session, data_dir)
+
+    file_watcher.on_file_ready(source.uuid, file.uuid, file.filename)
+    file_watcher.on_file_ready(source.uuid, other_file.uuid, other_file.filename)
+    file_watcher.on_file_ready(source.uuid, "deleted-file-uuid", "deleted-file")
+
+    assert file_watcher.watcher.directories() == [source_dir(data_dir, source)]
+    assert set(file_watcher.watched_directories[source_dir(data_dir, source)]) == {
+        file.location(data_dir),
+        other_file.location(data_dir),
+    }
+
+
+def test_FileWatcher_update_missing_files(homedir, session, mocker):
+    """
+    Ensure only the files of the directories that changed are checked once a file is deleted, and
+    that the data directory is not scanned again.
+    """
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    deleted_file = factory.File(source=source, filename="1-foo-doc.gz.gpg")
+    file = factory.File(source=source, filename="2-foo-doc.gz.gpg")
+    session.add_all([source, deleted_file, file])
+    session.commit()
+    add_file_to_data_dir(data_dir, deleted_file)
+    add_file_to_data_dir(data_dir, file)
+    file_watcher = FileWatcher(session, data_dir)
+    file_watcher.start()
+    update_missing_files = mocker.spy(storage, "update_missing_files")
+    file_missing_emissions = QSignalSpy(file_watcher.file_missing)
+
+    shutil.rmtree(os.path.dirname(deleted_file.location(data_dir)))
+    file_watcher._on_directory_changed(source_dir(data_dir, source))
+
+    assert file_watcher.timer.isActive()
+
+    file_watcher.update_missing_files()
+
+    update_missing_files.assert_not_called()
+    assert len(file_missing_emissions) == 1
+    assert file_missing_emissions[0] == [source.uuid, deleted_file.uuid, str(deleted_file)]
+    assert deleted_file.is_downloaded is False
+    assert file.is_downloaded is True
+    assert file_watcher.watched_directories == {
+        source_dir(data_dir, source): {file.location(data_dir): file.uuid}
+    }
+
+
+def test_FileWatcher_update_missing_files_when_source_directory_is_deleted(homedir, session):
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    file = factory.File(source=source)
+    session.add_all([source, file])
+    session.commit()
+    add_file_to_data_dir(data_dir, file)
+    file_watcher = FileWatcher(session, data_dir)
+    file_watcher.start()
+
+    shutil.rmtree(source_dir(data_dir, source))
+    file_watcher._on_directory_changed(source_dir(data_dir, source))
+    file_watcher.update_missing_files()
+
+    assert file.is_downloaded is False
+    assert file_watcher.watched_directories == {}
+    assert file_watcher.watcher.directories() == []
+
+
+def test_FileWatcher_update_missing_files_retries_on_database_error(homedir, session, mocker):
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    file = factory.File(source=source)
+    session.add_all([source, file])
+    session.commit()
+    add_file_to_data_dir(data_dir, file)
+    file_watcher = FileWatcher(session, data_dir)
+    file_watcher.start()
+    mocker.patch(
+        "securedrop_client.file_watcher.storage.mark_all_as_not_downloaded",
+        side_effect=SQLAlchemyError(),
+    )
+    rollback = mocker.spy(session, "rollback")
+    file_missing_emissions = QSignalSpy(file_watcher.file_missing)
+
+    os.remove(file.location(data_dir))
+    file_watcher._on_directory_changed(source_dir(data_dir, source))
+    file_watcher.timer.stop()
+    file_watcher.update_missing_files()
+
+    rollback.assert_called_once_with()
+    assert file_watcher.timer.isActive()
+    assert file_watcher.changed_directories == {source_dir(data_dir, source)}
+    assert len(file_missing_emissions) == 0
+
+
+def test_FileWatcher_on_file_ready_when_file_cannot_be_queried(homedir, session, mocker):
+    data_dir = os.path.join(homedir, "data")
+    file_watcher = FileWatcher(session, data_dir)
+    file_watcher.start()
+    mocker.patch.object(session, "query", side_effect=SQLAlchemyError())
+
+    file_watcher.on_file_ready("source-uuid", "file-uuid", "file")
+
+    assert not file_watcher.is_watching_all_files
+    assert file_watcher.watched_directories == {}
@@ -536,7 +536,7 @@ def test_Controller_on_sync_success(homedir, config, mocker):
     co.on_sync_success()
 
     mock_storage.update_missing_files.assert_called_once_with(co.data_dir, co.session)
-    co.update_sources.assert_called_once_with()
+    co.update_sources.assert_called_once_with(None)
     co.download_new_messages.assert_called_once_with()
     co.download_new_replies.assert_called_once_with()
     co.resume_queues.assert_called_once_with()
@@ -544,6 +544,45 @@ def test_Controller_on_sync_success(homedir, config, mocker):
     assert file_missing_emissions[0] == [missing.source.uuid, missing.uuid, str(missing)]
 
 
+def test_Controller_on_sync_success_updates_changed_sources(homedir, config, mocker):
+    """
+    Ensure only the sources that changed during the sync are updated, and that the source list is
+    not updated at all when none did.
+    """
+    co = Controller("http://localhost", mocker.MagicMock(), mocker.MagicMock(), homedir, None)
+    co.update_sources = mocker.MagicMock()
+    co.download_new_messages = mocker.MagicMock()
+    co.download_new_replies = mocker.MagicMock()
+    co.resume_queues = mocker.MagicMock()
+    mock_storage = mocker.patch("securedrop_client.logic.storage")
+    mock_storage.update_missing_files.return_value = []
+
+    co.on_sync_success({"changed_uuid"})
+    co.update_sources.assert_called_once_with({"changed_uuid"})
+
+    co.update_sources.reset_mock()
+    co.on_sync_success(set())
+    co.update_sources.assert_not_called()
+    assert co.download_new_messages.call_count == 2
+
+
+def test_Controller_on_sync_success_does_not_update_watched_missing_files(homedir, config, mocker):
+    """
+    Ensure the data directory is not scanned for missing files on sync when they are all watched.
+    """
+    co = Controller("http://localhost", mocker.MagicMock(), mocker.MagicMock(), homedir, None)
+    co.update_sources = mocker.MagicMock()
+    co.download_new_messages = mocker.MagicMock()
+    co.download_new_replies = mocker.MagicMock()
+    co.resume_queues = mocker.MagicMock()
+    co.file_watcher.is_watching_all_files = True
+    mock_storage = mocker.patch("securedrop_client.logic.storage")
+
+    co.on_sync_success()
+
+    mock_storage.update_missing_files.assert_not_called()
+
+
 def test_Controller_on_sync_success_when_current_user_deleted(mocker, homedir):
     co = Controller("http://localhost", mocker.MagicMock(), mocker.MagicMock(), homedir, None)
 
@@ -681,7 +720,7 @@ def test_Controller_update_sources(homedir, config, mocker):
     co.update_sources()
 
     mock_storage.get_local_sources.assert_called_once_with(mock_session)
-    mock_gui.show_sources.assert_called_once_with(source_list)
+    mock_gui.show_sources.assert_called_once_with(source_list, None)
 
 
 def test_Controller_mark_seen(homedir, config, mocker, session, session_maker):
@@ -1074,6 +1113,41 @@ def test_Controller_logout_success(homedir, config, mocker, session_maker):
     info_logger.assert_called_once_with(msg)
 
 
+def test_Controller_logout_shuts_down_decryption_pool(homedir, config, mocker, session_maker):
+    """
+    Ensure the decryption pool is shut down on logout, and replaced so that downloaded items can be
+    decrypted again after the next login.
+    Using the `config` fixture to ensure the config is written to disk.
+    """
+    mock_gui = mocker.MagicMock()
+    co = Controller("http://localhost", mock_gui, session_maker, homedir, None)
+    co.api = None
+    co.api_job_queue = mocker.MagicMock()
+    decryption_pool = co.decryption_pool
+    shutdown = mocker.spy(decryption_pool, "shutdown")
+
+    co.logout()
+
+    shutdown.assert_called_once_with()
+    assert co.decryption_pool is not decryption_pool
+    assert co.decryption_pool.decrypt_executor.submit(lambda: True).result(timeout=5)
+    co.decryption_pool.shutdown()
+
+
+def test_Controller_shutdown(homedir, config, mocker, session_maker):
+    """
+    Ensure the decryption pool is shut down when the application exits.
+    Using the `config` fixture to ensure the config is written to disk.
+    """
+    mock_gui = mocker.MagicMock()
+    co = Controller("http://localhost", mock_gui, session_maker, homedir, None)
+    shutdown = mocker.spy(co.decryption_pool, "shutdown")
+
+    co.shutdown()
+
+    shutdown.assert_called_once_with()
+
+
 def test_Controller_logout_failure(homedir, config, mocker, session_maker):
     """
     Ensure the API is called on logout and if the API call fails,
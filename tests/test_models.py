@@ -1,4 +1,5 @@
 import datetime
+import os
 
 import pytest
 
@@ -14,6 +15,7 @@ from securedrop_client.db import (
     ReplySendStatus,
     ReplySendStatusCodes,
     User,
+    resolve_locations,
 )
 from tests import factory
 
@@ -298,6 +300,42 @@ def test_source_collection_ordering_with_multiple_draft_replies():
     assert source.collection[6] == draft_reply_7
 
 
+def test_source_journalist_filename_follows_designation():
+    source = factory.Source(journalist_designation="Foo Bar!")
+    assert source.journalist_filename == "foo_bar"
+
+    source.journalist_designation = "Baz Qux"
+    assert source.journalist_filename == "baz_qux"
+
+
+def test_location_follows_data_dir_and_designation(homedir):
+    """
+    Check that the resolved location of an item is kept until its data directory or its source's
+    designation change, and that it matches the location resolved along with other items.
+    """
+    source = factory.Source(journalist_designation="foo bar")
+    file = factory.File(source=source, filename="1-foo-doc.gz.gpg")
+    message = factory.Message(source=source, filename="2-foo-msg.gpg")
+    reply = factory.Reply(source=source, filename="3-foo-reply.gpg")
+    root = os.path.realpath(homedir)
+    data_dir = os.path.join(root, "data")
+
+    assert file.location(data_dir) == os.path.join(
+        root, "data", "foo_bar", "1-foo_bar-doc", "1-foo-doc.gz.gpg"
+    )
+    assert message.location(data_dir) == os.path.join(root, "data", "foo_bar", "2-foo-msg.txt")
+    assert reply.location(data_dir) == os.path.join(root, "data", "foo_bar", "3-foo-reply.txt")
+    assert resolve_locations(data_dir, [file, message, reply]) == [
+        file.location(data_dir),
+        message.location(data_dir),
+        reply.location(data_dir),
+    ]
+
+    source.journalist_designation = "baz qux"
+    assert message.location(data_dir) == os.path.join(root, "data", "baz_qux", "2-foo-msg.txt")
+    assert message.location(root) == os.path.join(root, "baz_qux", "2-foo-msg.txt")
+
+
 def test_file_init():
     """
     Check that:
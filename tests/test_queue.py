@@ -1,6 +1,7 @@
 """
 Testing for the ApiJobQueue and related classes.
 """
+import threading
 from queue import Queue
 
 import pytest
@@ -274,6 +275,118 @@ def test_RunnableQueue_clear(mocker):
     assert queue.queue.empty()
 
 
+def test_RunnableQueue_lanes_share_duplicate_detection(mocker):
+    """
+    A job already queued or running in one lane is not added to another lane.
+    """
+    queue = RunnableQueue(mocker.MagicMock(), mocker.MagicMock())
+    lane = RunnableQueue(mocker.MagicMock(), mocker.MagicMock(), peer=queue)
+    assert queue.lanes == [queue, lane]
+    assert lane.condition_add_or_remove_job is queue.condition_add_or_remove_job
+
+    queue.add_job(FileDownloadJob("mock", "mock", "mock"))
+    lane.add_job(FileDownloadJob("mock", "mock", "mock"))
+    assert queue.queue.qsize() == 1
+    assert lane.queue.empty()
+
+    queue.current_job = queue.queue.get()[1]
+    lane.add_job(FileDownloadJob("mock", "mock", "mock"))
+    assert lane.queue.empty()
+
+
+def test_RunnableQueue_lane_takes_jobs_from_busiest_peer(mocker):
+    """
+    A lane with an empty queue processes the jobs queued in other lanes.
+    """
+    job1_cls = factory.dummy_job_factory(mocker, "mock")
+    job2_cls = factory.dummy_job_factory(mocker, ApiInaccessibleError())  # stops processing
+    queue = RunnableQueue(mocker.MagicMock(), mocker.MagicMock())
+    idle_lane = RunnableQueue(mocker.MagicMock(), mocker.MagicMock(), peer=queue)
+    lane = RunnableQueue(mocker.MagicMock(), mocker.MagicMock(), peer=queue)
+    for q in queue.lanes:
+        q.JOB_PRIORITIES = {job1_cls: 1, job2_cls: 2}
+
+    queue.add_job(job1_cls())
+    queue.add_job(job2_cls())
+
+    lane.process()
+
+    assert queue.queue.empty()
+    assert idle_lane.queue.empty()
+    assert lane.api_client is None
+
+
+def test_RunnableQueue_lane_does_not_take_control_jobs_from_peer(mocker):
+    """
+    Pausing or clearing a lane is left to that lane, so its queued jobs are not taken from it until
+    it has processed the control job.
+    """
+    queue = RunnableQueue(mocker.MagicMock(), mocker.MagicMock())
+    lane = RunnableQueue(mocker.MagicMock(), mocker.MagicMock(), peer=queue)
+
+    queue.add_job(FileDownloadJob("mock", "mock", "mock"))
+    queue.add_job(PauseQueueJob())
+    assert lane._next_lane() is None
+
+    queue.queue.get()
+    assert lane._next_lane() is queue
+
+
+def test_RunnableQueue_lanes_pause_together_when_a_stolen_job_times_out(mocker):
+    """
+    A job that times out in one lane pauses every lane, and is not taken back by another lane
+    while the lanes are paused, even if it was taken from that lane in the first place.
+    """
+    started, release = threading.Event(), threading.Event()
+
+    def block(job, api_client, session):
+        started.set()
+        release.wait()
+
+    blocking_job_cls = factory.dummy_job_factory(mocker, "mock")
+    blocking_job_cls.call_api = block
+    timeout_job_cls = factory.dummy_job_factory(mocker, RequestTimeoutError(), remaining_attempts=1)
+    other_job_cls = factory.dummy_job_factory(mocker, "mock")
+    other_job_cls.call_api = mocker.MagicMock()
+    queue = RunnableQueue(mocker.MagicMock(), mocker.MagicMock())
+    lane = RunnableQueue(mocker.MagicMock(), mocker.MagicMock(), peer=queue)
+    for q in queue.lanes:
+        q.JOB_PRIORITIES = {
+            PauseQueueJob: 0,
+            blocking_job_cls: 1,
+            timeout_job_cls: 2,
+            other_job_cls: 3,
+        }
+    timeout_job = timeout_job_cls()
+    other_job = other_job_cls()
+    queue.add_job(blocking_job_cls())
+    queue.add_job(timeout_job)
+    queue.add_job(other_job)
+
+    queue_thread = threading.Thread(target=queue.process)
+    queue_thread.start()
+    started.wait(1)
+    lane_thread = threading.Thread(target=lane.process)
+    lane_thread.start()  # takes the timeout job from the busy queue
+    lane_thread.join(1)
+    release.set()
+    queue_thread.join(1)
+
+    assert not lane_thread.is_alive()
+    assert not queue_thread.is_alive()
+    assert queue.is_paused and lane.is_paused
+    assert [job for _, job in lane.queue.queue] == [timeout_job]
+    assert [job for _, job in queue.queue.queue] == [other_job]
+    other_job_cls.call_api.assert_not_called()
+
+    # The timed out job is only taken from its lane once that lane is resumed too
+    queue.queue.get()
+    queue.is_paused = False
+    assert queue._next_lane() is None
+    lane.is_paused = False
+    assert queue._next_lane() is lane
+
+
 def test_ApiJobQueue_enqueue_when_queues_are_running(mocker):
     mock_client = mocker.MagicMock()
     mock_session_maker = mocker.MagicMock()
@@ -534,6 +647,43 @@ def test_ApiJobQueue_stop_stops_queue_threads(mocker):
         assert job_queue.download_file_thread.wait()
 
 
+def test_ApiJobQueue_enqueue_spreads_file_downloads_across_lanes(mocker):
+    with threads(3) as [main_thread, file_download_thread, additional_thread]:
+        job_queue = ApiJobQueue(
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            main_thread,
+            file_download_thread,
+            [additional_thread],
+        )
+        job_queue.main_thread.isRunning = mocker.MagicMock(return_value=True)
+        job_queue.download_file_thread.isRunning = mocker.MagicMock(return_value=True)
+
+        job_queue.enqueue(FileDownloadJob("uuid1", "mock", "mock"))
+        job_queue.enqueue(FileDownloadJob("uuid2", "mock", "mock"))
+        job_queue.enqueue(FileDownloadJob("uuid2", "mock", "mock"))  # duplicate
+
+        assert job_queue.download_file_queue.queue.qsize() == 1
+        assert job_queue.additional_download_file_queues[0].queue.qsize() == 1
+
+
+def test_ApiJobQueue_stop_stops_additional_file_download_threads(mocker):
+    with threads(3) as [main_thread, file_download_thread, additional_thread]:
+        job_queue = ApiJobQueue(
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            main_thread,
+            file_download_thread,
+            [additional_thread],
+        )
+        job_queue.start(mocker.MagicMock())
+        assert additional_thread.isRunning()
+
+        job_queue.stop()
+        assert job_queue.download_file_thread.wait()
+        assert additional_thread.wait()
+
+
 def test_ApiJobQueue_stop_clears_jobs(mocker):
     """
     After ApiJobQueue.stop(), the underlying RunnableQueue is empty.
@@ -11,6 +11,7 @@ import pytest
 from dateutil.parser import parse
 from PyQt5.QtCore import QThread
 from sdclientapi import Reply, Submission
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -21,6 +22,7 @@ from securedrop_client.storage import (
     _cleanup_directory_if_empty,
     _cleanup_flagged_locally_deleted,
     _delete_source_collection_from_db,
+    add_seen_records,
     create_or_update_user,
     delete_local_conversation_by_source_uuid,
     delete_local_source_by_uuid,
@@ -34,12 +36,16 @@ from securedrop_client.storage import (
     get_local_replies,
     get_local_sources,
     get_message,
-    get_remote_data,
+    get_remote_source_digests,
     get_reply,
+    load_source_collection,
+    mark_all_as_not_downloaded,
     mark_all_pending_drafts_as_failed,
     mark_as_decrypted,
     mark_as_downloaded,
     mark_as_not_downloaded,
+    sanitize_sources,
+    sanitize_submissions_or_replies,
     set_message_or_reply_content,
     source_exists,
     update_draft_replies,
@@ -49,6 +55,8 @@ from securedrop_client.storage import (
     update_messages,
     update_missing_files,
     update_replies,
+    update_source_summaries,
+    update_source_summary_preview,
     update_sources,
 )
 from tests import factory
@@ -129,6 +137,37 @@ def test_make_session_maker_updates_db_file_with_safe_perms():
             assert oct(os.stat(db_path).st_mode) == "0o100600"  # now check safe perms
 
 
+def test_make_session_maker_sets_pragmas(homedir):
+    """
+    Ensure connections are configured with the default SQLite pragmas, or the given ones.
+    """
+    session = db.make_session_maker(homedir)()
+    assert session.execute("PRAGMA journal_mode").scalar() == "wal"
+    assert session.execute("PRAGMA synchronous").scalar() == 1  # NORMAL
+    assert session.execute("PRAGMA busy_timeout").scalar() == db.DEFAULT_PRAGMAS["busy_timeout"]
+    session.close()
+
+    session = db.make_session_maker(homedir, {"journal_mode": "DELETE"})()
+    assert session.execute("PRAGMA journal_mode").scalar() == "delete"
+    assert session.execute("PRAGMA synchronous").scalar() == 2  # the SQLite default, FULL
+    session.close()
+
+
+@pytest.mark.parametrize(
+    "pragmas",
+    [
+        {"foo": 1},
+        {"journal_mode": "WAL; DROP TABLE sources"},
+        {"journal_mode": "wall"},
+        {"cache_size": "-"},
+        {"busy_timeout": -1},
+    ],
+)
+def test_make_session_maker_rejects_invalid_pragmas(homedir, pragmas):
+    with pytest.raises(ValueError):
+        db.make_session_maker(homedir, pragmas)
+
+
 def test_get_local_sources(mocker):
     """
     At this moment, just return all sources.
@@ -218,35 +257,6 @@ def test_get_local_replies(mocker):
     mock_session.query.assert_called_once_with(securedrop_client.db.Reply)
 
 
-def test_get_remote_data_handles_api_error(mocker):
-    """
-    Ensure any error encountered when accessing the API is logged but the
-    caller handles the exception.
-    """
-    mock_api = mocker.MagicMock()
-    mock_api.get_sources.side_effect = Exception("BANG!")
-    with pytest.raises(Exception):
-        get_remote_data(mock_api)
-
-
-def test_get_remote_data(mocker):
-    """
-    In the good case, a tuple of results is returned.
-    """
-    # Some source, submission and reply objects from the API.
-    mock_api = mocker.MagicMock()
-    source = factory.RemoteSource()
-    mock_api.get_sources.return_value = [source]
-    submission = mocker.MagicMock()
-    mock_api.get_all_submissions.return_value = [submission]
-    reply = mocker.MagicMock()
-    mock_api.get_all_replies.return_value = [reply]
-    sources, submissions, replies = get_remote_data(mock_api)
-    assert sources == [source]
-    assert submissions == [submission]
-    assert replies == [reply]
-
-
 def test_update_local_storage(homedir, mocker, session_maker):
     """
     Check that update functions are called with expected remote sources and submissions.
@@ -292,6 +302,28 @@ def test_update_local_storage(homedir, mocker, session_maker):
     )
 
 
+def test_update_local_storage_commits_once(homedir, mocker, session):
+    """
+    Check that a sync is committed in a single transaction.
+    """
+    remote_source = factory.RemoteSource()
+    source_url = "/api/v1/sources/{}".format(remote_source.uuid)
+    remote_file = factory.RemoteFile(source_url=source_url, filename="1-foo-doc.gz.gpg")
+    remote_message = factory.RemoteMessage(source_url=source_url, filename="2-foo-msg.gpg")
+    remote_reply = factory.RemoteReply(source_url=source_url, filename="3-foo-reply.gpg")
+    commit = mocker.spy(session, "commit")
+
+    update_local_storage(
+        session, [remote_source], [remote_file, remote_message], [remote_reply], homedir
+    )
+
+    commit.assert_called_once_with()
+    assert session.query(db.Source).filter_by(uuid=remote_source.uuid).one()
+    assert session.query(db.File).filter_by(uuid=remote_file.uuid).one()
+    assert session.query(db.Message).filter_by(uuid=remote_message.uuid).one()
+    assert session.query(db.Reply).filter_by(uuid=remote_reply.uuid).one()
+
+
 def test_update_local_storage_sanitizes_remote_data(mocker, homedir):
     """
     Check that sanitize functions are called with expected remote sources and submissions.
@@ -315,6 +347,296 @@ def test_update_local_storage_sanitizes_remote_data(mocker, homedir):
     sanitize_submissions_or_replies.call_args_list[1][0][0] == [remote_reply]
 
 
+def test_sanitize_sources_and_submissions_or_replies():
+    """
+    Check that malformed sources, submissions and replies are dropped, and that the remote lists
+    themselves are returned when all their objects are valid.
+    """
+    source = factory.RemoteSource()
+    malformed_source = factory.RemoteSource(journalist_designation="../../traversed")
+    message = make_remote_message(source.uuid)
+    malformed_message = make_remote_message(source.uuid)
+    malformed_message.filename = "1-../../traversed-msg"
+    sources = [source]
+    submissions = [message]
+
+    assert sanitize_sources(sources) is sources
+    assert sanitize_submissions_or_replies(submissions) is submissions
+    assert sanitize_sources([malformed_source, source]) == [source]
+    assert sanitize_submissions_or_replies([message, malformed_message]) == [message]
+
+
+def test_update_local_storage_splits_submissions_of_changed_sources(mocker, homedir, session):
+    """
+    Check that a delta sync only passes the messages and files of the changed sources to the
+    updaters.
+    """
+    changed_source = factory.RemoteSource()
+    unchanged_source = factory.RemoteSource()
+    message = make_remote_message(changed_source.uuid)
+    file = make_remote_submission(changed_source.uuid)
+    file.filename = "2-submission-doc.gz.gpg"
+    unchanged_message = make_remote_message(unchanged_source.uuid)
+    update_files = mocker.patch("securedrop_client.storage.update_files")
+    update_messages = mocker.patch("securedrop_client.storage.update_messages")
+    mocker.patch(
+        "securedrop_client.storage._get_changed_source_uuids", return_value={changed_source.uuid}
+    )
+
+    update_local_storage(
+        session,
+        [changed_source, unchanged_source],
+        [message, file, unchanged_message],
+        [],
+        homedir,
+        {},
+    )
+
+    assert update_files.call_args[0][0] == [file]
+    assert update_messages.call_args[0][0] == [message]
+
+
+def test_get_remote_source_digests():
+    """
+    Check that a source's digest changes with the source and its submissions and replies, and
+    only with them.
+    """
+    source = factory.RemoteSource()
+    other_source = factory.RemoteSource()
+    message = make_remote_message(source.uuid)
+    reply = make_remote_reply(source.uuid)
+
+    digests = get_remote_source_digests([source, other_source], [message], [reply])
+    assert digests == get_remote_source_digests([source, other_source], [message], [reply])
+
+    message.seen_by = ["journalist-uuid"]
+    new_digests = get_remote_source_digests([source, other_source], [message], [reply])
+    assert new_digests[source.uuid] != digests[source.uuid]
+    assert new_digests[other_source.uuid] == digests[other_source.uuid]
+
+    other_source.is_starred = not other_source.is_starred
+    newer_digests = get_remote_source_digests([source, other_source], [message], [reply])
+    assert newer_digests[source.uuid] == new_digests[source.uuid]
+    assert newer_digests[other_source.uuid] != new_digests[other_source.uuid]
+
+
+def test_update_local_storage_delta_skips_unchanged_sources(homedir, mocker, session):
+    """
+    Check that once a sync has recorded source digests, the next sync only updates the sources
+    that have changed, along with their submissions and replies.
+    """
+    unchanged_source = factory.RemoteSource(journalist_designation="unchanged source")
+    changed_source = factory.RemoteSource(journalist_designation="changed source")
+    unchanged_message = make_remote_message(unchanged_source.uuid)
+    changed_message = make_remote_message(changed_source.uuid)
+    remote_sources = [unchanged_source, changed_source]
+    remote_submissions = [unchanged_message, changed_message]
+    source_digests = {}
+
+    changed_source_uuids = update_local_storage(
+        session, remote_sources, remote_submissions, [], homedir, source_digests
+    )
+
+    assert changed_source_uuids is None
+    assert session.query(db.Source).count() == 2
+    assert session.query(db.Message).count() == 2
+    assert set(source_digests) == {unchanged_source.uuid, changed_source.uuid}
+
+    changed_source.is_starred = not changed_source.is_starred
+    changed_message.is_read = True
+    update_sources = mocker.spy(securedrop_client.storage, "update_sources")
+    update_messages = mocker.spy(securedrop_client.storage, "update_messages")
+
+    changed_source_uuids = update_local_storage(
+        session, remote_sources, remote_submissions, [], homedir, source_digests
+    )
+
+    assert changed_source_uuids == {changed_source.uuid}
+    remote_sources_arg, local_sources_arg = update_sources.call_args[0][:2]
+    assert remote_sources_arg == [changed_source]
+    assert [s.uuid for s in local_sources_arg] == [changed_source.uuid]
+    remote_messages_arg, local_messages_arg = update_messages.call_args[0][:2]
+    assert remote_messages_arg == [changed_message]
+    assert [m.uuid for m in local_messages_arg] == [changed_message.uuid]
+
+    local_source = session.query(db.Source).filter_by(uuid=changed_source.uuid).one()
+    assert local_source.is_starred == changed_source.is_starred
+    assert session.query(db.Message).filter_by(uuid=changed_message.uuid).one().is_read
+    assert session.query(db.Message).count() == 2
+
+
+def test_update_local_storage_delta_deletes_sources_missing_from_server(homedir, mocker, session):
+    """
+    Check that a delta sync still deletes local sources that no longer exist on the server, and
+    re-adds sources that were deleted locally even though their digest has not changed.
+    """
+    deleted_source = factory.RemoteSource(journalist_designation="deleted source")
+    kept_source = factory.RemoteSource(journalist_designation="kept source")
+    source_digests = {}
+    mocker.patch("securedrop_client.storage.delete_source_collection")
+
+    update_local_storage(session, [deleted_source, kept_source], [], [], homedir, source_digests)
+    session.query(db.Source).filter_by(uuid=kept_source.uuid).delete()
+    session.commit()
+
+    changed_source_uuids = update_local_storage(
+        session, [kept_source], [], [], homedir, source_digests
+    )
+
+    assert changed_source_uuids == {deleted_source.uuid, kept_source.uuid}
+    assert [s.uuid for s in session.query(db.Source).all()] == [kept_source.uuid]
+    assert set(source_digests) == {kept_source.uuid}
+
+
+def test_update_local_storage_delta_falls_back_to_full_sync(homedir, mocker, session):
+    """
+    Check that a delta sync with no previous digests, or with too many changed sources, diffs all
+    local sources.
+    """
+    remote_sources = [factory.RemoteSource(journalist_designation="first source")]
+    update_sources = mocker.patch("securedrop_client.storage.update_sources")
+    get_local_sources = mocker.patch("securedrop_client.storage.get_local_sources", return_value=[])
+
+    update_local_storage(session, remote_sources, [], [], homedir, {})
+    update_sources.assert_called_once_with(remote_sources, [], [], [], session, homedir)
+    get_local_sources.assert_called_once_with(session)
+
+    mocker.patch("securedrop_client.storage.DELTA_SYNC_MAX_CHANGED_SOURCES", 0)
+    update_local_storage(session, remote_sources, [], [], homedir, {"outdated": "digest"})
+    assert get_local_sources.call_count == 2
+
+
+def test_update_local_storage_updates_source_summaries(homedir, mocker, session):
+    """
+    Check that both full and delta syncs leave the summaries of the sources they update up to
+    date.
+    """
+    source = factory.RemoteSource()
+    message = make_remote_message(source.uuid)
+    source_digests = {}
+
+    update_local_storage(session, [source], [message], [], homedir, source_digests)
+
+    local_source = session.query(db.Source).filter_by(uuid=source.uuid).one()
+    assert local_source.summary.last_activity_uuid == message.uuid
+    assert local_source.summary.preview == "<Message not yet available>"
+    assert local_source.summary.unseen_count == 1
+
+    message.is_read = True
+
+    update_local_storage(session, [source], [message], [], homedir, source_digests)
+
+    session.refresh(local_source)
+    assert local_source.summary.unseen_count == 0
+
+
+def test_update_source_summaries(session, source):
+    """
+    Check that the summary of a source has its latest file, message or reply, and its number of
+    files and messages that have not been seen.
+    """
+    journalist = factory.User()
+    session.add(journalist)
+    seen_message = factory.Message(source=source["source"], filename="1-foo-msg.gpg")
+    unseen_message = factory.Message(source=source["source"], filename="2-foo-msg.gpg")
+    legacy_seen_file = factory.File(source=source["source"], filename="3-foo-doc.gz.gpg")
+    legacy_seen_file.is_read = True
+    unseen_file = factory.File(
+        source=source["source"], filename="4-foo-doc.gz.gpg", is_downloaded=False, is_decrypted=None
+    )
+    session.add_all([seen_message, unseen_message, legacy_seen_file, unseen_file])
+    session.commit()
+    session.add(db.SeenMessage(message_id=seen_message.id, journalist_id=journalist.id))
+    session.commit()
+
+    update_source_summaries(session)
+    session.commit()
+
+    summary = session.query(db.SourceSummary).filter_by(source_id=source["id"]).one()
+    assert summary.last_activity_uuid == unseen_file.uuid
+    assert summary.preview == "<Encrypted file on server>"
+    assert summary.unseen_count == 2
+
+    # A reply wins over the file with the same file counter, as in Source.server_collection
+    reply = factory.Reply(source=source["source"], filename="4-foo-reply.gpg", content="hi\nthere")
+    session.add(reply)
+    session.commit()
+
+    update_source_summaries(session, [source["id"]])
+    session.commit()
+
+    assert summary.last_activity_uuid == reply.uuid
+    assert summary.preview == "hi"
+    assert summary.unseen_count == 2
+
+
+def test_update_source_summaries_of_empty_conversation(session, source):
+    """
+    Check that a source without files, messages or replies has an empty summary.
+    """
+    message = factory.Message(source=source["source"])
+    session.add(message)
+    session.commit()
+    update_source_summaries(session, [source["id"]])
+    session.commit()
+
+    session.delete(message)
+    update_source_summaries(session, [source["id"]])
+    session.commit()
+
+    summary = session.query(db.SourceSummary).filter_by(source_id=source["id"]).one()
+    assert summary.last_activity_uuid is None
+    assert summary.preview is None
+    assert summary.unseen_count == 0
+
+
+def test_update_source_summary_preview(session, source):
+    """
+    Check that the preview of a source's summary is only updated for its latest activity.
+    """
+    earlier_message = factory.Message(source=source["source"], filename="1-foo-msg.gpg")
+    message = factory.Message(source=source["source"], filename="2-foo-msg.gpg", content="hi")
+    session.add_all([earlier_message, message])
+    session.commit()
+    update_source_summaries(session, [source["id"]])
+    session.commit()
+
+    earlier_message.content = "earlier"
+    update_source_summary_preview(session, earlier_message)
+    message.content = "hello"
+    update_source_summary_preview(session, message)
+    session.commit()
+
+    summary = session.query(db.SourceSummary).filter_by(source_id=source["id"]).one()
+    assert summary.preview == "hello"
+
+
+def test_source_seen_from_source_summaries(session):
+    """
+    Check that the seen state of every source is known from the query that loads the sources,
+    without loading their conversations.
+    """
+    sources = [factory.Source() for i in range(3)]
+    session.add_all(sources)
+    session.add(factory.Message(source=sources[0], is_read=True))
+    session.add(factory.Message(source=sources[1]))
+    session.commit()
+    update_source_summaries(session)
+    session.commit()
+    session.expire_all()
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    seen = {source.uuid: source.seen for source in get_local_sources(session)}
+
+    assert seen == {sources[0].uuid: True, sources[1].uuid: False, sources[2].uuid: True}
+    assert len([x for x in statements if x.startswith("SELECT")]) == 1
+
+
 def test_sync_delete_race(homedir, mocker, session_maker, session):
     """
     Test a race between sync and source deletion (#797).
@@ -521,8 +843,8 @@ def test_update_submissions_deletes_files_associated_with_the_submission(homedir
     # Ensure the record for the local submission is gone.
     mock_session.delete.assert_called_once_with(local_submission)
 
-    # Session is committed to database.
-    assert mock_session.commit.call_count == 1
+    # Changes are flushed, to be committed once by update_local_storage.
+    assert mock_session.flush.call_count == 1
 
 
 def test_update_local_storage_does_not_call_update_functions_w_insecure_filenames(mocker, homedir):
@@ -603,8 +925,8 @@ def test_update_replies_deletes_files_associated_with_the_reply(homedir, mocker)
     # Ensure the record for the local reply is gone.
     mock_session.delete.assert_called_once_with(local_reply)
 
-    # Session is committed to database.
-    assert mock_session.commit.call_count == 1
+    # Changes are flushed, to be committed once by update_local_storage.
+    assert mock_session.flush.call_count == 1
 
 
 def test_update_sources_deletes_files_associated_with_the_source(homedir, mocker, session_maker):
@@ -683,8 +1005,8 @@ def test_update_sources_deletes_files_associated_with_the_source(homedir, mocker
     # related files.
     mock_session.delete.assert_called_with(local_source)
 
-    # Session is committed to database.
-    assert mock_session.commit.call_count == 1
+    # Changes are flushed, to be committed once by update_local_storage.
+    assert mock_session.flush.call_count == 1
 
 
 def test_update_files(homedir, mocker):
@@ -725,7 +1047,7 @@ def test_update_files(homedir, mocker):
     local_source = mocker.MagicMock()
     local_source.uuid = source.uuid
     local_source.id = 666  # };-)
-    mock_session.query().filter_by().first.return_value = local_source
+    mock_session.query().__iter__.return_value = iter([(local_source.uuid, local_source.id)])
     mock_delete_submission_files = mocker.patch(
         "securedrop_client.storage.delete_single_submission_or_reply_on_disk"
     )
@@ -741,17 +1063,18 @@ def test_update_files(homedir, mocker):
 
     # Check the expected local source object has been created with values from
     # the API.
-    assert mock_session.add.call_count == 1
-    new_sub = mock_session.add.call_args_list[0][0][0]
-    assert new_sub.uuid == remote_sub_create.uuid
-    assert new_sub.source_id == local_source.id
-    assert new_sub.filename == remote_sub_create.filename
+    mock_session.add.assert_not_called()
+    mock_session.execute.assert_called_once()
+    [new_sub] = mock_session.execute.call_args[0][1]
+    assert new_sub["uuid"] == remote_sub_create.uuid
+    assert new_sub["source_id"] == local_source.id
+    assert new_sub["filename"] == remote_sub_create.filename
     # Ensure the record for the local source that is missing from the results
     # of the API is deleted.
     mock_session.delete.assert_called_once_with(local_sub_delete)
     mock_delete_submission_files.assert_called_once_with(local_sub_delete, data_dir)
-    # Session is committed to database.
-    assert mock_session.commit.call_count == 1
+    # Changes are flushed, to be committed once by update_local_storage.
+    assert mock_session.flush.call_count == 1
 
 
 def test_update_files_adds_seen_record(homedir, mocker, session):
@@ -866,6 +1189,69 @@ def test_update_files_adds_seen_record(homedir, mocker, session):
     )
 
 
+def test_add_seen_records_inserts_only_missing_records(homedir, mocker, session):
+    """
+    Check that seen records are reconciled for all files at once: the journalists and existing
+    seen records are each queried once, only missing records are inserted, and a journalist
+    without an account does not prevent adding records for the other journalists.
+    """
+    mocker.patch("securedrop_client.storage.SQLITE_MAX_VARIABLE_NUMBER", 2)
+    journalist_1 = factory.User()
+    journalist_2 = factory.User()
+    session.add(journalist_1)
+    session.add(journalist_2)
+    source = factory.Source()
+    session.add(source)
+    session.commit()
+    files = [factory.File(source=source) for i in range(3)]
+    session.add_all(files)
+    session.commit()
+    session.add(db.SeenFile(file_id=files[0].id, journalist_id=journalist_1.id))
+    session.commit()
+    file_ids = [f.id for f in files]
+    journalist_ids = [journalist_1.id, journalist_2.id]
+    seen_by = {
+        file_ids[0]: ["unknown-journalist-uuid", journalist_1.uuid, journalist_2.uuid],
+        file_ids[1]: [journalist_2.uuid, journalist_2.uuid],
+        file_ids[2]: [],
+    }
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    add_seen_records(session, db.SeenFile, seen_by)
+    session.commit()
+
+    assert len([x for x in statements if x.startswith("SELECT users.")]) == 1
+    assert len([x for x in statements if x.startswith("SELECT seen_files.")]) == 1
+    assert len([x for x in statements if x.startswith("INSERT INTO seen_files")]) == 1
+    assert sorted(session.query(db.SeenFile.file_id, db.SeenFile.journalist_id)) == [
+        (file_ids[0], journalist_ids[0]),
+        (file_ids[0], journalist_ids[1]),
+        (file_ids[1], journalist_ids[1]),
+    ]
+
+
+def test_add_seen_records_expires_seen_records_of_loaded_items(session):
+    """
+    Check that an item loaded before its seen records are added is seen once they are added.
+    """
+    journalist = factory.User()
+    source = factory.Source()
+    message = factory.Message(source=source)
+    session.add_all([journalist, source, message])
+    session.commit()
+    assert not message.seen
+
+    add_seen_records(session, db.SeenMessage, {message.id: [journalist.uuid]})
+
+    assert message.seen
+    assert message.seen_by(journalist.id)
+
+
 def test_update_files_marks_read_files_as_seen_without_seen_records(homedir, mocker, session):
     """
     Check that the file submission without a seen record still returns true for "seen" if is_read is
@@ -950,7 +1336,7 @@ def test_update_messages(homedir, mocker):
     local_source.id = 666  # };-)
     local_user = mocker.MagicMock()
     local_user.id = 42
-    mock_session.query().filter_by().first.return_value = local_source
+    mock_session.query().__iter__.return_value = iter([(local_source.uuid, local_source.id)])
     mock_focu = mocker.MagicMock(return_value=local_user)
     mocker.patch("securedrop_client.storage.create_or_update_user", mock_focu)
     mock_delete_submission_files = mocker.patch(
@@ -967,18 +1353,55 @@ def test_update_messages(homedir, mocker):
 
     # Check the expected local source object has been created with values from
     # the API.
-    assert mock_session.add.call_count == 1
-    new_reply = mock_session.add.call_args_list[0][0][0]
-    assert new_reply.uuid == remote_message_create.uuid
-    assert new_reply.source_id == local_source.id
-    assert new_reply.size == remote_message_create.size
-    assert new_reply.filename == remote_message_create.filename
+    mock_session.add.assert_not_called()
+    mock_session.execute.assert_called_once()
+    [new_message] = mock_session.execute.call_args[0][1]
+    assert new_message["uuid"] == remote_message_create.uuid
+    assert new_message["source_id"] == local_source.id
+    assert new_message["size"] == remote_message_create.size
+    assert new_message["filename"] == remote_message_create.filename
     # Ensure the record for the local source that is missing from the results
     # of the API is deleted.
     mock_session.delete.assert_called_once_with(local_message_delete)
     mock_delete_submission_files.assert_called_once_with(local_message_delete, data_dir)
-    # Session is committed to database.
-    assert mock_session.commit.call_count == 1
+    # Changes are flushed, to be committed once by update_local_storage.
+    assert mock_session.flush.call_count == 1
+
+
+def test_update_messages_inserts_new_messages_in_bulk(homedir, mocker, session):
+    """
+    Check that new messages and their seen records are inserted without flushing the session
+    once per message, even when there are more of them than SQLite accepts bound parameters.
+    """
+    data_dir = os.path.join(homedir, "data")
+    mocker.patch("securedrop_client.storage.SQLITE_MAX_VARIABLE_NUMBER", 2)
+    journalist = factory.User()
+    source = factory.Source()
+    session.add(journalist)
+    session.add(source)
+    session.commit()
+    remote_messages = []
+    for i in range(1, 6):
+        remote_message = make_remote_message(source.uuid, file_counter=i)
+        remote_message.seen_by = [journalist.uuid, journalist.uuid, "unknown-journalist-uuid"]
+        remote_messages.append(remote_message)
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    update_messages(remote_messages, [], [], [], session, data_dir)
+
+    assert len([x for x in statements if x.startswith("INSERT INTO messages")]) == 1
+    assert len([x for x in statements if x.startswith("INSERT INTO seen_messages")]) == 1
+    messages = session.query(db.Message).order_by(db.Message.file_counter).all()
+    assert [m.uuid for m in messages] == [m.uuid for m in remote_messages]
+    assert [m.file_counter for m in messages] == [1, 2, 3, 4, 5]
+    for message in messages:
+        assert message.source_id == source.id
+        assert [s.journalist_id for s in message.seen_messages] == [journalist.id]
 
 
 def test_update_messages_marks_read_messages_as_seen_without_seen_records(homedir, mocker, session):
@@ -1527,30 +1950,66 @@ def test_find_new_messages(mocker, session):
         assert message.is_downloaded is False or message.is_decrypted is not True
 
 
-def test_update_missing_files(mocker, homedir):
-    session = mocker.MagicMock()
-    file = mocker.MagicMock()
-    file.is_downloaded = True
-    files = [file]
-    session.query().filter_by().all.return_value = files
+def test_update_missing_files(homedir, session):
+    """
+    Check that the downloaded files missing from the data directory are marked as not downloaded
+    with a single statement, and that the others are left as they are.
+    """
     data_dir = os.path.join(homedir, "data")
-    mocker.patch("os.path.splitext", return_value=("mock_filename", "dummy"))
-    mocker.patch("os.path.exists", return_value=False)
-    mark_as_not_downloaded_fn = mocker.patch("securedrop_client.storage.mark_as_not_downloaded")
+    source = factory.Source()
+    present_file = factory.File(source=source, filename="1-foo-doc.gz.gpg")
+    missing_files = [
+        factory.File(source=source, filename="2-foo-doc.gz.gpg"),
+        factory.File(source=source, filename="3-foo-doc.gz.gpg"),
+    ]
+    not_downloaded_file = factory.File(
+        source=source, filename="4-foo-doc.gz.gpg", is_downloaded=False, is_decrypted=None
+    )
+    session.add_all([source, present_file, not_downloaded_file] + missing_files)
+    session.commit()
+    os.makedirs(os.path.dirname(present_file.location(data_dir)))
+    with open(present_file.location(data_dir), "w") as f:
+        f.write("present")
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
 
-    update_missing_files(data_dir, session)
+    result = update_missing_files(data_dir, session)
 
-    mark_as_not_downloaded_fn.assert_called_once_with(file.uuid, session)
+    assert result == missing_files
+    assert len([x for x in statements if x.startswith("UPDATE files")]) == 1
+    session.expire_all()
+    assert present_file.is_downloaded
+    for missing_file in missing_files:
+        assert missing_file.is_downloaded is False
+        assert missing_file.is_decrypted is None
+
+
+def test_update_missing_files_without_downloaded_files(homedir, session):
+    data_dir = os.path.join(homedir, "data")
+    source = factory.Source()
+    session.add(source)
+    session.add(factory.File(source=source, is_downloaded=False, is_decrypted=None))
+    session.commit()
+
+    assert update_missing_files(data_dir, session) == []
 
 
 def test_find_new_files(mocker, session):
-    mock_session = mocker.MagicMock()
-    mock_submission = mocker.MagicMock()
-    mock_submission.is_downloaded = False
-    mock_submissions = [mock_submission]
-    mock_session.query().join().filter_by().order_by().all.return_value = mock_submissions
-    submissions = find_new_files(mock_session)
-    assert submissions[0].is_downloaded is False
+    source = factory.Source()
+    file_not_downloaded = factory.File(source=source, is_downloaded=False, is_decrypted=None)
+    file_downloaded = factory.File(source=source, is_downloaded=True, is_decrypted=True)
+    session.add(source)
+    session.add(file_not_downloaded)
+    session.add(file_downloaded)
+    session.commit()
+
+    files = find_new_files(session)
+
+    assert files == [file_not_downloaded]
 
 
 def test_find_new_replies(mocker, session):
@@ -1634,6 +2093,22 @@ def test_mark_file_as_not_downloaded(mocker):
     session.commit.assert_called_once_with()
 
 
+def test_mark_all_as_not_downloaded(session):
+    source = factory.Source()
+    file = factory.File(source=source, is_downloaded=True, is_decrypted=True)
+    other_file = factory.File(source=source, is_downloaded=True, is_decrypted=True)
+    not_downloaded_file = factory.File(source=source, is_downloaded=False, is_decrypted=None)
+    session.add_all([source, file, other_file, not_downloaded_file])
+    session.commit()
+
+    missing_files = mark_all_as_not_downloaded([file.uuid, not_downloaded_file.uuid], session)
+
+    assert missing_files == [file]
+    assert file.is_downloaded is False
+    assert file.is_decrypted is None
+    assert other_file.is_downloaded is True
+
+
 def test_mark_file_as_downloaded(mocker):
     session = mocker.MagicMock()
     file = factory.File(source=factory.Source(), is_downloaded=False)
@@ -1792,6 +2267,67 @@ def test_get_reply(mocker, session):
     assert result == reply
 
 
+def test_load_source_collection(session, reply_status_codes):
+    """
+    Check that a conversation is loaded in a fixed number of queries along with everything needed
+    to render its items, no matter how many items it contains.
+    """
+    journalist = factory.User()
+    source = factory.Source()
+    session.add(journalist)
+    session.add(source)
+    session.commit()
+    pending_status = (
+        session.query(db.ReplySendStatus)
+        .filter_by(name=db.ReplySendStatusCodes.PENDING.value)
+        .one()
+    )
+    for i in range(3):
+        message = factory.Message(source=source, filename=f"{3 * i + 1}-source-msg.gpg")
+        file = factory.File(source=source, filename=f"{3 * i + 2}-source-doc.gz.gpg")
+        reply = factory.Reply(
+            source=source, journalist=journalist, filename=f"{3 * i + 3}-source-reply.gpg"
+        )
+        session.add_all([message, file, reply])
+        session.add(db.SeenMessage(message=message, journalist=journalist))
+        session.add(db.SeenFile(file=file, journalist=journalist))
+        session.add(db.SeenReply(reply=reply, journalist=journalist))
+    draft_reply = factory.DraftReply(
+        source_id=source.id,
+        journalist_id=journalist.id,
+        file_counter=10,
+        send_status_id=pending_status.id,
+    )
+    session.add(draft_reply)
+    session.commit()
+    session.expire_all()
+    source.id
+    statements = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    collection = load_source_collection(session, source)
+    for item in collection:
+        str(item)
+        assert item.seen
+        assert item.seen_by(journalist.id)
+        if not isinstance(item, db.File):
+            assert list(item.seen_by_list) in ([journalist.username], [])
+        if isinstance(item, (db.Reply, db.DraftReply)):
+            assert item.journalist.username == journalist.username
+        if isinstance(item, db.DraftReply):
+            assert item.send_status.name == db.ReplySendStatusCodes.PENDING.value
+
+    assert len(collection) == 10
+    assert collection[-1] == draft_reply
+    # The source, then its messages, files, replies and draft replies, then the seen records of
+    # its messages, files and replies.
+    assert len([x for x in statements if x.startswith("SELECT")]) == 8
+
+
 def test_mark_pending_replies_as_failed(mocker, session, reply_status_codes):
     source = factory.Source()
     pending_status = (
@@ -3,7 +3,7 @@ from sdclientapi import RequestTimeoutError, ServerConnectionError
 
 from securedrop_client.api_jobs.base import ApiInaccessibleError
 from securedrop_client.app import threads
-from securedrop_client.sync import ApiSync
+from securedrop_client.sync import ApiSync, SyncScheduler
 
 
 def test_ApiSync_init(mocker, session_maker, homedir):
@@ -193,7 +193,12 @@ def test_ApiSync_on_sync_success(mocker, session_maker, homedir):
 
         api_sync.on_sync_success()
 
-        sync_success.emit.assert_called_once_with()
+        sync_success.emit.assert_called_once_with(None)
+
+        sync_success.emit.reset_mock()
+        api_sync.on_sync_success({"changed_uuid"})
+
+        sync_success.emit.assert_called_once_with({"changed_uuid"})
 
 
 def test_ApiSync_on_sync_failure(mocker, session_maker, homedir):
@@ -231,3 +236,122 @@ def test_ApiSync_on_sync_failure_because_of_timeout(mocker, session_maker, homed
         api_sync.on_sync_failure(error)
 
         sync_failure.emit.assert_called_once_with(error)
+
+
+def test_ApiSync_on_sync_success_schedules_next_sync(mocker, session_maker, homedir):
+    """
+    Ensure the next sync is scheduled once a sync is over, later when nothing changed.
+    """
+    with threads(1) as [sync_thread]:
+        api_sync = ApiSync(
+            mocker.MagicMock(), session_maker, mocker.MagicMock(), homedir, sync_thread
+        )
+        api_sync.timer = mocker.MagicMock()
+
+        api_sync.on_sync_success({"changed_uuid"})
+        api_sync.timer.start.assert_called_once_with(SyncScheduler.TIME_BETWEEN_SYNCS_MS)
+
+        api_sync.timer.start.reset_mock()
+        api_sync.on_sync_success(set())
+        api_sync.timer.start.assert_called_once_with(2 * SyncScheduler.TIME_BETWEEN_SYNCS_MS)
+        assert api_sync.scheduler.decisions == {"changes": 1, "no_changes": 1}
+        assert api_sync.scheduler.interval == 2 * SyncScheduler.TIME_BETWEEN_SYNCS_MS
+
+
+def test_ApiSync_on_activity(mocker, session_maker, homedir):
+    """
+    Ensure activity brings the next sync forward when it was scheduled later because nothing
+    changed.
+    """
+    with threads(1) as [sync_thread]:
+        api_sync = ApiSync(
+            mocker.MagicMock(), session_maker, mocker.MagicMock(), homedir, sync_thread
+        )
+        api_sync.timer = mocker.MagicMock()
+        api_sync.timer.isActive.return_value = True
+        api_sync.timer.remainingTime.return_value = 2 * SyncScheduler.TIME_BETWEEN_SYNCS_MS
+
+        api_sync.on_activity()
+
+        api_sync.timer.start.assert_called_once_with(SyncScheduler.TIME_BETWEEN_SYNCS_MS)
+
+        api_sync.timer.start.reset_mock()
+        api_sync.timer.remainingTime.return_value = 1000
+        api_sync.on_activity()
+
+        api_sync.timer.start.assert_not_called()
+
+
+def test_SyncScheduler_backs_off_when_idle():
+    scheduler = SyncScheduler()
+
+    intervals = [scheduler.after_success(set()) for i in range(5)]
+
+    assert intervals == [
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS * 2,
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS * 4,
+        SyncScheduler.MAX_IDLE_TIME_BETWEEN_SYNCS_MS,
+        SyncScheduler.MAX_IDLE_TIME_BETWEEN_SYNCS_MS,
+        SyncScheduler.MAX_IDLE_TIME_BETWEEN_SYNCS_MS,
+    ]
+    assert scheduler.after_success(None) == SyncScheduler.TIME_BETWEEN_SYNCS_MS
+    assert scheduler.after_success(set()) == SyncScheduler.TIME_BETWEEN_SYNCS_MS * 2
+    assert scheduler.decisions == {"no_changes": 6, "changes": 1}
+
+
+def test_SyncScheduler_decisions():
+    """
+    Ensure the number of decisions made for each reason, and the last wait, can be read.
+    """
+    scheduler = SyncScheduler()
+    assert scheduler.decisions == {}
+    assert scheduler.interval == SyncScheduler.TIME_BETWEEN_SYNCS_MS
+
+    scheduler.after_success(set())
+    scheduler.after_activity()
+    scheduler.after_failure(Exception())
+    scheduler.after_success(set())
+
+    assert scheduler.decisions == {"no_changes": 2, "activity": 1, "failure": 1}
+    assert scheduler.interval == SyncScheduler.TIME_BETWEEN_SYNCS_MS * 2
+
+
+def test_SyncScheduler_after_activity():
+    scheduler = SyncScheduler()
+    scheduler.after_success(set())
+    scheduler.after_success(set())
+
+    assert scheduler.after_activity() == SyncScheduler.TIME_BETWEEN_SYNCS_MS
+    assert scheduler.after_success(set()) == SyncScheduler.TIME_BETWEEN_SYNCS_MS * 2
+
+
+@pytest.mark.parametrize("exception", [RequestTimeoutError, ServerConnectionError])
+def test_SyncScheduler_backs_off_with_jitter_when_unreachable(mocker, exception):
+    uniform = mocker.patch("securedrop_client.sync.random.uniform", return_value=1)
+    scheduler = SyncScheduler()
+
+    intervals = [scheduler.after_failure(exception()) for i in range(7)]
+
+    assert intervals == [
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS,
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS * 2,
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS * 4,
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS * 8,
+        SyncScheduler.TIME_BETWEEN_SYNCS_MS * 16,
+        SyncScheduler.MAX_BACKOFF_MS,
+        SyncScheduler.MAX_BACKOFF_MS,
+    ]
+    uniform.assert_called_with(0.5, 1)
+
+    uniform.return_value = 0.5
+    assert scheduler.after_failure(exception()) == SyncScheduler.MAX_BACKOFF_MS // 2
+
+    assert scheduler.after_success(None) == SyncScheduler.TIME_BETWEEN_SYNCS_MS
+    assert scheduler.after_failure(exception()) == SyncScheduler.TIME_BETWEEN_SYNCS_MS // 2
+
+
+def test_SyncScheduler_after_other_failure():
+    scheduler = SyncScheduler()
+
+    assert scheduler.after_failure(Exception()) == SyncScheduler.TIME_BETWEEN_SYNCS_MS
+    assert scheduler.failed_sync_count == 0
@@ -1,19 +1,37 @@
+import gzip
+import io
 import os
 import tempfile
+import threading
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
 import pytest
 
+from securedrop_client.crypto import read_gzip_header
 from securedrop_client.utils import (
+    call_concurrently,
     check_all_permissions,
     check_dir_permissions,
     check_path_traversal,
     humanize_filesize,
+    longest_increasing_subsequence,
     relative_filepath,
+    safe_gunzip_stream,
     safe_mkdir,
 )
 
 
+def gzip_body(data):
+    """
+    Return a stream of gzipped data positioned just after its (filename-less) header.
+    """
+    stream = io.BytesIO(gzip.compress(data))
+    stream.read(10)
+    return stream
+
+
 def test_humanize_file_size_bytes():
     expected_humanized_filesize = "123B"
     actual_humanized_filesize = humanize_filesize(123)
@@ -309,3 +327,134 @@ def test_check_dir_permissions_unsafe(mocker):
 
         with pytest.raises(RuntimeError):
             check_dir_permissions(os.path.join(temp_dir, "bad"))
+
+
+def test_safe_gunzip_stream(homedir, mocker):
+    mocker.patch("securedrop_client.utils.GZIP_STREAM_CHUNK_SIZE", 16)
+    data = os.urandom(1000)
+    dest_path = os.path.join(homedir, "data", "source", "1-doc.gz.gpg")
+
+    extracted = safe_gunzip_stream(gzip_body(data), dest_path, "doc.txt", homedir)
+
+    assert extracted == Path(homedir, "data", "source", "doc.txt")
+    assert extracted.read_bytes() == data
+    assert extracted.stat().st_mode & 0o777 == 0o600
+
+
+def test_safe_gunzip_stream_removes_file_with_bad_crc(homedir):
+    stream = io.BytesIO(gzip.compress(b"content")[:-8] + b"\0" * 8)
+    stream.read(10)
+    dest_path = os.path.join(homedir, "data", "1-doc.gz.gpg")
+
+    with pytest.raises(OSError, match="CRC check failed"):
+        safe_gunzip_stream(stream, dest_path, "doc.txt", homedir)
+
+    assert not os.path.exists(os.path.join(homedir, "data", "doc.txt"))
+
+
+def test_safe_gunzip_stream_removes_truncated_file(homedir):
+    stream = io.BytesIO(gzip.compress(os.urandom(1000))[:500])
+    stream.read(10)
+    dest_path = os.path.join(homedir, "data", "1-doc.gz.gpg")
+
+    with pytest.raises(EOFError):
+        safe_gunzip_stream(stream, dest_path, "doc.txt", homedir)
+
+    assert not os.path.exists(os.path.join(homedir, "data", "doc.txt"))
+
+
+@pytest.mark.parametrize("filename", ["../traversed", "dir/../../traversed", "/tmp/traversed"])
+def test_safe_gunzip_stream_with_path_traversal_in_filename(homedir, filename):
+    dest_path = os.path.join(homedir, "data", "1-doc.gz.gpg")
+
+    with pytest.raises(ValueError):
+        safe_gunzip_stream(gzip_body(b"content"), dest_path, filename, homedir)
+
+    assert not os.path.exists(os.path.join(homedir, "traversed"))
+    assert not os.path.exists("/tmp/traversed")
+
+
+def test_safe_gunzip_stream_with_path_traversal_in_gzip_header(homedir):
+    """
+    The original filename read from the gzip header of a submission cannot write outside of its
+    source's directory.
+    """
+    # The gzip module only writes the basename of a filename, so set the header's FNAME flag and
+    # filename by hand.
+    compressed = gzip.compress(b"content")
+    stream = io.BytesIO(
+        b"\x1f\x8b\x08\x08" + compressed[4:10] + b"../traversed\0" + compressed[10:]
+    )
+    dest_path = os.path.join(homedir, "data", "1-doc.gz.gpg")
+
+    original_filename = read_gzip_header(stream)
+    with pytest.raises(ValueError):
+        safe_gunzip_stream(stream, dest_path, original_filename, homedir)
+
+    assert original_filename == "../traversed"
+    assert not os.path.exists(os.path.join(homedir, "traversed"))
+
+
+@pytest.mark.parametrize("dest_path", ["../traversed/1-doc.gz.gpg", "/tmp/traversed/1-doc.gz.gpg"])
+def test_safe_gunzip_stream_with_path_traversal_in_dest_path(homedir, dest_path):
+    with pytest.raises(ValueError):
+        safe_gunzip_stream(gzip_body(b"content"), dest_path, "doc.txt", homedir)
+
+    assert not os.path.exists("/tmp/traversed")
+
+
+@pytest.mark.parametrize(
+    "values,positions",
+    [
+        ([], set()),
+        ([0, 1, 2], {0, 1, 2}),
+        ([2, 0, 1], {1, 2}),
+        ([0, 1, 1], {0, 2}),
+        ([3, 1, 2, 0, 4], {1, 2, 4}),
+    ],
+)
+def test_longest_increasing_subsequence(values, positions):
+    assert longest_increasing_subsequence(values) == positions
+
+
+def test_call_concurrently_returns_results_in_order():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def first():
+        barrier.wait()  # only returns once both functions are running
+        return 1
+
+    def second():
+        barrier.wait()
+        return 2
+
+    assert call_concurrently([first, second]) == [1, 2]
+
+
+def test_call_concurrently_raises_first_exception_once_other_calls_return():
+    returned = threading.Event()
+
+    def slow():
+        time.sleep(0.1)
+        returned.set()
+
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        call_concurrently([slow, fail])
+
+    assert returned.is_set()
+
+
+def test_call_concurrently_raises_timeout_error_once_other_calls_return():
+    returned = threading.Event()
+
+    def slow():
+        time.sleep(0.1)
+        returned.set()
+
+    with pytest.raises(FuturesTimeoutError):
+        call_concurrently([slow, lambda: 1], timeout=0.01)
+
+    assert returned.is_set()